@@ -0,0 +1,234 @@
+"""
+요청 수락 제어 (ASGI 미들웨어)
+
+JSON 파싱, pydantic 검증, 실행 풀에 들어가기 전에 요청을 걸러서, 잘못되거나 과도한 요청이
+몰려도 정상 요청의 지연 시간이 늘어나지 않게 한다.
+
+- 본문 크기: Content-Length가 한도를 넘으면 본문을 읽지 않고 바로 413. Content-Length가 없거나
+  실제 본문이 더 길면 받은 바이트를 세다가 한도를 넘는 순간 413 (본문 전체를 메모리에 모으지 않는다)
+- 클라이언트별 속도 제한: 토큰 버킷 (초당 rate개, 최대 burst개). 토큰이 없으면 429 + Retry-After
+- 클라이언트별 동시 요청 수: 처리 중인 요청이 max_concurrency개면 429 + Retry-After
+- 클라이언트 키는 client_header 헤더 값 (NestJS 백엔드가 전달), 없으면 접속 IP.
+  클라이언트 상태는 최근 max_clients개만 유지한다 (LRU)
+
+거절 응답은 미리 인코딩한 바이트를 그대로 보내므로 요청당 비용이 일정하다.
+상태는 이벤트 루프 안에서만 바뀌므로 잠금이 필요 없다. 여러 워커 프로세스면 한도는 워커별로 적용된다.
+"""
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+import math
+import time
+
+from fastapi import HTTPException
+
+REJECT_REASONS = ("body_too_large", "rate_limited", "too_many_concurrent")
+
+
+class BodyTooLarge(HTTPException):
+    """본문 크기 한도 초과 (본문을 읽는 도중 발생하면 FastAPI가 그대로 413 응답으로 바꾼다)"""
+
+    def __init__(self, limit: int):
+        super().__init__(status_code=413, detail=f"요청 본문이 너무 큽니다 (최대 {limit}바이트)")
+        self.limit = limit
+
+
+class ClientState:
+    """클라이언트별 토큰 버킷과 처리 중인 요청 수"""
+    __slots__ = ("tokens", "updated", "in_flight")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+        self.in_flight = 0
+
+
+class AdmissionControl:
+    """본문 크기 한도와 클라이언트별 속도/동시 요청 제한 (설정과 상태, 미들웨어가 공유)"""
+
+    def __init__(self, max_body_bytes: int = 1 << 20, body_limits: Optional[Dict[str, int]] = None,
+                 rate: float = 0.0, burst: int = 0, max_concurrency: int = 0,
+                 client_header: str = "X-Client-ID", max_clients: int = 10000,
+                 limited_prefixes: Iterable[str] = ("/simulate", "/plans")):
+        """
+        Args:
+            max_body_bytes: 본문 크기 한도 (0이면 제한 없음)
+            body_limits: 경로별 본문 크기 한도 (max_body_bytes 대신 적용, 0이면 제한 없음)
+            rate: 클라이언트별 초당 요청 수 (0이면 속도 제한 없음)
+            burst: 토큰 버킷 크기 (0이면 rate를 올림한 값)
+            max_concurrency: 클라이언트별 동시 요청 수 (0이면 제한 없음)
+            limited_prefixes: 속도/동시 요청 제한을 적용할 경로 접두사 (/health, /metrics 등은 제외)
+        """
+        self.max_body_bytes = max_body_bytes
+        self.body_limits = dict(body_limits or {})
+        self.rate = rate
+        self.burst = burst or max(math.ceil(rate), 1)
+        self.max_concurrency = max_concurrency
+        self.client_header = client_header.lower().encode("latin-1")
+        self.max_clients = max_clients
+        self.limited_prefixes = tuple(limited_prefixes)
+        self.clients: "OrderedDict[str, ClientState]" = OrderedDict()
+        self.rejected: Dict[str, int] = {reason: 0 for reason in REJECT_REASONS}
+
+    def body_limit(self, path: str) -> int:
+        return self.body_limits.get(path, self.max_body_bytes)
+
+    def limits(self, path: str) -> bool:
+        """속도/동시 요청 제한 대상 경로인지"""
+        return (self.rate > 0 or self.max_concurrency > 0) and path.startswith(self.limited_prefixes)
+
+    def client(self, scope) -> ClientState:
+        key = None
+        for name, value in scope["headers"]:
+            if name == self.client_header:
+                key = value.decode("latin-1")
+                break
+        if key is None:
+            client = scope.get("client")
+            key = client[0] if client else "unknown"
+
+        state = self.clients.get(key)
+        if state is None:
+            state = ClientState(float(self.burst), time.monotonic())
+            self.clients[key] = state
+            if len(self.clients) > self.max_clients:
+                # 밀려난 클라이언트의 처리 중인 요청은 자기 상태 객체에서 계속 감소한다
+                self.clients.popitem(last=False)
+        else:
+            self.clients.move_to_end(key)
+        return state
+
+    def admit(self, state: ClientState) -> Optional[Tuple[str, int]]:
+        """수락하면 None, 거절하면 (사유, Retry-After 초)"""
+        if self.max_concurrency and state.in_flight >= self.max_concurrency:
+            return "too_many_concurrent", 1
+        if self.rate > 0:
+            now = time.monotonic()
+            state.tokens = min(self.burst, state.tokens + (now - state.updated) * self.rate)
+            state.updated = now
+            if state.tokens < 1:
+                return "rate_limited", max(math.ceil((1 - state.tokens) / self.rate), 1)
+            state.tokens -= 1
+        return None
+
+    def stats(self) -> dict:
+        return {"clients": len(self.clients), "rejected": dict(self.rejected)}
+
+    def collector(self):
+        """거절 메트릭 수집기"""
+        def collect():
+            return [("gpa_admission_rejected_total", (("reason", reason),), count)
+                    for reason, count in self.rejected.items()] + [("gpa_admission_clients", (), len(self.clients))]
+        return collect
+
+
+_REJECT_DETAIL = {
+    "rate_limited": "요청이 너무 많습니다",
+    "too_many_concurrent": "처리 중인 요청이 너무 많습니다",
+}
+
+
+class AdmissionMiddleware:
+    """AdmissionControl을 적용하는 ASGI 미들웨어"""
+
+    def __init__(self, app, control: AdmissionControl):
+        self.app = app
+        self.control = control
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        control = self.control
+        path = scope["path"]
+        limit = control.body_limit(path)
+        if limit:
+            declared = _content_length(scope)
+            if declared is not None and declared > limit:
+                control.rejected["body_too_large"] += 1
+                await _reject(send, 413, f"요청 본문이 너무 큽니다 (최대 {limit}바이트)")
+                return
+            receive = self._limited_receive(receive, limit)
+
+        state = None
+        if control.limits(path):
+            state = control.client(scope)
+            rejection = control.admit(state)
+            if rejection is not None:
+                reason, retry_after = rejection
+                control.rejected[reason] += 1
+                await _reject(send, 429, f"{_REJECT_DETAIL[reason]}. {retry_after}초 후 다시 시도해주세요", retry_after)
+                return
+            state.in_flight += 1
+
+        started = False
+
+        async def send_tracking(message):
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking)
+        except BodyTooLarge as e:
+            # 라우트 밖에서 본문을 읽다가 넘친 경우 (라우트 안에서는 FastAPI가 413으로 응답)
+            if started:
+                raise
+            await _reject(send, 413, e.detail)
+        finally:
+            if state is not None:
+                state.in_flight -= 1
+
+    def _limited_receive(self, receive, limit: int):
+        received = 0
+
+        async def limited():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    self.control.rejected["body_too_large"] += 1
+                    raise BodyTooLarge(limit)
+            return message
+
+        return limited
+
+
+def _content_length(scope) -> Optional[int]:
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+async def _reject(send, status_code: int, detail: str, retry_after: Optional[int] = None):
+    # detail은 서비스가 만든 문자열이라 JSON 이스케이프가 필요 없다
+    body = ('{"detail":"' + detail + '"}').encode("utf-8")
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    if retry_after is not None:
+        headers.append((b"retry-after", str(retry_after).encode()))
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def create_admission_control(settings) -> AdmissionControl:
+    """설정에 맞는 수락 제어 생성"""
+    return AdmissionControl(
+        max_body_bytes=settings.max_body_bytes,
+        body_limits={
+            "/simulate/batch": settings.max_batch_body_bytes,
+            "/simulate/risk/batch": settings.max_batch_body_bytes,
+            # NDJSON 스트리밍은 줄 단위로 읽으며 STREAM_MAX_LINE_BYTES로 제한한다
+            "/simulate/stream": 0,
+        },
+        rate=settings.rate_limit_rps,
+        burst=settings.rate_limit_burst,
+        max_concurrency=settings.client_max_concurrency,
+        client_header=settings.admission_client_header,
+        max_clients=settings.admission_max_clients
+    )
@@ -0,0 +1,237 @@
+"""
+GPA Simulator - 배치(벡터화) 계산 로직
+
+여러 학생의 입력을 학생 × 학기 패딩 행렬로 펼친 뒤 GPASimulator.simulate의
+Step 1~5를 NumPy 배열 연산으로 한 번에 수행한다.
+단건 경로와 결과가 비트 단위로 같아야 하므로 합계는 모두 순차 누적(cumsum)으로,
+반올림은 파이썬 round()와 같은 규칙으로 계산한다.
+"""
+from typing import List, Union
+import logging
+
+import numpy as np
+
+from app.models import SimulationInput, SimulationResult
+from app.simulator import GPASimulator
+
+logger = logging.getLogger(__name__)
+
+# 계절학기 자동 추가 시 최대 학점 (GPASimulator._adjust_remaining_credits와 동일)
+SUMMER_MAX_CREDITS = 9
+
+BatchOutcome = Union[List[SimulationResult], Exception]
+
+
+def _sequential_sum(values: np.ndarray) -> np.ndarray:
+    """행별 순차 합계 (파이썬 sum()과 같은 덧셈 순서)"""
+    if values.shape[1] == 0:
+        return np.zeros(values.shape[0])
+    return np.cumsum(values, axis=1)[:, -1]
+
+
+def _round2(values: np.ndarray) -> np.ndarray:
+    """
+    소수 둘째 자리 반올림 (파이썬 round(x, 2)와 동일한 결과)
+
+    np.round는 x*100을 거쳐 반올림하므로 .5 경계 근처에서 파이썬 round와
+    다를 수 있다. 경계 근처 값만 파이썬 round로 다시 계산한다.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        for idx in zip(*np.nonzero(near_tie)):
+            rounded[idx] = round(float(values[idx]), 2)
+    return rounded
+
+
+class BatchGPASimulator:
+    """여러 학생의 GPA 시뮬레이션을 한 번에 계산"""
+
+    def __init__(self, inputs: List[SimulationInput]):
+        self.inputs = inputs
+
+    def simulate(self) -> List[BatchOutcome]:
+        """
+        배치 시뮬레이션 실행
+
+        Returns:
+            입력 순서대로 학기별 결과 리스트 또는 발생한 예외
+            (목표 달성 불가능한 경우 ValueError)
+        """
+        n = len(self.inputs)
+        if n == 0:
+            return []
+
+        outcomes: List[BatchOutcome] = [None] * n
+
+        # Step 1: 현재 상태 계산
+        C_e, G_c, C_r, g_need, failed = self._calculate_current_state()
+
+        # Step 2: 남은 학점 합계 보정
+        credits, max_credits, lengths = self._adjust_remaining_credits(C_r)
+
+        # Step 3: 초기 균등 분배 (학점이 있는 학기만 계획에 포함)
+        in_plan = credits > 0
+
+        # Step 4: 현실성 조정
+        # Step 1을 통과하면 g_need <= scale_max 이므로 평점 상한에 걸리는 학기는 없다.
+        # 학점이 최대 이수 학점을 넘는 학생만 water-filling이 필요하므로 단건 경로로 계산한다.
+        needs_adjustment = (in_plan & (credits > max_credits)).any(axis=1)
+        # exact 라운딩은 정수 연산이므로 단건 경로로 계산한다
+        exact = np.array([data.rounding == "exact" for data in self.inputs])
+        fallback = failed | needs_adjustment | exact
+
+        # Step 5: 라운딩 및 최종 보정
+        vectorized = np.nonzero(~fallback)[0]
+        if len(vectorized) > 0:
+            self._round_and_adjust(
+                outcomes, vectorized,
+                credits[vectorized], in_plan[vectorized], g_need[vectorized],
+                G_c[vectorized], C_e[vectorized]
+            )
+
+        for i in np.nonzero(fallback)[0]:
+            outcomes[i] = self._simulate_single(self.inputs[i])
+
+        logger.debug("Batch simulation: %d records, %d fallback", n, int(fallback.sum()))
+        return outcomes
+
+    def _calculate_current_state(self):
+        """Step 1: 현재 상태 계산 (실패한 학생은 failed로 표시)"""
+        n = len(self.inputs)
+        max_history = max(len(data.history) for data in self.inputs)
+
+        history_credits = np.zeros((n, max_history))
+        history_avgs = np.zeros((n, max_history))
+        for i, data in enumerate(self.inputs):
+            for j, h in enumerate(data.history):
+                history_credits[i, j] = h.credits
+                history_avgs[i, j] = h.achieved_avg
+
+        self.G_t = np.array([data.G_t for data in self.inputs])
+        self.C_tot = np.array([data.C_tot for data in self.inputs])
+        self.scale_max = np.array([data.scale_max for data in self.inputs])
+
+        C_e = _sequential_sum(history_credits)
+        total_grade_points = _sequential_sum(history_credits * history_avgs)
+        G_c = np.divide(total_grade_points, C_e, out=np.zeros(n), where=C_e > 0)
+
+        C_r = self.C_tot - C_e
+        g_need = np.divide(
+            self.G_t * self.C_tot - G_c * C_e, C_r,
+            out=np.zeros(n), where=C_r > 0
+        )
+
+        # 단건 경로에서 ValueError가 발생하는 경우 (메시지는 단건 경로에서 생성)
+        failed = (C_r <= 0) | (g_need < 0) | (g_need > self.scale_max)
+
+        return C_e, G_c, C_r, g_need, failed
+
+    def _adjust_remaining_credits(self, C_r: np.ndarray):
+        """Step 2: 남은 학점 합계 보정 (계절학기 추가용으로 한 열을 더 둔다)"""
+        n = len(self.inputs)
+        lengths = np.array([len(data.terms) for data in self.inputs])
+        width = int(lengths.max()) + 1
+
+        credits = np.zeros((n, width))
+        max_credits = np.zeros((n, width))
+        for i, data in enumerate(self.inputs):
+            for j, t in enumerate(data.terms):
+                credits[i, j] = t.planned_credits
+                max_credits[i, j] = t.max_credits
+
+        total_planned = _sequential_sum(credits)
+        rows = np.arange(n)
+
+        # 부족한 경우: 마지막 학기 다음 열에 계절학기 추가
+        short = total_planned < C_r
+        shortage = C_r - total_planned
+        credits[rows[short], lengths[short]] = shortage[short]
+        max_credits[rows[short], lengths[short]] = np.minimum(shortage[short], SUMMER_MAX_CREDITS)
+
+        # 초과한 경우: 뒤에서부터 감소
+        over = np.nonzero(total_planned > C_r)[0]
+        if len(over) > 0:
+            sub_lengths = lengths[over]
+            steps = np.arange(width - 1)
+            # 뒤에서부터 k번째 학기의 열 위치 (학기 수를 넘어가면 -1)
+            positions = sub_lengths[:, None] - 1 - steps[None, :]
+            valid = positions >= 0
+            safe_positions = np.where(valid, positions, 0)
+            reversed_credits = np.where(valid, credits[over[:, None], safe_positions], 0.0)
+
+            # excess_k: k번째 학기를 처리하기 직전의 남은 초과 학점
+            running = np.cumsum(
+                np.concatenate([(total_planned - C_r)[over, None], -reversed_credits], axis=1),
+                axis=1
+            )[:, :-1]
+            reduce = valid & (running > 0)
+            reduced = reversed_credits - np.minimum(running, reversed_credits)
+
+            target_rows = np.broadcast_to(over[:, None], positions.shape)[reduce]
+            credits[target_rows, positions[reduce]] = reduced[reduce]
+
+        return credits, max_credits, lengths
+
+    def _round_and_adjust(self, outcomes: List[BatchOutcome], rows: np.ndarray,
+                          credits: np.ndarray, in_plan: np.ndarray, g_need: np.ndarray,
+                          G_c: np.ndarray, C_e: np.ndarray):
+        """Step 5: 라운딩 및 최종 보정 (벡터화 대상 학생만)"""
+        G_t = self.G_t[rows]
+        scale_max = self.scale_max[rows]
+
+        rounded_credits = np.where(in_plan, _round2(credits), 0.0)
+        rounded_avgs = np.where(in_plan, _round2(np.broadcast_to(g_need[:, None], credits.shape)), 0.0)
+
+        total_new_credits = _sequential_sum(rounded_credits)
+        total_new_grade_points = _sequential_sum(rounded_credits * rounded_avgs)
+        final_gpa = (G_c * C_e + total_new_grade_points) / (C_e + total_new_credits)
+
+        # 목표 GPA와의 차이를 마지막 학기에 보정
+        diff = G_t - final_gpa
+        width = credits.shape[1]
+        last = width - 1 - np.argmax(in_plan[:, ::-1], axis=1)
+        local = np.arange(len(rows))
+        last_credits = rounded_credits[local, last]
+        last_avgs = rounded_avgs[local, last]
+
+        # 마지막 학기 학점이 0으로 반올림되면 단건 경로와 같은 예외가 나도록 넘긴다
+        degenerate = (np.abs(diff) > 0.001) & (last_credits == 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            adjustment = diff * (C_e + total_new_credits) / last_credits
+            adjusted = _round2(np.where(degenerate, last_avgs, last_avgs + adjustment))
+        adjusted = np.where(adjusted > scale_max, scale_max, adjusted)
+        rounded_avgs[local, last] = np.where(np.abs(diff) > 0.001, adjusted, last_avgs)
+
+        for k, i in enumerate(rows):
+            data = self.inputs[i]
+            if degenerate[k]:
+                outcomes[i] = self._simulate_single(data)
+                continue
+            term_ids = [t.id for t in data.terms]
+            term_ids.append(f"Summer{len(data.terms)+1}")
+            outcomes[i] = [
+                SimulationResult.model_construct(
+                    term_id=term_ids[j],
+                    credits=float(rounded_credits[k, j]),
+                    required_avg=float(rounded_avgs[k, j])
+                )
+                for j in np.nonzero(in_plan[k])[0]
+            ]
+
+    def _simulate_single(self, data: SimulationInput) -> BatchOutcome:
+        """단건 경로로 계산"""
+        try:
+            simulator = GPASimulator(
+                scale_max=data.scale_max,
+                G_t=data.G_t,
+                C_tot=data.C_tot,
+                history=data.history,
+                terms=data.terms,
+                rounding=data.rounding
+            )
+            return simulator.simulate()
+        except Exception as e:
+            return e
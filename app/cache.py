@@ -0,0 +1,243 @@
+"""
+시뮬레이션 결과 캐시
+
+정규화된 SimulationInput의 해시를 키로 결과를 저장한다.
+같은 입력이면 같은 결과가 나오므로 프론트엔드 재요청이나 같은 목표 페이지 재방문 시
+계산을 건너뛸 수 있다. 저장소는 CacheBackend 인터페이스로 교체할 수 있다.
+"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from app.models import SimulationInput
+from app.records import ResultRecord, record_from_dict, results_to_json
+
+logger = logging.getLogger(__name__)
+
+# 계산 로직이 바뀌면 올려서 공유 저장소의 이전 결과를 무시한다
+CACHE_KEY_VERSION = "v1"
+
+
+def canonical_key(data: SimulationInput) -> str:
+    """정규화된 입력의 SHA-256 해시 (필드 순서, 정수/실수 표기와 무관)"""
+    payload = json.dumps(
+        data.model_dump(mode="json"),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"gpa:{CACHE_KEY_VERSION}:{digest}"
+
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스 (값은 직렬화된 문자열)"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """키에 해당하는 값 (없거나 만료되면 None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """값 저장 (ttl초 후 만료)"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """모든 값 삭제"""
+
+    def size(self) -> int:
+        """저장된 항목 수 (알 수 없으면 -1)"""
+        return -1
+
+
+class LocalCacheBackend(CacheBackend):
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, max_size: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.clock = clock
+        self.evictions = 0
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= self.clock():
+                del self._items[key]
+                self.evictions += 1
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._items[key] = (self.clock() + ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def size(self) -> int:
+        return len(self._items)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    여러 uvicorn 워커가 공유하는 Redis 캐시
+
+    만료는 Redis TTL로, 용량 제한은 Redis의 maxmemory-policy(allkeys-lru)로 처리한다.
+    redis 패키지는 이 백엔드를 쓸 때만 필요하다.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", client=None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError("CACHE_BACKEND=redis 를 사용하려면 redis 패키지가 필요합니다") from e
+            client = redis.Redis.from_url(url)
+        self.client = client
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(key)
+        if value is None:
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self.client.set(key, value, px=max(int(ttl * 1000), 1))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=f"gpa:{CACHE_KEY_VERSION}:*"):
+            self.client.delete(key)
+
+
+class ResultCache:
+    """시뮬레이션 결과 캐시 (성공 결과와 목표 달성 불가능 메시지를 모두 저장)"""
+
+    def __init__(self, backend: CacheBackend, ttl: float = 300, enabled: bool = True):
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        """
+        캐시 조회
+
+        Returns:
+            캐시된 결과 리스트 또는 ValueError, 없으면 None
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            # 공유 저장소 장애 시 캐시 없이 계산
+            logger.warning("Cache get failed: %s", e)
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry = json.loads(value)
+        if "error" in entry:
+            return ValueError(entry["error"])
+        return [record_from_dict(r) for r in entry["results"]]
+
+    def set(self, key: str, outcome) -> None:
+        """결과 리스트 또는 ValueError 저장"""
+        if not self.enabled:
+            return
+
+        if isinstance(outcome, ValueError):
+            value = json.dumps({"error": str(outcome)}, ensure_ascii=False)
+        else:
+            value = '{"results":' + results_to_json(outcome).decode("utf-8") + "}"
+
+        try:
+            self.backend.set(key, value, self.ttl)
+        except Exception as e:
+            logger.warning("Cache set failed: %s", e)
+
+    def get_or_compute(self, data: SimulationInput,
+                       compute: Callable[[], List[ResultRecord]]) -> List[ResultRecord]:
+        """
+        캐시에 있으면 반환하고, 없으면 계산 후 저장
+
+        Raises:
+            ValueError: 목표 달성 불가능한 경우 (캐시된 경우 포함)
+        """
+        key = canonical_key(data)
+        cached = self.get(key)
+        if isinstance(cached, ValueError):
+            raise cached
+        if cached is not None:
+            return cached
+
+        try:
+            results = compute()
+        except ValueError as e:
+            self.set(key, e)
+            raise
+
+        self.set(key, results)
+        return results
+
+    async def get_or_compute_async(self, data: SimulationInput,
+                                   compute: Callable[[], Awaitable[List[ResultRecord]]]) -> List[ResultRecord]:
+        """get_or_compute와 같고, 계산은 실행 풀 등에서 비동기로 수행"""
+        key = canonical_key(data)
+        cached = self.get(key)
+        if isinstance(cached, ValueError):
+            raise cached
+        if cached is not None:
+            return cached
+
+        try:
+            results = await compute()
+        except ValueError as e:
+            self.set(key, e)
+            raise
+
+        self.set(key, results)
+        return results
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": self.backend.size(),
+            "evictions": getattr(self.backend, "evictions", 0),
+        }
+
+
+def create_result_cache(settings) -> ResultCache:
+    """설정에 맞는 결과 캐시 생성"""
+    if settings.cache_backend == "redis":
+        backend = RedisCacheBackend(settings.cache_redis_url)
+    else:
+        backend = LocalCacheBackend(max_size=settings.cache_max_size)
+    return ResultCache(backend, ttl=settings.cache_ttl_seconds, enabled=settings.cache_enabled)
@@ -0,0 +1,360 @@
+"""
+오프라인 배치 실행기
+
+HTTP를 거치지 않고 대용량 입력 파일의 모든 학생 계획을 계산한다 (야간 분석 작업용).
+
+    python main.py students.jsonl plans.csv --workers 8 --chunk-size 1000
+    python main.py students.jsonl plans.csv --resume
+
+입력 형식 (확장자로 판단, --input-format으로 지정 가능)
+- jsonl/ndjson: 한 줄에 SimulationInput + 선택 필드 key 하나 (mmap으로 읽음)
+- json: SimulationInput 객체의 배열 (버퍼 단위로 나누어 읽음)
+- csv: key, scale_max, G_t, C_tot, history, terms 컬럼 (history/terms는 JSON 문자열)
+- parquet: csv와 같은 컬럼 (pyarrow 필요, history/terms는 JSON 문자열 또는 struct 리스트)
+
+출력은 학기 하나당 한 행인 CSV다.
+- 컬럼: record, key, status_code, detail, term_id, credits, required_avg
+- 실패한 레코드는 detail만 채운 한 행이다
+- 상태 코드는 단건 /simulate와 같다
+
+청크마다 출력 파일을 fsync한 뒤 진행 상황(<출력>.progress)을 기록한다.
+--resume으로 다시 실행하면 출력을 마지막 기록 지점으로 자르고 그다음 입력부터 이어서 계산한다.
+"""
+from collections import deque
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import csv
+import io
+import json
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+
+from app.simulator import GPASimulator
+from app.tasks import parse_record
+
+OUTPUT_COLUMNS = ("record", "key", "status_code", "detail", "term_id", "credits", "required_avg")
+INPUT_FORMATS = ("jsonl", "json", "csv", "parquet")
+
+# (입력 레코드, 이 레코드 다음부터 다시 읽기 위한 위치)
+Record = Tuple[Any, Any]
+
+
+def detect_format(path: str) -> str:
+    """확장자로 입력 형식 판단"""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "ndjson":
+        return "jsonl"
+    if extension not in INPUT_FORMATS:
+        raise ValueError(f"입력 형식을 알 수 없습니다: {path} (--input-format으로 지정)")
+    return extension
+
+
+def read_jsonl(path: str, start: int = 0) -> Iterator[Record]:
+    """NDJSON 레코드 (위치: 바이트 오프셋)"""
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        position = start
+        size = len(mm)
+        while position < size:
+            end = mm.find(b"\n", position)
+            if end < 0:
+                end = size
+            line = mm[position:end]
+            position = end + 1
+            if line.strip():
+                yield line, position
+
+
+def read_json_array(path: str, start: int = 0, buffer_size: int = 1 << 20) -> Iterator[Record]:
+    """
+    JSON 배열의 원소 (위치: 원소 개수)
+
+    파일 전체를 올리지 않고 buffer_size 단위로 읽으면서 원소를 하나씩 디코딩한다.
+    재개 시에는 앞쪽 start개 원소를 디코딩만 하고 건너뛴다.
+    """
+    decoder = json.JSONDecoder()
+    count = 0
+    with open(path, encoding="utf-8") as f:
+        buffer = f.read(buffer_size).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError("JSON 입력은 배열이어야 합니다")
+        position = 1
+        eof = False
+        while True:
+            # 구분자(공백, 쉼표) 건너뛰기
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer) and buffer[position] == "]":
+                return
+            try:
+                if position >= len(buffer):
+                    raise ValueError("버퍼 끝")
+                element, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                if eof:
+                    raise ValueError(f"JSON 배열의 {count + 1}번째 원소를 읽을 수 없습니다")
+                chunk = f.read(buffer_size)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            position = end
+            count += 1
+            if count > start:
+                yield element, count
+
+
+def _csv_row(header: List[str], row: List[str]) -> Any:
+    """CSV 행 → 입력 dict (history/terms JSON 디코딩 실패 시 에러 메시지 문자열)"""
+    record = dict(zip(header, row))
+    for column in ("history", "terms"):
+        value = record.get(column)
+        if value is not None:
+            try:
+                record[column] = json.loads(value) if value.strip() else []
+            except ValueError as e:
+                return f"{column} 컬럼 JSON 형식 오류: {e}"
+    if record.get("key") == "":
+        record["key"] = None
+    return record
+
+
+def read_csv(path: str, start: int = 0) -> Iterator[Record]:
+    """CSV 레코드 (위치: 바이트 오프셋, 첫 행은 컬럼 이름)"""
+    with open(path, "rb") as f:
+        offset = 0
+
+        def lines():
+            nonlocal offset
+            for raw in iter(f.readline, b""):
+                offset += len(raw)
+                yield raw.decode("utf-8")
+
+        reader = csv.reader(lines())
+        header = next(reader, None)
+        if header is None:
+            return
+        if start > offset:
+            f.seek(start)
+            offset = start
+            reader = csv.reader(lines())
+        for row in reader:
+            if row:
+                yield _csv_row(header, row), offset
+
+
+def read_parquet(path: str, start: int = 0, batch_size: int = 10000) -> Iterator[Record]:
+    """Parquet 레코드 (위치: 행 개수, 배치 단위로 읽음)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet 입력을 사용하려면 pyarrow 패키지가 필요합니다") from e
+
+    count = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        if count + batch.num_rows <= start:
+            count += batch.num_rows
+            continue
+        for row in batch.to_pylist():
+            count += 1
+            if count <= start:
+                continue
+            for column in ("history", "terms"):
+                if isinstance(row.get(column), str):
+                    row[column] = json.loads(row[column])
+            yield row, count
+
+
+READERS = {"jsonl": read_jsonl, "json": read_json_array, "csv": read_csv, "parquet": read_parquet}
+
+
+def simulate_chunk(chunk: Sequence[Tuple[int, Any]]) -> List[tuple]:
+    """
+    레코드 묶음 계산 (워커 프로세스에서 실행)
+
+    Args:
+        chunk: (레코드 번호, 입력 레코드) 목록
+
+    Returns:
+        OUTPUT_COLUMNS 순서의 출력 행 목록
+    """
+    rows = []
+    for index, raw in chunk:
+        if isinstance(raw, str):
+            rows.append((index, "", 422, raw, "", "", ""))
+            continue
+        key, data, error = parse_record(raw)
+        key = "" if key is None else key
+        if error is not None:
+            rows.append((index, key, error[0], error[1], "", "", ""))
+            continue
+        try:
+            results = GPASimulator(
+                data.scale_max, data.G_t, data.C_tot, data.history, data.terms, data.rounding
+            ).simulate_records()
+        except ValueError as e:
+            rows.append((index, key, 422, str(e), "", "", ""))
+        except Exception as e:
+            rows.append((index, key, 500, f"내부 서버 오류: {str(e)}", "", "", ""))
+        else:
+            rows.extend((index, key, 200, "", r.term_id, r.credits, r.required_avg) for r in results)
+    return rows
+
+
+def _chunks(records: Iterator[Record], first_index: int, chunk_size: int) -> Iterator[Tuple[list, Any]]:
+    """(청크, 청크 마지막 레코드 다음 위치)"""
+    chunk = []
+    position = None
+    for index, (raw, position) in enumerate(records, start=first_index):
+        chunk.append((index, raw))
+        if len(chunk) >= chunk_size:
+            yield chunk, position
+            chunk = []
+    if chunk:
+        yield chunk, position
+
+
+def _progress_path(output: str) -> str:
+    return output + ".progress"
+
+
+def _load_progress(output: str, input_path: str) -> Optional[dict]:
+    try:
+        with open(_progress_path(output), encoding="utf-8") as f:
+            progress = json.load(f)
+    except FileNotFoundError:
+        return None
+    if progress.get("input") != os.path.abspath(input_path):
+        raise ValueError(f"진행 상황 파일이 다른 입력({progress.get('input')})의 것입니다")
+    return progress
+
+
+def _save_progress(output: str, progress: dict):
+    """진행 상황 기록 (임시 파일에 쓴 뒤 교체해 중간에 끊겨도 이전 기록 유지)"""
+    path = _progress_path(output)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(progress, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def _report(progress: dict, started: float, resumed_records: int, stream):
+    elapsed = time.perf_counter() - started
+    done = progress["records"] - resumed_records
+    rate = done / elapsed if elapsed > 0 else 0.0
+    print(f"records={progress['records']} failed={progress['failed']} "
+          f"elapsed={elapsed:.1f}s rate={rate:.0f} records/s", file=stream, flush=True)
+
+
+def run(input_path: str, output_path: str, input_format: Optional[str] = None, workers: Optional[int] = None,
+        chunk_size: int = 1000, resume: bool = False, report_interval: float = 5.0, stream=sys.stderr) -> dict:
+    """
+    입력 파일 전체를 계산해 출력 CSV에 기록
+
+    Args:
+        input_path: 입력 파일
+        output_path: 출력 CSV
+        input_format: 입력 형식 (생략 시 확장자로 판단)
+        workers: 워커 프로세스 수 (생략 시 CPU 코어 수, 1이면 현재 프로세스에서 계산)
+        chunk_size: 워커에 한 번에 넘기는 레코드 수 (진행 상황 기록 단위)
+        resume: 이전 실행의 진행 상황부터 이어서 계산
+        report_interval: 처리 속도 출력 간격 (초)
+        stream: 처리 속도 출력 대상
+
+    Returns:
+        {"records", "failed", "elapsed_s", "records_per_s"}
+    """
+    reader = READERS[input_format or detect_format(input_path)]
+    workers = workers or os.cpu_count() or 1
+
+    progress = _load_progress(output_path, input_path) if resume else None
+    if progress is None:
+        progress = {"input": os.path.abspath(input_path), "position": 0, "records": 0, "failed": 0,
+                    "output_offset": 0}
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(OUTPUT_COLUMNS)
+            progress["output_offset"] = f.tell()
+        _save_progress(output_path, progress)
+
+    resumed_records = progress["records"]
+    started = time.perf_counter()
+    last_report = started
+
+    # 마지막 진행 상황 기록 이후에 쓰인 행은 버린다
+    with open(output_path, "r+b") as out:
+        out.truncate(progress["output_offset"])
+        out.seek(progress["output_offset"])
+        text = io.TextIOWrapper(out, encoding="utf-8", newline="", write_through=True)
+        writer = csv.writer(text)
+
+        def write(rows: List[tuple], chunk_records: int, position: Any):
+            nonlocal last_report
+            writer.writerows(rows)
+            text.flush()
+            os.fsync(out.fileno())
+            progress["position"] = position
+            progress["records"] += chunk_records
+            progress["failed"] += len({row[0] for row in rows if row[2] != 200})
+            progress["output_offset"] = out.tell()
+            _save_progress(output_path, progress)
+            if time.perf_counter() - last_report >= report_interval:
+                _report(progress, started, resumed_records, stream)
+                last_report = time.perf_counter()
+
+        chunks = _chunks(reader(input_path, progress["position"]), progress["records"], chunk_size)
+        if workers == 1:
+            for chunk, position in chunks:
+                write(simulate_chunk(chunk), len(chunk), position)
+        else:
+            # Pool.imap은 입력을 끝까지 미리 읽으므로, 진행 중인 청크 수를 제한해 메모리를 일정하게 유지
+            with multiprocessing.Pool(workers) as pool:
+                pending = deque()
+                for chunk, position in chunks:
+                    pending.append((pool.apply_async(simulate_chunk, (chunk,)), len(chunk), position))
+                    if len(pending) >= workers * 2:
+                        result, count, end = pending.popleft()
+                        write(result.get(), count, end)
+                while pending:
+                    result, count, end = pending.popleft()
+                    write(result.get(), count, end)
+        text.detach()
+
+    _report(progress, started, resumed_records, stream)
+    elapsed = time.perf_counter() - started
+    return {
+        "records": progress["records"],
+        "failed": progress["failed"],
+        "elapsed_s": round(elapsed, 3),
+        "records_per_s": round((progress["records"] - resumed_records) / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="GPA 시뮬레이션 오프라인 배치 실행기")
+    parser.add_argument("input", help="입력 파일 (jsonl, ndjson, json, csv, parquet)")
+    parser.add_argument("output", help="출력 CSV 파일")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, help="입력 형식 (생략 시 확장자로 판단)")
+    parser.add_argument("--workers", type=int, default=0, help="워커 프로세스 수 (0이면 CPU 코어 수)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="워커에 한 번에 넘기는 레코드 수")
+    parser.add_argument("--resume", action="store_true", help="이전 실행의 진행 상황부터 이어서 계산")
+    parser.add_argument("--report-interval", type=float, default=5.0, help="처리 속도 출력 간격 (초)")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = run(args.input, args.output, args.input_format, args.workers or None,
+                      args.chunk_size, args.resume, args.report_interval)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+
+    print(json.dumps(summary, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+환경 변수 기반 서비스 설정
+"""
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+class Settings:
+    """서비스 설정 (프로세스 시작 시 환경 변수에서 한 번 읽음)"""
+
+    def __init__(self):
+        # uvicorn 연결 설정 (python app/main.py로 실행할 때, Docker CMD도 같은 환경 변수 사용).
+        # keep-alive는 호출 측 연결 풀의 유휴 시간보다 길어야 재사용 직전에 서버가 연결을 닫지 않는다
+        self.keep_alive_timeout = _env_int("KEEP_ALIVE_TIMEOUT", 75)
+        self.backlog = _env_int("BACKLOG", 2048)
+        # 다중 워커 실행 (python -m app.prefork). workers 0이면 컨테이너 CPU 할당량에 맞춤
+        self.host = os.getenv("HOST", "0.0.0.0")
+        self.port = _env_int("PORT", 8000)
+        self.workers = _env_int("WORKERS", 0)
+
+        # 로깅 (format: text, json)
+        self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        self.log_format = os.getenv("LOG_FORMAT", "text")
+        # 단계별 상세 추적 로그: 전체(LOG_TRACE) 또는 요청 ID 샘플링 비율
+        self.log_trace = _env_bool("LOG_TRACE", False)
+        self.log_trace_sample_rate = _env_float("LOG_TRACE_SAMPLE_RATE", 0.0)
+
+        # 결과 캐시
+        self.cache_enabled = _env_bool("CACHE_ENABLED", True)
+        self.cache_backend = os.getenv("CACHE_BACKEND", "local")  # local, redis
+        self.cache_max_size = _env_int("CACHE_MAX_SIZE", 10000)
+        self.cache_ttl_seconds = _env_float("CACHE_TTL_SECONDS", 300)
+        self.cache_redis_url = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+        # 메트릭 (/metrics). 여러 워커 프로세스면 워커별 스냅샷을 공유 디렉터리에 기록해 합산
+        self.metrics_enabled = _env_bool("METRICS_ENABLED", True)
+        self.metrics_multiproc_dir = os.getenv("METRICS_MULTIPROC_DIR") or None
+        self.metrics_flush_interval = _env_float("METRICS_FLUSH_INTERVAL", 1.0)
+
+        # 시뮬레이션 실행 풀 (mode: inline, thread, process). workers 0이면 CPU 코어 수
+        self.executor_mode = os.getenv("EXECUTOR_MODE", "thread")
+        self.executor_workers = _env_int("EXECUTOR_WORKERS", 0)
+        self.executor_max_queue = _env_int("EXECUTOR_MAX_QUEUE", 64)
+
+        # NDJSON 스트리밍 (/simulate/stream): 한 번에 계산할 최대 레코드 수와 한 줄의 최대 크기
+        self.stream_chunk_size = _env_int("STREAM_CHUNK_SIZE", 256)
+        self.stream_max_line_bytes = _env_int("STREAM_MAX_LINE_BYTES", 1 << 20)
+
+        # 요청 수락 제어: 본문 크기 (배치 엔드포인트는 별도 한도), 목록 길이 (모델 생성 전에 검사)
+        self.max_body_bytes = _env_int("MAX_BODY_BYTES", 1 << 20)
+        self.max_batch_body_bytes = _env_int("MAX_BATCH_BODY_BYTES", 64 << 20)
+        self.max_history_terms = _env_int("MAX_HISTORY_TERMS", 256)
+        self.max_terms = _env_int("MAX_TERMS", 256)
+        self.max_term_courses = _env_int("MAX_TERM_COURSES", 128)
+        self.max_batch_inputs = _env_int("MAX_BATCH_INPUTS", 10000)
+        # 클라이언트별 속도/동시 요청 제한 (0이면 제한 없음). 클라이언트 키는 헤더 값, 없으면 접속 IP
+        self.rate_limit_rps = _env_float("RATE_LIMIT_RPS", 0)
+        self.rate_limit_burst = _env_int("RATE_LIMIT_BURST", 0)
+        self.client_max_concurrency = _env_int("CLIENT_MAX_CONCURRENCY", 0)
+        self.admission_client_header = os.getenv("ADMISSION_CLIENT_HEADER", "X-Client-ID")
+        self.admission_max_clients = _env_int("ADMISSION_MAX_CLIENTS", 10000)
+
+        # 학교별 성적 체계 추가 정의 (JSON 파일, 내장 kr-4.5/kr-4.3/us-4.0에 더해 등록)
+        self.grade_scales_path = os.getenv("GRADE_SCALES_PATH") or None
+
+        # 학생별 계획 저장소 (backend: none, sqlite). 동시에 들어온 쓰기는 최대 batch_size개씩 한 트랜잭션으로 기록
+        self.plan_store_backend = os.getenv("PLAN_STORE_BACKEND", "none")
+        self.plan_store_path = os.getenv("PLAN_STORE_PATH", "plans.db")
+        self.plan_store_pool_size = _env_int("PLAN_STORE_POOL_SIZE", 4)
+        self.plan_store_cache_size = _env_int("PLAN_STORE_CACHE_SIZE", 10000)
+        self.plan_store_batch_size = _env_int("PLAN_STORE_BATCH_SIZE", 256)
+        # 여러 프로세스가 같은 저장소를 쓰는 경우 (uvicorn --workers 등, app.prefork는 워커가 2개 이상이면 자동으로 켠다)
+        self.plan_store_shared = _env_bool("PLAN_STORE_SHARED", False)
+
+
+settings = Settings()
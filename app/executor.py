@@ -0,0 +1,163 @@
+"""
+시뮬레이션 실행 풀
+
+CPU를 쓰는 시뮬레이션을 이벤트 루프 밖(스레드 풀 또는 프로세스 풀)에서 실행해
+큰 계획이나 배치 요청이 /health 등 다른 연결을 막지 않게 한다.
+
+- inline: 이벤트 루프에서 바로 실행 (이전 동작)
+- thread: 스레드 풀 (요청 컨텍스트의 추적 플래그 유지)
+- process: 프로세스 풀 (GIL과 무관하게 병렬 실행, 작업 함수와 인자는 pickle 가능해야 함)
+
+실행 중 + 대기 중 작업 수는 workers + max_queue로 제한하고, 넘치면 바로
+ExecutorSaturated(retry_after 초)를 발생시킨다. 대기 없이 거절하므로 과부하 시
+응답 지연이 쌓이지 않는다.
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+import asyncio
+import contextvars
+import math
+import multiprocessing
+import os
+import threading
+import time
+
+from app.metrics import metrics as default_registry, REQUEST_BUCKETS
+
+EXECUTOR_MODES = ("inline", "thread", "process")
+
+
+class ExecutorSaturated(Exception):
+    """실행 풀과 대기열이 가득 참"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"요청이 많아 처리할 수 없습니다. {retry_after}초 후 다시 시도해주세요")
+        self.retry_after = retry_after
+
+
+def _run_timed(submitted: float, fn: Callable, args: tuple):
+    """작업 실행 (대기 시간과 실행 시간 함께 반환, 프로세스 풀에서도 같은 시계 사용)"""
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started - submitted, time.monotonic() - started
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+class SimulationExecutor:
+    """대기열 길이가 제한된 시뮬레이션 실행 풀"""
+
+    def __init__(self, mode: str = "thread", workers: Optional[int] = None, max_queue: int = 64,
+                 registry=default_registry):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"알 수 없는 실행 모드: {mode} (inline, thread, process 중 하나)")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.capacity = self.workers + max_queue
+        self.registry = registry
+
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        # 작업 실행 시간 지수 이동 평균 (Retry-After 추정용)
+        self.avg_seconds = 0.0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "thread":
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="simulation")
+            else:
+                # 이벤트 루프와 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+        return self._pool
+
+    def retry_after(self) -> int:
+        """대기 중인 작업이 모두 끝날 때까지의 예상 시간 (초, 최소 1)"""
+        queued = max(self.in_flight - self.workers, 0) + 1
+        return max(1, math.ceil(queued * self.avg_seconds / self.workers))
+
+    def is_saturated(self) -> bool:
+        """새 작업을 받을 수 없는 상태인지"""
+        return self.mode != "inline" and self.in_flight >= self.capacity
+
+    def _acquire(self):
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                raise ExecutorSaturated(self.retry_after())
+            self.in_flight += 1
+
+    def _release(self, _future=None):
+        # 클라이언트가 끊겨 대기가 취소돼도 작업이 실제로 끝날 때 반환
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def run(self, fn: Callable, *args):
+        """
+        작업 실행
+
+        Raises:
+            ExecutorSaturated: 실행 중 + 대기 중 작업 수가 한도에 도달한 경우
+        """
+        if self.mode == "inline":
+            return fn(*args)
+
+        self._acquire()
+        try:
+            pool = self._get_pool()
+            submitted = time.monotonic()
+            if self.mode == "thread":
+                context = contextvars.copy_context()
+                future = pool.submit(context.run, _run_timed, submitted, fn, args)
+            else:
+                future = pool.submit(_run_timed, submitted, fn, args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        result, waited, ran = await asyncio.wrap_future(future)
+        self.avg_seconds = ran if self.avg_seconds == 0 else 0.9 * self.avg_seconds + 0.1 * ran
+        self.registry.observe("gpa_executor_queue_wait_seconds", waited, buckets=REQUEST_BUCKETS)
+        return result
+
+    def warm_up(self):
+        """풀의 워커를 미리 시작 (프로세스 풀은 워커마다 모듈 import 비용이 있음)"""
+        if self.mode == "inline":
+            return
+        pool = self._get_pool()
+        for future in [pool.submit(_noop) for _ in range(self.workers)]:
+            future.result()
+
+    def collector(self):
+        """포화 상태 메트릭 수집기"""
+        def collect():
+            return [
+                ("gpa_executor_in_flight", (("mode", self.mode),), self.in_flight),
+                ("gpa_executor_capacity", (("mode", self.mode),), self.capacity),
+                ("gpa_executor_completed_total", (("mode", self.mode),), self.completed),
+                ("gpa_executor_rejected_total", (("mode", self.mode),), self.rejected),
+            ]
+        return collect
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def create_executor(settings) -> SimulationExecutor:
+    """설정에 맞는 실행 풀 생성"""
+    return SimulationExecutor(
+        mode=settings.executor_mode,
+        workers=settings.executor_workers or None,
+        max_queue=settings.executor_max_queue
+    )
@@ -0,0 +1,68 @@
+"""
+GPA Simulator - 목표 달성 가능 여부 빠른 확인
+
+사용자가 목표 GPA를 입력하는 동안(키 입력마다) 필요한 것은 달성 가능 여부와
+달성 가능한 GPA 범위뿐이다. 학기 목록을 만들거나 검증하지 않고, 호출자가 학생별로
+캐시해 둔 이수 이력 집계(이수 학점 C_e, 총 grade points)만으로 O(1)에 계산한다.
+
+판정과 에러 메시지는 /simulate의 입력 검증 + Step 1과 같다. 학기 계획은 Step 2~4에서
+계절학기 추가로 항상 맞출 수 있으므로 판정에 영향을 주지 않는다.
+"""
+from typing import Optional
+
+from app.models import FeasibilityResult
+from app.simulator import GPASimulator
+
+
+def check_feasibility(scale_max: float, C_tot: float, C_e: float = 0, grade_points: float = 0,
+                      G_t: Optional[float] = None) -> FeasibilityResult:
+    """
+    달성 가능한 GPA 범위와 목표 G_t의 달성 가능 여부
+
+    Args:
+        scale_max: 평점 최대값
+        C_tot: 졸업 요구 총 학점
+        C_e: 이수 완료 학점 (history credits 합계)
+        grade_points: 이수 완료 grade points (history credits × achieved_avg 합계)
+        G_t: 목표 GPA (생략하면 범위만 계산)
+    """
+    G_c = grade_points / C_e if C_e > 0 else 0
+    C_r = C_tot - C_e
+
+    if C_r <= 0:
+        result = FeasibilityResult(max_achievable_gpa=G_c, min_achievable_gpa=G_c)
+    else:
+        result = FeasibilityResult(
+            max_achievable_gpa=(G_c * C_e + scale_max * C_r) / C_tot,
+            min_achievable_gpa=(G_c * C_e) / C_tot
+        )
+    if G_t is None:
+        if C_r <= 0:
+            result.detail = "이미 졸업 요구 학점을 충족했습니다"
+        return result
+
+    # 입력 검증 (/simulate의 400, Step 1보다 먼저)
+    if G_t > scale_max:
+        result.feasible, result.status_code = False, 400
+        result.detail = f"목표 GPA ({G_t})가 최대 평점 ({scale_max})을 초과합니다"
+        return result
+
+    # Step 1 (/simulate의 422)
+    if C_r <= 0:
+        result.feasible, result.status_code = False, 422
+        result.detail = "이미 졸업 요구 학점을 충족했습니다"
+        return result
+    g_need = (G_t * C_tot - G_c * C_e) / C_r
+    result.required_avg = g_need
+    if g_need < 0:
+        result.feasible, result.status_code = False, 422
+        result.detail = "이미 목표 GPA를 초과 달성했습니다"
+    elif g_need > scale_max:
+        simulator = GPASimulator(scale_max, G_t, C_tot, [], [])
+        additional = simulator._calculate_additional_credits_needed(G_c, C_e, C_r)
+        result.feasible, result.status_code = False, 422
+        result.additional_credits_needed = additional if additional != float("inf") else None
+        result.detail = simulator._unreachable_message(G_c, C_e, C_r)
+    else:
+        result.feasible, result.status_code = True, 200
+    return result
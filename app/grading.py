@@ -0,0 +1,323 @@
+"""
+GPA Simulator - 성적 체계 (학교별 등급표)
+
+GPASimulator는 연속적인 평점(scale_max 이하의 실수)만 다루지만 실제 성적표는
+A+=4.5, A0=4.0 같은 이산 등급이다. 학교별 등급표를 이름으로 등록해 두고,
+학기별 필요 평점을 실제로 받을 수 있는 등급 조합으로 바꿔 준다.
+
+- 학기 과목 수: 학점 / 과목당 학점(course_credits)을 반올림 (1 ~ MAX_COURSES과목, 과목 학점은 같다고 가정)
+- 조회 테이블: 등급표마다 과목 수 n별로 "받을 수 있는 평점 합계(0.01 단위 정수)"를 정렬한 배열과,
+  합계마다 가장 고른 등급 조합(평점 제곱합 최소, DP)을 만든다. 등급표당 한 번만 만들고
+  (처음 조회할 때 또는 /ready 예열 시) 요청에서는 bisect로 필요 평점 이상인 가장 낮은 합계를 찾는다
+- 과목별 배정: 학기 입력에 courses가 있으면 과목마다 등급을 정한다 (GradeScale.allocate).
+  모든 과목에 필요 평점 이하 최고 등급을 주고 부족분만큼 일부 과목을 한 단계 올리는데,
+  어떤 과목을 올릴지는 학점별 묶음 × 부족 학점 메모이제이션 DP로 정하므로 과목이 수십 개여도 빠르다.
+  학점 종류가 많아 DP 계산량이 MAX_BUMP_WORK를 넘으면 큰 학점부터 채우는 탐욕 배정으로 대신한다
+- 내장 등급표: kr-4.5, kr-4.3, us-4.0. GRADE_SCALES_PATH의 JSON 파일({"이름": {"등급": 평점}})로 추가할 수 있다
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+import json
+import logging
+import math
+import threading
+
+from app.config import settings
+from app.models import CourseGrade, CourseItem, GradeMix, SimulationInput
+from app.records import GradedResultRecord
+
+logger = logging.getLogger(__name__)
+
+# 한 학기 과목 수 상한 (조회 테이블 크기 제한)
+MAX_COURSES = 12
+# 학기별로 돌려주는 조합 수 (필요 평점 이상인 평균을 낮은 순으로)
+MIX_LIMIT = 3
+# 과목별 배정 DP의 계산량 상한 (묶음별 선택지 수 × 부족 학점 합계). 넘으면 탐욕 배정
+MAX_BUMP_WORK = 25_000
+
+BUILTIN_SCALES: Dict[str, Dict[str, float]] = {
+    "kr-4.5": {"A+": 4.5, "A0": 4.0, "B+": 3.5, "B0": 3.0, "C+": 2.5, "C0": 2.0, "D+": 1.5, "D0": 1.0, "F": 0.0},
+    "kr-4.3": {"A+": 4.3, "A0": 4.0, "A-": 3.7, "B+": 3.3, "B0": 3.0, "B-": 2.7, "C+": 2.3, "C0": 2.0,
+               "C-": 1.7, "D+": 1.3, "D0": 1.0, "D-": 0.7, "F": 0.0},
+    "us-4.0": {"A": 4.0, "A-": 3.7, "B+": 3.3, "B": 3.0, "B-": 2.7, "C+": 2.3, "C": 2.0, "C-": 1.7,
+               "D+": 1.3, "D": 1.0, "F": 0.0},
+}
+
+
+def course_count(credits: float, course_credits: float) -> int:
+    """학기 학점을 과목 수로 변환 (1 ~ MAX_COURSES)"""
+    return min(MAX_COURSES, max(1, round(credits / course_credits)))
+
+
+class GradeScale:
+    """등급표 하나와 과목 수별 조회 테이블"""
+
+    def __init__(self, name: str, grades: Dict[str, float]):
+        """
+        Raises:
+            ValueError: 등급이 없거나 평점이 음수, 소수 셋째 자리 이하가 있거나 중복된 경우
+        """
+        if not grades:
+            raise ValueError(f"성적 체계 {name}에 등급이 없습니다")
+
+        ordered = sorted(grades.items(), key=lambda item: -item[1])
+        points = []
+        for letter, value in ordered:
+            hundredths = round(value * 100)
+            if value < 0 or abs(value * 100 - hundredths) > 1e-6:
+                raise ValueError(f"성적 체계 {name}의 {letter} 평점({value})은 0 이상, 소수 둘째 자리까지여야 합니다")
+            points.append(hundredths)
+        if len(set(points)) != len(points):
+            raise ValueError(f"성적 체계 {name}에 평점이 같은 등급이 있습니다")
+
+        self.name = name
+        self.grades = dict(ordered)
+        self.letters = tuple(letter for letter, _ in ordered)
+        self.scale_max = ordered[0][1]
+        # 0.01 단위 정수, 높은 등급부터
+        self._points = tuple(points)
+        # 과목 수 n → (평점 합계 오름차순 배열, 합계별 GradeMix)
+        self._tables: Optional[List[Tuple[List[int], List[GradeMix]]]] = None
+        self._lock = threading.Lock()
+
+    def compile(self):
+        """과목 수별 조회 테이블 생성 (한 번만, 이후 호출은 바로 반환)"""
+        if self._tables is not None:
+            return
+        with self._lock:
+            if self._tables is None:
+                self._tables = self._build_tables()
+
+    def _build_tables(self) -> List[Tuple[List[int], List[GradeMix]]]:
+        points = self._points
+
+        # layers[n][합계] = (평점 제곱합, 마지막에 더한 등급, 이전 합계): 제곱합이 가장 작은(가장 고른) 조합
+        layers = [{0: (0, -1, 0)}]
+        for _ in range(MAX_COURSES):
+            layer = {}
+            for total, (squares, _, _) in layers[-1].items():
+                for g, p in enumerate(points):
+                    key = total + p
+                    cost = squares + p * p
+                    best = layer.get(key)
+                    if best is None or cost < best[0]:
+                        layer[key] = (cost, g, total)
+            layers.append(layer)
+
+        tables = [([], [])]
+        for n in range(1, MAX_COURSES + 1):
+            sums = sorted(layers[n])
+            mixes = []
+            for total in sums:
+                counts = [0] * len(points)
+                key = total
+                for k in range(n, 0, -1):
+                    _, g, key = layers[k][key]
+                    counts[g] += 1
+                mixes.append(GradeMix.model_construct(
+                    average=round(total / (100 * n), 2),
+                    grades={self.letters[g]: c for g, c in enumerate(counts) if c}
+                ))
+            tables.append((sums, mixes))
+        return tables
+
+    def mixes(self, required_avg: float, courses: int, limit: int = MIX_LIMIT) -> List[GradeMix]:
+        """
+        과목 수 courses로 평균 required_avg 이상이 되는 등급 조합 (평균이 낮은 순, 최대 limit개)
+
+        첫 번째가 필요 평점 이상으로 받을 수 있는 가장 낮은 이산 평균이다.
+        필요 평점이 최고 등급보다 높으면 빈 목록.
+        """
+        self.compile()
+        sums, mixes = self._tables[courses]
+        # 평균 >= required_avg ⇔ 합계 >= required_avg × n (0.01 단위 정수로 정확히 비교)
+        start = bisect_left(sums, round(required_avg * 100) * courses)
+        return mixes[start:start + limit]
+
+    def nearest(self, required_avg: float, courses: int) -> Optional[GradeMix]:
+        """필요 평점 이상으로 받을 수 있는 가장 낮은 이산 평균과 그 조합 (없으면 None)"""
+        found = self.mixes(required_avg, courses, limit=1)
+        return found[0] if found else None
+
+    def allocate(self, required_avg: float, courses: List[CourseItem]) -> List[CourseGrade]:
+        """
+        과목별 등급 배정 (학점 가중 평균이 required_avg 이상)
+
+        모든 과목에 required_avg 이하 최고 등급을 주고, 부족한 grade points만큼 일부 과목을
+        바로 위 등급으로 올린다. 올리는 과목은 초과 grade points가 가장 작고, 같으면
+        올리는 과목 수가 가장 적은 조합이며, 같은 학점의 과목끼리는 입력 순서대로 올린다.
+
+        Raises:
+            ValueError: required_avg가 최고 등급보다 높은 경우
+        """
+        points = self._points
+        required = round(required_avg * 100)
+        units = [round(c.credits * 100) for c in courses]
+
+        # required 이하 최고 등급 (없으면 최저 등급)
+        low = next((g for g, p in enumerate(points) if p <= required), len(points) - 1)
+        grades = [low] * len(courses)
+        deficit = (required - points[low]) * sum(units)
+
+        if deficit > 0:
+            if low == 0:
+                raise ValueError(f"필요 평점 {required_avg}은 성적 체계 {self.name}의 등급으로 받을 수 없습니다")
+            step = points[low - 1] - points[low]
+            # 학점을 최대공약수 단위로 줄인 학점별 묶음에서 각각 몇 과목을 올릴지 정한다
+            unit = math.gcd(*units)
+            buckets: Dict[int, List[int]] = {}
+            for i, u in enumerate(units):
+                buckets.setdefault(u // unit, []).append(i)
+            need = -(-deficit // (step * unit))
+            # 학점이 모두 다르면(1.01, 1.02, ...) 최대공약수가 0.01 단위로 줄어 DP 상태가 폭증한다
+            work = sum(len(members) + 1 for members in buckets.values()) * need
+            bump = _bump_counts if work <= MAX_BUMP_WORK else _greedy_bump_counts
+            picks = bump(list(buckets.items()), need)
+            for (_, members), count in zip(buckets.items(), picks):
+                for i in members[:count]:
+                    grades[i] = low - 1
+
+        return [
+            CourseGrade.model_construct(
+                id=c.id, credits=c.credits, grade=self.letters[g], points=self.grades[self.letters[g]]
+            )
+            for c, g in zip(courses, grades)
+        ]
+
+
+def _bump_counts(buckets: List[Tuple[int, List[int]]], need: int) -> List[int]:
+    """
+    학점 묶음별로 올릴 과목 수 (올린 학점 합계 >= need 중 합계 최소, 같으면 과목 수 최소)
+
+    (묶음 위치, 남은 부족 학점) 상태를 메모이제이션한다. 상태 수는 묶음 수 × need 이하.
+    """
+    memo: Dict[Tuple[int, int], Optional[Tuple[int, int, Tuple[int, ...]]]] = {}
+
+    def best(b: int, remaining: int):
+        if remaining <= 0:
+            return (-remaining, 0, ())
+        if b == len(buckets):
+            return None
+        key = (b, remaining)
+        if key not in memo:
+            credits, members = buckets[b]
+            found = None
+            for k in range(len(members) + 1):
+                rest = best(b + 1, remaining - k * credits)
+                if rest is not None and (found is None or (rest[0], rest[1] + k) < found[:2]):
+                    found = (rest[0], rest[1] + k, (k,) + rest[2])
+                if remaining - k * credits <= 0:
+                    break
+            memo[key] = found
+        return memo[key]
+
+    counts = list(best(0, need)[2])
+    return counts + [0] * (len(buckets) - len(counts))
+
+
+def _greedy_bump_counts(buckets: List[Tuple[int, List[int]]], need: int) -> List[int]:
+    """
+    학점 묶음별로 올릴 과목 수 (탐욕, 올린 학점 합계 >= need)
+
+    큰 학점부터 need를 넘지 않는 만큼 올리고, 남은 부족분은 남은 과목 중 가장 작은 과목 하나로 채운다
+    (남은 과목은 모두 남은 부족분보다 크다). 초과가 최소라는 보장은 없지만 O(과목 수 log 과목 수)다.
+    """
+    counts = [0] * len(buckets)
+    remaining = need
+    order = sorted(range(len(buckets)), key=lambda b: -buckets[b][0])
+    for b in order:
+        credits, members = buckets[b]
+        counts[b] = min(len(members), max(remaining, 0) // credits)
+        remaining -= counts[b] * credits
+    if remaining > 0:
+        b = next(b for b in reversed(order) if counts[b] < len(buckets[b][1]))
+        counts[b] += 1
+    return counts
+
+
+class ScaleRegistry:
+    """이름 → GradeScale (요청마다 등급표를 다시 해석하지 않도록 프로세스당 한 번 등록)"""
+
+    def __init__(self):
+        self._scales: Dict[str, GradeScale] = {}
+
+    def register(self, name: str, grades: Dict[str, float]) -> GradeScale:
+        scale = GradeScale(name, grades)
+        self._scales[name] = scale
+        return scale
+
+    def load_file(self, path: str):
+        """JSON 파일({"이름": {"등급": 평점}})의 등급표 등록 (같은 이름이면 교체)"""
+        with open(path, encoding="utf-8") as f:
+            definitions = json.load(f)
+        for name, grades in definitions.items():
+            self.register(name, grades)
+        logger.info("Loaded %d grade scales from %s", len(definitions), path)
+
+    def get(self, name: str) -> Optional[GradeScale]:
+        return self._scales.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._scales)
+
+    def compile_all(self):
+        """모든 등급표의 조회 테이블 생성 (예열)"""
+        for scale in self._scales.values():
+            scale.compile()
+
+
+def validate_grading(data: SimulationInput) -> Optional[str]:
+    """grade_scale과 학기별 courses 검증 (문제가 있으면 에러 메시지 반환)"""
+    for term in data.terms:
+        if term.courses is None:
+            continue
+        if data.grade_scale is None:
+            return "과목별 계획(courses)을 쓰려면 grade_scale을 지정해야 합니다"
+        total = sum(c.credits for c in term.courses)
+        if abs(total - term.planned_credits) > 1e-9:
+            return f"{term.id} 학기의 과목 학점 합계 ({total})가 planned_credits ({term.planned_credits})와 다릅니다"
+    if data.grade_scale is None:
+        return None
+
+    scale = scales.get(data.grade_scale)
+    if scale is None:
+        return f"알 수 없는 성적 체계입니다: {data.grade_scale} (사용 가능: {', '.join(scales.names())})"
+    if scale.scale_max != data.scale_max:
+        return f"성적 체계 {scale.name}의 최고 평점 ({scale.scale_max})이 scale_max ({data.scale_max})와 다릅니다"
+    return None
+
+
+def annotate(results: list, data: SimulationInput) -> List[GradedResultRecord]:
+    """
+    학기별 결과에 등급 조합과 과목별 등급 추가 (data는 validate_grading으로 검증된 상태)
+
+    과목별 등급은 학기 입력의 courses 전체로 학기 평균이 필요 평점 이상이 되도록 정한다
+    (Step 2에서 학기 학점이 줄어도 입력한 과목 목록 기준).
+
+    Raises:
+        ValueError: 필요 평점이 최고 등급보다 높은 학기가 있는 경우
+    """
+    scale = scales.get(data.grade_scale)
+    courses_by_term = {t.id: t.courses for t in data.terms if t.courses is not None}
+    graded = []
+    for r in results:
+        courses = course_count(r.credits, data.course_credits)
+        mixes = scale.mixes(r.required_avg, courses)
+        if not mixes:
+            raise ValueError(
+                f"{r.term_id} 학기의 필요 평점 {r.required_avg}은 성적 체계 {scale.name}의 등급으로 받을 수 없습니다"
+            )
+        term_courses = courses_by_term.get(r.term_id)
+        course_grades = scale.allocate(r.required_avg, term_courses) if term_courses is not None else None
+        graded.append(GradedResultRecord(
+            r.term_id, r.credits, r.required_avg, courses, mixes[0].average, mixes, course_grades
+        ))
+    return graded
+
+
+# 서비스 전역 등급표 (내장 + GRADE_SCALES_PATH)
+scales = ScaleRegistry()
+for _name, _grades in BUILTIN_SCALES.items():
+    scales.register(_name, _grades)
+if settings.grade_scales_path:
+    scales.load_file(settings.grade_scales_path)
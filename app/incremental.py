@@ -0,0 +1,129 @@
+"""
+GPA Simulator - 증분 재계산
+
+학기 하나의 성적이 확정되거나 계획 학점/최대 학점이 바뀔 때 입력 전체를 다시 검증하고
+집계하지 않고 누적값만 갱신한다.
+
+- 이수 이력: 총 이수 학점(C_e)과 총 grade points의 누적합 (Step 1을 O(1)에)
+- 남은 학기: 학기 ID → 위치 색인 (변경 적용 O(1))
+
+학기별 계획(Step 2~5)은 조회할 때 GPASimulator의 같은 단계로 만든다. 계획 학점 합계를 누적 트리로
+따로 유지하면 소수 학점에서 순차 합과 마지막 자리가 달라 잘리는 학기나 0학점 학기가 전체 재계산과
+달라지므로, 학점 합계는 항상 GPASimulator와 같은 순서로 순차 합산한다.
+"""
+from typing import Dict, List, Optional
+import logging
+
+from app.models import (
+    HistoryItem, SimulationInput, SimulationResult,
+    TermCompleted, PlannedCreditsChanged, MaxCreditsChanged, PlanDiff
+)
+from app.simulator import GPASimulator
+from app.records import TermRecord
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalSimulator:
+    """변경 사항을 누적값에 반영하며 학기별 필요 평점을 유지"""
+
+    def __init__(self, data: SimulationInput):
+        self.scale_max = data.scale_max
+        self.G_t = data.G_t
+        self.C_tot = data.C_tot
+        self.rounding = data.rounding
+
+        # 이수 이력 누적값 (GPASimulator와 같은 순서로 합산)
+        self.history: List[HistoryItem] = list(data.history)
+        self.C_e = sum(h.credits for h in self.history) if self.history else 0
+        self.total_grade_points = sum(h.credits * h.achieved_avg for h in self.history) if self.history else 0
+
+        # 남은 학기 (완료된 학기 위치는 None으로 비워 위치를 유지)
+        self.slots: List[Optional[TermRecord]] = [TermRecord.from_item(t) for t in data.terms]
+        self.index: Dict[str, int] = {t.id: i for i, t in enumerate(self.slots)}
+
+    def _slot(self, term_id: str) -> int:
+        i = self.index.get(term_id)
+        if i is None:
+            raise KeyError(f"남은 학기에 {term_id}가 없습니다")
+        return i
+
+    def apply(self, delta) -> None:
+        """변경 사항 하나 적용"""
+        if isinstance(delta, TermCompleted):
+            self.complete_term(delta.term_id, delta.achieved_avg, delta.credits)
+        elif isinstance(delta, PlannedCreditsChanged):
+            self.set_planned_credits(delta.term_id, delta.planned_credits)
+        elif isinstance(delta, MaxCreditsChanged):
+            self.set_max_credits(delta.term_id, delta.max_credits)
+        else:
+            raise TypeError(f"알 수 없는 변경 사항: {type(delta).__name__}")
+
+    def complete_term(self, term_id: str, achieved_avg: float, credits: Optional[float] = None):
+        """학기 성적 확정: 남은 학기에서 빼고 이수 이력에 추가"""
+        i = self._slot(term_id)
+        term = self.slots[i]
+        credits = term.planned_credits if credits is None else credits
+
+        self.history.append(HistoryItem(term_id=term_id, credits=credits, achieved_avg=achieved_avg))
+        self.C_e += credits
+        self.total_grade_points += credits * achieved_avg
+
+        self.slots[i] = None
+        del self.index[term_id]
+
+    def set_planned_credits(self, term_id: str, planned_credits: float):
+        """남은 학기의 계획 학점 변경"""
+        i = self._slot(term_id)
+        term = self.slots[i]
+        self.slots[i] = TermRecord(term.id, term.type, planned_credits, term.max_credits)
+
+    def set_max_credits(self, term_id: str, max_credits: float):
+        """남은 학기의 최대 이수 가능 학점 변경"""
+        i = self._slot(term_id)
+        term = self.slots[i]
+        self.slots[i] = TermRecord(term.id, term.type, term.planned_credits, max_credits)
+
+    def _simulator(self) -> GPASimulator:
+        terms = [t for t in self.slots if t is not None]
+        return GPASimulator(self.scale_max, self.G_t, self.C_tot, self.history, terms, self.rounding)
+
+    def plan(self) -> List[SimulationResult]:
+        """
+        현재 상태의 학기별 필요 평점
+
+        Raises:
+            ValueError: 목표 달성 불가능한 경우 (GPASimulator와 같은 메시지)
+        """
+        simulator = self._simulator()
+
+        # Step 1: 현재 상태 계산 (누적값 사용)
+        C_e = self.C_e
+        G_c = self.total_grade_points / C_e if C_e > 0 else 0
+        C_r = self.C_tot - C_e
+        g_need = (self.G_t * self.C_tot - G_c * C_e) / C_r if C_r > 0 else 0
+        if C_r <= 0 or g_need < 0 or g_need > self.scale_max:
+            # 실패 메시지는 단건 경로에서 생성
+            simulator._calculate_current_state()
+
+        # Step 2~5: 전체 재계산과 같은 단계 (학점 합계의 부동소수점 결과까지 같도록)
+        simulator._adjust_remaining_credits(C_r)
+        term_plans = simulator._initial_distribution(g_need)
+        term_plans = simulator._water_filling_adjustment(term_plans, C_r, g_need)
+        return [r.to_model() for r in simulator._round_and_adjust(term_plans, G_c, C_e)]
+
+
+def diff_plans(previous: List[SimulationResult], current: List[SimulationResult]) -> PlanDiff:
+    """이전 계획 대비 바뀐 학기만 추림"""
+    before = {r.term_id: r for r in previous}
+    after_ids = {r.term_id for r in current}
+
+    diff = PlanDiff()
+    for r in current:
+        old = before.get(r.term_id)
+        if old is None:
+            diff.added.append(r)
+        elif old.credits != r.credits or old.required_avg != r.required_avg:
+            diff.changed.append(r)
+    diff.removed = [r.term_id for r in previous if r.term_id not in after_ids]
+    return diff
@@ -0,0 +1,88 @@
+"""
+로깅 설정
+
+요청마다 한 줄의 요약 로그만 남기고, 단계별 상세 추적 로그는
+디버그 플래그(LOG_TRACE)나 샘플링된 요청 ID에서만 남긴다.
+상세 로그는 추적이 꺼져 있으면 문자열을 만들지 않는다.
+"""
+from contextvars import ContextVar
+from typing import Optional
+import json
+import logging
+import zlib
+
+# 현재 요청의 상세 추적 여부
+_trace: ContextVar[bool] = ContextVar("gpa_trace", default=False)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_trace_all = False
+_trace_sample_rate = 0.0
+
+
+class TextFormatter(logging.Formatter):
+    """기본 텍스트 포맷 + 요약 필드는 한 줄 JSON으로 덧붙임"""
+
+    def __init__(self):
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line = f"{line} {json.dumps(fields, ensure_ascii=False, separators=(',', ':'))}"
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 출력"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+def configure_logging(settings) -> None:
+    """설정에 맞게 루트 로거 구성"""
+    global _trace_all, _trace_sample_rate
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter() if settings.log_format == "json" else TextFormatter())
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(settings.log_level.upper())
+
+    _trace_all = settings.log_trace or root.isEnabledFor(logging.DEBUG)
+    _trace_sample_rate = settings.log_trace_sample_rate
+
+
+def is_sampled(request_id: Optional[str]) -> bool:
+    """요청 ID 기반 샘플링 (같은 ID는 항상 같은 결과)"""
+    if not request_id or _trace_sample_rate <= 0:
+        return False
+    return zlib.crc32(request_id.encode("utf-8")) % 10000 < _trace_sample_rate * 10000
+
+
+def start_trace(request_id: Optional[str] = None, force: bool = False):
+    """현재 요청의 상세 추적 여부 설정 (reset_trace에 넘길 토큰 반환)"""
+    return _trace.set(_trace_all or force or is_sampled(request_id))
+
+
+def reset_trace(token) -> None:
+    _trace.reset(token)
+
+
+def trace_enabled() -> bool:
+    """현재 요청에서 상세 추적 로그를 남기는지 여부"""
+    return _trace.get() or _trace_all
@@ -4,23 +4,51 @@ GPA Simulator FastAPI Application
 import sys
 from pathlib import Path
 
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 프로젝트 루트를 Python 경로에 추가 (python app/main.py로 직접 실행할 때)
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Header, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional, Union
+import asyncio
 import logging
+import time
 
-from app.models import SimulationInput, SimulationResult, ErrorResponse
-from app.simulator import GPASimulator
+from app.models import (
+    SimulationInput, SimulationResult, GradedSimulationResult, GradeScaleInfo, ErrorResponse,
+    BatchSimulationInput, BatchSimulationItem, StreamSimulationItem,
+    SweepInput, SweepResult,
+    OptimizeInput, OptimizeResult,
+    RiskInput, RiskResult, RiskBatchInput, RiskBatchItem,
+    FeasibilityResult, StoredPlan, PlanVersion,
+    RetakeInput, RetakeResult, RetakeSearchInput, RetakeSearchResult,
+    IncrementalInput, IncrementalResult,
+    ScenarioInput, ScenarioComparison
+)
+from app.records import ResultRecord, results_to_json
+from app.responses import FastJSONResponse
+from app.cache import create_result_cache, canonical_key
+from app.executor import create_executor, ExecutorSaturated
+from app.streaming import simulate_stream, NDJSONStreamingResponse, NDJSON_MEDIA_TYPE
+from app import tasks
+from app.feasibility import check_feasibility
+from app.scenarios import split_scenarios
+from app.grading import scales
+from app.plan_store import create_plan_store
+from app.admission import AdmissionMiddleware, create_admission_control
+from app.metrics import metrics, MetricsMiddleware, cache_collector, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.config import settings
+from app.logging_config import configure_logging, start_trace, reset_trace, trace_enabled
+from app.warmup import warm_up
 
 # 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging(settings)
 logger = logging.getLogger(__name__)
 
 # FastAPI 앱 생성
@@ -30,6 +58,24 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 시뮬레이션 결과 캐시
+result_cache = create_result_cache(settings)
+metrics.register_collector(cache_collector(result_cache))
+
+# 시뮬레이션 실행 풀 (이벤트 루프를 막지 않도록, 대기열 초과 시 503)
+executor = create_executor(settings)
+metrics.register_collector(executor.collector())
+
+# 학생별 계획 저장소 (PLAN_STORE_BACKEND=none이면 비활성화, 종료 시 남은 쓰기 기록)
+plan_store = create_plan_store(settings)
+if plan_store is not None:
+    app.router.add_event_handler("shutdown", plan_store.close)
+
+# 요청 수락 제어 (본문 크기 413, 클라이언트별 속도/동시 요청 429). JSON 파싱 전에 거절한다
+admission = create_admission_control(settings)
+metrics.register_collector(admission.collector())
+app.add_middleware(AdmissionMiddleware, control=admission)
+
 # CORS 설정 (NestJS 백엔드와의 통신을 위해)
 app.add_middleware(
     CORSMiddleware,
@@ -39,6 +85,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 수/처리 시간 메트릭 (엔드포인트, 상태 코드별)
+app.add_middleware(MetricsMiddleware, registry=metrics, routes=app.routes)
+
+
+@app.exception_handler(RequestValidationError)
+async def _validation_error(request: Request, exc: RequestValidationError):
+    """입력 검증 실패 → 422 (목록 길이 초과는 넘친 목록 전체를 응답에 되돌려 주지 않는다)"""
+    errors = [
+        {k: v for k, v in error.items() if k != "input"} if error["type"] == "too_long" else error
+        for error in exc.errors()
+    ]
+    return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content={"detail": jsonable_encoder(errors)})
+
+
+def _saturated(e: ExecutorSaturated) -> HTTPException:
+    """실행 풀 포화 → 503 + Retry-After"""
+    logger.warning("Executor saturated: retry after %ds", e.retry_after)
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
 
 @app.get("/")
 async def root():
@@ -56,13 +125,68 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+def readiness_check():
+    """
+    준비 상태 확인 (/health와 별도)
+
+    처음 호출될 때 요청 모델 검증과 시뮬레이터 경로, 실행 풀 워커를 예열한 뒤 200을 반환한다.
+    오케스트레이터의 readiness probe로 사용하면 예열이 끝난 뒤 트래픽을 받는다.
+    """
+    timings = warm_up()
+    executor.warm_up()
+    return {"status": "ready", "warmup": timings}
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """결과 캐시 통계 (hit/miss, 크기, eviction 수)"""
+    return result_cache.stats()
+
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus 텍스트 형식 메트릭 (다중 워커면 모든 워커 합산)"""
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/scales", response_model=List[GradeScaleInfo])
+async def list_scales() -> FastJSONResponse:
+    """등록된 성적 체계 목록 (grade_scale에 쓸 수 있는 이름과 등급표)"""
+    return FastJSONResponse([
+        GradeScaleInfo(name=name, scale_max=scale.scale_max, grades=scale.grades)
+        for name, scale in ((name, scales.get(name)) for name in scales.names())
+    ])
+
+
+@app.get("/simulate/feasibility", response_model=FeasibilityResult)
+async def simulate_feasibility(
+    scale_max: float = Query(..., gt=0, description="평점 최대값"),
+    C_tot: float = Query(..., gt=0, description="졸업 요구 총 학점"),
+    C_e: float = Query(default=0, ge=0, description="이수 완료 학점 (history credits 합계)"),
+    grade_points: float = Query(default=0, ge=0, description="이수 완료 grade points (credits × achieved_avg 합계)"),
+    G_t: Optional[float] = Query(default=None, gt=0, description="목표 GPA (생략하면 달성 가능 범위만 계산)")
+) -> FeasibilityResult:
+    """
+    목표 GPA 달성 가능 여부 빠른 확인 (목표 입력 중 키 입력마다 호출)
+
+    학기 목록 없이 학생별 이수 이력 집계만으로 O(1)에 계산하며,
+    판정과 메시지는 같은 목표로 /simulate를 호출한 결과(200/400/422)와 같다.
+    실행 풀을 거치지 않는다.
+
+    Returns:
+        달성 가능 여부, 달성 가능한 GPA 범위, 필요 평균 평점, 필요한 추가 계절학기 학점
+    """
+    return FastJSONResponse(check_feasibility(scale_max, C_tot, C_e, grade_points, G_t))
+
+
 @app.post(
     "/simulate",
-    response_model=List[SimulationResult],
+    response_model=List[Union[GradedSimulationResult, SimulationResult]],
     responses={
         200: {
-            "description": "시뮬레이션 성공",
-            "model": List[SimulationResult]
+            "description": "시뮬레이션 성공 (grade_scale을 지정하면 학기별 등급 조합 포함)",
+            "model": List[Union[GradedSimulationResult, SimulationResult]]
         },
         400: {
             "description": "입력 데이터 검증 실패",
@@ -75,10 +199,18 @@ async def health_check():
         500: {
             "description": "내부 서버 오류",
             "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
         }
     }
 )
-async def simulate_gpa(data: SimulationInput) -> List[SimulationResult]:
+async def simulate_gpa(
+    data: SimulationInput,
+    x_request_id: Optional[str] = Header(default=None),
+    x_debug_trace: bool = Header(default=False)
+) -> Response:
     """
     GPA 시뮬레이션 실행
 
@@ -89,85 +221,780 @@ async def simulate_gpa(data: SimulationInput) -> List[SimulationResult]:
             - C_tot: 졸업 요구 총 학점
             - history: 이수 완료 학기 목록
             - terms: 남은 학기 목록
+            - grade_scale: 성적 체계 이름 (선택, 지정하면 학기별 등급 조합 포함)
+        x_request_id: 요청 ID (로그 요약 및 추적 샘플링에 사용)
+        x_debug_trace: true이면 이 요청의 단계별 상세 로그 출력
 
     Returns:
-        각 학기별 필요 평점 리스트
+        각 학기별 필요 평점 리스트 (내부 레코드를 응답 모델 검증 없이 바로 JSON으로 직렬화)
 
     Raises:
         HTTPException: 입력 검증 실패 또는 계산 불가능한 경우
     """
-    # 입력 데이터 로깅
+    started = time.perf_counter()
+    token = start_trace(x_request_id, force=x_debug_trace)
+    summary = {
+        "request_id": x_request_id,
+        "G_t": data.G_t,
+        "C_tot": data.C_tot,
+        "scale_max": data.scale_max,
+        "history_terms": len(data.history),
+        "remaining_terms": len(data.terms),
+    }
+    status_code = status.HTTP_200_OK
+
+    try:
+        if trace_enabled():
+            _trace_request(data)
+
+        # 입력 검증
+        error = tasks.validate_input(data)
+        if error is not None:
+            status_code = status.HTTP_400_BAD_REQUEST
+            raise HTTPException(
+                status_code=status_code,
+                detail=error
+            )
+
+        try:
+            # 실행 풀에서 시뮬레이션 (같은 입력의 결과는 캐시에서 반환)
+            results = await result_cache.get_or_compute_async(data, lambda: executor.run(tasks.simulate, data))
+
+            if trace_enabled():
+                _trace_results(results)
+            summary["result_terms"] = len(results)
+
+            return Response(content=results_to_json(results), media_type="application/json")
+
+        except ExecutorSaturated as e:
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            raise _saturated(e)
+
+        except ValueError as e:
+            # 목표 달성 불가능한 경우
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+            logger.warning("Simulation failed: %s", e)
+            raise HTTPException(
+                status_code=status_code,
+                detail=str(e)
+            )
+
+        except Exception as e:
+            # 예상치 못한 오류
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            raise HTTPException(
+                status_code=status_code,
+                detail=f"내부 서버 오류: {str(e)}"
+            )
+
+    finally:
+        reset_trace(token)
+        summary["status"] = status_code
+        summary["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        logger.info("simulate", extra={"fields": summary})
+
+
+def _trace_request(data: SimulationInput):
+    """입력 데이터 상세 로그 (추적이 켜진 요청에서만 호출)"""
     logger.info("="*80)
     logger.info("📥 [REQUEST] 백엔드로 들어온 데이터:")
-    logger.info(f"  - 목표 GPA (G_t): {data.G_t}")
-    logger.info(f"  - 졸업 총 학점 (C_tot): {data.C_tot}")
-    logger.info(f"  - 평점 최대값 (scale_max): {data.scale_max}")
-    logger.info(f"  - 완료된 학기 수: {len(data.history)}")
-    logger.info(f"  - 남은 학기 수: {len(data.terms)}")
+    logger.info("  - 목표 GPA (G_t): %s", data.G_t)
+    logger.info("  - 졸업 총 학점 (C_tot): %s", data.C_tot)
+    logger.info("  - 평점 최대값 (scale_max): %s", data.scale_max)
+    logger.info("  - 완료된 학기 수: %d", len(data.history))
+    logger.info("  - 남은 학기 수: %d", len(data.terms))
 
     # History 상세 로깅
     logger.info("\n📚 [HISTORY] 완료된 학기 상세:")
     for i, h in enumerate(data.history):
-        logger.info(f"  [{i+1}] {h.term_id}: {h.credits}학점, 평균 {h.achieved_avg}")
+        logger.info("  [%d] %s: %s학점, 평균 %s", i + 1, h.term_id, h.credits, h.achieved_avg)
 
     # Terms 상세 로깅
     logger.info("\n📝 [TERMS] 남은 학기 상세:")
     for i, t in enumerate(data.terms):
-        logger.info(f"  [{i+1}] {t.id} ({t.type}): 계획 {t.planned_credits}학점, 최대 {t.max_credits}학점")
+        logger.info("  [%d] %s (%s): 계획 %s학점, 최대 %s학점", i + 1, t.id, t.type, t.planned_credits, t.max_credits)
     logger.info("="*80)
 
-    # 입력 검증
-    if data.G_t > data.scale_max:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"목표 GPA ({data.G_t})가 최대 평점 ({data.scale_max})을 초과합니다"
-        )
 
-    if data.G_t <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="목표 GPA는 0보다 커야 합니다"
-        )
+def _trace_results(results: List[ResultRecord]):
+    """결과 상세 로그 (추적이 켜진 요청에서만 호출)"""
+    logger.info("\n" + "="*80)
+    logger.info("✅ [RESULT] 시뮬레이션 완료")
+    logger.info("  총 %d개 학기 계획:", len(results))
+    for i, r in enumerate(results):
+        logger.info("  [%d] %s: %s학점, 필요 평균 %s점", i + 1, r.term_id, r.credits, r.required_avg)
+    logger.info("="*80 + "\n")
+
+
+@app.post(
+    "/simulate/batch",
+    response_model=List[BatchSimulationItem],
+    responses={
+        200: {
+            "description": "배치 시뮬레이션 완료 (학생별 성공/실패는 status_code로 구분)",
+            "model": List[BatchSimulationItem]
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_gpa_batch(data: BatchSimulationInput) -> FastJSONResponse:
+    """
+    여러 학생의 GPA 시뮬레이션을 한 번에 실행
+
+    학생별 결과는 단건 /simulate 호출과 동일하며, 실패한 학생은
+    해당 HTTP 상태 코드와 에러 메시지를 담아 반환한다.
+
+    Args:
+        data: 학생별 시뮬레이션 입력 목록
+
+    Returns:
+        입력 순서대로 학생별 시뮬레이션 결과
+    """
+    started = time.perf_counter()
+
+    items: List[Optional[BatchSimulationItem]] = [None] * len(data.inputs)
+    valid_indices = []
+    for i, record in enumerate(data.inputs):
+        error = tasks.validate_input(record)
+        if error is not None:
+            items[i] = BatchSimulationItem(index=i, status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+        else:
+            valid_indices.append(i)
+
+    if valid_indices:
+        try:
+            outcomes = await executor.run(tasks.simulate_batch, [data.inputs[i] for i in valid_indices])
+        except ExecutorSaturated as e:
+            raise _saturated(e)
+        for i, outcome in zip(valid_indices, outcomes):
+            if isinstance(outcome, ValueError):
+                items[i] = BatchSimulationItem(
+                    index=i, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(outcome)
+                )
+            elif isinstance(outcome, Exception):
+                logger.error("Unexpected error in batch record %d: %s", i, outcome)
+                items[i] = BatchSimulationItem(
+                    index=i, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"내부 서버 오류: {str(outcome)}"
+                )
+            else:
+                items[i] = BatchSimulationItem(index=i, status_code=status.HTTP_200_OK, results=outcome)
+
+    failed = sum(1 for item in items if item.status_code != status.HTTP_200_OK)
+    logger.info("simulate_batch", extra={"fields": {
+        "records": len(items),
+        "failed": failed,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }})
+
+    return FastJSONResponse(items)
+
+
+@app.post(
+    "/simulate/stream",
+    response_class=NDJSONStreamingResponse,
+    responses={
+        200: {
+            "description": "입력 줄마다 결과 한 줄 (NDJSON, 학생별 성공/실패는 status_code로 구분)",
+            "model": StreamSimulationItem
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "description": "한 줄에 StreamSimulationInput(SimulationInput + key) 하나씩",
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}}
+        }
+    }
+)
+async def simulate_gpa_stream(request: Request) -> NDJSONStreamingResponse:
+    """
+    NDJSON 스트리밍 시뮬레이션 (학적 전체 재계산용)
+
+    요청 본문을 받는 대로 줄 단위로 읽어 청크(최대 STREAM_CHUNK_SIZE개)마다 실행 풀에서
+    계산하고, 입력 줄마다 {"key", "line", "status_code", "results" 또는 "detail"} 한 줄을 바로 보낸다.
+    업로드가 끝나기 전에 첫 결과가 나가며, 메모리 사용량은 학생 수와 무관하다.
+    클라이언트는 업로드하면서 응답을 함께 읽어야 한다.
+
+    Returns:
+        입력 순서대로 레코드별 결과 줄
+    """
+    if executor.is_saturated():
+        raise _saturated(ExecutorSaturated(executor.retry_after()))
+
+    return NDJSONStreamingResponse(simulate_stream(
+        request.stream(),
+        run_chunk=lambda inputs: executor.run(tasks.simulate_batch, inputs),
+        chunk_size=settings.stream_chunk_size,
+        max_line_bytes=settings.stream_max_line_bytes
+    ))
+
+
+@app.post(
+    "/simulate/sweep",
+    response_model=SweepResult,
+    responses={
+        200: {
+            "description": "목표 GPA별 시뮬레이션 완료 (달성 불가능한 목표는 feasible=false)",
+            "model": SweepResult
+        },
+        400: {
+            "description": "입력 데이터 검증 실패",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_gpa_sweep(data: SweepInput) -> FastJSONResponse:
+    """
+    여러 목표 GPA에 대한 학기별 필요 평점을 한 번에 계산
+
+    이수 이력 집계와 water-filling 구조는 한 번만 계산하고 목표마다 재사용한다.
+    각 행의 결과는 같은 목표로 /simulate를 호출한 결과와 동일하다.
+
+    Args:
+        data: 이수 이력, 남은 학기 계획, 목표 GPA 목록(targets) 또는 범위(G_t_min, G_t_max, G_t_step)
+
+    Returns:
+        학기 구성, 달성 가능한 GPA 범위, 목표별 학기 필요 평점 행렬
+    """
+    error = tasks.validate_input(data)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    started = time.perf_counter()
+    targets = data.target_list()
 
     try:
-        # 시뮬레이터 생성 및 실행
-        simulator = GPASimulator(
-            scale_max=data.scale_max,
-            G_t=data.G_t,
-            C_tot=data.C_tot,
-            history=data.history,
-            terms=data.terms
-        )
+        result = await executor.run(tasks.sweep, data, targets)
+    except ExecutorSaturated as e:
+        raise _saturated(e)
+
+    logger.info("simulate_sweep", extra={"fields": {
+        "targets": len(targets),
+        "feasible": sum(1 for row in result.rows if row.feasible),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }})
+
+    return FastJSONResponse(result)
+
+
+@app.post(
+    "/simulate/optimize",
+    response_model=OptimizeResult,
+    responses={
+        200: {
+            "description": "최적화 성공",
+            "model": OptimizeResult
+        },
+        400: {
+            "description": "입력 데이터 검증 실패",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "목표 GPA 달성 불가능",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_gpa_optimize(data: OptimizeInput) -> FastJSONResponse:
+    """
+    학점 재분배 최적화
 
-        results = simulator.simulate()
+    학기별 학점(0 ~ max_credits)과 필요 평점(0 ~ scale_max)을 함께 정해
+    가장 높은 (난이도 가중) 필요 평점 또는 필요 평점 제곱합을 최소화한다.
+    최대 학점 초과분은 계절학기를 추가하는 대신 여유 있는 학기로 옮긴다.
 
-        # 결과 로깅
-        logger.info("\n" + "="*80)
-        logger.info("✅ [RESULT] 시뮬레이션 완료")
-        logger.info(f"  총 {len(results)}개 학기 계획:")
-        for i, r in enumerate(results):
-            logger.info(f"  [{i+1}] {r.term_id}: {r.credits}학점, 필요 평균 {r.required_avg}점")
-        logger.info("="*80 + "\n")
+    Args:
+        data: 시뮬레이션 입력과 최적화 옵션
+            - objective: peak(최고 평점 최소화, 기본값) 또는 variance(제곱합 최소화, 학점 계획 유지)
+            - weights: 학기 ID별 난이도 가중치 (기본 1, 클수록 낮은 평점 배정)
 
-        return results
+    Returns:
+        최적화한 학기별 학점/필요 평점과 같은 입력의 /simulate 결과
+    """
+    error = tasks.validate_input(data)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    try:
+        return FastJSONResponse(await executor.run(tasks.optimize, data))
+    except ExecutorSaturated as e:
+        raise _saturated(e)
     except ValueError as e:
-        # 목표 달성 불가능한 경우
-        logger.warning(f"Simulation failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
+        logger.warning("Optimization failed: %s", e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+@app.post(
+    "/simulate/risk",
+    response_model=RiskResult,
+    responses={
+        200: {
+            "description": "목표 달성 확률 계산 완료",
+            "model": RiskResult
+        },
+        400: {
+            "description": "입력 데이터 검증 실패",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "목표 GPA 달성 불가능",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_gpa_risk(data: RiskInput) -> FastJSONResponse:
+    """
+    학기별 계획의 목표 GPA 달성 확률 (Monte Carlo)
+
+    /simulate와 같은 학기별 계획에서 학기별 실제 평점을 이수 이력으로 추정한 분포
+    (학기마다 독립인 정규분포, [0, scale_max]로 자름)에서 draws번 뽑아 졸업 GPA 분포를 계산한다.
+
+    Args:
+        data: 시뮬레이션 입력과 Monte Carlo 옵션
+            - draws: 표본 수 (기본 100,000)
+            - seed: 난수 시드 (기본 0)
+            - mean, std: 학기 평점 분포 (기본: 이수 이력에서 추정)
+
+    Returns:
+        성공 확률, 졸업 GPA 분위수, 학기별 달성 확률과 민감도, 가장 민감한 학기
+    """
+    error = tasks.validate_input(data)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    try:
+        return FastJSONResponse(await executor.run(tasks.risk, data))
+    except ExecutorSaturated as e:
+        raise _saturated(e)
+    except ValueError as e:
+        logger.warning("Risk simulation failed: %s", e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
 
-    except Exception as e:
-        # 예상치 못한 오류
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+@app.post(
+    "/simulate/risk/batch",
+    response_model=List[RiskBatchItem],
+    responses={
+        200: {
+            "description": "학생별 목표 달성 확률 (학생별 성공/실패는 status_code로 구분)",
+            "model": List[RiskBatchItem]
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_gpa_risk_batch(data: RiskBatchInput) -> FastJSONResponse:
+    """
+    여러 학생의 목표 GPA 달성 확률을 한 번에 계산 (학년/학과 단위 위험군 파악용)
+
+    학생별 결과는 같은 입력으로 /simulate/risk를 호출한 결과와 동일하며, 실패한 학생은
+    해당 HTTP 상태 코드와 에러 메시지를 담아 반환한다.
+
+    Args:
+        data: 학생별 목표 달성 확률 입력 목록
+
+    Returns:
+        입력 순서대로 학생별 결과
+    """
+    started = time.perf_counter()
+
+    items: List[Optional[RiskBatchItem]] = [None] * len(data.inputs)
+    valid_indices = []
+    for i, record in enumerate(data.inputs):
+        error = tasks.validate_input(record)
+        if error is not None:
+            items[i] = RiskBatchItem(index=i, status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+        else:
+            valid_indices.append(i)
+
+    if valid_indices:
+        try:
+            outcomes = await executor.run(tasks.risk_batch, [data.inputs[i] for i in valid_indices])
+        except ExecutorSaturated as e:
+            raise _saturated(e)
+        for i, outcome in zip(valid_indices, outcomes):
+            if isinstance(outcome, ValueError):
+                items[i] = RiskBatchItem(
+                    index=i, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(outcome)
+                )
+            elif isinstance(outcome, Exception):
+                logger.error("Unexpected error in risk batch record %d: %s", i, outcome)
+                items[i] = RiskBatchItem(
+                    index=i, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"내부 서버 오류: {str(outcome)}"
+                )
+            else:
+                items[i] = RiskBatchItem(index=i, status_code=status.HTTP_200_OK, result=outcome)
+
+    logger.info("simulate_risk_batch", extra={"fields": {
+        "records": len(items),
+        "failed": sum(1 for item in items if item.status_code != status.HTTP_200_OK),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }})
+
+    return FastJSONResponse(items)
+
+
+@app.post(
+    "/simulate/incremental",
+    response_model=IncrementalResult,
+    responses={
+        200: {
+            "description": "변경 사항 적용 완료",
+            "model": IncrementalResult
+        },
+        400: {
+            "description": "입력 데이터 검증 실패 또는 없는 학기 ID",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "변경 후 목표 GPA 달성 불가능",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_gpa_incremental(data: IncrementalInput) -> FastJSONResponse:
+    """
+    학기 성적 확정, 계획 학점/최대 학점 변경을 이전 계획에 반영
+
+    Args:
+        data: 이전 계획의 입력(base)과 순서대로 적용할 변경 사항(deltas)
+            - term_completed: 학기 성적 확정 (남은 학기 → 이수 이력)
+            - planned_credits_changed: 계획 학점 변경
+            - max_credits_changed: 최대 이수 가능 학점 변경
+
+    Returns:
+        변경 후 학기별 필요 평점과 이전 계획 대비 바뀐 학기 (바뀐 카드만 갱신할 수 있도록)
+    """
+    error = tasks.validate_input(data.base)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    try:
+        results, diff = await executor.run(tasks.incremental, data)
+    except ExecutorSaturated as e:
+        raise _saturated(e)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.args[0])
+    except ValueError as e:
+        logger.warning("Incremental simulation failed: %s", e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    return FastJSONResponse(IncrementalResult(results=results, diff=diff))
+
+
+@app.post(
+    "/simulate/scenarios",
+    response_model=ScenarioComparison,
+    responses={
+        200: {
+            "description": "시나리오 비교 완료 (잘못된 변경이나 달성 불가능한 시나리오는 행별 status_code와 detail)",
+            "model": ScenarioComparison
+        },
+        400: {
+            "description": "기준 입력 검증 실패",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "기준 입력의 목표 GPA 달성 불가능 (학기 계획과 무관하므로 모든 시나리오에 공통)",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_gpa_scenarios(data: ScenarioInput) -> FastJSONResponse:
+    """
+    학기 계획 변경 시나리오를 기준 계획과 비교 ("S5 21학점", "계절학기 추가", "S8 12학점" 등)
+
+    이수 이력 집계와 목표 달성 가능 여부는 한 번만 계산하고, 시나리오마다 변경을 적용한
+    학기 목록으로 학점 보정, water-filling, 라운딩만 다시 실행한다. process 실행 모드에서는
+    시나리오를 구간으로 나눠 실행 풀 워커에서 병렬로 계산한다.
+
+    Args:
+        data: 기준 입력(base)과 시나리오 목록 (이름, 순서대로 적용할 변경)
+            - planned_credits_changed: 계획 학점 변경
+            - max_credits_changed: 최대 이수 가능 학점 변경
+            - term_added: 학기 추가 (after 학기 뒤 또는 맨 뒤)
+            - term_removed: 학기 삭제
+
+    Returns:
+        공통 현재 GPA/필요 평균 평점과 기준 계획, 시나리오별 최고 필요 평점, 추가 계절학기 학점, 달성 가능 여부
+    """
+    started = time.perf_counter()
+    error = tasks.validate_input(data.base)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    # 스레드 풀은 GIL 때문에 나눠도 빨라지지 않으므로 process 모드에서만 워커 수만큼 나눈다.
+    # Step 1(이력 집계)도 실행 풀에서 계산한다. 구간마다 다시 계산하고 기준 계획 행도 만들지만
+    # 구간당 시나리오가 64개 이상이라 그 비용은 작다
+    parts = executor.workers if executor.mode == "process" else 1
+    chunks = split_scenarios(data.scenarios, parts)
+    try:
+        outcomes = await asyncio.gather(*(
+            executor.run(tasks.compare_scenarios, data.base, chunk, data.include_results) for chunk in chunks
+        ))
+    except ExecutorSaturated as e:
+        raise _saturated(e)
+    except ValueError as e:
+        logger.warning("Scenario comparison failed: %s", e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    result = outcomes[0]
+    for outcome in outcomes[1:]:
+        result.scenarios.extend(outcome.scenarios)
+    logger.info("simulate_scenarios", extra={"fields": {
+        "scenarios": len(data.scenarios),
+        "feasible": sum(1 for row in result.scenarios if row.feasible),
+        "chunks": len(chunks),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }})
+
+    return FastJSONResponse(result)
+
+
+@app.post(
+    "/simulate/retakes",
+    response_model=RetakeResult,
+    responses={
+        200: {
+            "description": "재수강을 반영한 계획",
+            "model": RetakeResult
+        },
+        400: {
+            "description": "입력 데이터 검증 실패 또는 이력에 없는 과목 ID",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "재수강 반영 후에도 목표 GPA 달성 불가능",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def simulate_retakes(data: RetakeInput) -> FastJSONResponse:
+    """
+    재수강(성적 대체)을 반영한 GPA 시뮬레이션
+
+    Args:
+        data: /simulate 입력 + 재수강 목록 (history[].courses의 과목 ID와 재수강 평점)
+
+    Returns:
+        재수강별 효과, 반영 후 현재 GPA와 균등 필요 평점, 학기별 필요 평점
+    """
+    error = tasks.validate_retakes(data)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    try:
+        return FastJSONResponse(await executor.run(tasks.retake, data))
+    except ExecutorSaturated as e:
+        raise _saturated(e)
+    except ValueError as e:
+        logger.warning("Retake simulation failed: %s", e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+@app.post(
+    "/simulate/retakes/best",
+    response_model=RetakeSearchResult,
+    responses={
+        200: {
+            "description": "재수강 후보 순위와 가장 적은 재수강 조합",
+            "model": RetakeSearchResult
+        },
+        400: {
+            "description": "입력 데이터 검증 실패",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "이미 졸업 요구 학점을 충족함",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "실행 풀 포화 (Retry-After 초 후 재시도)",
+            "model": ErrorResponse
+        }
+    }
+)
+async def search_retakes(data: RetakeSearchInput) -> FastJSONResponse:
+    """
+    목표 GPA에 필요한 가장 적은 재수강 탐색
+
+    이력의 과목별 성적을 재수강 예상 평점으로 바꿀 때의 grade points 증가량으로 후보를 순위 매기고,
+    남은 학기 균등 필요 평점이 max_required_avg 이하가 되는 가장 적은 과목을 고른다.
+
+    Args:
+        data: /simulate 입력 + retake_grade, eligible_max, max_retakes, max_required_avg, limit
+
+    Returns:
+        재수강 전 상태, 후보 순위, 고른 과목과 반영한 계획
+    """
+    error = tasks.validate_retakes(data)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    try:
+        return FastJSONResponse(await executor.run(tasks.retake_search, data))
+    except ExecutorSaturated as e:
+        raise _saturated(e)
+    except ValueError as e:
+        logger.warning("Retake search failed: %s", e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+def _require_plan_store():
+    if plan_store is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"내부 서버 오류: {str(e)}"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="계획 저장소가 비활성화되어 있습니다 (PLAN_STORE_BACKEND)"
         )
+    return plan_store
+
+
+def _plan_not_found(student_key: str, version: Optional[int] = None) -> HTTPException:
+    target = student_key if version is None else f"{student_key} 버전 {version}"
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"저장된 계획이 없습니다: {target}")
+
+
+@app.put(
+    "/plans/{student_key}",
+    response_model=StoredPlan,
+    responses={
+        200: {
+            "description": "저장된 계획 (입력이 같으면 다시 계산하지 않음)",
+            "model": StoredPlan
+        },
+        400: {
+            "description": "입력 데이터 검증 실패",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "목표 GPA 달성 불가능 (저장하지 않음)",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "계획 저장소 비활성화 또는 실행 풀 포화",
+            "model": ErrorResponse
+        }
+    }
+)
+async def save_plan(student_key: str, data: SimulationInput) -> Response:
+    """
+    학생의 계획 계산 및 저장
+
+    최신 버전의 입력 해시가 요청과 같으면 저장된 계획을 그대로 반환하고(recomputed=false),
+    입력이 바뀐 경우에만 /simulate와 같은 계산을 한 뒤 새 버전으로 저장한다.
+
+    Args:
+        student_key: 학생 키 (예: 학번)
+        data: /simulate와 같은 시뮬레이션 입력
+
+    Returns:
+        저장된 계획 (버전, 입력 해시, 저장 시각, 학기별 필요 평점)
+    """
+    store = _require_plan_store()
+    error = tasks.validate_input(data)
+    if error is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+    input_hash = canonical_key(data)
+    snapshot = store.peek(student_key)
+    if snapshot is None:
+        snapshot = await run_in_threadpool(store.latest, student_key)
+    if snapshot is not None and snapshot.input_hash == input_hash:
+        return Response(content=snapshot.to_json(recomputed=False), media_type="application/json")
+
+    try:
+        results = await result_cache.get_or_compute_async(data, lambda: executor.run(tasks.simulate, data))
+    except ExecutorSaturated as e:
+        raise _saturated(e)
+    except ValueError as e:
+        logger.warning("Plan simulation failed: %s", e)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    snapshot, recomputed = await run_in_threadpool(
+        store.save, student_key, input_hash, data.model_dump_json(), results_to_json(results).decode("utf-8")
+    )
+    return Response(content=snapshot.to_json(recomputed=recomputed), media_type="application/json")
+
+
+@app.get(
+    "/plans/{student_key}",
+    response_model=StoredPlan,
+    responses={404: {"description": "저장된 계획 없음", "model": ErrorResponse}}
+)
+async def get_plan(student_key: str) -> Response:
+    """학생의 최신 계획 (다시 계산하지 않음)"""
+    store = _require_plan_store()
+    snapshot = store.peek(student_key)
+    if snapshot is None:
+        snapshot = await run_in_threadpool(store.latest, student_key)
+    if snapshot is None:
+        raise _plan_not_found(student_key)
+    return Response(content=snapshot.to_json(recomputed=False), media_type="application/json")
+
+
+@app.get("/plans/{student_key}/versions", response_model=List[PlanVersion])
+async def list_plan_versions(student_key: str) -> FastJSONResponse:
+    """학생의 저장된 계획 버전 목록 (오래된 순)"""
+    store = _require_plan_store()
+    snapshots = await run_in_threadpool(store.versions, student_key)
+    return FastJSONResponse([
+        PlanVersion(version=s.version, input_hash=s.input_hash, created_at=s.created_at) for s in snapshots
+    ])
+
+
+@app.get(
+    "/plans/{student_key}/versions/{version}",
+    response_model=StoredPlan,
+    responses={404: {"description": "저장된 버전 없음", "model": ErrorResponse}}
+)
+async def get_plan_version(student_key: str, version: int) -> Response:
+    """학생의 지정한 버전 계획"""
+    store = _require_plan_store()
+    snapshot = await run_in_threadpool(store.get, student_key, version)
+    if snapshot is None:
+        raise _plan_not_found(student_key, version)
+    return Response(content=snapshot.to_json(recomputed=False), media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app, host="0.0.0.0", port=8000, http="httptools", loop="uvloop",
+        timeout_keep_alive=settings.keep_alive_timeout, backlog=settings.backlog
+    )
@@ -0,0 +1,399 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+요청 수/지연 시간(엔드포인트, 상태 코드별), 시뮬레이터 단계별 소요 시간,
+water-filling 결과, 자동 추가된 계절학기 수, 결과 캐시 통계를 수집한다.
+
+- 기록은 프로세스 메모리의 카운터/히스토그램에 잠금 한 번으로 반영한다 (외부 의존성 없음).
+- 여러 워커 프로세스로 실행할 때는 METRICS_MULTIPROC_DIR에 워커별 스냅샷 파일을
+  주기적으로 기록하고, /metrics를 받은 워커가 모든 파일을 합산해 응답한다.
+  카운터와 히스토그램은 종료된 워커의 값도 합산하고 (누적값 유지),
+  게이지는 살아 있는 워커의 값만 pid 라벨을 붙여 워커별로 출력한다.
+"""
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import glob
+import json
+import logging
+import os
+import threading
+import time
+
+from starlette.routing import Match
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# charset은 Response가 덧붙인다
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# 요청 지연 시간 버킷 (초)
+REQUEST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# 시뮬레이터 단계 소요 시간 버킷 (초, 단계 하나는 보통 수 µs)
+STEP_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 5e-3)
+
+# GPASimulator.simulate_records의 단계 순서
+SIMULATOR_STEPS = (
+    "calculate_current_state",
+    "adjust_remaining_credits",
+    "initial_distribution",
+    "water_filling_adjustment",
+    "round_and_adjust",
+)
+
+HELP = {
+    "gpa_requests_total": ("counter", "HTTP 요청 수"),
+    "gpa_request_duration_seconds": ("histogram", "HTTP 요청 처리 시간"),
+    "gpa_simulator_step_duration_seconds": ("histogram", "시뮬레이터 단계별 소요 시간"),
+    "gpa_water_filling_total": ("counter", "water-filling 단계 결과 (skipped: 조정 불필요, solved: 수위 계산)"),
+    "gpa_auto_summer_terms_total": ("counter", "자동 추가된 계절학기 수 (shortage: 졸업 학점 부족, extra: 목표 달성용)"),
+    "gpa_cache_hits_total": ("counter", "결과 캐시 hit"),
+    "gpa_cache_misses_total": ("counter", "결과 캐시 miss"),
+    "gpa_cache_evictions_total": ("counter", "결과 캐시 eviction"),
+    "gpa_cache_entries": ("gauge", "결과 캐시 항목 수"),
+    "gpa_executor_in_flight": ("gauge", "실행 풀에서 실행 중이거나 대기 중인 작업 수"),
+    "gpa_executor_capacity": ("gauge", "실행 풀 작업 수 한도 (workers + max_queue)"),
+    "gpa_executor_completed_total": ("counter", "실행 풀에서 끝난 작업 수"),
+    "gpa_executor_rejected_total": ("counter", "실행 풀이 가득 차 거절한 요청 수 (503)"),
+    "gpa_executor_queue_wait_seconds": ("histogram", "실행 풀 대기 시간"),
+    "gpa_stream_records_total": ("counter", "NDJSON 스트리밍으로 처리한 레코드 수 (상태 코드별)"),
+    "gpa_worker_requests_in_flight": ("gauge", "워커에서 처리 중인 HTTP 요청 수"),
+    "gpa_worker_requests": ("gauge", "워커가 시작 후 처리한 HTTP 요청 수"),
+    "gpa_worker_cpu_seconds": ("gauge", "워커 프로세스 CPU 사용 시간 (초)"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# 시뮬레이션마다 갱신하는 카운터 키
+_WATER_FILLING_SOLVED = ("gpa_water_filling_total", (("outcome", "solved"),))
+_WATER_FILLING_SKIPPED = ("gpa_water_filling_total", (("outcome", "skipped"),))
+_SHORTAGE_TERMS = ("gpa_auto_summer_terms_total", (("kind", "shortage"),))
+_EXTRA_TERMS = ("gpa_auto_summer_terms_total", (("kind", "extra"),))
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (버킷별 개수는 누적하지 않고 저장, 출력 시 누적)"""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join('%s="%s"' % (k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in pairs)
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """프로세스 내 메트릭 저장소"""
+
+    def __init__(self, enabled: bool = True, multiproc_dir: Optional[str] = None,
+                 flush_interval: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.enabled = enabled
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._collectors: List[Callable[[], Iterable[Tuple[str, Labels, float]]]] = []
+        self.reset()
+        self.register_collector(self._worker_load)
+
+    def reset(self):
+        """기록한 값 초기화 (pre-fork 워커가 부모의 예열 기록을 물려받지 않도록)"""
+        with self._lock:
+            self._last_flush = 0.0
+            self.counters: Dict[Tuple[str, Labels], float] = {}
+            self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+            # 워커별 부하 (게이지, 다중 워커면 pid 라벨로 워커별 출력)
+            self.requests_in_flight = 0
+            self.requests_handled = 0
+            # 시뮬레이션마다 기록하는 단계별 히스토그램은 미리 만들어 둔다
+            self._step_histograms = [
+                self._histogram("gpa_simulator_step_duration_seconds", (("step", step),), STEP_BUCKETS)
+                for step in SIMULATOR_STEPS
+            ]
+
+    def _worker_load(self):
+        return [
+            ("gpa_worker_requests_in_flight", (), self.requests_in_flight),
+            ("gpa_worker_requests", (), self.requests_handled),
+            ("gpa_worker_cpu_seconds", (), round(time.process_time(), 3)),
+        ]
+
+    def _histogram(self, name: str, labels: Labels, buckets: Sequence[float]) -> Histogram:
+        key = (name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(buckets)
+        return histogram
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1):
+        if not self.enabled:
+            return
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Labels = (),
+                buckets: Sequence[float] = REQUEST_BUCKETS):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._histogram(name, labels, buckets).observe(value)
+
+    def observe_request(self, endpoint: str, status_code: int, seconds: float):
+        """요청 수와 처리 시간 기록 (엔드포인트, 상태 코드별)"""
+        if not self.enabled:
+            return
+        labels = (("endpoint", endpoint), ("status", str(status_code)))
+        with self._lock:
+            self.requests_handled += 1
+            key = ("gpa_requests_total", labels)
+            self.counters[key] = self.counters.get(key, 0) + 1
+            self._histogram("gpa_request_duration_seconds", labels, REQUEST_BUCKETS).observe(seconds)
+        self.maybe_flush()
+
+    def observe_simulation(self, step_seconds: Sequence[float], water_filling_solved: bool,
+                           shortage_terms: int, extra_terms: int):
+        """시뮬레이션 한 번의 단계별 소요 시간과 water-filling/계절학기 추가 결과 기록"""
+        if not self.enabled:
+            return
+        counters = self.counters
+        with self._lock:
+            for histogram, seconds in zip(self._step_histograms, step_seconds):
+                histogram.observe(seconds)
+            key = _WATER_FILLING_SOLVED if water_filling_solved else _WATER_FILLING_SKIPPED
+            counters[key] = counters.get(key, 0) + 1
+            if shortage_terms:
+                counters[_SHORTAGE_TERMS] = counters.get(_SHORTAGE_TERMS, 0) + shortage_terms
+            if extra_terms:
+                counters[_EXTRA_TERMS] = counters.get(_EXTRA_TERMS, 0) + extra_terms
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, Labels, float]]]):
+        """스냅샷 시점에 값을 읽는 수집기 등록 (예: 캐시 통계). (이름, 라벨, 값)을 반환"""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> dict:
+        """이 프로세스의 메트릭 (JSON 직렬화 가능)"""
+        with self._lock:
+            counters = [[name, list(labels), value] for (name, labels), value in self.counters.items()]
+            histograms = [
+                [name, list(labels), list(h.buckets), list(h.counts), h.sum, h.count]
+                for (name, labels), h in self.histograms.items() if h.count
+            ]
+
+        gauges = []
+        for collector in self._collectors:
+            try:
+                for name, labels, value in collector():
+                    kind = HELP.get(name, ("gauge",))[0]
+                    target = gauges if kind == "gauge" else counters
+                    target.append([name, list(labels), value])
+            except Exception as e:
+                logger.warning("Metrics collector failed: %s", e)
+
+        return {"pid": os.getpid(), "counters": counters, "histograms": histograms, "gauges": gauges}
+
+    def _snapshot_path(self) -> str:
+        return os.path.join(self.multiproc_dir, f"metrics-{os.getpid()}.json")
+
+    def flush(self):
+        """워커별 스냅샷 파일 기록 (임시 파일 후 교체)"""
+        if not self.multiproc_dir:
+            return
+        self._last_flush = self._clock()
+        path = self._snapshot_path()
+        tmp = f"{path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Metrics flush failed: %s", e)
+
+    def maybe_flush(self):
+        """마지막 기록 후 flush_interval이 지났으면 스냅샷 파일 기록"""
+        if self.multiproc_dir and self._clock() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def collect(self) -> List[dict]:
+        """합산할 스냅샷 목록 (다중 워커면 디렉터리의 모든 워커 파일)"""
+        if not self.multiproc_dir:
+            return [self.snapshot()]
+
+        self.flush()
+        snapshots = []
+        for path in sorted(glob.glob(os.path.join(self.multiproc_dir, "metrics-*.json"))):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning("Metrics snapshot %s skipped: %s", path, e)
+        return snapshots
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        return render_snapshots(self.collect(), label_pid=bool(self.multiproc_dir))
+
+
+def merge_snapshots(snapshots: List[dict], label_pid: bool = False):
+    """
+    워커별 스냅샷 합산 (label_pid이면 게이지는 합산하지 않고 워커별 pid 라벨)
+
+    Returns:
+        (카운터/게이지 {(이름, 라벨): 값}, 히스토그램 {(이름, 라벨): (버킷, 개수, 합계, 관측 수)})
+    """
+    values: Dict[Tuple[str, Labels], float] = {}
+    histograms: Dict[Tuple[str, Labels], list] = {}
+
+    for snapshot in snapshots:
+        pid = snapshot.get("pid", 0)
+        series = list(snapshot.get("counters", []))
+        if pid == os.getpid() or _pid_alive(pid):
+            gauges = snapshot.get("gauges", [])
+            if label_pid:
+                gauges = [[name, list(labels) + [["pid", str(pid)]], value] for name, labels, value in gauges]
+            series += gauges
+        for name, labels, value in series:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            values[key] = values.get(key, 0) + value
+
+        for name, labels, buckets, counts, total, count in snapshot.get("histograms", []):
+            key = (name, tuple(tuple(pair) for pair in labels))
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = [buckets, list(counts), total, count]
+            elif merged[0] == buckets:
+                merged[1] = [a + b for a, b in zip(merged[1], counts)]
+                merged[2] += total
+                merged[3] += count
+
+    return values, histograms
+
+
+def render_snapshots(snapshots: List[dict], label_pid: bool = False) -> str:
+    """스냅샷을 합산해 Prometheus 텍스트 형식으로 출력"""
+    values, histograms = merge_snapshots(snapshots, label_pid)
+
+    by_name: Dict[str, List[str]] = {}
+    for (name, labels), value in sorted(values.items()):
+        by_name.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    for (name, labels), (buckets, counts, total, count) in sorted(histograms.items()):
+        lines = by_name.setdefault(name, [])
+        cumulative = 0
+        for le, n in zip(list(buckets) + [float("inf")], counts):
+            cumulative += n
+            lines.append(f"{name}_bucket{_format_labels(labels, ('le', _format_value(float(le))))} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+    output = []
+    for name in sorted(by_name):
+        kind, description = HELP.get(name, ("untyped", name))
+        output.append(f"# HELP {name} {description}")
+        output.append(f"# TYPE {name} {kind}")
+        output.extend(by_name[name])
+    return "\n".join(output) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    요청 수와 처리 시간을 기록하는 ASGI 미들웨어
+
+    엔드포인트 라벨은 등록된 라우트 경로 템플릿(/plans/{student_key})을 사용하고 나머지는 "other"로 묶는다.
+    고정 경로는 집합 조회, 경로 매개변수가 있는 라우트만 차례로 매칭한다.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry, routes):
+        self.app = app
+        self.registry = registry
+        self.routes = routes
+        self._paths = None
+        self._templates = None
+
+    def _endpoint(self, scope) -> str:
+        if self._paths is None:
+            paths = [getattr(route, "path", None) for route in self.routes]
+            self._paths = {path for path in paths if path and "{" not in path}
+            self._templates = [route for route, path in zip(self.routes, paths) if path and "{" in path]
+        path = scope["path"]
+        if path in self._paths:
+            return path
+        for route in self._templates:
+            match, _ = route.matches(scope)
+            if match != Match.NONE:
+                return route.path
+        return "other"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        endpoint = self._endpoint(scope)
+
+        started = time.perf_counter()
+        status_code = 500
+        self.registry.requests_in_flight += 1
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.registry.requests_in_flight -= 1
+            self.registry.observe_request(endpoint, status_code, time.perf_counter() - started)
+
+
+def cache_collector(cache):
+    """결과 캐시 통계 수집기"""
+    def collect():
+        stats = cache.stats()
+        return [
+            ("gpa_cache_hits_total", (), stats["hits"]),
+            ("gpa_cache_misses_total", (), stats["misses"]),
+            ("gpa_cache_evictions_total", (), stats["evictions"]),
+            ("gpa_cache_entries", (), stats["size"]),
+        ]
+    return collect
+
+
+# 서비스 전역 메트릭 저장소
+metrics = MetricsRegistry(
+    enabled=settings.metrics_enabled,
+    multiproc_dir=settings.metrics_multiproc_dir,
+    flush_interval=settings.metrics_flush_interval
+)
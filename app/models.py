@@ -1,8 +1,17 @@
 """
 Pydantic models for GPA Simulator API
 """
-from typing import List
-from pydantic import BaseModel, Field
+from typing import Annotated, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, model_validator
+
+from app.config import settings
+
+
+class CompletedCourse(BaseModel):
+    """이수 완료한 과목 (재수강 계산용)"""
+    id: str = Field(..., description="과목 ID (학기에 관계없이 고유)")
+    credits: float = Field(..., gt=0, description="과목 학점")
+    grade_points: float = Field(..., ge=0, description="받은 평점")
 
 
 class HistoryItem(BaseModel):
@@ -10,14 +19,28 @@ class HistoryItem(BaseModel):
     term_id: str = Field(..., description="학기 ID (e.g., S1, S2)")
     credits: float = Field(..., gt=0, description="이수 학점")
     achieved_avg: float = Field(..., ge=0, description="해당 학기 평균 평점")
+    courses: Optional[List[CompletedCourse]] = Field(
+        default=None, max_length=settings.max_term_courses,
+        description="과목별 성적 (재수강 계산에만 사용, 학점 합계는 credits와 같아야 함)"
+    )
+
+
+class CourseItem(BaseModel):
+    """남은 학기에 수강할 과목"""
+    id: str = Field(..., description="과목 ID (e.g., CS101)")
+    credits: float = Field(..., gt=0, description="과목 학점")
 
 
 class TermItem(BaseModel):
     """남은 학기 정보"""
     id: str = Field(..., description="학기 ID")
     type: str = Field(..., description="학기 유형 (regular, summer)")
-    planned_credits: float = Field(..., gt=0, description="계획 학점")
+    planned_credits: float = Field(..., gt=0, description="계획 학점 (courses를 지정하면 과목 학점 합계와 같아야 함)")
     max_credits: float = Field(default=21, gt=0, description="최대 이수 가능 학점")
+    courses: Optional[List[CourseItem]] = Field(
+        default=None, min_length=1, max_length=settings.max_term_courses,
+        description="과목별 학점 (지정하면 과목별 필요 등급 계산, grade_scale 필요)"
+    )
 
 
 class SimulationInput(BaseModel):
@@ -25,8 +48,19 @@ class SimulationInput(BaseModel):
     scale_max: float = Field(..., gt=0, description="평점 최대값 (예: 4.5)")
     G_t: float = Field(..., gt=0, description="목표 GPA")
     C_tot: float = Field(..., gt=0, description="졸업 요구 총 학점")
-    history: List[HistoryItem] = Field(..., min_length=0, description="이수 완료 학기 목록")
-    terms: List[TermItem] = Field(..., min_length=1, description="남은 학기 목록")
+    history: List[HistoryItem] = Field(
+        ..., min_length=0, max_length=settings.max_history_terms, description="이수 완료 학기 목록"
+    )
+    terms: List[TermItem] = Field(..., min_length=1, max_length=settings.max_terms, description="남은 학기 목록")
+    rounding: Literal["float", "exact"] = Field(
+        default="float",
+        description="라운딩 방식 (float: 반올림 후 마지막 학기 보정, exact: 정수 연산으로 결과 GPA가 항상 목표 이상)"
+    )
+    grade_scale: Optional[str] = Field(
+        default=None,
+        description="성적 체계 이름 (예: kr-4.5). 지정하면 학기별로 필요 평점을 맞추는 등급 조합을 함께 반환"
+    )
+    course_credits: float = Field(default=3, gt=0, description="과목당 학점 (grade_scale 지정 시 학기 과목 수 계산)")
 
 
 class SimulationResult(BaseModel):
@@ -36,6 +70,406 @@ class SimulationResult(BaseModel):
     required_avg: float = Field(..., description="필요한 평균 평점")
 
 
+class GradeMix(BaseModel):
+    """학기 평균을 맞추는 등급 조합"""
+    average: float = Field(..., description="조합의 평균 평점")
+    grades: Dict[str, int] = Field(..., description="등급별 과목 수 (예: {\"A+\": 2, \"A0\": 4})")
+
+
+class CourseGrade(BaseModel):
+    """과목별 필요 등급"""
+    id: str = Field(..., description="과목 ID")
+    credits: float = Field(..., description="과목 학점")
+    grade: str = Field(..., description="필요 등급")
+    points: float = Field(..., description="등급 평점")
+
+
+class GradedSimulationResult(SimulationResult):
+    """grade_scale을 지정한 경우의 학기별 결과"""
+    courses: int = Field(..., description="학기 과목 수 (학점 / course_credits)")
+    discrete_avg: float = Field(..., description="필요 평점 이상으로 실제 받을 수 있는 가장 낮은 평균 평점")
+    grade_mixes: List[GradeMix] = Field(..., description="필요 평점 이상이 되는 등급 조합 (평균이 낮은 순)")
+    course_grades: Optional[List[CourseGrade]] = Field(
+        ..., description="과목별 필요 등급 (학기 입력에 courses가 있을 때, 없으면 null)"
+    )
+
+
+class GradeScaleInfo(BaseModel):
+    """등록된 성적 체계"""
+    name: str = Field(..., description="성적 체계 이름")
+    scale_max: float = Field(..., description="최고 평점")
+    grades: Dict[str, float] = Field(..., description="등급별 평점 (높은 순)")
+
+
+class BatchSimulationInput(BaseModel):
+    """배치 시뮬레이션 입력 데이터"""
+    inputs: List[SimulationInput] = Field(
+        ..., min_length=1, max_length=settings.max_batch_inputs, description="학생별 시뮬레이션 입력 목록"
+    )
+
+
+class BatchSimulationItem(BaseModel):
+    """배치 시뮬레이션의 학생별 결과"""
+    index: int = Field(..., description="입력 목록에서의 위치")
+    status_code: int = Field(..., description="단건 /simulate 호출 시의 HTTP 상태 코드")
+    results: Optional[List[Union[GradedSimulationResult, SimulationResult]]] = Field(
+        default=None, description="학기별 필요 평점 (성공 시)"
+    )
+    detail: Optional[str] = Field(default=None, description="에러 메시지 (실패 시)")
+
+
+class StreamSimulationInput(SimulationInput):
+    """NDJSON 스트리밍 입력의 한 줄"""
+    key: Optional[Union[str, int]] = Field(default=None, description="결과 줄에 그대로 붙는 호출자 지정 키 (예: 학번)")
+
+
+class StreamSimulationItem(BaseModel):
+    """NDJSON 스트리밍 결과의 한 줄"""
+    key: Optional[Union[str, int]] = Field(default=None, description="입력 줄의 key")
+    line: int = Field(..., description="입력 줄 번호 (1부터)")
+    status_code: int = Field(..., description="단건 /simulate 호출 시의 HTTP 상태 코드")
+    results: Optional[List[Union[GradedSimulationResult, SimulationResult]]] = Field(
+        default=None, description="학기별 필요 평점 (성공 시)"
+    )
+    detail: Optional[str] = Field(default=None, description="에러 메시지 (실패 시)")
+
+
+class OptimizeInput(SimulationInput):
+    """학점 재분배 최적화 입력 데이터"""
+    objective: Literal["peak", "variance"] = Field(
+        default="peak",
+        description="peak: 가장 높은 (가중) 필요 평점 최소화, variance: (가중) 필요 평점 제곱합 최소화"
+    )
+    weights: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="학기 ID별 난이도 가중치 (기본 1, 클수록 어려운 학기로 보고 낮은 평점 배정)"
+    )
+
+    @model_validator(mode="after")
+    def check_weights(self):
+        if self.weights:
+            term_ids = {term.id for term in self.terms}
+            for term_id, weight in self.weights.items():
+                if term_id not in term_ids:
+                    raise ValueError(f"weights에 없는 학기 ID가 있습니다: {term_id}")
+                if weight <= 0:
+                    raise ValueError(f"가중치는 0보다 커야 합니다: {term_id}")
+        return self
+
+
+class OptimizeResult(BaseModel):
+    """학점 재분배 최적화 결과"""
+    objective: str = Field(..., description="최적화 목표")
+    results: List[SimulationResult] = Field(..., description="학기별 학점과 필요 평점")
+    peak_required_avg: float = Field(
+        ..., description="최적화 결과의 가중 최고 필요 평점 max(w_i × a_i) (weights가 없으면 가장 높은 필요 평점)"
+    )
+    baseline_results: List[SimulationResult] = Field(..., description="같은 입력의 /simulate 결과")
+    baseline_peak_required_avg: float = Field(
+        ..., description="/simulate 결과의 가중 최고 필요 평점 (peak_required_avg와 같은 weights)"
+    )
+
+
+class RiskInput(SimulationInput):
+    """목표 달성 확률(Monte Carlo) 입력 데이터"""
+    draws: int = Field(default=100_000, ge=1000, le=1_000_000, description="표본 수")
+    seed: int = Field(default=0, ge=0, description="난수 시드 (같은 입력과 시드면 같은 결과)")
+    mean: Optional[float] = Field(
+        default=None, ge=0, description="학기 평점 분포의 평균 (기본: 이수 이력의 학점 가중 평균)"
+    )
+    std: Optional[float] = Field(
+        default=None, gt=0, description="학기 평점 분포의 표준편차 (기본: 이수 이력의 학점 가중 표준편차)"
+    )
+
+    @model_validator(mode="after")
+    def check_distribution(self):
+        if not self.history and self.mean is None:
+            raise ValueError("이수 이력이 없으면 mean을 지정해야 합니다")
+        if self.mean is not None and self.mean > self.scale_max:
+            raise ValueError(f"mean ({self.mean})이 최대 평점 ({self.scale_max})을 초과합니다")
+        return self
+
+
+class RiskTermResult(BaseModel):
+    """학기별 달성 확률과 민감도"""
+    term_id: str = Field(..., description="학기 ID")
+    credits: float = Field(..., description="할당된 학점")
+    required_avg: float = Field(..., description="필요한 평균 평점 (/simulate 결과)")
+    meet_probability: float = Field(..., description="이 학기 평점이 필요 평점 이상일 확률")
+    sensitivity: float = Field(..., description="이 학기 평점만 표준편차만큼 낮아질 때 줄어드는 성공 확률")
+
+
+class RiskResult(BaseModel):
+    """목표 달성 확률(Monte Carlo) 결과"""
+    success_probability: float = Field(..., description="졸업 GPA가 목표 GPA 이상일 확률")
+    mean_gpa: float = Field(..., description="졸업 GPA 평균")
+    gpa_percentiles: Dict[str, float] = Field(..., description="졸업 GPA 분위수 (p5, p25, p50, p75, p95)")
+    most_sensitive_term: str = Field(..., description="성공 확률에 가장 큰 영향을 주는 학기 ID")
+    terms: List[RiskTermResult] = Field(..., description="학기별 결과")
+    fitted_mean: float = Field(..., description="사용한 학기 평점 분포의 평균")
+    fitted_std: float = Field(..., description="사용한 학기 평점 분포의 표준편차")
+    draws: int = Field(..., description="표본 수")
+    seed: int = Field(..., description="난수 시드")
+
+
+class RiskBatchInput(BaseModel):
+    """목표 달성 확률 배치 입력 데이터"""
+    inputs: List[RiskInput] = Field(..., min_length=1, max_length=1000, description="학생별 입력 목록")
+
+
+class RiskBatchItem(BaseModel):
+    """목표 달성 확률 배치의 학생별 결과"""
+    index: int = Field(..., description="입력 목록에서의 위치")
+    status_code: int = Field(..., description="단건 /simulate/risk 호출 시의 HTTP 상태 코드")
+    result: Optional[RiskResult] = Field(default=None, description="목표 달성 확률 (성공 시)")
+    detail: Optional[str] = Field(default=None, description="에러 메시지 (실패 시)")
+
+
+class RetakeItem(BaseModel):
+    """반영할 재수강"""
+    course_id: str = Field(..., description="이력의 과목 ID")
+    grade_points: float = Field(..., ge=0, description="재수강으로 받을 평점 (기존 성적을 대체)")
+
+
+class RetakeInput(SimulationInput):
+    """재수강 반영 시뮬레이션 입력"""
+    retakes: List[RetakeItem] = Field(..., min_length=1, max_length=1000, description="반영할 재수강 목록")
+
+
+class RetakeSearchInput(SimulationInput):
+    """최선의 재수강 탐색 입력"""
+    retake_grade: Optional[float] = Field(
+        default=None, ge=0, description="재수강 시 예상 평점 (기본 scale_max, 학교의 재수강 성적 상한이 있으면 그 값)"
+    )
+    eligible_max: Optional[float] = Field(
+        default=None, ge=0, description="이 평점 이하인 과목만 후보 (예: 2.5 = C+ 이하만 재수강 가능)"
+    )
+    max_retakes: Optional[int] = Field(default=None, ge=0, description="재수강 가능 과목 수 상한")
+    max_required_avg: Optional[float] = Field(
+        default=None, gt=0, description="남은 학기에 받을 수 있다고 보는 최고 평균 평점 (기본 scale_max)"
+    )
+    limit: int = Field(default=20, ge=1, le=1000, description="응답에 포함할 후보 수")
+
+
+class RetakeCandidate(BaseModel):
+    """재수강 후보 (이 과목 하나만 재수강할 때의 효과)"""
+    course_id: str = Field(..., description="과목 ID")
+    term_id: str = Field(..., description="이수 학기 ID")
+    credits: float = Field(..., description="과목 학점")
+    grade_points: float = Field(..., description="현재 평점")
+    retake_grade_points: float = Field(..., description="재수강 평점")
+    gain: float = Field(..., description="grade points 증가량 (학점 × 평점 차이)")
+    gpa: float = Field(..., description="재수강 후 현재 GPA")
+    required_avg: float = Field(..., description="재수강 후 남은 학기 균등 필요 평점")
+
+
+class RetakeResult(BaseModel):
+    """재수강 반영 계획"""
+    retakes: List[RetakeCandidate] = Field(..., description="반영한 재수강 (각각 단독 효과)")
+    gpa: float = Field(..., description="모두 반영한 현재 GPA")
+    required_avg: float = Field(..., description="모두 반영한 남은 학기 균등 필요 평점")
+    results: List[Union[GradedSimulationResult, SimulationResult]] = Field(..., description="학기별 필요 평점")
+
+
+class RetakeSearchResult(BaseModel):
+    """최선의 재수강 탐색 결과"""
+    gpa: float = Field(..., description="재수강 전 현재 GPA")
+    required_avg: float = Field(..., description="재수강 전 남은 학기 균등 필요 평점")
+    reachable: bool = Field(..., description="후보 재수강으로 필요 평점을 max_required_avg 이하로 낮출 수 있는지")
+    selected: List[str] = Field(..., description="가장 적은 재수강 과목 (필요 없거나 불가능하면 빈 목록)")
+    candidates: List[RetakeCandidate] = Field(..., description="후보 (grade points 증가량이 큰 순, 최대 limit개)")
+    plan: Optional[RetakeResult] = Field(default=None, description="selected를 반영한 계획")
+
+
+class FeasibilityResult(BaseModel):
+    """목표 달성 가능 여부 확인 결과"""
+    feasible: Optional[bool] = Field(default=None, description="목표 GPA 달성 가능 여부 (G_t 생략 시 null)")
+    status_code: Optional[int] = Field(default=None, description="같은 목표로 /simulate를 호출할 때의 HTTP 상태 코드")
+    max_achievable_gpa: float = Field(..., description="남은 학점을 모두 만점으로 받을 때의 GPA")
+    min_achievable_gpa: float = Field(..., description="남은 학점을 모두 0점으로 받을 때의 GPA")
+    required_avg: Optional[float] = Field(default=None, description="남은 학점의 필요 평균 평점 (g_need)")
+    additional_credits_needed: Optional[float] = Field(
+        default=None, description="달성 불가능할 때 필요한 최소 추가 계절학기 학점 (모두 만점 기준)"
+    )
+    detail: Optional[str] = Field(default=None, description="달성 불가능한 이유 (/simulate 에러 메시지와 동일)")
+
+
+class SweepInput(BaseModel):
+    """
+    목표 GPA 범위 시뮬레이션 입력 데이터 (targets 또는 G_t_min/G_t_max 중 하나)
+
+    행은 학기별 필요 평점만 담으므로 grade_scale이 없고, 학기별 courses도 쓸 수 없다.
+    """
+    scale_max: float = Field(..., gt=0, description="평점 최대값 (예: 4.5)")
+    C_tot: float = Field(..., gt=0, description="졸업 요구 총 학점")
+    history: List[HistoryItem] = Field(
+        ..., min_length=0, max_length=settings.max_history_terms, description="이수 완료 학기 목록"
+    )
+    terms: List[TermItem] = Field(..., min_length=1, max_length=settings.max_terms, description="남은 학기 목록")
+    targets: Optional[List[float]] = Field(default=None, min_length=1, max_length=1000, description="목표 GPA 목록")
+    G_t_min: Optional[float] = Field(default=None, gt=0, description="목표 GPA 범위 시작")
+    G_t_max: Optional[float] = Field(default=None, gt=0, description="목표 GPA 범위 끝 (포함)")
+    G_t_step: float = Field(default=0.05, gt=0, description="목표 GPA 범위 간격")
+    rounding: Literal["float", "exact"] = Field(
+        default="float",
+        description="라운딩 방식 (float: 반올림 후 마지막 학기 보정, exact: 정수 연산으로 결과 GPA가 항상 목표 이상)"
+    )
+
+    @model_validator(mode="after")
+    def check_targets(self):
+        has_range = self.G_t_min is not None or self.G_t_max is not None
+        if (self.targets is None) == (not has_range):
+            raise ValueError("targets 또는 G_t_min/G_t_max 중 하나만 지정해야 합니다")
+        if has_range:
+            if self.G_t_min is None or self.G_t_max is None or self.G_t_min > self.G_t_max:
+                raise ValueError("G_t_min과 G_t_max를 모두 지정해야 하며 G_t_min <= G_t_max 여야 합니다")
+            if (self.G_t_max - self.G_t_min) / self.G_t_step > 1000:
+                raise ValueError("목표 GPA는 최대 1000개까지 지정할 수 있습니다")
+        return self
+
+    def target_list(self) -> List[float]:
+        """시뮬레이션할 목표 GPA 목록"""
+        if self.targets is not None:
+            return self.targets
+        count = int(round((self.G_t_max - self.G_t_min) / self.G_t_step + 1e-9)) + 1
+        return [round(self.G_t_min + i * self.G_t_step, 6) for i in range(count)]
+
+
+class SweepRow(BaseModel):
+    """목표 GPA 하나에 대한 결과"""
+    G_t: float = Field(..., description="목표 GPA")
+    feasible: bool = Field(..., description="달성 가능 여부")
+    required_avg: Optional[List[float]] = Field(default=None, description="term_ids 순서의 학기별 필요 평점")
+    detail: Optional[str] = Field(default=None, description="달성 불가능한 이유")
+
+
+class SweepResult(BaseModel):
+    """목표 GPA 범위 시뮬레이션 결과"""
+    term_ids: List[str] = Field(..., description="학기 ID (required_avg 열 순서)")
+    credits: List[float] = Field(..., description="학기별 할당 학점")
+    max_achievable_gpa: float = Field(..., description="남은 학기를 모두 만점으로 받을 때의 GPA")
+    min_achievable_gpa: float = Field(..., description="남은 학기를 모두 0점으로 받을 때의 GPA")
+    rows: List[SweepRow] = Field(..., description="목표 GPA별 결과")
+
+
+class TermCompleted(BaseModel):
+    """학기 성적 확정: 남은 학기에서 빠지고 이수 이력에 추가"""
+    type: Literal["term_completed"] = "term_completed"
+    term_id: str = Field(..., description="완료된 학기 ID")
+    achieved_avg: float = Field(..., ge=0, description="확정된 학기 평균 평점")
+    credits: Optional[float] = Field(default=None, gt=0, description="이수 학점 (생략 시 계획 학점)")
+
+
+class PlannedCreditsChanged(BaseModel):
+    """남은 학기의 계획 학점 변경"""
+    type: Literal["planned_credits_changed"] = "planned_credits_changed"
+    term_id: str = Field(..., description="학기 ID")
+    planned_credits: float = Field(..., gt=0, description="새 계획 학점")
+
+
+class MaxCreditsChanged(BaseModel):
+    """남은 학기의 최대 이수 가능 학점 변경"""
+    type: Literal["max_credits_changed"] = "max_credits_changed"
+    term_id: str = Field(..., description="학기 ID")
+    max_credits: float = Field(..., gt=0, description="새 최대 이수 가능 학점")
+
+
+PlanDelta = Annotated[
+    Union[TermCompleted, PlannedCreditsChanged, MaxCreditsChanged],
+    Field(discriminator="type")
+]
+
+
+class IncrementalInput(BaseModel):
+    """증분 시뮬레이션 입력 데이터"""
+    base: SimulationInput = Field(..., description="이전 계획의 시뮬레이션 입력")
+    deltas: List[PlanDelta] = Field(..., min_length=1, max_length=1000, description="순서대로 적용할 변경 사항")
+
+
+class PlanDiff(BaseModel):
+    """이전 계획 대비 변경된 학기"""
+    changed: List[SimulationResult] = Field(default_factory=list, description="학점 또는 필요 평점이 바뀐 학기")
+    added: List[SimulationResult] = Field(default_factory=list, description="새로 생긴 학기")
+    removed: List[str] = Field(default_factory=list, description="없어진 학기 ID")
+
+
+class IncrementalResult(BaseModel):
+    """증분 시뮬레이션 결과"""
+    results: List[SimulationResult] = Field(..., description="변경 사항을 적용한 학기별 필요 평점")
+    diff: PlanDiff = Field(..., description="이전 계획 대비 변경 사항")
+
+
+class TermAdded(BaseModel):
+    """남은 학기 추가 (예: 계절학기)"""
+    type: Literal["term_added"] = "term_added"
+    term: TermItem = Field(..., description="추가할 학기 (courses는 사용하지 않음)")
+    after: Optional[str] = Field(default=None, description="이 학기 바로 뒤에 추가 (생략 시 맨 뒤)")
+
+
+class TermRemoved(BaseModel):
+    """남은 학기 삭제"""
+    type: Literal["term_removed"] = "term_removed"
+    term_id: str = Field(..., description="학기 ID")
+
+
+ScenarioEdit = Annotated[
+    Union[PlannedCreditsChanged, MaxCreditsChanged, TermAdded, TermRemoved],
+    Field(discriminator="type")
+]
+
+
+class Scenario(BaseModel):
+    """비교할 학기 계획 시나리오"""
+    name: str = Field(..., description="시나리오 이름 (예: S5 21학점)")
+    edits: List[ScenarioEdit] = Field(..., min_length=1, max_length=100, description="기준 계획에 순서대로 적용할 변경")
+
+
+class ScenarioInput(BaseModel):
+    """학기 계획 시나리오 비교 입력 데이터"""
+    base: SimulationInput = Field(..., description="기준 시뮬레이션 입력 (grade_scale은 사용하지 않음)")
+    scenarios: List[Scenario] = Field(..., min_length=1, max_length=1000, description="비교할 시나리오 목록")
+    include_results: bool = Field(default=False, description="시나리오별 학기별 필요 평점 포함 여부")
+
+
+class ScenarioRow(BaseModel):
+    """시나리오 하나의 비교 결과"""
+    name: str = Field(..., description="시나리오 이름 (기준 계획은 base)")
+    status_code: int = Field(..., description="변경을 적용한 입력으로 /simulate를 호출할 때의 HTTP 상태 코드")
+    feasible: bool = Field(..., description="목표 GPA 달성 가능 여부")
+    peak_required_avg: Optional[float] = Field(default=None, description="학기별 필요 평점 중 가장 높은 값")
+    peak_term_id: Optional[str] = Field(default=None, description="가장 높은 필요 평점의 학기 ID")
+    extra_summer_credits: Optional[float] = Field(default=None, description="자동 추가된 계절학기 학점 합계")
+    total_credits: Optional[float] = Field(default=None, description="남은 학기에 이수할 학점 합계")
+    detail: Optional[str] = Field(default=None, description="잘못된 변경 또는 달성 불가능한 이유")
+    results: Optional[List[SimulationResult]] = Field(default=None, description="학기별 필요 평점 (include_results)")
+
+
+class ScenarioComparison(BaseModel):
+    """학기 계획 시나리오 비교 결과"""
+    current_gpa: float = Field(..., description="현재 GPA (모든 시나리오 공통)")
+    required_avg: float = Field(..., description="남은 학점의 필요 평균 평점 (모든 시나리오 공통)")
+    max_achievable_gpa: float = Field(..., description="남은 학점을 모두 만점으로 받을 때의 GPA")
+    base: ScenarioRow = Field(..., description="변경하지 않은 기준 계획")
+    scenarios: List[ScenarioRow] = Field(..., description="입력 순서대로 시나리오별 결과")
+
+
+class StoredPlan(BaseModel):
+    """학생별로 저장된 계획 한 버전"""
+    student_key: str = Field(..., description="학생 키 (예: 학번)")
+    version: int = Field(..., description="버전 (1부터, 입력이 바뀔 때마다 증가)")
+    input_hash: str = Field(..., description="정규화된 입력의 해시 (결과 캐시 키와 같음)")
+    created_at: str = Field(..., description="저장 시각 (ISO 8601, UTC)")
+    recomputed: bool = Field(..., description="이번 요청에서 다시 계산했는지 (입력이 같으면 false)")
+    results: List[Union[GradedSimulationResult, SimulationResult]] = Field(..., description="학기별 필요 평점")
+
+
+class PlanVersion(BaseModel):
+    """저장된 계획의 버전 정보"""
+    version: int = Field(..., description="버전")
+    input_hash: str = Field(..., description="정규화된 입력의 해시")
+    created_at: str = Field(..., description="저장 시각 (ISO 8601, UTC)")
+
+
 class ErrorResponse(BaseModel):
     """에러 응답"""
     detail: str = Field(..., description="에러 메시지")
@@ -0,0 +1,214 @@
+"""
+GPA Simulator - 학점 재분배 최적화
+
+기본 시뮬레이션은 모든 학기에 같은 필요 평점(g_need)을 주고 학점은 계획대로 두며,
+최대 학점을 넘는 학기는 자른 뒤 계절학기를 추가한다. 최적화 모드는 학기별 학점
+c_i ∈ [0, max_credits]와 평점 a_i ∈ [0, scale_max]를 함께 정해 (w_i는 학기별 난이도 가중치)
+
+    Σ c_i = C_r,  Σ c_i a_i = g_need · C_r
+
+을 만족하면서 다음 목표를 최소화한다.
+
+- peak: 가장 높은 가중 평점 max(w_i a_i). 쉬운 학기(w_i가 작은 학기)로 학점을 옮기며,
+  같은 최고 평점을 내는 배분 중에서는 계획 대비 옮긴 학점이 가장 적은 배분을 고른다
+- variance: 학점 가중 제곱합 Σ c_i (w_i a_i)² (가중치가 모두 같으면 평점 분산).
+  학점은 계획을 유지하고 최대 학점 초과분만 여유 있는 학기로 옮긴다
+
+c_i a_i를 곱으로 묶어 보면 두 목표 모두 평점이 a_i = min(scale_max, λ r_i) 꼴
+(peak: r_i = 1/w_i, variance: r_i = 1/w_i²)인 water-filling 문제가 되고, 수위 λ는
+WaterLevel로 O(n log n)에 구한다. 학점 배분은 r_i 순서의 탐욕 배분이 최적이다
+(분할 배낭 문제). 범용 LP/볼록 최적화 라이브러리 없이 16학기 기준 수십 µs에 끝난다.
+"""
+from typing import Dict, List, Optional
+import logging
+import math
+
+from app.models import HistoryItem, TermItem, OptimizeResult
+from app.simulator import GPASimulator, WaterLevel
+from app.records import TermRecord, TermPlan, ResultRecord
+
+logger = logging.getLogger(__name__)
+
+OBJECTIVES = ("peak", "variance")
+
+# 최대 학점을 모두 채워도 졸업 학점이 부족할 때 추가하는 계절학기 최대 학점 (Step 2와 동일)
+SUMMER_MAX_CREDITS = 9
+
+_EPS = 1e-9
+
+
+class PlanOptimizer:
+    """학점 재분배로 최고 필요 평점(또는 제곱합)을 최소화하는 계획 계산"""
+
+    def __init__(self, scale_max: float, G_t: float, C_tot: float,
+                 history: List[HistoryItem], terms: List[TermItem],
+                 objective: str = "peak", weights: Optional[Dict[str, float]] = None,
+                 rounding: str = "float"):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"알 수 없는 최적화 목표: {objective} (peak, variance 중 하나)")
+        self.scale_max = scale_max
+        self.G_t = G_t
+        self.C_tot = C_tot
+        self.history = history
+        self.terms = terms
+        self.objective = objective
+        self.weights = weights or {}
+        self.rounding = rounding
+
+    def optimize(self) -> OptimizeResult:
+        """
+        최적화 실행 (기본 시뮬레이션 결과와 함께 반환)
+
+        Raises:
+            ValueError: 목표 달성 불가능한 경우 (기본 시뮬레이션과 같은 조건)
+        """
+        baseline = GPASimulator(self.scale_max, self.G_t, self.C_tot, self.history, self.terms, self.rounding).simulate_records()
+        results = self.optimize_records()
+        return OptimizeResult(
+            objective=self.objective,
+            results=[r.to_model() for r in results],
+            peak_required_avg=self._weighted_peak(results),
+            baseline_results=[r.to_model() for r in baseline],
+            baseline_peak_required_avg=self._weighted_peak(baseline)
+        )
+
+    def _weighted_peak(self, results: List[ResultRecord]) -> float:
+        """peak 목표와 같은 가중 최고 평점 max(w_i a_i) (가중치가 없으면 가장 높은 필요 평점)"""
+        return max(self.weights.get(r.term_id, 1.0) * r.required_avg for r in results)
+
+    def optimize_records(self) -> List[ResultRecord]:
+        """
+        최적화 실행 (내부 레코드 반환)
+
+        Raises:
+            ValueError: 목표 달성 불가능한 경우
+        """
+        simulator = GPASimulator(self.scale_max, self.G_t, self.C_tot, self.history, self.terms, self.rounding)
+        plans, G_c, C_e = self._optimal_plans(simulator)
+
+        # Step 5: 라운딩 및 최종 보정 (기본 시뮬레이션과 동일)
+        return simulator._round_and_adjust(plans, G_c, C_e)
+
+    def _optimal_plans(self, simulator: GPASimulator):
+        """라운딩 전 최적 계획 (학기별 계획, G_c, C_e)"""
+        # Step 1: 현재 상태 계산 (검증과 에러 메시지는 기본 시뮬레이션과 동일)
+        C_e, G_c, C_r, g_need = simulator._calculate_current_state()
+        terms = simulator.terms
+        target = g_need * C_r
+
+        # 학기별 평점 기울기 r_i (가중치가 클수록 어려운 학기 → 낮은 평점)
+        rates = [self._rate(term) for term in terms]
+
+        # 학점 합계를 C_r에 맞춤 (최대 학점 초과분은 여유 있는 학기로, 그래도 부족하면 계절학기 추가)
+        credits = self._fit_credits(terms, rates, C_r)
+
+        if self.objective == "peak":
+            self._move_credits_to_easy_terms(terms, rates, credits, C_r, target)
+
+        # 정해진 학점에서 수위 λ 계산
+        level = self._level(credits, rates, target)
+
+        plans = [
+            TermPlan(term.id, c, min(self.scale_max, max(level * r, 0.0)), term.max_credits)
+            for term, c, r in zip(terms, credits, rates)
+            if c > _EPS
+        ]
+        return plans, G_c, C_e
+
+    def _level(self, credits: List[float], rates: List[float], target: float) -> float:
+        """
+        Σ c_i · min(scale_max, λ r_i) = target 을 만족하는 수위 λ
+
+        c_i · min(scale_max, λ r_i) = (c_i r_i) · min(scale_max / r_i, λ) 이므로
+        학점 c_i r_i, 상한 scale_max / r_i 인 WaterLevel 문제다 (학점이 0인 학기는 제외).
+        """
+        active = [i for i, c in enumerate(credits) if c > _EPS]
+        level, _ = WaterLevel(
+            [credits[i] * rates[i] for i in active],
+            [self.scale_max / rates[i] for i in active]
+        ).solve(target)
+        return level
+
+    def _rate(self, term: TermRecord) -> float:
+        weight = self.weights.get(term.id, 1.0)
+        return 1.0 / weight if self.objective == "peak" else 1.0 / (weight * weight)
+
+    def _fit_credits(self, terms: List[TermRecord], rates: List[float], C_r: float) -> List[float]:
+        """
+        계획 학점을 최대 학점으로 자른 뒤 합계를 C_r에 맞춤
+
+        초과분은 어려운 학기(r 작은 순, 같으면 뒤 학기)부터 줄이고, 부족분은 쉬운 학기
+        (r 큰 순, 같으면 앞 학기)의 여유 학점에 채운다. 최대 학점을 모두 채워도 부족하면
+        계절학기(최대 9학점)를 추가한다 (terms, rates에도 추가).
+        """
+        credits = [min(term.planned_credits, term.max_credits) for term in terms]
+        excess = sum(credits) - C_r
+
+        if excess > _EPS:
+            for i in sorted(range(len(terms)), key=lambda i: (rates[i], -i)):
+                reduction = min(excess, credits[i])
+                credits[i] -= reduction
+                excess -= reduction
+                if excess <= _EPS:
+                    break
+        elif excess < -_EPS:
+            shortage = -excess
+            for i in sorted(range(len(terms)), key=lambda i: (-rates[i], i)):
+                addition = min(shortage, terms[i].max_credits - credits[i])
+                credits[i] += addition
+                shortage -= addition
+                if shortage <= _EPS:
+                    break
+            while shortage > _EPS:
+                addition = min(shortage, SUMMER_MAX_CREDITS)
+                terms.append(TermRecord(f"Summer{len(terms)+1}", "summer", addition, SUMMER_MAX_CREDITS))
+                rates.append(self._rate(terms[-1]))
+                credits.append(addition)
+                shortage -= addition
+
+        return credits
+
+    def _move_credits_to_easy_terms(self, terms: List[TermRecord], rates: List[float],
+                                    credits: List[float], C_r: float, target: float):
+        """
+        peak 목표: 최고 가중 평점이 최소가 되도록 어려운 학기의 학점을 쉬운 학기로 이동
+
+        1) 최소 수위 λ*: 쉬운 학기부터 최대 학점까지 채운 배분(분할 배낭의 최적해)에서
+           Σ c_i · min(scale_max, λ r_i) = target 의 해
+        2) λ*에서 학기별 평점 상한 u_i = min(scale_max, λ* r_i). 현재 배분의 부족분
+           target - Σ c_i u_i 을 u가 가장 낮은 학기에서 가장 높은 학기로 옮기며 채운다.
+           옮기는 학점 1당 이득(u_i - u_j)이 큰 쌍부터 옮기므로 옮긴 학점이 최소다.
+           옮기는 양은 정수 학점으로 올림한다 (계획 학점이 정수면 결과도 정수).
+        """
+        order = sorted(range(len(terms)), key=lambda i: (-rates[i], i))
+        filled = [0.0] * len(terms)
+        remaining = C_r
+        for i in order:
+            filled[i] = min(terms[i].max_credits, remaining)
+            remaining -= filled[i]
+            if remaining <= _EPS:
+                break
+
+        best_level = self._level(filled, rates, target)
+        caps = [min(self.scale_max, best_level * r) for r in rates]
+
+        shortfall = target - sum(c * u for c, u in zip(credits, caps))
+        sources = sorted(range(len(terms)), key=lambda i: (caps[i], -i))
+        sinks = sorted(range(len(terms)), key=lambda i: (-caps[i], i))
+        s, t = 0, 0
+        while shortfall > _EPS and s < len(sources) and t < len(sinks):
+            source, sink = sources[s], sinks[t]
+            gain = caps[sink] - caps[source]
+            if gain <= _EPS:
+                break
+            if credits[source] <= _EPS:
+                s += 1
+                continue
+            headroom = terms[sink].max_credits - credits[sink]
+            if headroom <= _EPS:
+                t += 1
+                continue
+            amount = min(credits[source], headroom, math.ceil(shortfall / gain - _EPS))
+            credits[source] -= amount
+            credits[sink] += amount
+            shortfall -= amount * gain
@@ -0,0 +1,334 @@
+"""
+GPA Simulator - 계획 저장소
+
+학생 키별로 /simulate 결과를 버전별 스냅샷으로 저장한다. 같은 입력(정규화된 입력 해시가 같음)으로
+다시 요청하면 저장된 계획을 그대로 반환하고, 입력이 바뀐 경우에만 다시 계산해 새 버전으로 저장한다.
+
+- 학생별 최신 스냅샷은 메모리 LRU에 두어 입력 해시 비교와 반환이 O(1)이다 (없으면 저장소에서 한 번 조회).
+  여러 프로세스가 같은 저장소에 쓰면(shared) 메모리의 스냅샷을 쓰기 전에 저장소의 최신 버전 번호만 확인한다
+- 버전 번호와 입력 해시 비교는 저장소의 쓰기 트랜잭션 안에서 정하므로, 같은 저장소를 쓰는 다른 PlanStore(다른 워커
+  프로세스)와 버전이 겹치거나 서로의 이력을 덮어쓰지 않는다
+- 기록하는 동안 들어온 저장 요청은 대기열에 모였다가 다음 트랜잭션 하나로 함께 기록된다 (최대 batch_size개, group commit).
+  save()는 기록을 마친 뒤 반환한다
+- 저장소는 PlanStoreBackend 인터페이스로 교체할 수 있다 (기본 SQLite 파일, 연결 풀 사용)
+"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timezone
+from json.encoder import encode_basestring
+from typing import Iterator, List, Optional, Tuple
+import contextlib
+import logging
+import queue
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PlanSnapshot:
+    """저장된 계획 한 버전 (결과는 results_to_json으로 직렬화된 JSON 배열)"""
+    __slots__ = ("student_key", "version", "input_hash", "input_json", "results_json", "created_at")
+
+    def __init__(self, student_key: str, version: int, input_hash: str, input_json: str,
+                 results_json: str, created_at: str):
+        self.student_key = student_key
+        self.version = version
+        self.input_hash = input_hash
+        self.input_json = input_json
+        self.results_json = results_json
+        self.created_at = created_at
+
+    def to_json(self, recomputed: bool) -> bytes:
+        """StoredPlan 응답 JSON (저장된 결과 JSON을 다시 파싱하지 않고 그대로 붙인다)"""
+        return (
+            '{"student_key":' + encode_basestring(self.student_key)
+            + ',"version":' + str(self.version)
+            + ',"input_hash":' + encode_basestring(self.input_hash)
+            + ',"created_at":' + encode_basestring(self.created_at)
+            + ',"recomputed":' + ("true" if recomputed else "false")
+            + ',"results":' + self.results_json + "}"
+        ).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return (f"PlanSnapshot(student_key={self.student_key!r}, version={self.version!r}, "
+                f"input_hash={self.input_hash!r}, created_at={self.created_at!r})")
+
+
+class PlanStoreBackend(ABC):
+    """계획 저장소 인터페이스"""
+
+    @abstractmethod
+    def latest(self, student_key: str) -> Optional[PlanSnapshot]:
+        """최신 버전 (없으면 None)"""
+
+    def latest_version(self, student_key: str) -> Optional[int]:
+        """최신 버전 번호 (없으면 None)"""
+        snapshot = self.latest(student_key)
+        return snapshot.version if snapshot is not None else None
+
+    @abstractmethod
+    def get(self, student_key: str, version: int) -> Optional[PlanSnapshot]:
+        """지정한 버전 (없으면 None)"""
+
+    @abstractmethod
+    def versions(self, student_key: str) -> List[PlanSnapshot]:
+        """모든 버전 (오래된 순)"""
+
+    @abstractmethod
+    def append_many(self, snapshots: List[PlanSnapshot]) -> List[Tuple[PlanSnapshot, bool]]:
+        """
+        여러 스냅샷을 한 트랜잭션으로 순서대로 추가
+
+        학생별 버전은 트랜잭션 안에서 저장소의 최신 버전 + 1로 정한다 (스냅샷의 version은 무시).
+        최신 버전의 입력 해시가 같으면 추가하지 않는다.
+
+        Returns:
+            스냅샷마다 (저장된 스냅샷, 새로 추가했는지)
+        """
+
+    def open(self) -> None:
+        """닫은 연결 다시 열기 (pre-fork 워커가 fork 후 호출)"""
+
+    def close(self) -> None:
+        """연결 정리"""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plan_snapshots (
+    student_key TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    input_json TEXT NOT NULL,
+    results_json TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (student_key, version)
+)
+"""
+_COLUMNS = "student_key, version, input_hash, input_json, results_json, created_at"
+
+
+class SQLitePlanStoreBackend(PlanStoreBackend):
+    """
+    SQLite 파일 저장소
+
+    연결은 pool_size개를 미리 열어 두고 돌려 쓴다. WAL 모드라 기록 중에도 다른 연결에서 읽을 수 있다.
+    SQLite 연결은 fork를 넘겨 쓰면 안 되므로 pre-fork 부모는 fork 전에 close(), 워커는 open()한다.
+    """
+
+    def __init__(self, path: str = "plans.db", pool_size: int = 4):
+        self.path = path
+        self.pool_size = max(pool_size, 1)
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self.open()
+        with self._connection() as connection:
+            connection.execute(_SCHEMA)
+
+    def open(self) -> None:
+        self.close()
+        for _ in range(self.pool_size):
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._pool.put(connection)
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._pool.get()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._pool.put(connection)
+
+    def latest(self, student_key: str) -> Optional[PlanSnapshot]:
+        with self._connection() as connection:
+            row = connection.execute(
+                f"SELECT {_COLUMNS} FROM plan_snapshots WHERE student_key = ? ORDER BY version DESC LIMIT 1",
+                (student_key,)
+            ).fetchone()
+        return PlanSnapshot(*row) if row else None
+
+    def latest_version(self, student_key: str) -> Optional[int]:
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT MAX(version) FROM plan_snapshots WHERE student_key = ?", (student_key,)
+            ).fetchone()
+        return row[0]
+
+    def get(self, student_key: str, version: int) -> Optional[PlanSnapshot]:
+        with self._connection() as connection:
+            row = connection.execute(
+                f"SELECT {_COLUMNS} FROM plan_snapshots WHERE student_key = ? AND version = ?",
+                (student_key, version)
+            ).fetchone()
+        return PlanSnapshot(*row) if row else None
+
+    def versions(self, student_key: str) -> List[PlanSnapshot]:
+        with self._connection() as connection:
+            rows = connection.execute(
+                f"SELECT {_COLUMNS} FROM plan_snapshots WHERE student_key = ? ORDER BY version",
+                (student_key,)
+            ).fetchall()
+        return [PlanSnapshot(*row) for row in rows]
+
+    def append_many(self, snapshots: List[PlanSnapshot]) -> List[Tuple[PlanSnapshot, bool]]:
+        saved = []
+        with self._connection() as connection:
+            # 최신 버전 조회부터 쓰기 잠금을 잡아 다른 연결(다른 프로세스 포함)이 사이에 같은 버전을 쓰지 못하게 한다
+            connection.execute("BEGIN IMMEDIATE")
+            for s in snapshots:
+                row = connection.execute(
+                    f"SELECT {_COLUMNS} FROM plan_snapshots WHERE student_key = ? ORDER BY version DESC LIMIT 1",
+                    (s.student_key,)
+                ).fetchone()
+                if row is not None and row[2] == s.input_hash:
+                    saved.append((PlanSnapshot(*row), False))
+                    continue
+                snapshot = PlanSnapshot(s.student_key, row[1] + 1 if row is not None else 1, s.input_hash,
+                                        s.input_json, s.results_json, s.created_at)
+                connection.execute(
+                    f"INSERT INTO plan_snapshots ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                    (snapshot.student_key, snapshot.version, snapshot.input_hash, snapshot.input_json,
+                     snapshot.results_json, snapshot.created_at)
+                )
+                saved.append((snapshot, True))
+        return saved
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class _Append:
+    """group commit 대기열의 저장 요청 하나"""
+    __slots__ = ("snapshot", "result", "error")
+
+    def __init__(self, snapshot: PlanSnapshot):
+        self.snapshot = snapshot
+        self.result: Optional[Tuple[PlanSnapshot, bool]] = None
+        self.error: Optional[Exception] = None
+
+
+class PlanStore:
+    """
+    학생별 버전 스냅샷 저장 (최신 버전 메모리 LRU + 동시에 들어온 쓰기를 한 트랜잭션으로 기록)
+
+    shared: 다른 프로세스(pre-fork 워커 등)도 같은 저장소에 쓰는 경우. 메모리의 최신 버전이 저장소보다
+    오래됐을 수 있으므로 peek은 항상 None이고, latest는 저장소의 최신 버전 번호가 같을 때만 메모리 스냅샷을 쓴다.
+    """
+
+    def __init__(self, backend: PlanStoreBackend, cache_size: int = 10000, batch_size: int = 256,
+                 shared: bool = False):
+        self.backend = backend
+        self.cache_size = cache_size
+        self.batch_size = max(batch_size, 1)
+        self.shared = shared
+        self._latest: "OrderedDict[str, PlanSnapshot]" = OrderedDict()
+        self._queue: List[_Append] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def peek(self, student_key: str) -> Optional[PlanSnapshot]:
+        """메모리에 있는 최신 버전 (저장소 조회 없음, shared면 확인 없이 믿을 수 없으므로 None)"""
+        return None if self.shared else self._cached(student_key)
+
+    def latest(self, student_key: str) -> Optional[PlanSnapshot]:
+        """최신 버전 (메모리에 없거나 shared에서 저장소보다 오래됐으면 저장소에서 조회)"""
+        snapshot = self._cached(student_key)
+        if snapshot is not None and (not self.shared or self.backend.latest_version(student_key) == snapshot.version):
+            return snapshot
+        snapshot = self.backend.latest(student_key)
+        if snapshot is not None:
+            self._remember(snapshot)
+        return snapshot
+
+    def get(self, student_key: str, version: int) -> Optional[PlanSnapshot]:
+        return self.backend.get(student_key, version)
+
+    def versions(self, student_key: str) -> List[PlanSnapshot]:
+        """모든 버전 (오래된 순)"""
+        return self.backend.versions(student_key)
+
+    def save(self, student_key: str, input_hash: str, input_json: str, results_json: str) -> Tuple[PlanSnapshot, bool]:
+        """
+        새 버전 저장 (기록을 마친 뒤 반환)
+
+        Returns:
+            (스냅샷, 새로 저장했는지). 저장소의 최신 버전 입력 해시가 같으면 (다른 요청이나 다른 워커가 먼저
+            같은 입력으로 저장한 경우) 새 버전을 만들지 않고 최신 버전을 반환한다.
+        """
+        request = _Append(PlanSnapshot(
+            student_key=student_key,
+            version=0,
+            input_hash=input_hash,
+            input_json=input_json,
+            results_json=results_json,
+            created_at=datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        ))
+        with self._lock:
+            self._queue.append(request)
+        # 앞선 트랜잭션을 기다리는 동안 다른 스레드가 이 요청까지 함께 기록했을 수 있다
+        with self._write_lock:
+            while request.result is None and request.error is None:
+                self._commit()
+        if request.error is not None:
+            raise request.error
+        self._remember(request.result[0])
+        return request.result
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"cached": len(self._latest), "queued": len(self._queue)}
+
+    def _commit(self):
+        """대기열 앞쪽 batch_size개를 한 트랜잭션으로 기록 (_write_lock 안에서 호출)"""
+        with self._lock:
+            batch = self._queue[:self.batch_size]
+            del self._queue[:self.batch_size]
+        try:
+            saved = self.backend.append_many([request.snapshot for request in batch])
+        except Exception as e:
+            logger.warning("Plan store write failed: %s", e)
+            for request in batch:
+                request.error = e
+            return
+        for request, result in zip(batch, saved):
+            request.result = result
+
+    def _cached(self, student_key: str) -> Optional[PlanSnapshot]:
+        with self._lock:
+            snapshot = self._latest.get(student_key)
+            if snapshot is not None:
+                self._latest.move_to_end(student_key)
+            return snapshot
+
+    def _remember(self, snapshot: PlanSnapshot):
+        with self._lock:
+            current = self._latest.get(snapshot.student_key)
+            if current is None or current.version <= snapshot.version:
+                self._latest[snapshot.student_key] = snapshot
+            self._latest.move_to_end(snapshot.student_key)
+            while len(self._latest) > self.cache_size:
+                self._latest.popitem(last=False)
+
+
+def create_plan_store(settings) -> Optional[PlanStore]:
+    """설정에 맞는 계획 저장소 생성 (PLAN_STORE_BACKEND=none이면 None)"""
+    if settings.plan_store_backend == "none":
+        return None
+    if settings.plan_store_backend != "sqlite":
+        raise ValueError(f"알 수 없는 PLAN_STORE_BACKEND: {settings.plan_store_backend}")
+    backend = SQLitePlanStoreBackend(settings.plan_store_path, pool_size=settings.plan_store_pool_size)
+    return PlanStore(
+        backend,
+        cache_size=settings.plan_store_cache_size,
+        batch_size=settings.plan_store_batch_size,
+        shared=settings.plan_store_shared
+    )
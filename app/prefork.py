@@ -0,0 +1,210 @@
+"""
+GPA Simulator - 다중 워커 실행 (pre-fork)
+
+    python -m app.prefork
+
+부모 프로세스가 앱을 import하고 예열(요청 모델 검증, 시뮬레이터 경로, 성적 체계 조회 테이블)한 뒤
+듣기 소켓을 열고 워커를 fork한다. 워커는 부모의 메모리를 copy-on-write로 물려받으므로
+모듈, pydantic 검증기, 성적 체계 테이블 같은 읽기 전용 상태는 복사하지 않고 공유한다.
+fork 전에 gc.freeze()로 그때까지 만든 객체를 GC 대상에서 빼서, 워커의 GC가 참조 정보를 건드려
+공유 페이지를 복사하지 않게 한다.
+
+워커끼리 공유하지 않는 상태 (shared-nothing):
+- 결과 캐시: 워커별 LRU (여러 워커가 결과를 공유하려면 CACHE_BACKEND=redis)
+- 실행 풀, 계획 저장소 SQLite 연결: 워커가 fork 후 각자 연다
+- 계획 저장소 최신 버전 LRU: 워커별. 워커가 2개 이상이면 shared 모드로 바꿔, 메모리의 버전을 쓰기 전에
+  저장소의 최신 버전 번호를 확인한다 (다른 워커가 저장한 새 버전을 놓치지 않도록)
+- 메트릭: 워커별로 기록하고 METRICS_MULTIPROC_DIR의 스냅샷 파일로 합산
+  (설정하지 않으면 임시 디렉터리를 만들어 쓰고 종료할 때 지운다)
+
+워커 수는 WORKERS, 0이면 컨테이너 CPU 할당량(cgroup cpu.max 또는 cfs_quota_us)을 올림한 값과
+사용할 수 있는 코어 수 중 작은 값. 죽은 워커는 다시 fork하고, SIGTERM/SIGINT는 워커에 전달해
+처리 중인 요청을 마치고 종료한다.
+"""
+from typing import Callable, Dict, Optional
+import gc
+import glob
+import logging
+import math
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="ascii") as f:
+        return f.read().strip()
+
+
+def cpu_quota(root: str = CGROUP_ROOT) -> Optional[float]:
+    """컨테이너 CPU 할당량 (코어 수, 제한이 없거나 알 수 없으면 None)"""
+    # cgroup v2: "<quota> <period>" 또는 "max <period>"
+    try:
+        quota, period = _read(os.path.join(root, "cpu.max")).split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    # cgroup v1: 제한이 없으면 quota -1
+    try:
+        quota = int(_read(os.path.join(root, "cpu", "cpu.cfs_quota_us")))
+        period = int(_read(os.path.join(root, "cpu", "cpu.cfs_period_us")))
+        return quota / period if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """이 프로세스가 쓸 수 있는 코어 수 (CPU affinity)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - Linux 외
+        return os.cpu_count() or 1
+
+
+def worker_count(requested: int = 0, root: str = CGROUP_ROOT) -> int:
+    """워커 수 (requested가 0이면 CPU 할당량 올림과 사용 가능한 코어 수 중 작은 값)"""
+    if requested > 0:
+        return requested
+    cpus = available_cpus()
+    quota = cpu_quota(root)
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(cpus, 1)
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """워커가 함께 accept할 듣기 소켓"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class Supervisor:
+    """워커 프로세스 fork와 감시 (죽은 워커는 다시 fork, 종료 시그널은 워커에 전달)"""
+
+    def __init__(self, target: Callable[[], None], workers: int, restart_delay: float = 1.0):
+        self.target = target
+        self.workers = workers
+        self.restart_delay = restart_delay
+        self.children: Dict[int, float] = {}  # pid -> 시작 시각
+        self.stopping = False
+
+    def spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                self.target()
+            except BaseException:
+                logger.exception("Worker failed")
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+        logger.info("Worker %s started", pid)
+        return pid
+
+    def stop(self, signum=signal.SIGTERM, frame=None):
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> None:
+        """워커를 띄우고 모두 종료할 때까지 감시"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for _ in range(self.workers):
+            self.spawn()
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, None)
+            if started is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if self.stopping:
+                logger.info("Worker %s stopped (exit code %s)", pid, code)
+                continue
+            logger.warning("Worker %s exited with code %s, restarting", pid, code)
+            # 시작하자마자 죽는 워커를 계속 fork하지 않도록
+            if time.monotonic() - started < self.restart_delay:
+                time.sleep(self.restart_delay)
+            if not self.stopping:
+                self.spawn()
+
+
+def serve(settings) -> None:
+    """부모에서 예열 후 워커 fork (모두 종료할 때까지 반환하지 않음)"""
+    import uvicorn
+    from app import main
+    from app.metrics import metrics
+    from app.warmup import warm_up
+
+    workers = worker_count(settings.workers)
+    timings = warm_up()
+    logger.info("Prefork warm-up done in %.1fms, starting %d workers (cpu quota %s, cpus %d)",
+                sum(timings.values()), workers, cpu_quota(), available_cpus())
+
+    # 워커별 메트릭을 합산할 디렉터리 (이전 실행의 스냅샷은 지운다)
+    temp_dir = None
+    if metrics.enabled and metrics.multiproc_dir is None and workers > 1:
+        metrics.multiproc_dir = temp_dir = tempfile.mkdtemp(prefix="gpa-metrics-")
+    elif metrics.multiproc_dir:
+        os.makedirs(metrics.multiproc_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(metrics.multiproc_dir, "metrics-*.json")):
+            os.remove(path)
+
+    # SQLite 연결은 fork를 넘겨 쓰지 않는다 (워커가 각자 다시 연다)
+    if main.plan_store is not None:
+        main.plan_store.backend.close()
+        if workers > 1:
+            main.plan_store.shared = True
+
+    sock = bind_socket(settings.host, settings.port, settings.backlog)
+
+    def run_worker():
+        # 부모의 예열 중 기록한 메트릭은 버리고 워커 스냅샷을 바로 남겨 유휴 워커도 /metrics에 보이게 한다
+        metrics.reset()
+        metrics.flush()
+        if main.plan_store is not None:
+            main.plan_store.backend.open()
+        config = uvicorn.Config(
+            main.app, http="httptools", loop="uvloop", timeout_keep_alive=settings.keep_alive_timeout,
+            backlog=settings.backlog, log_level="info", access_log=True, use_colors=False
+        )
+        uvicorn.Server(config).run(sockets=[sock])
+
+    # 지금까지 만든 객체(모듈, 검증기, 조회 테이블)를 GC 대상에서 빼서 워커와 공유하는 페이지를 유지
+    gc.collect()
+    gc.freeze()
+    try:
+        Supervisor(run_worker, workers).run()
+    finally:
+        sock.close()
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    from app.config import settings
+
+    serve(settings)
@@ -0,0 +1,185 @@
+"""
+GPA Simulator - 내부 계산용 레코드
+
+pydantic 검증은 API 경계(요청 파싱)에서만 하고, 시뮬레이터 내부의 학기 목록,
+학기별 계획, 결과는 __slots__ 레코드로 다룬다. 레코드는 검증 없이 생성되고
+속성 딕셔너리가 없어 요청당 할당이 적다. 결과는 results_to_json으로 바로 JSON을 만든다.
+"""
+from json.encoder import encode_basestring
+from typing import List, Optional
+import math
+
+from app.models import CourseGrade, GradeMix, GradedSimulationResult, SimulationResult
+
+
+class TermRecord:
+    """남은 학기 (입력 TermItem의 복사본 또는 자동 추가된 계절학기)"""
+    __slots__ = ("id", "type", "planned_credits", "max_credits")
+
+    def __init__(self, id: str, type: str, planned_credits: float, max_credits: float):
+        self.id = id
+        self.type = type
+        self.planned_credits = planned_credits
+        self.max_credits = max_credits
+
+    @classmethod
+    def from_item(cls, item) -> "TermRecord":
+        """TermItem(또는 같은 속성을 가진 객체)을 복사"""
+        return cls(item.id, item.type, item.planned_credits, item.max_credits)
+
+    def __repr__(self) -> str:
+        return (f"TermRecord(id={self.id!r}, type={self.type!r}, "
+                f"planned_credits={self.planned_credits!r}, max_credits={self.max_credits!r})")
+
+
+class TermPlan:
+    """Step 3~5에서 다루는 학기별 계획"""
+    __slots__ = ("term_id", "credits", "required_avg", "max_credits", "is_capped")
+
+    def __init__(self, term_id: str, credits: float, required_avg: float, max_credits: float,
+                 is_capped: bool = False):
+        self.term_id = term_id
+        self.credits = credits
+        self.required_avg = required_avg
+        self.max_credits = max_credits
+        self.is_capped = is_capped
+
+    def with_required_avg(self, required_avg: float) -> "TermPlan":
+        """필요 평점만 바꾼 복사본"""
+        return TermPlan(self.term_id, self.credits, required_avg, self.max_credits)
+
+    def __repr__(self) -> str:
+        return (f"TermPlan(term_id={self.term_id!r}, credits={self.credits!r}, "
+                f"required_avg={self.required_avg!r}, max_credits={self.max_credits!r}, "
+                f"is_capped={self.is_capped!r})")
+
+
+class ResultRecord:
+    """학기별 필요 평점 결과 (SimulationResult와 같은 필드)"""
+    __slots__ = ("term_id", "credits", "required_avg")
+
+    def __init__(self, term_id: str, credits: float, required_avg: float):
+        self.term_id = term_id
+        self.credits = credits
+        self.required_avg = required_avg
+
+    def to_model(self) -> SimulationResult:
+        """응답 모델로 변환 (값은 이미 검증되어 있으므로 검증 생략)"""
+        return SimulationResult.model_construct(
+            term_id=self.term_id, credits=self.credits, required_avg=self.required_avg
+        )
+
+    def to_dict(self) -> dict:
+        return {"term_id": self.term_id, "credits": self.credits, "required_avg": self.required_avg}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ResultRecord):
+            return NotImplemented
+        return (self.term_id == other.term_id and self.credits == other.credits
+                and self.required_avg == other.required_avg)
+
+    def __repr__(self) -> str:
+        return (f"ResultRecord(term_id={self.term_id!r}, credits={self.credits!r}, "
+                f"required_avg={self.required_avg!r})")
+
+
+class GradedResultRecord(ResultRecord):
+    """grade_scale을 지정한 경우의 결과 (GradedSimulationResult와 같은 필드, 조합은 조회 테이블의 GradeMix 공유)"""
+    __slots__ = ("courses", "discrete_avg", "grade_mixes", "course_grades")
+
+    def __init__(self, term_id: str, credits: float, required_avg: float,
+                 courses: int, discrete_avg: float, grade_mixes: List[GradeMix],
+                 course_grades: Optional[List[CourseGrade]] = None):
+        super().__init__(term_id, credits, required_avg)
+        self.courses = courses
+        self.discrete_avg = discrete_avg
+        self.grade_mixes = grade_mixes
+        self.course_grades = course_grades
+
+    def to_model(self) -> GradedSimulationResult:
+        return GradedSimulationResult.model_construct(
+            term_id=self.term_id, credits=self.credits, required_avg=self.required_avg,
+            courses=self.courses, discrete_avg=self.discrete_avg, grade_mixes=self.grade_mixes,
+            course_grades=self.course_grades
+        )
+
+    def to_dict(self) -> dict:
+        return dict(
+            super().to_dict(), courses=self.courses, discrete_avg=self.discrete_avg,
+            grade_mixes=[m.model_dump() for m in self.grade_mixes],
+            course_grades=None if self.course_grades is None else [c.model_dump() for c in self.course_grades]
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GradedResultRecord):
+            return NotImplemented
+        return (super().__eq__(other) and self.courses == other.courses
+                and self.discrete_avg == other.discrete_avg and self.grade_mixes == other.grade_mixes
+                and self.course_grades == other.course_grades)
+
+    def __repr__(self) -> str:
+        return (f"GradedResultRecord(term_id={self.term_id!r}, credits={self.credits!r}, "
+                f"required_avg={self.required_avg!r}, courses={self.courses!r}, "
+                f"discrete_avg={self.discrete_avg!r}, grade_mixes={self.grade_mixes!r}, "
+                f"course_grades={self.course_grades!r})")
+
+
+def record_from_dict(r: dict) -> ResultRecord:
+    """to_dict/results_to_json 형식의 dict를 레코드로 복원 (결과 캐시)"""
+    if "grade_mixes" in r:
+        return GradedResultRecord(
+            r["term_id"], r["credits"], r["required_avg"], r["courses"], r["discrete_avg"],
+            [GradeMix.model_construct(average=m["average"], grades=m["grades"]) for m in r["grade_mixes"]],
+            None if r["course_grades"] is None else [CourseGrade.model_construct(**c) for c in r["course_grades"]]
+        )
+    return ResultRecord(r["term_id"], r["credits"], r["required_avg"])
+
+
+def _encode_float(value: float) -> str:
+    """pydantic JSON 직렬화와 같은 규칙 (NaN/inf는 null)"""
+    if math.isfinite(value):
+        return repr(float(value))
+    return "null"
+
+
+def _encode_mix(mix) -> str:
+    return ('{"average":' + _encode_float(mix.average) + ',"grades":{'
+            + ",".join(encode_basestring(k) + ":" + str(v) for k, v in mix.grades.items()) + "}}")
+
+
+def _encode_course_grades(course_grades) -> str:
+    if course_grades is None:
+        return "null"
+    return "[" + ",".join(
+        '{"id":' + encode_basestring(c.id) + ',"credits":' + _encode_float(c.credits)
+        + ',"grade":' + encode_basestring(c.grade) + ',"points":' + _encode_float(c.points) + "}"
+        for c in course_grades
+    ) + "]"
+
+
+def _graded_results_to_json(results: list) -> bytes:
+    body = "[" + ",".join(
+        '{"term_id":' + encode_basestring(r.term_id)
+        + ',"credits":' + _encode_float(r.credits)
+        + ',"required_avg":' + _encode_float(r.required_avg)
+        + ',"courses":' + str(r.courses)
+        + ',"discrete_avg":' + _encode_float(r.discrete_avg)
+        + ',"grade_mixes":[' + ",".join(_encode_mix(m) for m in r.grade_mixes) + "]"
+        + ',"course_grades":' + _encode_course_grades(r.course_grades) + "}"
+        for r in results
+    ) + "]"
+    return body.encode("utf-8")
+
+
+def results_to_json(results: List[ResultRecord]) -> bytes:
+    """결과 목록을 JSON 배열로 직렬화 (FastAPI 기본 응답과 같은 압축 형식)"""
+    # 한 목록의 결과는 모두 같은 종류 (grade_scale 지정 여부는 입력 단위)
+    if results and getattr(results[0], "grade_mixes", None) is not None:
+        return _graded_results_to_json(results)
+    body = "[" + ",".join(
+        '{"term_id":' + encode_basestring(r.term_id)
+        + ',"credits":' + _encode_float(r.credits)
+        + ',"required_avg":' + _encode_float(r.required_avg) + "}"
+        for r in results
+    ) + "]"
+    return body.encode("utf-8")
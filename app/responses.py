@@ -0,0 +1,44 @@
+"""
+GPA Simulator - 빠른 JSON 응답
+
+FastAPI는 엔드포인트가 모델을 반환하면 response_model로 한 번 더 검증하고
+jsonable_encoder로 딕셔너리를 만든 뒤 표준 json으로 인코딩한다. 엔드포인트가 만든 모델은
+이미 검증된 값이므로, FastJSONResponse로 감싸 반환하면 이 과정을 건너뛰고 한 번에 JSON 바이트를 만든다.
+(응답 스키마 문서는 response_model 그대로 유지된다)
+
+- orjson이 설치되어 있으면 orjson (pydantic 모델은 model_dump로 변환)
+- 없으면 pydantic_core.to_json (모델 직렬화기를 그대로 사용)
+
+두 방식 모두 표준 json과 같은 값을 만든다 (공백 없음, 한글은 UTF-8 그대로).
+"""
+from typing import Any
+
+import pydantic_core
+from pydantic import BaseModel
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - requirements.txt에 포함
+    orjson = None
+
+
+def _default(value: Any):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 값: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """모델, 모델 목록, 딕셔너리를 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(Response):
+    """검증이 끝난 응답 모델을 재검증 없이 한 번에 직렬화하는 JSON 응답"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,203 @@
+"""
+GPA Simulator - 재수강 (성적 대체)
+
+이수 이력의 과목 기록(HistoryItem.courses)을 과목 ID로 색인해 두고, 재수강으로 과목 성적을
+바꾸는 것을 grade points 합계에 대한 O(1) 갱신으로 계산한다. 재수강 학점은 졸업 학점에 다시
+더해지지 않으므로(성적 대체) 이수 학점 C_e와 남은 학점 C_r은 그대로이고,
+
+    g_need = (G_t × C_tot - grade points) / C_r
+
+에서 grade points만 바뀐다. 따라서 후보 하나의 효과는 grade points 증가량 / C_r 만큼 g_need가 낮아지는 것이다.
+
+- 후보: 재수강 예상 평점(retake_grade, 기본 scale_max)보다 낮은 과목 (eligible_max 이하만)
+- 최선의 재수강: g_need <= max_required_avg가 되는 가장 적은 과목 수.
+  k과목으로 얻을 수 있는 최대 증가량은 증가량 상위 k개의 합이므로 증가량 순으로 정렬해 앞에서부터 고른다
+- 계획: 고른 과목을 반영한 이력으로 /simulate와 같은 계산 (바뀐 학기만 achieved_avg가 달라진다)
+"""
+from typing import Dict, List, Optional, Tuple
+
+from app import tasks
+from app.models import (
+    HistoryItem, RetakeCandidate, RetakeResult, RetakeSearchResult, SimulationInput
+)
+
+# 과목 평점으로 계산한 학기 평균과 achieved_avg의 허용 오차 (성적표의 학기 평균은 보통 소수 둘째 자리로 반올림)
+AVG_TOLERANCE = 0.005
+
+
+def validate_courses(data: SimulationInput) -> Optional[str]:
+    """
+    이력 과목 기록 검증 (문제가 있으면 에러 메시지 반환)
+
+    학기 grade points는 credits × achieved_avg, 재수강 증가량은 과목 평점으로 계산하므로
+    두 값이 같은 성적을 나타내야 한다 (과목 학점 합계 = credits, 과목 학점 가중 평균 ≈ achieved_avg).
+    """
+    seen = set()
+    for h in data.history:
+        if h.courses is None:
+            continue
+        total = sum(c.credits for c in h.courses)
+        if abs(total - h.credits) > 1e-9:
+            return f"{h.term_id} 학기의 과목 학점 합계 ({total})가 이수 학점 ({h.credits})과 다릅니다"
+        for c in h.courses:
+            if c.id in seen:
+                return f"과목 ID가 중복됩니다: {c.id}"
+            if c.grade_points > data.scale_max:
+                return f"과목 평점 ({c.grade_points})이 최대 평점 ({data.scale_max})을 초과합니다: {c.id}"
+            seen.add(c.id)
+        average = sum(c.credits * c.grade_points for c in h.courses) / h.credits
+        if abs(average - h.achieved_avg) > AVG_TOLERANCE:
+            return (f"{h.term_id} 학기의 과목 평점 평균 ({average:.4f})이 "
+                    f"학기 평균 평점 ({h.achieved_avg})과 다릅니다")
+    return None
+
+
+class CourseIndex:
+    """이수 과목 색인 (과목 ID → 학기 위치, 학점, 평점)과 학기별/전체 grade points"""
+
+    def __init__(self, history: List[HistoryItem]):
+        self.history = history
+        self.credits = sum(h.credits for h in history)
+        self.term_points = [h.credits * h.achieved_avg for h in history]
+        self.grade_points = sum(self.term_points)
+        # 과목 ID → (학기 위치, 학점, 현재 평점)
+        self.courses: Dict[str, Tuple[int, float, float]] = {
+            c.id: (i, c.credits, c.grade_points)
+            for i, h in enumerate(history) if h.courses is not None
+            for c in h.courses
+        }
+        self._changed = set()
+
+    def gain(self, course_id: str, grade_points: float) -> float:
+        """과목 성적을 grade_points로 바꿀 때 grade points 증가량 (O(1))"""
+        _, credits, current = self.courses[course_id]
+        return credits * (grade_points - current)
+
+    def replace(self, course_id: str, grade_points: float) -> float:
+        """
+        과목 성적 대체 (O(1), grade points 증가량 반환)
+
+        Raises:
+            KeyError: 없는 과목 ID
+        """
+        term, credits, current = self.courses[course_id]
+        delta = credits * (grade_points - current)
+        self.courses[course_id] = (term, credits, grade_points)
+        self.term_points[term] += delta
+        self.grade_points += delta
+        self._changed.add(term)
+        return delta
+
+    def gpa(self, extra_points: float = 0.0) -> float:
+        return (self.grade_points + extra_points) / self.credits if self.credits > 0 else 0.0
+
+    def to_history(self) -> List[HistoryItem]:
+        """성적 대체를 반영한 이력 (바뀐 학기만 새 HistoryItem)"""
+        history = list(self.history)
+        for i in self._changed:
+            h = history[i]
+            history[i] = h.model_copy(update={"achieved_avg": self.term_points[i] / h.credits})
+        return history
+
+
+class RetakePlanner:
+    """재수강 반영 계획과 최선의 재수강 탐색"""
+
+    def __init__(self, data: SimulationInput):
+        self.data = data
+        self.index = CourseIndex(data.history)
+        self.C_r = data.C_tot - self.index.credits
+
+    def required_avg(self, extra_points: float = 0.0) -> float:
+        """남은 학기 균등 필요 평점 g_need (Step 1과 같은 식, 성적 대체로 늘어난 grade points 반영)"""
+        if self.C_r <= 0:
+            raise ValueError("이미 졸업 요구 학점을 충족했습니다")
+        return (self.data.G_t * self.data.C_tot - self.index.grade_points - extra_points) / self.C_r
+
+    def _candidate(self, course_id: str, grade_points: float) -> RetakeCandidate:
+        term, credits, current = self.index.courses[course_id]
+        gain = self.index.gain(course_id, grade_points)
+        return RetakeCandidate(
+            course_id=course_id,
+            term_id=self.data.history[term].term_id,
+            credits=credits,
+            grade_points=current,
+            retake_grade_points=grade_points,
+            gain=round(gain, 4),
+            gpa=round(self.index.gpa(gain), 4),
+            required_avg=round(self.required_avg(gain), 4)
+        )
+
+    def apply(self, retakes: List[Tuple[str, float]]) -> RetakeResult:
+        """
+        재수강 반영 후 계획
+
+        Raises:
+            KeyError: 없는 과목 ID
+            ValueError: 반영 후 목표 달성 불가능한 경우 (/simulate와 같은 조건)
+        """
+        applied = [self._candidate(course_id, grade) for course_id, grade in retakes]
+        for course_id, grade in retakes:
+            self.index.replace(course_id, grade)
+
+        data = self.data.model_copy(update={"history": self.index.to_history()})
+        results = tasks.simulate(data)
+        return RetakeResult(
+            retakes=applied,
+            gpa=round(self.index.gpa(), 4),
+            required_avg=round(self.required_avg(), 4),
+            results=[r.to_model() for r in results]
+        )
+
+    def search(self, retake_grade: Optional[float] = None, eligible_max: Optional[float] = None,
+               max_retakes: Optional[int] = None, max_required_avg: Optional[float] = None,
+               limit: int = 20) -> RetakeSearchResult:
+        """
+        g_need <= max_required_avg가 되는 가장 적은 재수강 과목 탐색
+
+        Raises:
+            ValueError: 이미 졸업 요구 학점을 충족한 경우
+        """
+        grade = self.data.scale_max if retake_grade is None else retake_grade
+        ceiling = self.data.scale_max if max_required_avg is None else max_required_avg
+        baseline = self.required_avg()
+
+        # 후보별 증가량은 O(1), 증가량이 큰 순 (같으면 학점이 적은 순, 과목 ID 순)
+        gains = sorted(
+            (
+                (self.index.gain(course_id, grade), credits, course_id)
+                for course_id, (_, credits, current) in self.index.courses.items()
+                if current < grade and (eligible_max is None or current <= eligible_max)
+            ),
+            key=lambda item: (-item[0], item[1], item[2])
+        )
+
+        # g_need <= ceiling ⇔ 증가량 합계 >= (baseline - ceiling) × C_r
+        shortfall = (baseline - ceiling) * self.C_r
+        selected: List[str] = []
+        total = 0.0
+        reachable = shortfall <= 1e-9
+        if not reachable:
+            for gain, _, course_id in gains[:max_retakes]:
+                selected.append(course_id)
+                total += gain
+                if total >= shortfall - 1e-9:
+                    reachable = True
+                    break
+
+        plan = None
+        if reachable and selected:
+            try:
+                plan = RetakePlanner(self.data).apply([(course_id, grade) for course_id in selected])
+            except ValueError:
+                # 재수강만으로 목표를 넘어서 남은 학기에 필요한 평점이 없는 경우
+                plan = None
+
+        return RetakeSearchResult(
+            gpa=round(self.index.gpa(), 4),
+            required_avg=round(baseline, 4),
+            reachable=reachable,
+            selected=selected if reachable else [],
+            candidates=[self._candidate(course_id, grade) for _, _, course_id in gains[:limit]],
+            plan=plan
+        )
@@ -0,0 +1,154 @@
+"""
+GPA Simulator - 목표 달성 확률 (Monte Carlo)
+
+GPASimulator의 학기별 계획(학점, 필요 평점)을 그대로 두고, 학기별 실제 평점을
+이수 이력에서 추정한 분포에서 뽑아 졸업 GPA의 분포를 계산한다.
+
+- 분포: 평균은 이수 이력의 학점 가중 평균(G_c), 표준편차는 학기 평점의 학점 가중
+  표준편차. 학기마다 독립인 정규분포를 [0, scale_max]로 자른다.
+  이력이 두 학기 미만이면 표준편차는 DEFAULT_STD, 요청에서 mean/std로 바꿀 수 있다
+- 성공 확률: 졸업 GPA >= G_t 인 표본 비율
+- 민감도: 한 학기의 평점만 표준편차만큼 낮아질 때 성공 확률이 줄어드는 양.
+  가장 크게 줄어드는 학기가 most_sensitive_term
+- 학기별 달성 확률(학기 평점 >= 필요 평점)은 분포에서 바로 계산한다
+
+표본은 BLOCK_DRAWS × 학기 수 행렬 단위로 만들어 벡터 연산으로 처리하므로 메모리
+사용량은 표본 수와 거의 무관하다. 같은 seed면 결과가 같다.
+"""
+from typing import List, Optional, Tuple
+import logging
+import math
+
+import numpy as np
+
+from app.models import HistoryItem, TermItem, RiskResult, RiskTermResult
+from app.simulator import GPASimulator
+
+logger = logging.getLogger(__name__)
+
+# 이력이 두 학기 미만이라 표준편차를 추정할 수 없을 때의 학기 평점 표준편차
+DEFAULT_STD = 0.3
+# 추정한 표준편차의 하한 (매 학기 평점이 같았던 학생도 불확실성은 남긴다)
+MIN_STD = 0.05
+# 한 번에 만드는 표본 수 (표본 행렬 크기 제한)
+BLOCK_DRAWS = 1 << 15
+PERCENTILES = (5, 25, 50, 75, 95)
+
+_EPS = 1e-9
+
+
+class RiskSimulator:
+    """학기별 계획의 목표 GPA 달성 확률 계산"""
+
+    def __init__(self, scale_max: float, G_t: float, C_tot: float,
+                 history: List[HistoryItem], terms: List[TermItem],
+                 draws: int = 100_000, seed: int = 0,
+                 mean: Optional[float] = None, std: Optional[float] = None, rounding: str = "float"):
+        self.scale_max = scale_max
+        self.G_t = G_t
+        self.C_tot = C_tot
+        self.history = history
+        self.terms = terms
+        self.draws = draws
+        self.seed = seed
+        self.mean = mean
+        self.std = std
+        self.rounding = rounding
+
+    def fit(self) -> Tuple[float, float]:
+        """
+        학기 평점 분포 (평균, 표준편차)
+
+        Raises:
+            ValueError: 이수 이력이 없고 mean도 지정하지 않은 경우
+        """
+        credits = sum(h.credits for h in self.history)
+        if credits > 0:
+            mean = sum(h.credits * h.achieved_avg for h in self.history) / credits
+        elif self.mean is not None:
+            mean = self.mean
+        else:
+            raise ValueError("이수 이력이 없으면 mean을 지정해야 합니다")
+
+        if len(self.history) >= 2:
+            variance = sum(h.credits * (h.achieved_avg - mean) ** 2 for h in self.history) / credits
+            std = max(math.sqrt(variance), MIN_STD)
+        else:
+            std = DEFAULT_STD
+
+        return (
+            self.mean if self.mean is not None else mean,
+            self.std if self.std is not None else std
+        )
+
+    def run(self) -> RiskResult:
+        """
+        Monte Carlo 실행
+
+        Raises:
+            ValueError: 목표 달성 불가능한 경우 (/simulate와 같은 조건) 또는 분포를 정할 수 없는 경우
+        """
+        plan = GPASimulator(self.scale_max, self.G_t, self.C_tot, self.history, self.terms, self.rounding).simulate_records()
+        mean, std = self.fit()
+
+        credits = np.array([r.credits for r in plan])
+        completed_credits = sum(h.credits for h in self.history)
+        completed_points = sum(h.credits * h.achieved_avg for h in self.history)
+        total_credits = completed_credits + float(credits.sum())
+        # 학기 평점 1점이 졸업 GPA에 주는 영향
+        gpa_weights = credits / total_credits
+        base_gpa = completed_points / total_credits
+        threshold = self.G_t - _EPS
+
+        # 학기 i만 std 낮아질 때 GPA가 줄어드는 최대폭. 목표와의 차이가 이보다 큰 표본은 민감도에 영향이 없다
+        max_drop = float(gpa_weights.max()) * std
+
+        rng = np.random.default_rng(self.seed)
+        gpas = np.empty(self.draws)
+        lost = np.zeros(len(plan))
+        for start in range(0, self.draws, BLOCK_DRAWS):
+            size = min(BLOCK_DRAWS, self.draws - start)
+            outcomes = rng.normal(mean, std, size=(size, len(plan)))
+            np.clip(outcomes, 0.0, self.scale_max, out=outcomes)
+
+            gpa = base_gpa + outcomes @ gpa_weights
+            gpas[start:start + size] = gpa
+
+            # 학기 i만 std 낮아질 때 (0점 아래로는 내려가지 않음) 실패로 바뀌는 표본 수
+            near = (gpa >= threshold) & (gpa < threshold + max_drop)
+            drop = np.minimum(outcomes[near], std) * gpa_weights
+            lost += ((gpa[near, None] - drop) < threshold).sum(axis=0)
+
+        success_probability = float((gpas >= threshold).mean())
+        sensitivity = lost / self.draws
+        percentiles = np.percentile(gpas, PERCENTILES)
+
+        return RiskResult(
+            success_probability=round(success_probability, 4),
+            mean_gpa=round(float(gpas.mean()), 2),
+            gpa_percentiles={f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, percentiles)},
+            most_sensitive_term=plan[int(np.argmax(sensitivity))].term_id,
+            terms=[
+                RiskTermResult(
+                    term_id=r.term_id,
+                    credits=r.credits,
+                    required_avg=r.required_avg,
+                    meet_probability=round(self._meet_probability(r.required_avg, mean, std), 4),
+                    sensitivity=round(float(s), 4)
+                )
+                for r, s in zip(plan, sensitivity)
+            ],
+            fitted_mean=round(mean, 4),
+            fitted_std=round(std, 4),
+            draws=self.draws,
+            seed=self.seed
+        )
+
+    def _meet_probability(self, required_avg: float, mean: float, std: float) -> float:
+        """학기 평점이 필요 평점 이상일 확률 (잘린 정규분포의 꼬리 확률, 표본 없이 정확히 계산)"""
+        if required_avg <= 0:
+            return 1.0
+        if required_avg > self.scale_max:
+            return 0.0
+        # 상한에서 잘린 질량은 scale_max에 모이므로 required_avg <= scale_max면 꼬리에 포함된다
+        return 0.5 * math.erfc((required_avg - mean) / (std * math.sqrt(2)))
@@ -0,0 +1,168 @@
+"""
+GPA Simulator - 학기 계획 시나리오 비교
+
+"S5에 21학점", "계절학기 추가", "S8을 12학점으로" 같은 학기 계획 변경을 한 번에 비교한다.
+이수 이력 집계(C_e, G_c, C_r), 필요 평균 평점(g_need)과 목표 달성 가능 여부는 학기 계획과
+무관하므로 한 번만 계산하고, 시나리오마다 변경을 적용한 학기 목록으로 Step 2~5만 다시 실행한다.
+각 시나리오의 결과는 변경을 적용한 입력으로 /simulate를 호출한 결과와 같다.
+"""
+from typing import List, Optional, Sequence, Tuple
+import logging
+import math
+
+from app.config import settings
+from app.models import (
+    SimulationInput, PlannedCreditsChanged, MaxCreditsChanged, TermAdded, TermRemoved,
+    Scenario, ScenarioRow, ScenarioComparison
+)
+from app.records import ResultRecord, TermRecord
+from app.simulator import GPASimulator
+
+logger = logging.getLogger(__name__)
+
+
+def _position(terms: List[TermRecord], term_id: str) -> int:
+    for i, term in enumerate(terms):
+        if term.id == term_id:
+            return i
+    raise KeyError(f"남은 학기에 {term_id}가 없습니다")
+
+
+def apply_edits(terms: Sequence[TermRecord], edits) -> List[TermRecord]:
+    """
+    학기 목록 복사본에 변경을 순서대로 적용
+
+    Raises:
+        KeyError: 없는 학기 ID 또는 이미 있는 학기 ID 추가
+    """
+    edited = [TermRecord(t.id, t.type, t.planned_credits, t.max_credits) for t in terms]
+    for edit in edits:
+        if isinstance(edit, TermAdded):
+            if any(t.id == edit.term.id for t in edited):
+                raise KeyError(f"남은 학기에 {edit.term.id}가 이미 있습니다")
+            position = len(edited) if edit.after is None else _position(edited, edit.after) + 1
+            edited.insert(position, TermRecord.from_item(edit.term))
+        elif isinstance(edit, TermRemoved):
+            del edited[_position(edited, edit.term_id)]
+        elif isinstance(edit, PlannedCreditsChanged):
+            edited[_position(edited, edit.term_id)].planned_credits = edit.planned_credits
+        elif isinstance(edit, MaxCreditsChanged):
+            edited[_position(edited, edit.term_id)].max_credits = edit.max_credits
+        else:
+            raise TypeError(f"알 수 없는 변경 사항: {type(edit).__name__}")
+    return edited
+
+
+def validate_terms(terms: Sequence[TermRecord]) -> Optional[str]:
+    """
+    변경을 적용한 학기 목록 검증 (SimulationInput.terms와 같은 길이 제한, /simulate의 422)
+
+    계획 학점이 최대 학점을 넘는 학기는 /simulate처럼 Step 4에서 잘리므로 거절하지 않는다.
+    """
+    if not terms:
+        return "남은 학기가 없습니다 (terms는 1개 이상이어야 합니다)"
+    if len(terms) > settings.max_terms:
+        return f"남은 학기가 {len(terms)}개로 최대 {settings.max_terms}개를 넘습니다"
+    return None
+
+
+def split_scenarios(scenarios: List[Scenario], parts: int, min_size: int = 64) -> List[List[Scenario]]:
+    """실행 풀에 나눠 보낼 연속 구간 (구간당 최소 min_size개, 최대 parts개)"""
+    parts = max(1, min(parts, math.ceil(len(scenarios) / min_size)))
+    size = math.ceil(len(scenarios) / parts)
+    return [scenarios[i:i + size] for i in range(0, len(scenarios), size)]
+
+
+class ScenarioComparer:
+    """
+    기준 입력 하나에 여러 학기 계획 변경을 적용해 비교
+
+    생성할 때 Step 1(현재 상태, 필요 평균 평점, 달성 가능 여부)을 한 번 계산한다.
+    /simulate/scenarios는 실행 풀 작업(tasks.compare_scenarios) 안에서 시나리오 구간마다 만든다.
+
+    Raises:
+        ValueError: 기준 입력이 목표 달성 불가능 (모든 시나리오에 공통, /simulate의 422)
+    """
+
+    def __init__(self, data: SimulationInput):
+        self.scale_max = data.scale_max
+        self.G_t = data.G_t
+        self.C_tot = data.C_tot
+        self.history = data.history
+        self.rounding = data.rounding
+
+        base = GPASimulator(data.scale_max, data.G_t, data.C_tot, data.history, data.terms, data.rounding)
+        self.C_e, self.G_c, self.C_r, self.g_need = base._calculate_current_state()
+        self.terms = base.terms
+        # exact 라운딩의 이력 정수 합계도 시나리오끼리 공유
+        self._scaled_history = base._scaled_history
+
+    @property
+    def max_achievable_gpa(self) -> float:
+        return (self.G_c * self.C_e + self.scale_max * self.C_r) / self.C_tot
+
+    def compare(self, scenarios: List[Scenario], include_results: bool = False) -> ScenarioComparison:
+        """기준 계획과 모든 시나리오 비교 (한 스레드에서 순서대로)"""
+        return self.comparison(self.evaluate(scenarios, include_results, include_base=True))
+
+    def comparison(self, rows: List[ScenarioRow]) -> ScenarioComparison:
+        """evaluate(include_base=True) 결과(들을 이어 붙인 목록)로 비교 결과 생성"""
+        return ScenarioComparison(
+            current_gpa=self.G_c,
+            required_avg=self.g_need,
+            max_achievable_gpa=self.max_achievable_gpa,
+            base=rows[0],
+            scenarios=rows[1:]
+        )
+
+    def evaluate(self, scenarios: List[Scenario], include_results: bool = False,
+                 include_base: bool = False) -> List[ScenarioRow]:
+        """시나리오별 결과 (include_base면 맨 앞에 기준 계획)"""
+        rows = [self._row("base", (), include_results)] if include_base else []
+        rows.extend(self._row(scenario.name, scenario.edits, include_results) for scenario in scenarios)
+        logger.debug("Scenario comparison: %d scenarios, %d terms", len(scenarios), len(self.terms))
+        return rows
+
+    def _row(self, name: str, edits, include_results: bool) -> ScenarioRow:
+        try:
+            terms = apply_edits(self.terms, edits)
+        except KeyError as e:
+            return ScenarioRow(name=name, status_code=400, feasible=False, detail=e.args[0])
+        error = validate_terms(terms)
+        if error is not None:
+            return ScenarioRow(name=name, status_code=422, feasible=False, detail=error)
+
+        try:
+            results, extra_summer_credits = self._simulate(terms)
+        except ValueError as e:
+            return ScenarioRow(name=name, status_code=422, feasible=False, detail=str(e))
+
+        peak: Optional[ResultRecord] = None
+        for record in results:
+            if peak is None or record.required_avg > peak.required_avg:
+                peak = record
+        return ScenarioRow(
+            name=name,
+            status_code=200,
+            feasible=True,
+            peak_required_avg=peak.required_avg if peak is not None else None,
+            peak_term_id=peak.term_id if peak is not None else None,
+            extra_summer_credits=round(extra_summer_credits, 2),
+            total_credits=round(sum(r.credits for r in results), 2),
+            results=[r.to_model() for r in results] if include_results else None
+        )
+
+    def _simulate(self, terms: List[TermRecord]) -> Tuple[List[ResultRecord], float]:
+        """Step 2~5 (학기별 결과, 자동 추가된 계절학기 학점 합계)"""
+        simulator = GPASimulator(self.scale_max, self.G_t, self.C_tot, self.history, (), self.rounding)
+        simulator.terms = terms
+        simulator._scaled_history = self._scaled_history
+        count = len(terms)
+
+        simulator._adjust_remaining_credits(self.C_r)
+        term_plans = simulator._initial_distribution(self.g_need)
+        term_plans = simulator._water_filling_adjustment(term_plans, self.C_r, self.g_need)
+        results = simulator._round_and_adjust(term_plans, self.G_c, self.C_e)
+
+        added = {term.id for term in simulator.terms[count:]}
+        return results, sum(r.credits for r in results if r.term_id in added)
@@ -1,23 +1,102 @@
 """
 GPA Simulator - Core calculation logic
 """
-from typing import List, Dict
+from typing import List, Tuple
 from app.models import HistoryItem, TermItem, SimulationResult
 import logging
+import math
+import operator
+import time
+
+from app.logging_config import trace_enabled
+from app.metrics import metrics
+from app.records import TermRecord, TermPlan, ResultRecord
 
 logger = logging.getLogger(__name__)
 
+# 목표 달성을 위해 자동 추가되는 계절학기 (학점, 최대 학점)
+EXTRA_SUMMER_CREDITS = 6
+EXTRA_SUMMER_MAX_CREDITS = 9
+
+# 달성 불가능 메시지에서 계절학기 추가를 안내하는 최대 학점
+MAX_ADDITIONAL_CREDITS = 50
+
+# Step 5 라운딩 방식 (float: 반올림 후 마지막 학기 보정, exact: 정수 연산 + 최대 잔여 배분)
+ROUNDING_MODES = ("float", "exact")
+# exact 라운딩에서 입력(이력, 목표 GPA, 평점 최대값)을 정수로 바꾸는 배율 (소수 여섯째 자리까지 정확)
+EXACT_INPUT_SCALE = 10 ** 6
+# 0.01 단위 정수 → 입력 배율, (0.01학점 × 0.01점) 단위 정수 → 입력 배율²
+_EXACT_HUNDREDTH = EXACT_INPUT_SCALE // 100
+_EXACT_POINT_UNIT = EXACT_INPUT_SCALE ** 2 // 10_000
+
+
+class WaterLevel:
+    """
+    sum(credits[i] * min(level, caps[i])) == target 을 만족하는 공통 평점(수위) 계산기
+
+    상한 기준으로 정렬한 뒤 상한이 낮은 학기부터 고정했을 때의 누적 grade points와
+    남은 학점을 미리 계산해 두고 (O(n log n)), 목표 grade points마다 이분 탐색으로 수위를 구한다 (O(log n)).
+    같은 학기 구성에 여러 목표를 적용할 때 한 번만 만들어 재사용한다.
+    """
+
+    def __init__(self, credits: List[float], caps: List[float]):
+        order = sorted(range(len(caps)), key=caps.__getitem__)
+        self.caps = [caps[i] for i in order]
+        # k번째 학기 직전까지 상한으로 고정했을 때의 grade points / 남은 학점
+        self.fixed_grade_points = [0.0]
+        self.remaining_credits = [sum(credits)]
+        for i in order:
+            self.fixed_grade_points.append(self.fixed_grade_points[-1] + credits[i] * caps[i])
+            self.remaining_credits.append(self.remaining_credits[-1] - credits[i])
+
+    def _level_at(self, k: int, target: float) -> float:
+        return (target - self.fixed_grade_points[k]) / self.remaining_credits[k]
+
+    def solve(self, target: float) -> Tuple[float, int]:
+        """
+        Returns:
+            (수위, 상한에 고정된 학기 수). 모든 학기를 상한으로 채워도 부족하면 수위는 inf
+        """
+        lo, hi = 0, len(self.caps)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._level_at(mid, target) <= self.caps[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        if lo == len(self.caps):
+            return float('inf'), lo
+        return self._level_at(lo, target), lo
+
+
+def water_level(credits: List[float], caps: List[float], target: float) -> Tuple[float, int]:
+    """
+    sum(credits[i] * min(level, caps[i])) == target 을 만족하는 공통 평점(수위) 계산 (O(n log n))
+
+    Returns:
+        (수위, 상한에 고정된 학기 수). 모든 학기를 상한으로 채워도 부족하면 수위는 inf
+    """
+    return WaterLevel(credits, caps).solve(target)
+
 
 class GPASimulator:
     """GPA 목표 달성을 위한 학기별 필요 평점 계산"""
 
     def __init__(self, scale_max: float, G_t: float, C_tot: float,
-                 history: List[HistoryItem], terms: List[TermItem]):
+                 history: List[HistoryItem], terms: List[TermItem], rounding: str = "float"):
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"알 수 없는 라운딩 방식: {rounding} (float, exact 중 하나)")
         self.scale_max = scale_max
         self.G_t = G_t
         self.C_tot = C_tot
         self.history = history
-        self.terms = terms
+        self.rounding = rounding
+        self._scaled_history = None
+        # 학점 보정과 계절학기 추가가 입력 객체를 바꾸지 않도록 내부 레코드로 복사
+        self.terms = [TermRecord.from_item(t) for t in terms]
+        # Step 4에서 수위를 계산했는지 (메트릭용)
+        self.water_filling_solved = False
 
     def simulate(self) -> List[SimulationResult]:
         """
@@ -27,89 +106,146 @@ class GPASimulator:
         Raises:
             ValueError: 목표 달성 불가능한 경우
         """
+        return [r.to_model() for r in self.simulate_records()]
+
+    def simulate_records(self) -> List[ResultRecord]:
+        """
+        메인 시뮬레이션 실행 (내부 레코드 반환, 응답 직렬화는 results_to_json)
+        Raises:
+            ValueError: 목표 달성 불가능한 경우
+        """
+        clock = time.perf_counter
+        t0 = clock()
+
         # Step 1: 현재 상태 계산
         C_e, G_c, C_r, g_need = self._calculate_current_state()
+        t1 = clock()
 
         # Step 2: 남은 학점 합계 보정
+        input_terms = len(self.terms)
         self._adjust_remaining_credits(C_r)
+        adjusted_terms = len(self.terms)
+        t2 = clock()
 
         # Step 3: 초기 균등 분배
         term_plans = self._initial_distribution(g_need)
+        t3 = clock()
 
         # Step 4: 현실성 조정 (water-filling)
         term_plans = self._water_filling_adjustment(term_plans, C_r, g_need)
+        t4 = clock()
 
         # Step 5: 라운딩 및 최종 보정
         results = self._round_and_adjust(term_plans, G_c, C_e)
+        t5 = clock()
+
+        metrics.observe_simulation(
+            (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4),
+            water_filling_solved=self.water_filling_solved,
+            shortage_terms=adjusted_terms - input_terms,
+            extra_terms=len(self.terms) - adjusted_terms
+        )
 
         return results
 
     def _calculate_current_state(self):
         """Step 1: 현재 상태 계산"""
-        logger.info("\n" + "="*80)
-        logger.info("🧮 [CALCULATION] 현재 상태 계산 시작")
-
-        if len(self.history) == 0:
-            C_e = 0
-            G_c = 0
-            logger.info("  ℹ️  이수 완료 학기 없음 (C_e=0, G_c=0)")
-        else:
-            C_e = sum(h.credits for h in self.history)
-            logger.info(f"\n  📊 이수 완료 학점 계산:")
-            logger.info(f"    - 총 이수 학점 (C_e): {C_e}")
-
-            logger.info(f"\n  📈 현재 GPA 계산 과정:")
-            total_grade_points = 0
-            for i, h in enumerate(self.history):
-                grade_points = h.credits * h.achieved_avg
-                total_grade_points += grade_points
-                logger.info(f"    [{i+1}] {h.term_id}: {h.credits}학점 × {h.achieved_avg}평점 = {grade_points:.2f} grade points")
-
-            logger.info(f"\n  📐 총 grade points: {total_grade_points:.2f}")
-            G_c = total_grade_points / C_e if C_e > 0 else 0
-            logger.info(f"  ⭐ 현재 GPA (G_c): {total_grade_points:.2f} ÷ {C_e} = {G_c:.4f}")
+        trace = trace_enabled()
 
+        C_e, G_c, total_grade_points = self._history_totals()
         C_r = self.C_tot - C_e
-        logger.info(f"\n  📝 남은 학점 (C_r): {self.C_tot} - {C_e} = {C_r}")
+
+        if trace:
+            self._trace_current_state(C_e, G_c, C_r, total_grade_points)
 
         if C_r <= 0:
             raise ValueError("이미 졸업 요구 학점을 충족했습니다")
 
         # 목표 GPA 달성을 위해 필요한 평균 평점
         g_need = (self.G_t * self.C_tot - G_c * C_e) / C_r
-        logger.info(f"\n  🎯 목표 달성에 필요한 평균 평점 계산:")
-        logger.info(f"    g_need = ({self.G_t} × {self.C_tot} - {G_c:.4f} × {C_e}) ÷ {C_r}")
-        logger.info(f"    g_need = ({self.G_t * self.C_tot:.2f} - {G_c * C_e:.2f}) ÷ {C_r}")
-        logger.info(f"    g_need = {g_need:.4f}")
+        if trace:
+            logger.info("\n  🎯 목표 달성에 필요한 평균 평점 계산:")
+            logger.info("    g_need = (%s × %s - %.4f × %s) ÷ %s", self.G_t, self.C_tot, G_c, C_e, C_r)
+            logger.info("    g_need = (%.2f - %.2f) ÷ %s", self.G_t * self.C_tot, G_c * C_e, C_r)
+            logger.info("    g_need = %.4f", g_need)
 
         if g_need < 0:
             raise ValueError("이미 목표 GPA를 초과 달성했습니다")
 
         # 기본 검증: 목표 평점이 스케일을 초과하는지 확인
         if g_need > self.scale_max:
-            # 달성 가능한 최대 GPA 계산 (모든 남은 학기에 만점을 받았을 때)
-            max_possible_gpa = (G_c * C_e + self.scale_max * C_r) / self.C_tot
-
-            # 계절학기 추가로 달성 가능한지 계산
-            additional_credits_needed = self._calculate_additional_credits_needed(G_c, C_e, C_r)
-
-            if additional_credits_needed > 0 and additional_credits_needed <= 50:  # 최대 50학점까지만 추가
-                raise ValueError(
-                    f"현재 상태에서 목표 GPA {self.G_t}를 달성하려면 {additional_credits_needed:.0f}학점의 "
-                    f"계절학기(모두 만점 {self.scale_max})가 추가로 필요합니다. "
-                    f"현재 졸업 학점({self.C_tot}학점)으로는 최대 {max_possible_gpa:.2f}까지만 달성 가능합니다."
-                )
-            else:
-                raise ValueError(
-                    f"목표 GPA {self.G_t} 달성이 불가능합니다. "
-                    f"현재 상태(이수 학점: {C_e:.0f}, 현재 평점: {G_c:.2f})에서 "
-                    f"남은 {C_r:.0f}학점을 모두 만점({self.scale_max})으로 받아도 "
-                    f"최대 {max_possible_gpa:.2f}까지만 달성 가능합니다. "
-                    f"목표를 {max_possible_gpa:.2f} 이하로 낮추거나, 현재 성적을 다시 확인해주세요."
-                )
+            raise ValueError(self._unreachable_message(G_c, C_e, C_r))
 
         return C_e, G_c, C_r, g_need
 
+    def _unreachable_message(self, G_c: float, C_e: float, C_r: float) -> str:
+        """남은 학점을 모두 만점으로 받아도 목표에 못 미칠 때의 에러 메시지"""
+        # 달성 가능한 최대 GPA 계산 (모든 남은 학기에 만점을 받았을 때)
+        max_possible_gpa = (G_c * C_e + self.scale_max * C_r) / self.C_tot
+
+        # 계절학기 추가로 달성 가능한지 계산
+        additional_credits_needed = self._calculate_additional_credits_needed(G_c, C_e, C_r)
+
+        if additional_credits_needed > 0 and additional_credits_needed <= MAX_ADDITIONAL_CREDITS:
+            return (
+                f"현재 상태에서 목표 GPA {self.G_t}를 달성하려면 {additional_credits_needed:.0f}학점의 "
+                f"계절학기(모두 만점 {self.scale_max})가 추가로 필요합니다. "
+                f"현재 졸업 학점({self.C_tot}학점)으로는 최대 {max_possible_gpa:.2f}까지만 달성 가능합니다."
+            )
+        return (
+            f"목표 GPA {self.G_t} 달성이 불가능합니다. "
+            f"현재 상태(이수 학점: {C_e:.0f}, 현재 평점: {G_c:.2f})에서 "
+            f"남은 {C_r:.0f}학점을 모두 만점({self.scale_max})으로 받아도 "
+            f"최대 {max_possible_gpa:.2f}까지만 달성 가능합니다. "
+            f"목표를 {max_possible_gpa:.2f} 이하로 낮추거나, 현재 성적을 다시 확인해주세요."
+        )
+
+    def _history_totals(self):
+        """이수 완료 학점, 현재 GPA, 총 grade points"""
+        if len(self.history) == 0:
+            return 0, 0, 0
+
+        if self.rounding == "exact":
+            # Step 5에서 쓰는 정수 합계를 한 번만 계산해 재사용
+            credits, points = self._scaled_history_totals()
+            C_e = credits / EXACT_INPUT_SCALE
+            total_grade_points = points / (EXACT_INPUT_SCALE * EXACT_INPUT_SCALE)
+        else:
+            C_e = sum(h.credits for h in self.history)
+            total_grade_points = sum(h.credits * h.achieved_avg for h in self.history)
+        G_c = total_grade_points / C_e if C_e > 0 else 0
+        return C_e, G_c, total_grade_points
+
+    def _scaled_history_totals(self) -> Tuple[int, int]:
+        """이수 학점 (EXACT_INPUT_SCALE 배), grade points (EXACT_INPUT_SCALE² 배) 정수 합계"""
+        if self._scaled_history is None:
+            scale = EXACT_INPUT_SCALE
+            credits = [round(h.credits * scale) for h in self.history]
+            avgs = [round(h.achieved_avg * scale) for h in self.history]
+            self._scaled_history = (sum(credits), sum(map(operator.mul, credits, avgs)))
+        return self._scaled_history
+
+    def _trace_current_state(self, C_e: float, G_c: float, C_r: float, total_grade_points: float):
+        """Step 1 상세 추적 로그 (추적이 켜진 요청에서만 호출)"""
+        logger.info("\n" + "="*80)
+        logger.info("🧮 [CALCULATION] 현재 상태 계산 시작")
+
+        if len(self.history) == 0:
+            logger.info("  ℹ️  이수 완료 학기 없음 (C_e=0, G_c=0)")
+        else:
+            logger.info("\n  📊 이수 완료 학점 계산:")
+            logger.info("    - 총 이수 학점 (C_e): %s", C_e)
+
+            logger.info("\n  📈 현재 GPA 계산 과정:")
+            for i, h in enumerate(self.history):
+                logger.info("    [%d] %s: %s학점 × %s평점 = %.2f grade points",
+                            i + 1, h.term_id, h.credits, h.achieved_avg, h.credits * h.achieved_avg)
+
+            logger.info("\n  📐 총 grade points: %.2f", total_grade_points)
+            logger.info("  ⭐ 현재 GPA (G_c): %.2f ÷ %s = %.4f", total_grade_points, C_e, G_c)
+
+        logger.info("\n  📝 남은 학점 (C_r): %s - %s = %s", self.C_tot, C_e, C_r)
+
     def _calculate_additional_credits_needed(self, G_c: float, C_e: float, C_r: float) -> float:
         """
         목표 GPA 달성을 위해 필요한 추가 계절학기 학점 계산
@@ -144,7 +280,7 @@ class GPASimulator:
         if total_planned < C_r:
             # 부족한 경우: 계절학기 추가
             shortage = C_r - total_planned
-            self.terms.append(TermItem(
+            self.terms.append(TermRecord(
                 id=f"Summer{len(self.terms)+1}",
                 type="summer",
                 planned_credits=shortage,
@@ -160,100 +296,105 @@ class GPASimulator:
                 self.terms[i].planned_credits -= reduction
                 excess -= reduction
 
-    def _initial_distribution(self, g_need: float) -> List[Dict]:
+    def _initial_distribution(self, g_need: float) -> List[TermPlan]:
         """Step 3: 초기 균등 분배"""
-        term_plans = []
-        for term in self.terms:
-            if term.planned_credits > 0:  # 학점이 있는 학기만 포함
-                term_plans.append({
-                    'term_id': term.id,
-                    'credits': term.planned_credits,
-                    'required_avg': g_need,
-                    'max_credits': term.max_credits
-                })
-        return term_plans
+        return [
+            TermPlan(term.id, term.planned_credits, g_need, term.max_credits)
+            for term in self.terms
+            if term.planned_credits > 0  # 학점이 있는 학기만 포함
+        ]
 
-    def _water_filling_adjustment(self, term_plans: List[Dict], C_r: float, g_need: float) -> List[Dict]:
+    def _water_filling_adjustment(self, term_plans: List[TermPlan], C_r: float, g_need: float) -> List[TermPlan]:
         """
         Step 4: 현실성 조정 (water-filling 알고리즘)
 
-        일부 학기에서 max_credits나 scale_max를 초과하는 경우,
-        해당 학기를 최대치로 고정하고 나머지 학기에 재분배
+        학점이 max_credits를 초과하는 학기는 최대치로 자르고, 평점 상한을 넘는 학기는
+        상한으로 고정한 뒤 나머지 학기에 같은 평점(수위)을 재분배한다.
+        수위는 상한 기준 정렬 + 누적합으로 한 번에 계산하며, 모든 학기를 상한으로 채워도
+        부족하면 필요한 추가 계절학기 수를 바로 계산해 추가한다.
         """
-        max_iterations = 20  # 무한 루프 방지
-
-        for _ in range(max_iterations):
-            adjusted = False
-
-            for plan in term_plans:
-                # 평점이 스케일 최대치를 초과하는 경우
-                if plan['required_avg'] > self.scale_max:
-                    plan['required_avg'] = self.scale_max
-                    plan['is_capped'] = True
-                    adjusted = True
-
-                # 학점이 최대 이수 가능 학점을 초과하는 경우
-                # (현재 로직에서는 planned_credits가 이미 max_credits 이하이므로 체크만)
-                if plan['credits'] > plan['max_credits']:
-                    excess_credits = plan['credits'] - plan['max_credits']
-                    plan['credits'] = plan['max_credits']
-                    adjusted = True
-
-            if adjusted:
-                # 재계산: 고정되지 않은 학기들에 재분배
-                fixed_plans = [p for p in term_plans if p.get('is_capped', False)]
-                flexible_plans = [p for p in term_plans if not p.get('is_capped', False)]
-
-                if len(flexible_plans) == 0:
-                    raise ValueError("목표 GPA를 달성할 수 없습니다 (모든 학기가 최대치에 도달)")
-
-                # 고정된 학기들의 총 grade points 계산
-                fixed_grade_points = sum(p['credits'] * p['required_avg'] for p in fixed_plans)
-                fixed_credits = sum(p['credits'] for p in fixed_plans)
-
-                # 유연한 학기들에 필요한 평균 재계산
-                flexible_credits = sum(p['credits'] for p in flexible_plans)
-                needed_grade_points = g_need * C_r - fixed_grade_points
-                new_avg = needed_grade_points / flexible_credits
-
-                if new_avg > self.scale_max:
-                    # 추가 계절학기 자동 생성
-                    additional_credits = 6  # 기본 6학점 추가
-                    self.terms.append(TermItem(
-                        id=f"Summer_Extra{len(self.terms)+1}",
-                        type="summer",
-                        planned_credits=additional_credits,
-                        max_credits=9
-                    ))
-                    term_plans.append({
-                        'term_id': self.terms[-1].id,
-                        'credits': additional_credits,
-                        'required_avg': self.scale_max,
-                        'max_credits': 9
-                    })
-                    C_r += additional_credits
-
-                    # 전체 재계산
-                    new_avg = (g_need * (C_r - additional_credits) - fixed_grade_points) / (flexible_credits + additional_credits)
-
-                for p in flexible_plans:
-                    p['required_avg'] = new_avg
-            else:
-                break
+        clipped = self._clip_credits(term_plans)
+
+        if not clipped and all(plan.required_avg <= self.scale_max for plan in term_plans):
+            return term_plans
+
+        self.water_filling_solved = True
+        caps = [self.scale_max] * len(term_plans)
+        total_credits = sum(plan.credits for plan in term_plans)
+        capacity = sum(plan.credits * cap for plan, cap in zip(term_plans, caps))
+
+        extra_terms = self._extra_terms_needed(total_credits, capacity, C_r, g_need)
+        total_credits = self._append_extra_terms(term_plans, caps, extra_terms, total_credits)
+
+        target = self._needed_grade_points(total_credits, C_r, g_need)
+        level, _ = water_level([plan.credits for plan in term_plans], caps, target)
+        self._apply_level(term_plans, caps, level)
 
         return term_plans
 
-    def _round_and_adjust(self, term_plans: List[Dict], G_c: float, C_e: float) -> List[SimulationResult]:
+    def _clip_credits(self, term_plans: List[TermPlan]) -> bool:
+        """학점이 최대 이수 가능 학점을 초과하는 학기를 최대치로 자름 (잘린 학기가 있으면 True)"""
+        clipped = False
+        for plan in term_plans:
+            if plan.credits > plan.max_credits:
+                plan.credits = plan.max_credits
+                clipped = True
+        return clipped
+
+    def _needed_grade_points(self, total_credits: float, C_r: float, g_need: float) -> float:
+        """
+        실제 이수 학점(T) 기준으로 목표 GPA를 맞추는 데 필요한 grade points
+
+        needed(T) = G_t * (C_e + T) - G_c * C_e = g_need * C_r + G_t * (T - C_r)
+        """
+        return g_need * C_r + self.G_t * (total_credits - C_r)
+
+    def _extra_terms_needed(self, total_credits: float, capacity: float, C_r: float, g_need: float) -> int:
+        """졸업 학점을 채우고, 만점으로 목표를 달성할 수 있는 최소 추가 계절학기 수"""
+        extra_terms = 0
+        if total_credits < C_r:
+            extra_terms = math.ceil((C_r - total_credits) / EXTRA_SUMMER_CREDITS - 1e-9)
+
+        shortfall = self._needed_grade_points(total_credits, C_r, g_need) - capacity
+        if shortfall > 1e-9:
+            gain_per_term = EXTRA_SUMMER_CREDITS * (self.scale_max - self.G_t)
+            if gain_per_term <= 0:
+                raise ValueError("목표 GPA를 달성할 수 없습니다 (모든 학기가 최대치에 도달)")
+            extra_terms = max(extra_terms, math.ceil(shortfall / gain_per_term - 1e-9))
+
+        return extra_terms
+
+    def _append_extra_terms(self, term_plans: List[TermPlan], caps: List[float],
+                            extra_terms: int, total_credits: float) -> float:
+        """추가 계절학기를 학기 목록과 계획에 추가 (추가 후 총 학점 반환)"""
+        for _ in range(extra_terms):
+            term_id = f"Summer_Extra{len(self.terms)+1}"
+            self.terms.append(TermRecord(term_id, "summer", EXTRA_SUMMER_CREDITS, EXTRA_SUMMER_MAX_CREDITS))
+            term_plans.append(TermPlan(term_id, EXTRA_SUMMER_CREDITS, self.scale_max, EXTRA_SUMMER_MAX_CREDITS))
+            caps.append(self.scale_max)
+            total_credits += EXTRA_SUMMER_CREDITS
+        return total_credits
+
+    @staticmethod
+    def _apply_level(term_plans: List[TermPlan], caps: List[float], level: float):
+        """수위를 각 학기에 적용 (상한을 넘는 학기는 상한으로 고정)"""
+        for plan, cap in zip(term_plans, caps):
+            if level >= cap:
+                plan.required_avg = cap
+                plan.is_capped = True
+            else:
+                plan.required_avg = max(level, 0)
+
+    def _round_and_adjust(self, term_plans: List[TermPlan], G_c: float, C_e: float) -> List[ResultRecord]:
         """Step 5: 라운딩 및 최종 보정"""
-        results = []
+        if self.rounding == "exact":
+            return self._round_exact(term_plans)
 
-        # 먼저 소수 둘째 자리로 반올림
-        for plan in term_plans:
-            results.append(SimulationResult(
-                term_id=plan['term_id'],
-                credits=round(plan['credits'], 2),
-                required_avg=round(plan['required_avg'], 2)
-            ))
+        # 먼저 소수 둘째 자리로 반올림 (응답 모델과 같이 float으로)
+        results = [
+            ResultRecord(plan.term_id, float(round(plan.credits, 2)), float(round(plan.required_avg, 2)))
+            for plan in term_plans
+        ]
 
         # 최종 검증: 실제 달성 GPA 계산
         total_new_credits = sum(r.credits for r in results)
@@ -274,3 +415,54 @@ class GPASimulator:
                 last_result.required_avg = self.scale_max
 
         return results
+
+    def _round_exact(self, term_plans: List[TermPlan]) -> List[ResultRecord]:
+        """
+        Step 5 (exact): 1/100 단위 정수 라운딩
+
+        학점과 필요 평점을 1/100 단위 정수로, 이력과 목표 GPA를 EXACT_INPUT_SCALE 배 정수로
+        바꿔 필요 grade points를 오차 없이 계산한다. 평점은 모두 내림한 뒤, 부족한 grade points를
+        잔여(버린 소수부)가 큰 학기부터 0.01씩 올려 채운다 (최대 잔여 방식).
+        따라서 응답의 학점/평점으로 다시 계산한 GPA는 항상 G_t 이상이고, 각 학기 평점은
+        라운딩 전 값의 내림 또는 올림이다 (부동소수 오차로 한 바퀴에 못 채우면 한 바퀴 더 올린다).
+
+        Raises:
+            ValueError: 모든 학기를 평점 최대값으로 올려도 목표에 못 미치는 경우
+        """
+        scale = EXACT_INPUT_SCALE
+        credits = [round(plan.credits * 100) for plan in term_plans]
+        # Step 1~4를 거친 평점은 [0, scale_max] 안이므로 내림해도 [0, cap] 안이다
+        avgs = [math.floor(plan.required_avg * 100) for plan in term_plans]
+        cap = round(self.scale_max * scale) // _EXACT_HUNDREDTH
+
+        # 필요 grade points (1/scale² 단위) → Σ credits × avgs (1/100² 단위) 하한으로 올림
+        history_credits, history_points = self._scaled_history_totals()
+        needed = round(self.G_t * scale) * (history_credits + sum(credits) * _EXACT_HUNDREDTH) - history_points
+        deficit = -(-needed // _EXACT_POINT_UNIT) - sum(map(operator.mul, credits, avgs))
+
+        if deficit > 0:
+            # 잔여가 큰 학기부터 (같으면 앞 학기부터, sorted는 reverse에서도 안정 정렬)
+            remainders = [plan.required_avg * 100 - a for plan, a in zip(term_plans, avgs)]
+            if min(remainders) == max(remainders):
+                # water-filling 없이 모든 학기가 g_need인 경우
+                order = range(len(avgs))
+            else:
+                order = sorted(range(len(avgs)), key=remainders.__getitem__, reverse=True)
+            while deficit > 0:
+                raised = False
+                for i in order:
+                    if avgs[i] < cap and credits[i] > 0:
+                        avgs[i] += 1
+                        deficit -= credits[i]
+                        raised = True
+                        if deficit <= 0:
+                            break
+                if not raised:
+                    raise ValueError(
+                        f"소수 둘째 자리 평점으로는 목표 GPA {self.G_t}를 맞출 수 없습니다 (모든 학기가 최대 평점)"
+                    )
+
+        return [
+            ResultRecord(plan.term_id, c / 100, a / 100)
+            for plan, c, a in zip(term_plans, credits, avgs)
+        ]
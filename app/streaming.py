@@ -0,0 +1,189 @@
+"""
+NDJSON 스트리밍 시뮬레이션
+
+학적 전체 재계산처럼 학생 수가 많은 경우를 위해 요청 본문을 줄 단위(NDJSON)로 읽으면서
+시뮬레이션하고, 레코드마다 결과 또는 에러 한 줄을 바로 응답으로 내보낸다.
+
+- 한 번의 네트워크 읽기로 들어온 줄(최대 chunk_size개)을 묶어 실행 풀에서 계산하므로
+  업로드가 끝나기 전에 첫 결과가 나가고, 메모리는 학생 수와 무관하게 한 청크 분량만 사용한다
+- 입력 줄의 "key"를 결과 줄에 그대로 붙이고, 줄 번호(line, 1부터)도 함께 반환한다
+- 학생별 상태 코드는 단건 /simulate 호출과 같다 (400 입력 검증, 422 달성 불가능 또는 형식 오류)
+"""
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+import json
+import logging
+import time
+
+from starlette.responses import StreamingResponse
+
+from app.models import SimulationInput
+from app.records import results_to_json
+from app.executor import ExecutorSaturated
+from app.metrics import metrics
+from app.tasks import parse_record
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# (줄 번호, 줄 내용) - 최대 길이를 넘은 줄은 None
+Line = Tuple[int, Optional[bytes]]
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    요청 본문을 읽으면서 응답을 보내는 스트리밍 응답
+
+    StreamingResponse는 응답 중 receive()로 연결 종료를 기다리는데, 그러면 아직 읽지 않은
+    요청 본문까지 소비해 버린다. 본문은 body_iterator가 직접 읽으므로 응답만 보낸다.
+    (클라이언트가 끊기면 본문 읽기에서 ClientDisconnect가 발생해 스트림이 멈춘다)
+    """
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def read_lines(body: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[List[Line]]:
+    """
+    본문을 줄 단위로 나누어 네트워크 읽기마다 완성된 줄 목록 반환
+
+    빈 줄은 건너뛰지만 줄 번호에는 포함한다. max_line_bytes를 넘는 줄은 버퍼에
+    쌓지 않고 다음 줄바꿈까지 버린 뒤 None으로 반환한다.
+    """
+    buffer = bytearray()
+    line_no = 0
+    oversized = False
+
+    async for data in body:
+        if not data:
+            continue
+        buffer += data
+        parts = buffer.split(b"\n")
+        buffer = parts.pop()
+
+        lines: List[Line] = []
+        for part in parts:
+            line_no += 1
+            if oversized or len(part) > max_line_bytes:
+                oversized = False
+                lines.append((line_no, None))
+            elif part.strip():
+                lines.append((line_no, bytes(part)))
+
+        if len(buffer) > max_line_bytes:
+            oversized = True
+            buffer.clear()
+
+        if lines:
+            yield lines
+
+    if oversized:
+        yield [(line_no + 1, None)]
+    elif buffer.strip():
+        yield [(line_no + 1, bytes(buffer))]
+
+
+def _encode_line(key, line_no: int, status_code: int, results=None, detail: Optional[str] = None) -> bytes:
+    """결과 한 줄 (성공이면 results, 실패면 detail)"""
+    head = (
+        '{"key":' + json.dumps(key, ensure_ascii=False)
+        + ',"line":' + str(line_no)
+        + ',"status_code":' + str(status_code)
+    )
+    if results is not None:
+        return head.encode("utf-8") + b',"results":' + results_to_json(results) + b"}\n"
+    return (head + ',"detail":' + json.dumps(detail, ensure_ascii=False) + "}\n").encode("utf-8")
+
+
+class _Entry:
+    """청크 안의 레코드 하나 (검증을 통과했으면 data, 결과가 정해지면 output)"""
+    __slots__ = ("line_no", "key", "data", "status_code", "output")
+
+    def __init__(self, line_no: int, key=None, data: Optional[SimulationInput] = None):
+        self.line_no = line_no
+        self.key = key
+        self.data = data
+        self.status_code = 0
+        self.output = b""
+
+    def finish(self, status_code: int, results=None, detail: Optional[str] = None) -> "_Entry":
+        self.status_code = status_code
+        self.output = _encode_line(self.key, self.line_no, status_code, results, detail)
+        return self
+
+
+def _parse(line_no: int, line: Optional[bytes], max_line_bytes: int) -> _Entry:
+    """줄 하나를 SimulationInput으로 검증 (실패하면 에러 줄을 가진 항목)"""
+    entry = _Entry(line_no)
+    if line is None:
+        return entry.finish(422, detail=f"한 줄은 최대 {max_line_bytes}바이트까지 보낼 수 있습니다")
+
+    entry.key, entry.data, error = parse_record(line)
+    if error is not None:
+        return entry.finish(error[0], detail=error[1])
+    return entry
+
+
+async def simulate_stream(
+    body: AsyncIterator[bytes],
+    run_chunk: Callable[[List[SimulationInput]], Awaitable[list]],
+    chunk_size: int = 256,
+    max_line_bytes: int = 1 << 20
+) -> AsyncIterator[bytes]:
+    """
+    NDJSON 본문을 읽으면서 청크 단위로 시뮬레이션하고 청크마다 결과 줄 반환
+
+    Args:
+        body: 요청 본문 스트림
+        run_chunk: 검증된 입력 목록 → 입력 순서대로 결과 또는 예외 목록 (BatchGPASimulator.simulate 형식)
+        chunk_size: 한 번에 계산할 최대 레코드 수
+        max_line_bytes: 한 줄의 최대 크기
+
+    실행 풀이 가득 차면 해당 청크의 레코드는 503 줄로 반환하고 다음 청크를 계속 읽는다.
+    호출자는 key로 503 레코드만 다시 보낼 수 있다.
+    """
+    started = time.perf_counter()
+    counts = {}
+
+    try:
+        async for lines in read_lines(body, max_line_bytes):
+            for offset in range(0, len(lines), chunk_size):
+                entries = [_parse(line_no, line, max_line_bytes)
+                           for line_no, line in lines[offset:offset + chunk_size]]
+                valid = [entry for entry in entries if entry.data is not None]
+
+                if valid:
+                    try:
+                        outcomes = await run_chunk([entry.data for entry in valid])
+                    except ExecutorSaturated as e:
+                        outcomes = [e] * len(valid)
+                    for entry, outcome in zip(valid, outcomes):
+                        _finish_outcome(entry, outcome)
+
+                for entry in entries:
+                    counts[entry.status_code] = counts.get(entry.status_code, 0) + 1
+                yield b"".join(entry.output for entry in entries)
+    finally:
+        for status_code, count in counts.items():
+            metrics.inc("gpa_stream_records_total", (("status", str(status_code)),), count)
+        logger.info("simulate_stream", extra={"fields": {
+            "records": sum(counts.values()),
+            "failed": sum(count for code, count in counts.items() if code != 200),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        }})
+
+
+def _finish_outcome(entry: _Entry, outcome):
+    """시뮬레이션 결과 또는 예외를 결과 줄로 (상태 코드는 단건 /simulate와 동일)"""
+    if isinstance(outcome, ExecutorSaturated):
+        entry.finish(503, detail=str(outcome))
+    elif isinstance(outcome, ValueError):
+        entry.finish(422, detail=str(outcome))
+    elif isinstance(outcome, Exception):
+        logger.error("Unexpected error in stream line %d: %s", entry.line_no, outcome)
+        entry.finish(500, detail=f"내부 서버 오류: {str(outcome)}")
+    else:
+        entry.finish(200, results=outcome)
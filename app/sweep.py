@@ -0,0 +1,114 @@
+"""
+GPA Simulator - 목표 GPA 범위 시뮬레이션
+
+한 학생의 이수 이력과 남은 학기 계획에 여러 목표 GPA를 한 번에 적용한다.
+이수 이력 집계(C_e, G_c, C_r), 학점 보정과 water-filling 구조(학점 상한 적용,
+추가 계절학기, 정렬된 평점 상한)는 목표와 무관하므로 한 번만 계산하고,
+목표마다 필요 평점(g_need)과 수위만 다시 계산한다.
+"""
+from typing import List, Optional
+import logging
+
+from app.models import HistoryItem, TermItem, SweepRow, SweepResult
+from app.simulator import GPASimulator, WaterLevel
+
+logger = logging.getLogger(__name__)
+
+
+class GoalSweeper:
+    """여러 목표 GPA에 대한 학기별 필요 평점 계산"""
+
+    def __init__(self, scale_max: float, C_tot: float,
+                 history: List[HistoryItem], terms: List[TermItem], rounding: str = "float"):
+        self.scale_max = scale_max
+        self.C_tot = C_tot
+        self.history = history
+        self.terms = terms
+        self.rounding = rounding
+
+    def sweep(self, targets: List[float]) -> SweepResult:
+        """
+        목표 GPA별 시뮬레이션 실행
+
+        Returns:
+            학기 구성, 달성 가능한 GPA 범위, 목표별 학기 필요 평점 행렬
+        """
+        # Step 1: 현재 상태 계산 (목표와 무관한 부분)
+        base = GPASimulator(self.scale_max, self.scale_max, self.C_tot, self.history, self.terms, self.rounding)
+        C_e, G_c, _ = base._history_totals()
+        C_r = self.C_tot - C_e
+
+        if C_r <= 0:
+            return SweepResult(
+                term_ids=[], credits=[],
+                max_achievable_gpa=G_c, min_achievable_gpa=G_c,
+                rows=[SweepRow(G_t=G_t, feasible=False, detail="이미 졸업 요구 학점을 충족했습니다")
+                      for G_t in targets]
+            )
+
+        max_gpa = (G_c * C_e + self.scale_max * C_r) / self.C_tot
+        min_gpa = (G_c * C_e) / self.C_tot
+
+        # Step 2~4: 학점 보정과 water-filling 구조 (모든 목표에 공통)
+        base._adjust_remaining_credits(C_r)
+        template = base._initial_distribution(0.0)
+        clipped = base._clip_credits(template)
+        caps = [self.scale_max] * len(template)
+
+        total_credits = sum(plan.credits for plan in template)
+        solver: Optional[WaterLevel] = None
+        if clipped:
+            # 달성 가능한 목표에서는 g_need <= scale_max 이므로 추가 계절학기는
+            # 졸업 학점을 채우는 만큼만 필요하다 (목표와 무관)
+            capacity = sum(plan.credits * cap for plan, cap in zip(template, caps))
+            extra_terms = base._extra_terms_needed(total_credits, capacity, C_r, 0.0)
+            total_credits = base._append_extra_terms(template, caps, extra_terms, total_credits)
+            solver = WaterLevel([plan.credits for plan in template], caps)
+
+        rows = []
+        for G_t in targets:
+            detail = self._check_target(G_t, G_c, C_e, C_r, max_gpa)
+            if detail is not None:
+                rows.append(SweepRow(G_t=G_t, feasible=False, detail=detail))
+                continue
+
+            simulator = GPASimulator(self.scale_max, G_t, self.C_tot, self.history, base.terms, self.rounding)
+            g_need = (G_t * self.C_tot - G_c * C_e) / C_r
+            term_plans = [plan.with_required_avg(g_need) for plan in template]
+
+            if solver is not None:
+                target = simulator._needed_grade_points(total_credits, C_r, g_need)
+                level, _ = solver.solve(target)
+                simulator._apply_level(term_plans, caps, level)
+
+            # Step 5: 라운딩 및 최종 보정 (exact는 상한까지 올려도 모자라면 /simulate처럼 실패)
+            try:
+                results = simulator._round_and_adjust(term_plans, G_c, C_e)
+            except ValueError as e:
+                rows.append(SweepRow(G_t=G_t, feasible=False, detail=str(e)))
+                continue
+            rows.append(SweepRow(G_t=G_t, feasible=True, required_avg=[r.required_avg for r in results]))
+
+        logger.debug("Goal sweep: %d targets, %d terms", len(targets), len(template))
+
+        return SweepResult(
+            term_ids=[plan.term_id for plan in template],
+            credits=[round(plan.credits, 2) for plan in template],
+            max_achievable_gpa=max_gpa,
+            min_achievable_gpa=min_gpa,
+            rows=rows
+        )
+
+    def _check_target(self, G_t: float, G_c: float, C_e: float, C_r: float, max_gpa: float) -> Optional[str]:
+        """목표 GPA 검증 (달성 불가능하면 이유 반환)"""
+        if G_t > self.scale_max:
+            return f"목표 GPA ({G_t})가 최대 평점 ({self.scale_max})을 초과합니다"
+        if G_t <= 0:
+            return "목표 GPA는 0보다 커야 합니다"
+
+        g_need = (G_t * self.C_tot - G_c * C_e) / C_r
+        if g_need < 0:
+            return "이미 목표 GPA를 초과 달성했습니다"
+        if g_need > self.scale_max:
+            return f"목표 GPA {G_t} 달성이 불가능합니다. 최대 {max_gpa:.2f}까지만 달성 가능합니다."
+        return None
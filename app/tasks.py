@@ -0,0 +1,265 @@
+"""
+실행 풀에서 돌리는 시뮬레이션 작업
+
+프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 두고, 인자와 반환값은
+pickle 가능한 입력 모델/결과 레코드/예외만 사용한다.
+프로세스 풀 워커의 메트릭은 METRICS_MULTIPROC_DIR이 지정된 경우 스냅샷 파일로 합산된다.
+"""
+from typing import Any, List, Optional, Tuple, Union
+import json
+
+from pydantic import ValidationError
+
+from app.models import (
+    SimulationInput, StreamSimulationInput, SweepInput, IncrementalInput, OptimizeInput, OptimizeResult,
+    RiskInput, RiskResult, RetakeInput, RetakeResult, RetakeSearchInput, RetakeSearchResult,
+    SimulationResult, PlanDiff, Scenario, ScenarioComparison
+)
+from app.simulator import GPASimulator
+from app.records import ResultRecord
+from app import grading
+from app.metrics import metrics
+
+
+def validate_input(data: Union[SimulationInput, SweepInput]) -> Optional[str]:
+    """
+    입력 검증 (문제가 있으면 에러 메시지 반환)
+
+    SweepInput의 목표 GPA는 GoalSweeper가 행마다 검증하고, 등급 조합을 계산하지 않으므로 courses만 거절한다.
+    """
+    if isinstance(data, SweepInput):
+        if any(term.courses is not None for term in data.terms):
+            return "/simulate/sweep은 등급 조합을 계산하지 않으므로 과목별 계획(courses)을 쓸 수 없습니다"
+        return None
+
+    if data.G_t > data.scale_max:
+        return f"목표 GPA ({data.G_t})가 최대 평점 ({data.scale_max})을 초과합니다"
+
+    if data.G_t <= 0:
+        return "목표 GPA는 0보다 커야 합니다"
+
+    return grading.validate_grading(data)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in e['loc']) or 'body'}: {e['msg']}" for e in error.errors()
+    )
+
+
+def parse_record(raw: Union[bytes, str, Any]) -> Tuple[Any, Optional[StreamSimulationInput], Optional[Tuple[int, str]]]:
+    """
+    대량 입력의 레코드 하나(NDJSON 줄 또는 이미 읽은 dict)를 검증 (/simulate/stream, 오프라인 배치)
+
+    Returns:
+        (key, 검증된 입력, None) 또는 (key, None, (상태 코드, 에러 메시지))
+        상태 코드는 단건 /simulate와 같다 (형식 오류 422, 입력 검증 실패 400)
+    """
+    record = raw
+    if isinstance(raw, (bytes, str)):
+        try:
+            record = json.loads(raw)
+        except ValueError as e:
+            return None, None, (422, f"JSON 형식 오류: {e}")
+    if not isinstance(record, dict):
+        return None, None, (422, "각 레코드는 JSON 객체여야 합니다")
+
+    # 다른 필드가 잘못돼도 에러에 key를 붙일 수 있도록 먼저 꺼내 둔다
+    key = record.get("key")
+    if not isinstance(key, (str, int)) or isinstance(key, bool):
+        key = None
+    try:
+        data = StreamSimulationInput.model_validate(record)
+    except ValidationError as e:
+        return key, None, (422, _format_validation_error(e))
+
+    error = validate_input(data)
+    if error is not None:
+        return key, None, (400, error)
+    return key, data, None
+
+
+def simulate(data: SimulationInput) -> List[ResultRecord]:
+    """단건 시뮬레이션 (/simulate)"""
+    try:
+        results = GPASimulator(
+            scale_max=data.scale_max,
+            G_t=data.G_t,
+            C_tot=data.C_tot,
+            history=data.history,
+            terms=data.terms,
+            rounding=data.rounding
+        ).simulate_records()
+        if data.grade_scale is not None:
+            results = grading.annotate(results, data)
+        return results
+    finally:
+        metrics.maybe_flush()
+
+
+def simulate_batch(inputs: List[SimulationInput]) -> list:
+    """배치 시뮬레이션 (/simulate/batch, 학생별 결과 또는 예외)"""
+    # numpy 로딩 비용을 배치 요청이 처음 올 때로 미룬다
+    from app.batch_simulator import BatchGPASimulator
+    try:
+        outcomes = BatchGPASimulator(inputs).simulate()
+        for i, data in enumerate(inputs):
+            if data.grade_scale is not None and not isinstance(outcomes[i], Exception):
+                try:
+                    outcomes[i] = [r.to_model() for r in grading.annotate(outcomes[i], data)]
+                except ValueError as e:
+                    outcomes[i] = e
+        return outcomes
+    finally:
+        metrics.maybe_flush()
+
+
+def sweep(data: SweepInput, targets: List[float]):
+    """목표 GPA 범위 시뮬레이션 (/simulate/sweep)"""
+    from app.sweep import GoalSweeper
+    return GoalSweeper(
+        scale_max=data.scale_max,
+        C_tot=data.C_tot,
+        history=data.history,
+        terms=data.terms,
+        rounding=data.rounding
+    ).sweep(targets)
+
+
+def optimize(data: OptimizeInput) -> OptimizeResult:
+    """학점 재분배 최적화 (/simulate/optimize)"""
+    from app.optimizer import PlanOptimizer
+    return PlanOptimizer(
+        scale_max=data.scale_max,
+        G_t=data.G_t,
+        C_tot=data.C_tot,
+        history=data.history,
+        terms=data.terms,
+        objective=data.objective,
+        weights=data.weights,
+        rounding=data.rounding
+    ).optimize()
+
+
+def _risk_simulator(data: RiskInput):
+    from app.risk import RiskSimulator
+    return RiskSimulator(
+        scale_max=data.scale_max,
+        G_t=data.G_t,
+        C_tot=data.C_tot,
+        history=data.history,
+        terms=data.terms,
+        draws=data.draws,
+        seed=data.seed,
+        mean=data.mean,
+        std=data.std,
+        rounding=data.rounding
+    )
+
+
+def risk(data: RiskInput) -> RiskResult:
+    """목표 달성 확률 (/simulate/risk)"""
+    try:
+        return _risk_simulator(data).run()
+    finally:
+        metrics.maybe_flush()
+
+
+def risk_batch(inputs: List[RiskInput]) -> list:
+    """목표 달성 확률 배치 (/simulate/risk/batch, 학생별 결과 또는 예외)"""
+    outcomes = []
+    try:
+        for data in inputs:
+            try:
+                outcomes.append(_risk_simulator(data).run())
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    finally:
+        metrics.maybe_flush()
+
+
+def validate_retakes(data: SimulationInput) -> Optional[str]:
+    """재수강 입력 검증 (/simulate/retakes, /simulate/retakes/best, 문제가 있으면 에러 메시지 반환)"""
+    from app.retake import validate_courses
+    error = validate_input(data) or validate_courses(data)
+    if error is not None:
+        return error
+    if isinstance(data, RetakeSearchInput):
+        if data.retake_grade is not None and data.retake_grade > data.scale_max:
+            return f"재수강 예상 평점 ({data.retake_grade})이 최대 평점 ({data.scale_max})을 초과합니다"
+        return None
+    if not isinstance(data, RetakeInput):
+        return None
+
+    known = {c.id for h in data.history if h.courses is not None for c in h.courses}
+    seen = set()
+    for retake in data.retakes:
+        if retake.course_id not in known:
+            return f"이력에 없는 과목 ID입니다: {retake.course_id}"
+        if retake.course_id in seen:
+            return f"같은 과목을 두 번 재수강할 수 없습니다: {retake.course_id}"
+        if retake.grade_points > data.scale_max:
+            return f"재수강 평점 ({retake.grade_points})이 최대 평점 ({data.scale_max})을 초과합니다: {retake.course_id}"
+        seen.add(retake.course_id)
+    return None
+
+
+def retake(data: RetakeInput) -> RetakeResult:
+    """재수강 반영 계획 (/simulate/retakes)"""
+    from app.retake import RetakePlanner
+    try:
+        return RetakePlanner(data).apply([(r.course_id, r.grade_points) for r in data.retakes])
+    finally:
+        metrics.maybe_flush()
+
+
+def retake_search(data: RetakeSearchInput) -> RetakeSearchResult:
+    """최선의 재수강 탐색 (/simulate/retakes/best)"""
+    from app.retake import RetakePlanner
+    try:
+        return RetakePlanner(data).search(
+            retake_grade=data.retake_grade,
+            eligible_max=data.eligible_max,
+            max_retakes=data.max_retakes,
+            max_required_avg=data.max_required_avg,
+            limit=data.limit
+        )
+    finally:
+        metrics.maybe_flush()
+
+
+def incremental(data: IncrementalInput) -> Tuple[List[SimulationResult], PlanDiff]:
+    """
+    변경 사항 적용 후 계획과 이전 계획 대비 차이 (/simulate/incremental)
+
+    Raises:
+        KeyError: 없는 학기 ID
+        ValueError: 변경 후 목표 달성 불가능
+    """
+    from app.incremental import IncrementalSimulator, diff_plans
+    simulator = IncrementalSimulator(data.base)
+    try:
+        previous = simulator.plan()
+    except ValueError:
+        previous = []
+
+    for delta in data.deltas:
+        simulator.apply(delta)
+
+    results = simulator.plan()
+    return results, diff_plans(previous, results)
+
+
+def compare_scenarios(base: SimulationInput, scenarios: List[Scenario], include_results: bool) -> ScenarioComparison:
+    """
+    학기 계획 시나리오 구간 비교 (/simulate/scenarios)
+
+    Raises:
+        ValueError: 기준 입력이 목표 달성 불가능 (Step 1)
+    """
+    from app.scenarios import ScenarioComparer
+    try:
+        return ScenarioComparer(base).compare(scenarios, include_results)
+    finally:
+        metrics.maybe_flush()
@@ -0,0 +1,85 @@
+"""
+트래픽을 받기 전 예열
+
+요청 모델 검증, 시뮬레이터 경로(학점 상한 적용, 추가 계절학기, 달성 불가능 메시지),
+응답 직렬화, 캐시 키 계산을 한 번씩 실행하고 성적 체계 조회 테이블을 만들어
+첫 요청이 느려지지 않게 한다.
+/ready가 처음 호출될 때 한 번 실행한다.
+"""
+from typing import Dict
+import logging
+import threading
+import time
+
+from app.models import SimulationInput, SweepInput, IncrementalInput
+from app.simulator import GPASimulator
+from app.records import results_to_json
+from app.cache import canonical_key
+from app.grading import scales
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE = {
+    "scale_max": 4.5,
+    "G_t": 4.0,
+    "C_tot": 130,
+    "history": [
+        {"term_id": "S1", "credits": 18, "achieved_avg": 3.8},
+        {"term_id": "S2", "credits": 18, "achieved_avg": 3.9}
+    ],
+    "terms": [
+        {"id": "S3", "type": "regular", "planned_credits": 24, "max_credits": 21},
+        {"id": "S4", "type": "regular", "planned_credits": 18, "max_credits": 21},
+        {"id": "S5", "type": "regular", "planned_credits": 12, "max_credits": 21}
+    ]
+}
+
+_lock = threading.Lock()
+_timings: Dict[str, float] = {}
+
+
+def is_warm() -> bool:
+    return bool(_timings)
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    예열 실행 (프로세스당 한 번, 이후 호출은 첫 결과 반환)
+
+    Returns:
+        {단계: 소요 시간(ms)}
+    """
+    with _lock:
+        if _timings:
+            return _timings
+
+        started = time.perf_counter()
+        data = SimulationInput.model_validate(_SAMPLE)
+        SweepInput.model_validate(dict(_SAMPLE, G_t_min=3.5, G_t_max=4.0))
+        IncrementalInput.model_validate({
+            "base": _SAMPLE,
+            "deltas": [{"type": "term_completed", "term_id": "S3", "achieved_avg": 4.0}]
+        })
+        validated = time.perf_counter()
+
+        # 학점 상한 적용 + 졸업 학점 부족분 계절학기 추가 경로
+        results = GPASimulator(data.scale_max, data.G_t, data.C_tot, data.history, data.terms).simulate_records()
+        results_to_json(results)
+        canonical_key(data)
+        # 달성 불가능 메시지 경로
+        try:
+            GPASimulator(data.scale_max, data.scale_max, data.C_tot, data.history, data.terms).simulate_records()
+        except ValueError:
+            pass
+        simulated = time.perf_counter()
+
+        scales.compile_all()
+        compiled = time.perf_counter()
+
+        _timings.update({
+            "validation_ms": round((validated - started) * 1000, 3),
+            "simulation_ms": round((simulated - validated) * 1000, 3),
+            "grade_tables_ms": round((compiled - simulated) * 1000, 3),
+        })
+        logger.info("warm_up", extra={"fields": dict(_timings)})
+        return _timings
@@ -0,0 +1,3 @@
+"""
+GPA Simulator 성능 벤치마크
+"""
@@ -0,0 +1,153 @@
+"""
+거절 대상 요청이 몰릴 때 정상 /simulate 요청의 지연 시간
+
+정상 트래픽은 학생 1000명(X-Client-ID: student-<n>)이 동시 요청 4개로 /simulate를 보낸다.
+그동안 한 클라이언트(X-Client-ID: flood)가 응답을 기다리지 않고 초당 --flood-rps개씩 다음을 번갈아 보낸다
+(미완료 flood 요청이 256개면 그 주기는 건너뛰고 dropped로 센다).
+- oversized: 학기 수만 개로 MAX_BODY_BYTES를 넘는 본문 (413, 본문을 읽지 않음)
+- too_many_terms: 본문 한도 안에서 학기 수가 MAX_TERMS를 넘는 입력 (422, 학기 검증 전에 거절)
+- rate_limited: 정상 입력이지만 클라이언트별 속도/동시 요청 한도를 넘는 요청 (429)
+
+flood 없음 / 수락 제어 켬 / 수락 제어 끔(본문 한도, 클라이언트별 제한 없음)에서
+정상 요청의 p50/p99와 에러 수를 비교한다. 모델의 목록 길이 한도는 끌 수 없으므로 세 경우 모두 적용된다.
+
+실행:
+    python -m benchmarks.bench_admission --requests 2000 --flood-rps 500
+"""
+from typing import Dict, List
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from benchmarks.bench_api import _percentile
+from benchmarks.scenarios import generate_payload
+
+HEADERS = {"content-type": "application/json"}
+FLOOD_HEADERS = dict(HEADERS, **{"x-client-id": "flood"})
+
+
+def flood_bodies() -> List[bytes]:
+    """oversized, too_many_terms, rate_limited 순서의 미리 인코딩한 본문"""
+    base = generate_payload(0, 8)
+    term = base["terms"][0]
+    oversized = dict(base, terms=[dict(term, id=f"T{i}") for i in range(40000)])
+    too_many_terms = dict(base, terms=[dict(term, id=f"T{i}") for i in range(300)])
+    return [json.dumps(body).encode() for body in (oversized, too_many_terms, generate_payload(1, 40))]
+
+
+async def _run(app, good: List[bytes], requests: int, flood_rps: float, max_pending: int = 256,
+               students: int = 1000) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    flood_sent = 0
+    flood_dropped = 0
+    flood_statuses: Dict[int, int] = {}
+    done = asyncio.Event()
+    counter = iter(range(requests))
+    bodies = flood_bodies()
+    loop = asyncio.get_running_loop()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def good_worker():
+            nonlocal errors
+            for i in counter:
+                headers = dict(HEADERS, **{"x-client-id": f"student-{i % students}"})
+                started = time.perf_counter()
+                response = await client.post("/simulate", content=good[i % len(good)], headers=headers)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+
+        async def good_traffic():
+            await asyncio.gather(*(good_worker() for _ in range(4)))
+            done.set()
+
+        async def send_flood(i: int):
+            response = await client.post("/simulate", content=bodies[i % len(bodies)], headers=FLOOD_HEADERS)
+            flood_statuses[response.status_code] = flood_statuses.get(response.status_code, 0) + 1
+
+        async def flood_traffic():
+            # 열린 루프: 응답을 기다리지 않고 flood_rps로 보낸다 (처리가 밀리면 미완료 요청이 쌓임)
+            nonlocal flood_sent, flood_dropped
+            pending = set()
+            next_at = loop.time()
+            while flood_rps > 0 and not done.is_set():
+                if len(pending) < max_pending:
+                    task = asyncio.create_task(send_flood(flood_sent + flood_dropped))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                    flood_sent += 1
+                else:
+                    flood_dropped += 1
+                next_at += 1 / flood_rps
+                await asyncio.sleep(max(next_at - loop.time(), 0))
+            await asyncio.gather(*pending)
+
+        started = time.perf_counter()
+        await asyncio.gather(good_traffic(), flood_traffic())
+        elapsed = time.perf_counter() - started
+
+    return {
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "errors": errors,
+        "flood_rps": flood_sent / elapsed,
+        "flood_dropped": flood_dropped,
+        "flood_statuses": dict(sorted(flood_statuses.items())),
+    }
+
+
+def bench_admission(app, control, requests: int = 2000, flood_rps: float = 500) -> Dict[str, Dict[str, float]]:
+    """
+    Returns:
+        {"baseline" | "admission_on" | "admission_off":
+         {"p50_ms", "p99_ms", "errors", "flood_rps", "flood_dropped", "flood_statuses"}}
+    """
+    good = [json.dumps(generate_payload(seed, 8)).encode() for seed in range(100)]
+    enabled = (control.max_body_bytes, dict(control.body_limits), control.rate, control.burst,
+               control.max_concurrency)
+    disabled = (0, {}, 0.0, 1, 0)
+
+    def configure(values):
+        (control.max_body_bytes, control.body_limits, control.rate, control.burst,
+         control.max_concurrency) = values
+        control.clients.clear()
+
+    results = {}
+    try:
+        # 워밍업
+        configure(enabled)
+        asyncio.run(_run(app, good, min(requests, 200), 0))
+        for name, values, rps in (("baseline", enabled, 0), ("admission_on", enabled, flood_rps),
+                                  ("admission_off", disabled, flood_rps)):
+            configure(values)
+            results[name] = asyncio.run(_run(app, good, requests, rps))
+    finally:
+        configure(enabled)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="정상 요청 수")
+    parser.add_argument("--flood-rps", type=float, default=500, help="flood 초당 요청 수 (응답을 기다리지 않음)")
+    parser.add_argument("--rate", type=float, default=10, help="클라이언트별 초당 요청 수 (RATE_LIMIT_RPS)")
+    parser.add_argument("--burst", type=int, default=20, help="RATE_LIMIT_BURST")
+    parser.add_argument("--concurrency", type=int, default=4, help="CLIENT_MAX_CONCURRENCY")
+    args = parser.parse_args()
+
+    from app.main import app, admission, result_cache
+    result_cache.enabled = False
+    admission.rate, admission.burst, admission.max_concurrency = args.rate, args.burst, args.concurrency
+
+    for name, result in bench_admission(app, admission, args.requests, args.flood_rps).items():
+        print(f"{name:14s} p50 {result['p50_ms']:7.2f}ms  p99 {result['p99_ms']:7.2f}ms  "
+              f"errors {result['errors']:4d}  flood {result['flood_rps']:6.1f} req/s "
+              f"(dropped {result['flood_dropped']})  {result['flood_statuses']}")
+
+
+if __name__ == "__main__":
+    main()
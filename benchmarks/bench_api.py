@@ -0,0 +1,53 @@
+"""
+/simulate 인프로세스 ASGI 부하 테스트
+
+httpx ASGITransport로 네트워크 없이 앱을 호출한다. 동시 요청 수(concurrency)만큼
+작업자가 요청을 나눠 보내며 지연 시간 p50/p99와 처리량(req/s)을 측정한다.
+"""
+from typing import Dict, List
+import asyncio
+import time
+
+import httpx
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+async def _load_test(app, payloads: List[Dict], requests: int, concurrency: int,
+                     path: str = "/simulate") -> Dict[str, float]:
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            for i in counter:
+                started = time.perf_counter()
+                response = await client.post(path, json=payloads[i % len(payloads)])
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} 응답 {response.status_code}: {response.text[:200]}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "rps": requests / elapsed,
+    }
+
+
+def bench_api(app, payloads: List[Dict], requests: int = 1000, concurrency: int = 16,
+              path: str = "/simulate") -> Dict[str, float]:
+    """
+    Returns:
+        {"p50_ms", "p99_ms", "rps"}
+    """
+    # 워밍업
+    asyncio.run(_load_test(app, payloads, min(requests, 50), concurrency, path))
+    return asyncio.run(_load_test(app, payloads, requests, concurrency, path))
@@ -0,0 +1,79 @@
+"""
+로깅 모드별 /simulate 처리량 비교
+
+- trace: 모든 요청에서 단계별 상세 로그 출력 (이전 동작)
+- summary: 요청당 JSON 요약 한 줄 (기본 동작)
+
+로그는 docker json-file 드라이버처럼 파일에 기록한다.
+
+실행:
+    python -m benchmarks.bench_logging --requests 2000
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+
+from app import logging_config
+from app.config import Settings
+
+
+PAYLOAD = {
+    "scale_max": 4.5,
+    "C_tot": 130,
+    "history": [
+        {"term_id": f"S{i}", "credits": 18, "achieved_avg": 3.8} for i in range(1, 5)
+    ],
+    "terms": [
+        {"id": f"S{i}", "type": "regular", "planned_credits": 14.5, "max_credits": 21} for i in range(5, 9)
+    ]
+}
+
+
+def run(client: TestClient, requests: int) -> float:
+    """요청 처리량 (req/s) 측정"""
+    started = time.perf_counter()
+    for i in range(requests):
+        # 캐시 hit을 피하도록 목표 GPA를 바꿔가며 요청
+        payload = dict(PAYLOAD, G_t=3.9 + (i % 500) / 10000)
+        response = client.post("/simulate", json=payload)
+        assert response.status_code == 200
+    return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    from app.main import app, result_cache
+    result_cache.enabled = False
+    client = TestClient(app)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "service.log")
+        for mode, env in (("trace", {"LOG_TRACE": "true"}), ("summary", {"LOG_FORMAT": "json"})):
+            os.environ.update(env)
+            logging_config.configure_logging(Settings())
+            for name in env:
+                del os.environ[name]
+
+            # 표준 에러 대신 파일에 기록
+            root = logging.getLogger()
+            file_handler = logging.FileHandler(log_path, mode="w")
+            file_handler.setFormatter(root.handlers[0].formatter)
+            root.handlers = [file_handler]
+
+            run(client, min(args.requests, 200))  # 워밍업
+            rps = run(client, args.requests)
+            file_handler.close()
+            size_kb = os.path.getsize(log_path) / 1024
+
+            print(f"{mode:8s} {rps:10.1f} req/s   log {size_kb / (args.requests + min(args.requests, 200)):.2f} KB/req")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+uvicorn 서빙 설정별 /simulate 처리량 (실제 TCP 연결)
+
+설정마다 uvicorn 프로세스를 띄우고, 가벼운 HTTP/1.1 클라이언트(asyncio 스트림, 요청 바이트를 미리 만들어 둠)가
+동시 연결 --concurrency개로 8학기 /simulate를 보낸다. 결과 캐시는 끈다.
+
+- h11-asyncio: 순수 Python 파서와 기본 이벤트 루프 (uvicorn[standard] 없이 설치한 경우)
+- httptools-uvloop-close: Docker CMD와 같은 서버, 요청마다 새 연결 (Connection: close)
+- httptools-uvloop: Docker CMD와 같은 서버, keep-alive 연결 재사용
+- httptools-uvloop-no-access-log: 위 설정에서 uvicorn 접근 로그 끔 (서비스 요약 로그는 유지)
+
+실행:
+    python -m benchmarks.bench_serving --requests 3000 --concurrency 16
+"""
+from typing import Dict, List, Tuple
+import argparse
+import asyncio
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_api import _percentile
+from benchmarks.bench_startup import PROJECT_ROOT, _free_port, _request
+from benchmarks.scenarios import generate_payload
+
+SERVER_CONFIGS: Dict[str, Tuple[List[str], bool]] = {
+    # 이름: (uvicorn 인자, keep-alive)
+    "h11-asyncio": (["--http", "h11", "--loop", "asyncio"], True),
+    "httptools-uvloop-close": (["--http", "httptools", "--loop", "uvloop"], False),
+    "httptools-uvloop": (["--http", "httptools", "--loop", "uvloop"], True),
+    "httptools-uvloop-no-access-log": (["--http", "httptools", "--loop", "uvloop", "--no-access-log"], True),
+}
+
+_CONTENT_LENGTH = re.compile(rb"content-length: *(\d+)", re.IGNORECASE)
+
+
+def _build_request(port: int, body: bytes, keep_alive: bool) -> bytes:
+    return (
+        b"POST /simulate HTTP/1.1\r\n"
+        + f"Host: 127.0.0.1:{port}\r\n".encode()
+        + b"Content-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n".encode()
+        + (b"" if keep_alive else b"Connection: close\r\n")
+        + b"\r\n" + body
+    )
+
+
+async def _load(port: int, requests: List[bytes], concurrency: int, keep_alive: bool) -> Dict[str, float]:
+    latencies: List[float] = []
+    counter = iter(range(len(requests)))
+
+    async def worker():
+        reader = writer = None
+        for i in counter:
+            started = time.perf_counter()
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(requests[i])
+            head = await reader.readuntil(b"\r\n\r\n")
+            await reader.readexactly(int(_CONTENT_LENGTH.search(head).group(1)))
+            latencies.append(time.perf_counter() - started)
+            if not head.startswith(b"HTTP/1.1 200"):
+                raise RuntimeError(f"/simulate 응답: {head.splitlines()[0]!r}")
+            if not keep_alive:
+                writer.close()
+                writer = None
+        if writer is not None:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "rps": len(requests) / elapsed,
+    }
+
+
+def bench_config(args: List[str], keep_alive: bool, requests: int = 3000, concurrency: int = 16,
+                 timeout: float = 30.0) -> Dict[str, float]:
+    """uvicorn을 args로 띄워 /simulate 부하 측정"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--timeout-keep-alive", "75", "--log-level", "info", *args],
+        cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        env=dict(os.environ, CACHE_ENABLED="false")
+    )
+    try:
+        started = time.perf_counter()
+        while True:
+            try:
+                _request(f"http://127.0.0.1:{port}/ready", timeout=1.0)
+                break
+            except OSError:
+                if time.perf_counter() - started > timeout or process.poll() is not None:
+                    raise RuntimeError("서비스가 시작되지 않았습니다")
+                time.sleep(0.01)
+
+        bodies = [json.dumps(generate_payload(seed, 8)).encode() for seed in range(100)]
+        payloads = [_build_request(port, bodies[i % len(bodies)], keep_alive) for i in range(requests)]
+        asyncio.run(_load(port, payloads[:200], concurrency, keep_alive))  # 워밍업
+        return asyncio.run(_load(port, payloads, concurrency, keep_alive))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--configs", nargs="+", default=list(SERVER_CONFIGS), choices=list(SERVER_CONFIGS))
+    args = parser.parse_args()
+
+    for name in args.configs:
+        server_args, keep_alive = SERVER_CONFIGS[name]
+        result = bench_config(server_args, keep_alive, args.requests, args.concurrency)
+        print(f"{name:32s} {result['rps']:8.1f} req/s   p50 {result['p50_ms']:6.2f}ms   p99 {result['p99_ms']:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+GPASimulator 단계별 마이크로벤치마크
+
+각 단계(Step 1~5)와 simulate() 전체, 학점 재분배 최적화(optimize, peak 목표)의
+호출당 시간(µs, 중앙값)을 측정한다. Step 5와 simulate()는 exact 라운딩(_round_exact,
+simulate_exact)도 같은 계획으로 측정한다.
+입력마다 새 시뮬레이터를 준비하고, 측정은 해당 단계 호출만 포함한다.
+"""
+from typing import Dict, List
+import statistics
+import time
+
+from app.models import SimulationInput
+from app.simulator import GPASimulator
+from app.optimizer import PlanOptimizer
+
+STEPS = (
+    "_calculate_current_state",
+    "_adjust_remaining_credits",
+    "_initial_distribution",
+    "_water_filling_adjustment",
+    "_round_and_adjust",
+)
+
+
+def _new_simulator(data: SimulationInput, rounding: str = "float") -> GPASimulator:
+    return GPASimulator(
+        scale_max=data.scale_max,
+        G_t=data.G_t,
+        C_tot=data.C_tot,
+        history=list(data.history),
+        terms=data.terms,
+        rounding=rounding
+    )
+
+
+def _timed(samples: Dict[str, List[int]], name: str, fn, *args):
+    started = time.perf_counter_ns()
+    result = fn(*args)
+    samples[name].append(time.perf_counter_ns() - started)
+    return result
+
+
+def bench_simulator(inputs: List[SimulationInput], rounds: int = 20) -> Dict[str, float]:
+    """
+    Returns:
+        {단계 이름: 호출당 시간 중앙값(µs)} (simulate는 전체 실행)
+    """
+    samples: Dict[str, List[int]] = {name: [] for name in STEPS + ("_round_exact", "simulate", "simulate_exact", "optimize")}
+
+    for _ in range(rounds):
+        for data in inputs:
+            simulator = _new_simulator(data)
+            C_e, G_c, C_r, g_need = _timed(samples, STEPS[0], simulator._calculate_current_state)
+            _timed(samples, STEPS[1], simulator._adjust_remaining_credits, C_r)
+            term_plans = _timed(samples, STEPS[2], simulator._initial_distribution, g_need)
+            term_plans = _timed(samples, STEPS[3], simulator._water_filling_adjustment, term_plans, C_r, g_need)
+            _timed(samples, STEPS[4], simulator._round_and_adjust, term_plans, G_c, C_e)
+            # exact 모드에서는 이력 정수 합계를 Step 1이 계산한다
+            simulator._scaled_history_totals()
+            _timed(samples, "_round_exact", simulator._round_exact, term_plans)
+
+            # /simulate가 사용하는 경로 (응답 모델 변환 없이 레코드 반환)
+            _timed(samples, "simulate", _new_simulator(data).simulate_records)
+            _timed(samples, "simulate_exact", _new_simulator(data, "exact").simulate_records)
+
+            optimizer = PlanOptimizer(data.scale_max, data.G_t, data.C_tot, data.history, data.terms)
+            _timed(samples, "optimize", optimizer.optimize_records)
+
+    return {name: statistics.median(values) / 1000 for name, values in samples.items()}
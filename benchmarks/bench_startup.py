@@ -0,0 +1,111 @@
+"""
+서비스 기동 시간 측정
+
+- import_ms: 새 인터프리터에서 `import app.main`에 걸린 시간
+- first_response_ms: uvicorn 프로세스 시작부터 /health 첫 200 응답까지
+- ready_ms: 프로세스 시작부터 /ready(예열 포함) 200 응답까지
+- first_simulate_ms: 준비 후 첫 /simulate 요청 지연 시간
+
+Docker 이미지의 CMD와 같은 uvicorn 명령으로 실행한다. 컨테이너 생성 시간은 포함하지 않는다.
+"""
+from typing import Dict, List
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks.scenarios import generate_payload
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 새 인터프리터에서 import app.main 허용 시간 (ms, 1코어 개발 환경 기준)
+IMPORT_BUDGET_MS = 1200
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _request(url: str, payload=None, timeout: float = 5.0) -> int:
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+        return response.status
+
+
+def measure_import() -> float:
+    """새 인터프리터에서 import app.main 시간 (ms)"""
+    code = "import time; t = time.perf_counter(); import app.main; print((time.perf_counter() - t) * 1000)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        env=dict(os.environ, LOG_LEVEL="WARNING")
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_first_response(timeout: float = 30.0) -> Dict[str, float]:
+    """uvicorn 프로세스를 띄워 첫 응답, 준비 완료, 첫 시뮬레이션까지의 시간 측정 (ms)"""
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        env=dict(os.environ, LOG_LEVEL="WARNING")
+    )
+    try:
+        while True:
+            try:
+                _request(f"{base}/health", timeout=1.0)
+                break
+            except (urllib.error.URLError, ConnectionError, OSError):
+                if time.perf_counter() - started > timeout or process.poll() is not None:
+                    raise RuntimeError("서비스가 시작되지 않았습니다")
+                time.sleep(0.005)
+        first_response = time.perf_counter()
+
+        _request(f"{base}/ready")
+        ready = time.perf_counter()
+
+        _request(f"{base}/simulate", generate_payload(1, 8))
+        simulated = time.perf_counter()
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {
+        "first_response_ms": (first_response - started) * 1000,
+        "ready_ms": (ready - started) * 1000,
+        "first_simulate_ms": (simulated - ready) * 1000,
+    }
+
+
+def bench_startup(runs: int = 3) -> Dict[str, float]:
+    """
+    Returns:
+        {"import_ms", "first_response_ms", "ready_ms", "first_simulate_ms"} (runs회 중앙값)
+    """
+    samples: Dict[str, List[float]] = {}
+    for _ in range(runs):
+        samples.setdefault("import_ms", []).append(measure_import())
+        for name, value in measure_first_response().items():
+            samples.setdefault(name, []).append(value)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+if __name__ == "__main__":
+    results = bench_startup()
+    for name, value in results.items():
+        print(f"{name:<20} {value:>10.1f}")
+    if results["import_ms"] > IMPORT_BUDGET_MS:
+        print(f"import 시간이 예산({IMPORT_BUDGET_MS}ms)을 초과했습니다")
+        sys.exit(1)
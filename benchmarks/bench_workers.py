@@ -0,0 +1,140 @@
+"""
+워커 수별 /simulate 처리량과 워커 메모리 (실제 TCP 연결, keep-alive)
+
+워커 수마다 서버를 띄우고 bench_serving의 클라이언트로 8학기 /simulate를 동시 연결 --concurrency개로 보낸다.
+결과 캐시는 끈다. 부하가 끝난 뒤 /proc에서 워커별 CPU 시간과 메모리(smaps_rollup)를 읽는다.
+
+- prefork: python -m app.prefork (부모에서 예열 후 fork, 읽기 전용 상태를 copy-on-write로 공유)
+- uvicorn-workers: uvicorn --workers (워커마다 새 인터프리터에서 앱을 import)
+
+출력:
+- rps, p50/p99: 처리량과 지연 시간
+- cpu_share: 워커별 CPU 시간 비율 (최소-최대, 워커 간 부하 분산)
+- private_mb: 워커 하나의 평균 비공유 메모리 (Private_Clean + Private_Dirty)
+- pss_mb: 부모와 모든 워커의 PSS 합 (공유 페이지는 나눠 계산한 총 메모리)
+
+처리량은 코어 수만큼만 늘어난다. 테스트 환경의 CPU 수는 출력 첫 줄에 표시한다.
+
+실행:
+    python -m benchmarks.bench_workers --workers 1 2 4 8 --requests 3000 --concurrency 32
+"""
+from typing import Dict, List
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_serving import _build_request, _load
+from benchmarks.bench_startup import PROJECT_ROOT, _free_port, _request
+from benchmarks.scenarios import generate_payload
+
+SERVER_MODES = ("prefork", "uvicorn-workers")
+
+
+def _command(mode: str, workers: int, port: int) -> List[str]:
+    if mode == "prefork":
+        return [sys.executable, "-m", "app.prefork"]
+    return [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+            "--http", "httptools", "--loop", "uvloop", "--timeout-keep-alive", "75",
+            "--workers", str(workers)]
+
+
+def _children(pid: int) -> List[int]:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def _memory_kb(pid: int) -> Dict[str, int]:
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return values
+
+
+def _cpu_ticks(pid: int) -> int:
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return int(fields[11]) + int(fields[12])  # utime + stime
+
+
+def _workers(process: subprocess.Popen, mode: str, workers: int) -> List[int]:
+    children = _children(process.pid)
+    if mode == "uvicorn-workers":
+        # --workers 1이면 부모가 직접 요청을 처리한다
+        if workers == 1:
+            return [process.pid]
+        # multiprocessing이 띄우는 resource_tracker 등 보조 프로세스는 제외
+        children = [pid for pid in children if b"resource_tracker" not in open(f"/proc/{pid}/cmdline", "rb").read()]
+    return children
+
+
+def bench_workers(mode: str, workers: int, requests: int = 3000, concurrency: int = 32,
+                  timeout: float = 60.0) -> Dict[str, float]:
+    """mode 서버를 workers개로 띄워 /simulate 부하 측정"""
+    port = _free_port()
+    env = dict(os.environ, CACHE_ENABLED="false", WORKERS=str(workers), HOST="127.0.0.1", PORT=str(port))
+    process = subprocess.Popen(_command(mode, workers, port), cwd=PROJECT_ROOT, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        started = time.perf_counter()
+        while True:
+            try:
+                _request(f"http://127.0.0.1:{port}/ready", timeout=1.0)
+                if len(_workers(process, mode, workers)) >= workers:
+                    break
+            except OSError:
+                pass
+            if time.perf_counter() - started > timeout or process.poll() is not None:
+                raise RuntimeError("서비스가 시작되지 않았습니다")
+            time.sleep(0.05)
+
+        bodies = [json.dumps(generate_payload(seed, 8)).encode() for seed in range(100)]
+        payloads = [_build_request(port, bodies[i % len(bodies)], True) for i in range(requests)]
+        asyncio.run(_load(port, payloads[:50 * workers], concurrency, True))  # 워밍업
+        pids = _workers(process, mode, workers)
+        before = {pid: _cpu_ticks(pid) for pid in pids}
+        result = asyncio.run(_load(port, payloads, concurrency, True))
+
+        ticks = [_cpu_ticks(pid) - before[pid] for pid in pids]
+        shares = [t / max(sum(ticks), 1) for t in ticks]
+        memory = {pid: _memory_kb(pid) for pid in {process.pid, *pids}}
+        private = [memory[pid]["Private_Clean"] + memory[pid]["Private_Dirty"] for pid in pids]
+        result.update({
+            "workers": len(pids),
+            "cpu_share_min": min(shares),
+            "cpu_share_max": max(shares),
+            "private_mb": sum(private) / len(private) / 1024,
+            "pss_mb": sum(m["Pss"] for m in memory.values()) / 1024,
+        })
+        return result
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--modes", nargs="+", default=list(SERVER_MODES), choices=SERVER_MODES)
+    args = parser.parse_args()
+
+    from app.prefork import available_cpus, cpu_quota
+    print(f"cpus {available_cpus()}  cpu quota {cpu_quota()}")
+    for mode in args.modes:
+        for workers in args.workers:
+            r = bench_workers(mode, workers, args.requests, args.concurrency)
+            print(f"{mode:16s} workers {r['workers']:2d}  {r['rps']:7.1f} req/s  p50 {r['p50_ms']:6.2f}ms  "
+                  f"p99 {r['p99_ms']:7.2f}ms  cpu_share {r['cpu_share_min']:.2f}-{r['cpu_share_max']:.2f}  "
+                  f"private {r['private_mb']:5.1f}MB/worker  pss {r['pss_mb']:6.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+벤치마크 실행 및 성능 회귀 검사
+
+사용법:
+    python -m benchmarks.run                                  # 결과 출력
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --threshold 0.25
+
+--compare는 기준선 대비 threshold(비율) 이상 나빠진 지표가 있으면 종료 코드 1을 반환한다.
+시간 지표(_us, _ms)는 낮을수록, 처리량(rps)은 높을수록 좋다.
+"""
+from typing import Dict, List, Tuple
+import argparse
+import json
+import logging
+import platform
+import sys
+
+from benchmarks.scenarios import SCENARIO_SIZES, generate_inputs, generate_payload
+
+# 시나리오별 입력 수
+SIMULATOR_INPUTS = 50
+API_PAYLOADS = 50
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric.endswith("rps")
+
+
+def run_benchmarks(sizes=SCENARIO_SIZES, rounds: int = 20, requests: int = 1000,
+                   concurrency: int = 16, seed: int = 1, startup: bool = True) -> Dict[str, float]:
+    """모든 벤치마크를 실행해 {지표 이름: 값} 반환"""
+    from benchmarks.bench_simulator import bench_simulator
+    from benchmarks.bench_api import bench_api
+    from benchmarks.bench_startup import bench_startup
+    from app.main import app, result_cache
+
+    metrics: Dict[str, float] = {}
+    if startup:
+        # 다른 벤치마크가 캐시를 데우기 전에 새 프로세스로 측정
+        for name, value in bench_startup().items():
+            metrics[f"startup.{name}"] = value
+
+    for size in sizes:
+        inputs = generate_inputs(seed, size, SIMULATOR_INPUTS)
+        for step, value in bench_simulator(inputs, rounds).items():
+            metrics[f"simulator.{size}.{step.lstrip('_')}_us"] = value
+
+    # 캐시 적중이 측정을 왜곡하지 않도록 비활성화
+    cache_enabled = result_cache.enabled
+    result_cache.enabled = False
+    try:
+        for size in sizes:
+            payloads = [generate_payload(seed + i, size) for i in range(API_PAYLOADS)]
+            for name, value in bench_api(app, payloads, requests, concurrency).items():
+                metrics[f"api.{size}.{name}"] = value
+    finally:
+        result_cache.enabled = cache_enabled
+
+    return metrics
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float],
+            threshold: float) -> List[Tuple[str, float, float, float]]:
+    """
+    기준선 대비 회귀한 지표
+
+    Returns:
+        [(지표 이름, 기준값, 현재값, 악화 비율)]
+    """
+    regressions = []
+    for metric, base in sorted(baseline.items()):
+        value = current.get(metric)
+        if value is None or base <= 0:
+            continue
+        if higher_is_better(metric):
+            change = (base - value) / base
+        else:
+            change = (value - base) / base
+        if change > threshold:
+            regressions.append((metric, base, value, change))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="GPA Simulator 벤치마크")
+    parser.add_argument("--save-baseline", metavar="PATH", help="결과를 기준선 파일로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="기준선 파일과 비교해 회귀 시 실패")
+    parser.add_argument("--threshold", type=float, default=0.25, help="허용 악화 비율 (기본 0.25)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SCENARIO_SIZES), help="시나리오 학기 수")
+    parser.add_argument("--rounds", type=int, default=20, help="단계별 측정 반복 횟수")
+    parser.add_argument("--requests", type=int, default=1000, help="시나리오별 API 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--skip-startup", action="store_true", help="기동 시간 측정 생략")
+    args = parser.parse_args(argv)
+
+    # 요청별 요약 로그가 측정과 출력에 섞이지 않도록
+    logging.disable(logging.INFO)
+
+    metrics = run_benchmarks(args.sizes, args.rounds, args.requests, args.concurrency,
+                             startup=not args.skip_startup)
+    for metric, value in metrics.items():
+        print(f"{metric:<50} {value:>12.2f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "metrics": metrics,
+            }, f, indent=2)
+            f.write("\n")
+        print(f"기준선 저장: {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["metrics"]
+        regressions = compare(baseline, metrics, args.threshold)
+        if regressions:
+            print(f"\n성능 회귀 {len(regressions)}건 (허용 {args.threshold:.0%}):")
+            for metric, base, value, change in regressions:
+                print(f"  {metric}: {base:.2f} -> {value:.2f} (+{change:.0%} 악화)")
+            return 1
+        print(f"\n회귀 없음 (허용 {args.threshold:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
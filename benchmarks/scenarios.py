@@ -0,0 +1,63 @@
+"""
+벤치마크용 시나리오 생성기
+
+같은 시드면 항상 같은 입력을 만든다. 전체 학기 수(8/40/200)에 따라
+정규 학기(15~21학점) 또는 파트타임 학기(3~9학점) 위주로 이력과 남은 학기를 만든다.
+"""
+from typing import Dict, List
+import random
+
+from app.models import SimulationInput
+
+# 벤치마크 시나리오 크기 (이수 + 남은 학기 수)
+SCENARIO_SIZES = (8, 40, 200)
+
+
+def generate_payload(seed: int, total_terms: int, scale_max: float = 4.5) -> Dict:
+    """/simulate 요청 JSON과 같은 형태의 시나리오"""
+    rng = random.Random(seed * 1000 + total_terms)
+    part_time = total_terms > 10
+
+    completed = rng.randint(0, int(total_terms * 0.6))
+    history = []
+    for i in range(completed):
+        credits = rng.choice([3, 6, 9]) if part_time else rng.choice([15, 17, 18, 19, 21])
+        history.append({
+            "term_id": f"S{i+1}",
+            "credits": credits,
+            "achieved_avg": round(min(rng.gauss(3.6, 0.4), scale_max), 2),
+        })
+
+    terms = []
+    for i in range(completed, total_terms):
+        summer = (i % 3 == 2) and part_time
+        credits = rng.choice([3, 6]) if summer else (rng.choice([3, 6, 9]) if part_time else rng.choice([15, 18, 21]))
+        terms.append({
+            "id": f"S{i+1}",
+            "type": "summer" if summer else "regular",
+            "planned_credits": credits,
+            "max_credits": 9 if summer or part_time else 21,
+        })
+
+    C_e = sum(h["credits"] for h in history)
+    C_r = sum(t["planned_credits"] for t in terms)
+    C_tot = C_e + C_r + rng.choice([-6, 0, 0, 0, 3])
+
+    # 달성 가능한 범위에서 현재 GPA보다 조금 높은 목표
+    grade_points = sum(h["credits"] * h["achieved_avg"] for h in history)
+    current = grade_points / C_e if C_e else 3.5
+    max_gpa = (grade_points + scale_max * (C_tot - C_e)) / C_tot
+    G_t = round(min(current + rng.uniform(0.0, 0.4), max_gpa - 0.01, scale_max - 0.01), 2)
+
+    return {
+        "scale_max": scale_max,
+        "G_t": G_t,
+        "C_tot": C_tot,
+        "history": history,
+        "terms": terms,
+    }
+
+
+def generate_inputs(seed: int, total_terms: int, count: int) -> List[SimulationInput]:
+    """시드별로 count개의 SimulationInput"""
+    return [SimulationInput(**generate_payload(seed + i, total_terms)) for i in range(count)]
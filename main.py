@@ -1,16 +1,13 @@
-# 샘플 Python 스크립트입니다.
+"""
+GPA Simulator 오프라인 배치 실행기
 
-# ⌃R을(를) 눌러 실행하거나 내 코드로 바꿉니다.
-# 클래스, 파일, 도구 창, 액션 및 설정을 어디서나 검색하려면 ⇧ 두 번을(를) 누릅니다.
+    python main.py students.jsonl plans.csv [--workers N] [--chunk-size N] [--resume]
 
+옵션은 python main.py --help 참고. API 서버는 uvicorn app.main:app 으로 실행한다.
+"""
+import sys
 
-def print_hi(name):
-    # 스크립트를 디버그하려면 하단 코드 줄의 중단점을 사용합니다.
-    print(f'Hi, {name}')  # 중단점을 전환하려면 ⌘F8을(를) 누릅니다.
+from app.cli import main
 
-
-# 스크립트를 실행하려면 여백의 녹색 버튼을 누릅니다.
-if __name__ == '__main__':
-    print_hi('PyCharm')
-
-# https://www.jetbrains.com/help/pycharm/에서 PyCharm 도움말 참조
+if __name__ == "__main__":
+    sys.exit(main())
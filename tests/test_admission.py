@@ -0,0 +1,160 @@
+"""
+요청 수락 제어 단위 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+from app import admission as admission_module, main
+from app.admission import AdmissionControl, AdmissionMiddleware
+from app.config import settings
+from app.main import app
+
+PAYLOAD = {
+    "scale_max": 4.5, "G_t": 3.8, "C_tot": 72,
+    "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.6}],
+    "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": 18} for i in range(1, 4)]
+}
+
+
+def _request(target, method, path, **kwargs):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(run())
+
+
+class TestBodyLimit:
+    """본문 크기 한도 테스트"""
+
+    def test_content_length(self, monkeypatch):
+        """Content-Length가 한도를 넘으면 본문을 읽지 않고 413"""
+        monkeypatch.setattr(main.admission, "max_body_bytes", 1000)
+        before = main.admission.rejected["body_too_large"]
+
+        response = _request(app, "POST", "/simulate", content=b"x" * 1001, headers={"content-type": "application/json"})
+
+        assert response.status_code == 413
+        assert "1000" in response.json()["detail"]
+        assert main.admission.rejected["body_too_large"] == before + 1
+
+    def test_streamed_body(self, monkeypatch):
+        """Content-Length 없이 나눠 보낸 본문도 한도를 넘는 순간 413"""
+        monkeypatch.setattr(main.admission, "max_body_bytes", 1000)
+
+        async def chunks():
+            for _ in range(10):
+                yield b" " * 200
+
+        response = _request(app, "POST", "/simulate", content=chunks(), headers={"content-type": "application/json"})
+
+        assert response.status_code == 413
+
+    def test_batch_limit(self, monkeypatch):
+        """배치 엔드포인트는 별도 한도"""
+        monkeypatch.setattr(main.admission, "max_body_bytes", 100)
+        body = {"inputs": [PAYLOAD]}
+
+        assert _request(app, "POST", "/simulate", json=PAYLOAD).status_code == 413
+        assert _request(app, "POST", "/simulate/batch", json=body).status_code == 200
+
+
+class TestListLimits:
+    """목록 길이 한도 테스트"""
+
+    def test_too_many_terms(self):
+        """학기 수 한도 초과 → 422, 넘친 목록은 응답에 포함하지 않음"""
+        terms = [{"id": f"T{i}", "type": "regular", "planned_credits": 1} for i in range(settings.max_terms + 1)]
+
+        response = _request(app, "POST", "/simulate", json=dict(PAYLOAD, terms=terms))
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["type"] == "too_long" and error["loc"] == ["body", "terms"]
+        assert "input" not in error
+
+    def test_other_errors_keep_input(self):
+        response = _request(app, "POST", "/simulate", json=dict(PAYLOAD, G_t="high"))
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["input"] == "high"
+
+
+class TestClientLimits:
+    """클라이언트별 속도/동시 요청 제한 테스트"""
+
+    def test_rate_limit(self):
+        """토큰을 다 쓰면 429 + Retry-After, 다른 클라이언트와 /health는 영향 없음"""
+        control = AdmissionControl(rate=0.5, burst=2)
+        target = AdmissionMiddleware(app, control)
+        headers = {"X-Client-ID": "student-1"}
+
+        statuses = [_request(target, "POST", "/simulate", json=PAYLOAD, headers=headers).status_code for _ in range(3)]
+        limited = _request(target, "POST", "/simulate", json=PAYLOAD, headers=headers)
+
+        assert statuses == [200, 200, 429]
+        assert limited.headers["Retry-After"] == "2"
+        assert _request(target, "POST", "/simulate", json=PAYLOAD, headers={"X-Client-ID": "student-2"}).status_code == 200
+        assert _request(target, "GET", "/health", headers=headers).status_code == 200
+        assert control.rejected["rate_limited"] == 2
+
+    def test_refill(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(admission_module.time, "monotonic", lambda: now[0])
+        control = AdmissionControl(rate=2, burst=1)
+        state = control.client({"headers": [], "client": ("10.0.0.1", 1234)})
+
+        assert control.admit(state) is None
+        assert control.admit(state) == ("rate_limited", 1)
+        now[0] += 0.5
+        assert control.admit(state) is None
+
+    def test_concurrency(self):
+        """처리 중인 요청이 한도에 도달하면 429, 끝나면 다시 수락"""
+        release = asyncio.Event()
+
+        async def slow_app(scope, receive, send):
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        control = AdmissionControl(max_concurrency=1)
+        target = AdmissionMiddleware(slow_app, control)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://test") as client:
+                first = asyncio.create_task(client.post("/simulate", json=PAYLOAD))
+                await asyncio.sleep(0.01)
+                second = await client.post("/simulate", json=PAYLOAD)
+                release.set()
+                first = await first
+                third = await client.post("/simulate", json=PAYLOAD)
+                return first.status_code, second.status_code, third.status_code
+
+        assert asyncio.run(run()) == (200, 429, 200)
+        assert control.rejected["too_many_concurrent"] == 1
+
+    def test_client_table_bounded(self):
+        control = AdmissionControl(rate=1, max_clients=2)
+        for i in range(5):
+            control.client({"headers": [(b"x-client-id", f"c{i}".encode())]})
+
+        assert list(control.clients) == ["c3", "c4"]
+
+
+class TestFlood:
+    """거절 대상 요청이 섞여도 정상 요청은 모두 처리되고, flood는 413/422/429로 거절된다"""
+
+    def test_mixed_flood(self, monkeypatch):
+        from benchmarks.bench_admission import bench_admission
+
+        control = AdmissionControl(max_body_bytes=settings.max_body_bytes, rate=5, burst=5, max_concurrency=2)
+        monkeypatch.setattr(main.result_cache, "enabled", False)
+        target = AdmissionMiddleware(app, control)
+
+        results = bench_admission(target, control, requests=100, flood_rps=200)
+
+        on = results["admission_on"]
+        assert on["errors"] == 0
+        assert set(on["flood_statuses"]) <= {200, 413, 422, 429}
+        assert on["flood_statuses"][413] > 0 and on["flood_statuses"][429] > 0
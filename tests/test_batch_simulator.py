@@ -0,0 +1,129 @@
+"""
+BatchGPASimulator 단위 테스트
+"""
+import random
+
+import pytest
+from app.models import HistoryItem, TermItem, SimulationInput
+from app.simulator import GPASimulator
+from app.batch_simulator import BatchGPASimulator
+
+
+def _random_input(rng: random.Random) -> SimulationInput:
+    """학점 부족/초과, 달성 불가능 등 여러 경로를 섞은 임의 입력"""
+    scale_max = rng.choice([4.0, 4.3, 4.5])
+    history = [
+        HistoryItem(
+            term_id=f"S{i+1}",
+            credits=rng.choice([15, 17.5, 18, 19, 21]),
+            achieved_avg=round(rng.uniform(2.8, scale_max), 2)
+        )
+        for i in range(rng.randint(0, 6))
+    ]
+    terms = [
+        TermItem(
+            id=f"S{len(history)+i+1}",
+            type=rng.choice(["regular", "summer"]),
+            planned_credits=rng.choice([6, 12.5, 15, 18, 18, 21]) if rng.random() > 0.03 else 24,
+            max_credits=21
+        )
+        for i in range(rng.randint(1, 8))
+    ]
+    # 대부분은 계획 학점이 졸업 학점과 맞고, 일부는 부족하거나 초과
+    C_tot = (
+        sum(h.credits for h in history) + sum(t.planned_credits for t in terms)
+        + rng.choice([-10, -3.5, 0, 0, 0, 0, 2, 5, 12])
+    )
+    # 목표 GPA는 대부분 달성 가능한 범위, 일부는 달성 불가능
+    G_t = round(min(rng.uniform(2.5, scale_max - 0.2) + rng.choice([0, 0, 0, 0.5]), scale_max), 2)
+    return SimulationInput(
+        scale_max=scale_max,
+        G_t=G_t,
+        C_tot=max(C_tot, 1),
+        history=history,
+        terms=terms
+    )
+
+
+def _run_single(data: SimulationInput):
+    simulator = GPASimulator(
+        scale_max=data.scale_max,
+        G_t=data.G_t,
+        C_tot=data.C_tot,
+        history=list(data.history),
+        terms=[t.model_copy() for t in data.terms]
+    )
+    try:
+        return simulator.simulate()
+    except ValueError as e:
+        return e
+
+
+class TestBatchGPASimulator:
+    """BatchGPASimulator 클래스 테스트"""
+
+    def test_matches_single_path_exactly(self):
+        """단건 경로와 결과가 정확히 일치"""
+        rng = random.Random(42)
+        inputs = [_random_input(rng) for _ in range(500)]
+
+        outcomes = BatchGPASimulator(inputs).simulate()
+
+        assert len(outcomes) == len(inputs)
+        for data, outcome in zip(inputs, outcomes):
+            expected = _run_single(data)
+            if isinstance(expected, ValueError):
+                assert isinstance(outcome, ValueError)
+                assert str(outcome) == str(expected)
+            else:
+                assert [r.model_dump() for r in outcome] == [r.model_dump() for r in expected]
+
+    def test_does_not_mutate_input(self):
+        """입력 객체의 학기 계획이 변경되지 않음"""
+        data = SimulationInput(
+            scale_max=4.5, G_t=4.0, C_tot=60,
+            history=[HistoryItem(term_id="S1", credits=18, achieved_avg=3.8)],
+            terms=[
+                TermItem(id="S2", type="regular", planned_credits=30, max_credits=21),
+                TermItem(id="S3", type="regular", planned_credits=30, max_credits=21)
+            ]
+        )
+
+        BatchGPASimulator([data]).simulate()
+
+        assert [t.planned_credits for t in data.terms] == [30, 30]
+        assert len(data.terms) == 2
+
+
+class TestBatchAPI:
+    """배치 엔드포인트 통합 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """테스트 클라이언트 생성"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        return TestClient(app)
+
+    def test_batch_endpoint(self, client):
+        """성공/400/422가 섞인 배치 요청"""
+        ok = {
+            "scale_max": 4.5, "G_t": 4.0, "C_tot": 72, "history": [],
+            "terms": [{"id": f"S{i}", "type": "regular", "planned_credits": 18, "max_credits": 21}
+                      for i in range(1, 5)]
+        }
+        invalid = dict(ok, G_t=5.0)
+        impossible = {
+            "scale_max": 4.5, "G_t": 4.5, "C_tot": 54,
+            "history": [{"term_id": "S1", "credits": 36, "achieved_avg": 2.0}],
+            "terms": [{"id": "S2", "type": "regular", "planned_credits": 18, "max_credits": 21}]
+        }
+
+        response = client.post("/simulate/batch", json={"inputs": [ok, invalid, impossible]})
+        assert response.status_code == 200
+
+        items = response.json()
+        assert [item["index"] for item in items] == [0, 1, 2]
+        assert [item["status_code"] for item in items] == [200, 400, 422]
+        assert items[0]["results"] == client.post("/simulate", json=ok).json()
+        assert items[1]["detail"] and items[2]["detail"]
@@ -0,0 +1,41 @@
+"""
+벤치마크 시나리오 및 회귀 비교 단위 테스트
+"""
+from app.simulator import GPASimulator
+from benchmarks.scenarios import SCENARIO_SIZES, generate_inputs, generate_payload
+from benchmarks.run import compare
+
+
+class TestScenarios:
+    """시나리오 생성기 테스트"""
+
+    def test_deterministic(self):
+        """같은 시드면 같은 입력"""
+        assert generate_payload(3, 40) == generate_payload(3, 40)
+        assert generate_payload(3, 40) != generate_payload(4, 40)
+
+    def test_feasible(self):
+        """생성된 시나리오는 모두 달성 가능"""
+        for size in SCENARIO_SIZES:
+            for data in generate_inputs(1, size, 10):
+                assert len(data.history) + len(data.terms) == size
+                GPASimulator(data.scale_max, data.G_t, data.C_tot, data.history, data.terms).simulate()
+
+
+class TestCompare:
+    """기준선 비교 테스트"""
+
+    def test_regressions(self):
+        """시간은 증가, 처리량은 감소가 회귀"""
+        baseline = {"simulator.8.simulate_us": 100.0, "api.8.p99_ms": 2.0, "api.8.rps": 1000.0}
+        current = {"simulator.8.simulate_us": 130.0, "api.8.p99_ms": 1.0, "api.8.rps": 700.0}
+
+        regressions = compare(baseline, current, threshold=0.2)
+
+        assert [r[0] for r in regressions] == ["api.8.rps", "simulator.8.simulate_us"]
+
+    def test_within_threshold(self):
+        """허용 범위 이내 또는 기준선에 없는 지표는 무시"""
+        baseline = {"simulator.8.simulate_us": 100.0}
+        current = {"simulator.8.simulate_us": 115.0, "api.8.rps": 1.0}
+        assert compare(baseline, current, threshold=0.2) == []
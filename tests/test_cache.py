@@ -0,0 +1,158 @@
+"""
+결과 캐시 단위 테스트
+"""
+import pytest
+from app.models import SimulationInput
+from app.records import ResultRecord
+from app.cache import (
+    canonical_key, LocalCacheBackend, RedisCacheBackend, ResultCache
+)
+
+
+def _input(**overrides) -> SimulationInput:
+    payload = {
+        "scale_max": 4.5,
+        "G_t": 4.0,
+        "C_tot": 72,
+        "history": [],
+        "terms": [
+            {"id": "S1", "type": "regular", "planned_credits": 36, "max_credits": 21},
+            {"id": "S2", "type": "regular", "planned_credits": 36, "max_credits": 21}
+        ]
+    }
+    payload.update(overrides)
+    return SimulationInput(**payload)
+
+
+class FakeRedis:
+    """dict 기반 Redis 대역 (get/set/scan_iter/delete만 지원)"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, px=None):
+        self.store[key] = value.encode("utf-8")
+
+    def scan_iter(self, match=None):
+        prefix = match.rstrip("*")
+        return [k for k in list(self.store) if k.startswith(prefix)]
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+class TestCanonicalKey:
+    """캐시 키 테스트"""
+
+    def test_normalized_input_same_key(self):
+        """정수/실수 표기가 달라도 같은 키"""
+        a = _input(C_tot=72)
+        b = _input(C_tot=72.0)
+        assert canonical_key(a) == canonical_key(b)
+
+    def test_different_input_different_key(self):
+        """입력이 다르면 다른 키"""
+        assert canonical_key(_input(G_t=4.0)) != canonical_key(_input(G_t=4.1))
+
+
+class TestLocalCacheBackend:
+    """LRU + TTL 캐시 테스트"""
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목 제거"""
+        backend = LocalCacheBackend(max_size=2)
+        backend.set("a", "1", ttl=60)
+        backend.set("b", "2", ttl=60)
+        backend.get("a")
+        backend.set("c", "3", ttl=60)
+
+        assert backend.get("a") == "1"
+        assert backend.get("b") is None
+        assert backend.get("c") == "3"
+        assert backend.evictions == 1
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 만료"""
+        now = [0.0]
+        backend = LocalCacheBackend(max_size=10, clock=lambda: now[0])
+        backend.set("a", "1", ttl=5)
+
+        now[0] = 4.9
+        assert backend.get("a") == "1"
+        now[0] = 5.0
+        assert backend.get("a") is None
+        assert backend.size() == 0
+
+
+class TestResultCache:
+    """ResultCache 테스트"""
+
+    def test_hit_and_miss_counters(self):
+        """두 번째 호출은 계산하지 않고 캐시에서 반환"""
+        cache = ResultCache(LocalCacheBackend())
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return [ResultRecord("S1", 18.0, 4.0)]
+
+        first = cache.get_or_compute(_input(), compute)
+        second = cache.get_or_compute(_input(), compute)
+
+        assert len(calls) == 1
+        assert first == second
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_error_cached(self):
+        """목표 달성 불가능 메시지도 캐시"""
+        cache = ResultCache(LocalCacheBackend())
+
+        def compute():
+            raise ValueError("불가능")
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="불가능"):
+                cache.get_or_compute(_input(), compute)
+        assert cache.hits == 1
+
+    def test_pluggable_backend(self):
+        """공유 저장소 백엔드로 교체"""
+        client = FakeRedis()
+        cache = ResultCache(RedisCacheBackend(client=client))
+        results = [ResultRecord("S1", 18.0, 4.0)]
+
+        cache.get_or_compute(_input(), lambda: results)
+        # 다른 워커의 캐시 인스턴스도 같은 저장소를 보면 hit
+        other = ResultCache(RedisCacheBackend(client=client))
+        cached = other.get_or_compute(_input(), lambda: pytest.fail("재계산됨"))
+
+        assert cached[0].required_avg == 4.0
+        other.backend.clear()
+        assert client.store == {}
+
+
+class TestCacheAPI:
+    """캐시 적용된 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """테스트 클라이언트 생성"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        return TestClient(app)
+
+    def test_repeated_request_hits_cache(self, client):
+        """같은 요청을 반복하면 캐시 hit 증가"""
+        payload = _input(G_t=3.77).model_dump()
+
+        before = client.get("/cache/stats").json()["hits"]
+        first = client.post("/simulate", json=payload)
+        second = client.post("/simulate", json=payload)
+
+        assert first.status_code == 200
+        assert first.json() == second.json()
+        assert client.get("/cache/stats").json()["hits"] == before + 1
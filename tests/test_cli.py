@@ -0,0 +1,141 @@
+"""
+오프라인 배치 실행기 단위 테스트
+"""
+import csv
+import io
+import json
+
+import pytest
+from app.cli import run, read_jsonl, read_json_array, read_csv, simulate_chunk, main
+from app.models import SimulationInput
+from app import tasks
+
+PAYLOAD = {
+    "scale_max": 4.5, "G_t": 4.0, "C_tot": 130,
+    "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.8}],
+    "terms": [{"id": f"S{i}", "type": "regular", "planned_credits": 18, "max_credits": 21} for i in range(2, 9)]
+}
+
+
+def _records(count):
+    return [dict(PAYLOAD, key=f"st{i}", G_t=round(3.5 + (i % 10) * 0.05, 2)) for i in range(count)]
+
+
+def _write_jsonl(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return str(path)
+
+
+def _read_output(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class TestReaders:
+    """입력 형식별 reader 테스트"""
+
+    def test_jsonl_resume_position(self, tmp_path):
+        """다음 레코드부터 다시 읽을 수 있는 위치 (빈 줄은 건너뜀)"""
+        path = str(tmp_path / "in.jsonl")
+        with open(path, "w") as f:
+            f.write('{"a": 1}\n\n{"a": 2}\n{"a": 3}')
+
+        records = list(read_jsonl(path))
+
+        assert [json.loads(raw)["a"] for raw, _ in records] == [1, 2, 3]
+        assert [json.loads(raw)["a"] for raw, _ in read_jsonl(path, records[0][1])] == [2, 3]
+
+    def test_json_array_small_buffer(self, tmp_path):
+        """버퍼보다 큰 원소도 나누어 읽고, 재개 시 앞쪽 원소는 건너뜀"""
+        path = tmp_path / "in.json"
+        path.write_text(json.dumps(_records(5), indent=2))
+
+        records = list(read_json_array(str(path), buffer_size=64))
+
+        assert [raw["key"] for raw, _ in records] == [f"st{i}" for i in range(5)]
+        assert [raw["key"] for raw, _ in read_json_array(str(path), start=3)] == ["st3", "st4"]
+
+    def test_csv_columns(self, tmp_path):
+        """history/terms 컬럼은 JSON 문자열, 잘못된 JSON은 에러 메시지"""
+        path = tmp_path / "in.csv"
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["key", "scale_max", "G_t", "C_tot", "history", "terms"])
+            writer.writerow(["a", 4.5, 4.0, 130, json.dumps(PAYLOAD["history"]), json.dumps(PAYLOAD["terms"])])
+            writer.writerow(["b", 4.5, 4.0, 130, "[", "[]"])
+
+        records = list(read_csv(str(path)))
+
+        assert records[0][0]["terms"] == PAYLOAD["terms"]
+        assert isinstance(records[1][0], str)
+        assert [raw for raw, _ in read_csv(str(path), records[0][1])] == [records[1][0]]
+
+
+class TestSimulateChunk:
+    """simulate_chunk 함수 테스트"""
+
+    def test_rows_match_single_simulation(self):
+        """성공 레코드는 학기당 한 행, 실패 레코드는 단건 /simulate와 같은 상태 코드의 한 행"""
+        chunk = [
+            (0, json.dumps(dict(PAYLOAD, key="ok")).encode()),
+            (1, dict(PAYLOAD, key="over", G_t=5.0)),
+            (2, dict(PAYLOAD, key="infeasible", G_t=4.5, C_tot=40)),
+            (3, "terms 컬럼 JSON 형식 오류"),
+        ]
+
+        rows = simulate_chunk(chunk)
+
+        expected = tasks.simulate(SimulationInput.model_validate(PAYLOAD))
+        assert rows[:len(expected)] == [(0, "ok", 200, "", r.term_id, r.credits, r.required_avg) for r in expected]
+        assert [row[:3] for row in rows[len(expected):]] == [(1, "over", 400), (2, "infeasible", 422), (3, "", 422)]
+
+
+class TestRun:
+    """run 함수 테스트"""
+
+    def test_workers_same_output(self, tmp_path):
+        """워커 프로세스 수와 무관하게 같은 출력"""
+        source = _write_jsonl(tmp_path / "in.jsonl", _records(50))
+
+        single = run(source, str(tmp_path / "single.csv"), workers=1, chunk_size=7, stream=io.StringIO())
+        pooled = run(source, str(tmp_path / "pooled.csv"), workers=2, chunk_size=7, stream=io.StringIO())
+
+        assert single["records"] == pooled["records"] == 50
+        assert (tmp_path / "single.csv").read_bytes() == (tmp_path / "pooled.csv").read_bytes()
+        assert {row["key"] for row in _read_output(tmp_path / "single.csv")} == {f"st{i}" for i in range(50)}
+
+    def test_resume(self, tmp_path):
+        """중단된 실행을 이어서 계산하면 한 번에 계산한 결과와 같음"""
+        records = _records(30)
+        full = _write_jsonl(tmp_path / "full.jsonl", records)
+        run(full, str(tmp_path / "expected.csv"), workers=1, chunk_size=4, stream=io.StringIO())
+
+        # 앞쪽 10개만 있는 입력으로 실행한 뒤, 진행 상황 기록 이후에 쓰인 쓰레기 행을 흉내낸다
+        partial = _write_jsonl(tmp_path / "in.jsonl", records[:10])
+        output = str(tmp_path / "out.csv")
+        run(partial, output, workers=1, chunk_size=4, stream=io.StringIO())
+        with open(output, "a") as f:
+            f.write("999,garbage,200,,X,1,1\n")
+        _write_jsonl(tmp_path / "in.jsonl", records)
+
+        summary = run(partial, output, workers=1, chunk_size=4, resume=True, stream=io.StringIO())
+
+        assert summary["records"] == 30
+        assert (tmp_path / "out.csv").read_bytes() == (tmp_path / "expected.csv").read_bytes()
+
+    def test_resume_other_input(self, tmp_path):
+        """다른 입력의 진행 상황으로는 재개하지 않음"""
+        first = _write_jsonl(tmp_path / "a.jsonl", _records(2))
+        second = _write_jsonl(tmp_path / "b.jsonl", _records(2))
+        output = str(tmp_path / "out.csv")
+        run(first, output, workers=1, stream=io.StringIO())
+
+        with pytest.raises(ValueError):
+            run(second, output, workers=1, resume=True, stream=io.StringIO())
+
+    def test_main(self, tmp_path, capsys):
+        source = _write_jsonl(tmp_path / "in.jsonl", _records(3))
+
+        assert main([source, str(tmp_path / "out.csv"), "--workers", "1"]) == 0
+        assert json.loads(capsys.readouterr().out)["records"] == 3
+        assert main([str(tmp_path / "in.txt"), str(tmp_path / "out.csv")]) == 2
@@ -0,0 +1,126 @@
+"""
+SimulationExecutor 단위 테스트
+"""
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from app.executor import SimulationExecutor, ExecutorSaturated
+from app.logging_config import start_trace, reset_trace, trace_enabled
+from app.metrics import MetricsRegistry
+from app.models import SimulationInput
+from app import tasks
+
+PAYLOAD = {
+    "scale_max": 4.5, "G_t": 4.0, "C_tot": 130,
+    "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.8}],
+    "terms": [{"id": f"S{i}", "type": "regular", "planned_credits": 18, "max_credits": 21} for i in range(2, 9)]
+}
+
+
+class TestSimulationExecutor:
+    """SimulationExecutor 클래스 테스트"""
+
+    def test_thread_mode_keeps_trace_context(self):
+        """스레드 풀에서도 요청의 추적 플래그 유지"""
+        executor = SimulationExecutor("thread", workers=2, registry=MetricsRegistry())
+
+        async def run():
+            token = start_trace("req-1", force=True)
+            try:
+                return await executor.run(trace_enabled)
+            finally:
+                reset_trace(token)
+
+        assert asyncio.run(run()) is True
+        assert executor.in_flight == 0
+        executor.shutdown()
+
+    def test_saturation(self):
+        """실행 중 + 대기 중 작업이 한도에 도달하면 바로 거절"""
+        executor = SimulationExecutor("thread", workers=1, max_queue=1, registry=MetricsRegistry())
+        release = threading.Event()
+
+        async def run():
+            first = asyncio.ensure_future(executor.run(release.wait))
+            second = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.01)
+            with pytest.raises(ExecutorSaturated) as exc_info:
+                await executor.run(release.wait)
+            release.set()
+            await asyncio.gather(first, second)
+            return exc_info.value
+
+        error = asyncio.run(run())
+
+        assert error.retry_after >= 1
+        assert executor.rejected == 1
+        assert executor.completed == 2
+        assert executor.in_flight == 0
+        executor.shutdown()
+
+    def test_process_mode_matches_inline(self):
+        """프로세스 풀 결과가 이벤트 루프에서 직접 실행한 결과와 동일"""
+        data = SimulationInput(**PAYLOAD)
+        executor = SimulationExecutor("process", workers=1, registry=MetricsRegistry())
+
+        try:
+            results = asyncio.run(executor.run(tasks.simulate, data))
+        finally:
+            executor.shutdown()
+
+        assert results == tasks.simulate(data)
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            SimulationExecutor("fiber")
+
+
+class TestExecutorAPI:
+    """실행 풀 적용된 엔드포인트 테스트"""
+
+    def test_saturated_returns_503(self, monkeypatch):
+        """대기열 초과 시 503 + Retry-After, 포화 메트릭 노출"""
+        from fastapi.testclient import TestClient
+        from app import main
+
+        monkeypatch.setattr(main, "executor", SimulationExecutor("thread", workers=1, max_queue=0))
+        main.executor.in_flight = main.executor.capacity
+        main.result_cache.backend.clear()
+        client = TestClient(main.app)
+
+        response = client.post("/simulate", json=PAYLOAD)
+
+        assert response.status_code == 503
+        assert int(response.headers["retry-after"]) >= 1
+
+    def test_health_not_blocked(self, monkeypatch):
+        """긴 시뮬레이션이 실행 중이어도 /health는 바로 응답"""
+        from app import main
+
+        def slow_simulate(data):
+            time.sleep(0.5)
+            return []
+
+        monkeypatch.setattr(tasks, "simulate", slow_simulate)
+        monkeypatch.setattr(main, "executor", SimulationExecutor("thread", workers=1))
+        main.result_cache.backend.clear()
+
+        async def run():
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                simulate = asyncio.ensure_future(client.post("/simulate", json=dict(PAYLOAD, G_t=4.01)))
+                await asyncio.sleep(0.05)
+                started = time.perf_counter()
+                health = await client.get("/health")
+                health_seconds = time.perf_counter() - started
+                await simulate
+                return health, health_seconds
+
+        health, health_seconds = asyncio.run(run())
+
+        assert health.status_code == 200
+        assert health_seconds < 0.25
+        main.executor.shutdown()
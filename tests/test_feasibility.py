@@ -0,0 +1,92 @@
+"""
+목표 달성 가능 여부 확인 단위 테스트
+"""
+import asyncio
+import random
+
+import httpx
+import pytest
+from app.feasibility import check_feasibility
+from app.main import app
+from app.models import SimulationInput
+from app import tasks
+from benchmarks.scenarios import generate_payload
+
+
+def _simulate_status(data: SimulationInput):
+    """같은 입력으로 /simulate를 호출할 때의 상태 코드와 에러 메시지"""
+    error = tasks.validate_input(data)
+    if error is not None:
+        return 400, error
+    try:
+        tasks.simulate(data)
+    except ValueError as e:
+        return 422, str(e)
+    return 200, None
+
+
+class TestCheckFeasibility:
+    """check_feasibility 함수 테스트"""
+
+    def test_range(self):
+        """목표 없이 호출하면 달성 가능 범위만 계산"""
+        result = check_feasibility(4.5, 130, C_e=36, grade_points=138.6)
+
+        assert result.feasible is None
+        assert result.max_achievable_gpa == pytest.approx((138.6 + 4.5 * 94) / 130)
+        assert result.min_achievable_gpa == pytest.approx(138.6 / 130)
+
+    def test_additional_credits(self):
+        """달성 불가능하면 필요한 추가 계절학기 학점과 /simulate와 같은 메시지"""
+        result = check_feasibility(4.5, 40, C_e=20, grade_points=60, G_t=4.0)
+
+        assert result.feasible is False and result.status_code == 422
+        assert result.additional_credits_needed == pytest.approx(20)
+        assert "20학점의 계절학기" in result.detail
+
+    def test_graduated(self):
+        result = check_feasibility(4.5, 130, C_e=130, grade_points=520, G_t=4.0)
+
+        assert result.feasible is False
+        assert result.max_achievable_gpa == result.min_achievable_gpa == 4.0
+
+    def test_validation_before_step1(self):
+        """목표가 최대 평점을 넘으면 졸업 학점을 채웠어도 /simulate처럼 400"""
+        result = check_feasibility(4.5, 130, C_e=130, grade_points=520, G_t=4.6)
+
+        assert (result.feasible, result.status_code) == (False, 400)
+        assert result.detail == "목표 GPA (4.6)가 최대 평점 (4.5)을 초과합니다"
+
+    def test_matches_simulate(self):
+        """무작위 입력에서 /simulate와 같은 판정과 메시지"""
+        rng = random.Random(11)
+        for seed in range(200):
+            payload = generate_payload(seed, rng.choice([4, 8, 12]))
+            payload["G_t"] = round(rng.uniform(0.5, 4.7), 2)
+            data = SimulationInput.model_validate(payload)
+            C_e = sum(h.credits for h in data.history)
+            grade_points = sum(h.credits * h.achieved_avg for h in data.history)
+
+            result = check_feasibility(data.scale_max, data.C_tot, C_e, grade_points, data.G_t)
+
+            status_code, detail = _simulate_status(data)
+            assert result.status_code == status_code
+            assert result.feasible == (status_code == 200)
+            assert result.detail == detail
+
+
+class TestFeasibilityEndpoint:
+    """GET /simulate/feasibility 테스트"""
+
+    def _get(self, params):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.get("/simulate/feasibility", params=params)
+        return asyncio.run(run())
+
+    def test_feasibility(self):
+        response = self._get({"scale_max": 4.5, "C_tot": 130, "C_e": 36, "grade_points": 138.6, "G_t": 4.0})
+
+        assert response.status_code == 200
+        assert response.json()["feasible"] is True
+        assert self._get({"scale_max": 4.5, "C_tot": 130, "C_e": -1}).status_code == 422
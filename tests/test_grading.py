@@ -0,0 +1,220 @@
+"""
+성적 체계(등급표) 단위 테스트
+"""
+import asyncio
+import itertools
+import json
+import time
+
+import httpx
+import pytest
+from app.main import app
+from app.grading import GradeScale, ScaleRegistry, BUILTIN_SCALES, MAX_COURSES, course_count
+from app.cache import LocalCacheBackend, ResultCache, canonical_key
+from app.models import CourseItem, SimulationInput
+from app import tasks
+
+
+def _brute_force(grades, courses):
+    """가능한 모든 조합의 평점 합계(0.01 단위) → 가장 작은 평점 제곱합"""
+    best = {}
+    points = [round(p * 100) for p in grades.values()]
+    for combo in itertools.combinations_with_replacement(points, courses):
+        total, squares = sum(combo), sum(p * p for p in combo)
+        best[total] = min(best.get(total, squares), squares)
+    return best
+
+
+class TestGradeScale:
+    """GradeScale 조회 테이블 테스트"""
+
+    @pytest.mark.parametrize("name", sorted(BUILTIN_SCALES))
+    def test_tables_match_brute_force(self, name):
+        """합계 배열은 가능한 모든 조합과 같고, 조합은 합계가 맞으며 가장 고르다"""
+        grades = BUILTIN_SCALES[name]
+        scale = GradeScale(name, grades)
+        scale.compile()
+
+        for courses in (1, 2, 4):
+            expected = _brute_force(grades, courses)
+            sums, mixes = scale._tables[courses]
+            assert sums == sorted(expected)
+            for total, mix in zip(sums, mixes):
+                assert sum(mix.grades.values()) == courses
+                assert sum(round(grades[g] * 100) * c for g, c in mix.grades.items()) == total
+                assert sum(round(grades[g] * 100) ** 2 * c for g, c in mix.grades.items()) == expected[total]
+
+    def test_mixes(self):
+        """필요 평점 이상인 가장 낮은 평균부터 (0.01 단위 정수 비교)"""
+        scale = GradeScale("kr-4.5", BUILTIN_SCALES["kr-4.5"])
+
+        mixes = scale.mixes(3.83, 6)
+
+        assert [m.average for m in mixes] == [3.83, 3.92, 4.0]
+        assert mixes[0].grades == {"A0": 4, "B+": 2}
+        assert scale.nearest(3.84, 6).average == 3.92
+        assert scale.nearest(0, 3).grades == {"F": 3}
+        assert scale.nearest(4.51, 6) is None
+
+    def test_invalid_definition(self):
+        with pytest.raises(ValueError):
+            GradeScale("empty", {})
+        with pytest.raises(ValueError):
+            GradeScale("fine", {"A": 4.125, "F": 0})
+        with pytest.raises(ValueError):
+            GradeScale("duplicate", {"A": 4.0, "A0": 4.0})
+
+    def test_course_count(self):
+        assert course_count(18, 3) == 6
+        assert course_count(19, 3) == 6
+        assert course_count(1, 3) == 1
+        assert course_count(60, 3) == MAX_COURSES
+
+    def test_load_file(self, tmp_path):
+        """JSON 파일로 학교별 등급표 추가"""
+        path = tmp_path / "scales.json"
+        path.write_text(json.dumps({"pass-fail": {"P": 1.0, "F": 0.0}}), encoding="utf-8")
+        registry = ScaleRegistry()
+
+        registry.load_file(str(path))
+
+        assert registry.names() == ["pass-fail"]
+        assert registry.get("pass-fail").nearest(0.5, 2).grades == {"P": 1, "F": 1}
+
+
+def _courses(*credits):
+    return [CourseItem(id=f"C{i}", credits=c) for i, c in enumerate(credits, start=1)]
+
+
+def _grade_points(course_grades):
+    """0.01 단위 정수 (학점 × 평점)"""
+    return sum(round(c.credits * 100) * round(c.points * 100) for c in course_grades)
+
+
+class TestCourseAllocation:
+    """GradeScale.allocate 과목별 등급 배정 테스트"""
+
+    scale = GradeScale("kr-4.5", BUILTIN_SCALES["kr-4.5"])
+
+    def test_exact_grade(self):
+        """필요 평점이 등급과 같으면 모든 과목이 그 등급"""
+        assert {c.grade for c in self.scale.allocate(3.5, _courses(3, 3, 2))} == {"B+"}
+
+    def test_bumps_fewest_credits(self):
+        """부족분 (3.7 - 3.5) × 9 = 1.8을 가장 작은 초과로 채운다: 올린 학점 4 (3 + 1, 2.0) > 3 (1.5)으로는 부족"""
+        grades = self.scale.allocate(3.7, _courses(3, 3, 2, 1))
+
+        assert [c.grade for c in grades] == ["A0", "B+", "B+", "A0"]
+        assert _grade_points(grades) >= 370 * 900
+
+    def test_matches_brute_force(self):
+        """두 등급 배정 중 초과 grade points가 가장 작은 배정과 같다"""
+        courses = _courses(3, 2, 2, 1, 3, 4)
+        for required in (0.3, 1.17, 2.25, 3.01, 3.99, 4.49):
+            grades = self.scale.allocate(required, courses)
+            low, high = min(c.points for c in grades), max(c.points for c in grades)
+            need = round(required * 100) * sum(round(c.credits * 100) for c in courses)
+            candidates = [
+                sum(round(c.credits * 100) * round((high if bump else low) * 100) for c, bump in zip(courses, bumps))
+                for bumps in itertools.product((False, True), repeat=len(courses))
+            ]
+            assert _grade_points(grades) == min(p for p in candidates if p >= need)
+
+    def test_many_courses(self):
+        """과목이 수십 개여도 학점 묶음 DP로 계산"""
+        courses = _courses(*([3, 2, 1, 0.5] * 20))
+
+        grades = self.scale.allocate(3.47, courses)
+
+        assert len(grades) == 80
+        assert _grade_points(grades) >= 347 * sum(round(c.credits * 100) for c in courses)
+        assert {c.grade for c in grades} == {"B+", "B0"}
+
+    def test_distinct_credits(self):
+        """학점이 모두 달라도(DP 상태 폭증) 탐욕 배정으로 빠르게, 필요 평점 이상으로 배정"""
+        courses = [CourseItem(id=f"C{i}", credits=round(1 + i / 100, 2)) for i in range(1, 129)]
+
+        started = time.perf_counter()
+        for required in (0.3, 2.25, 3.99, 4.49):
+            grades = self.scale.allocate(required, courses)
+            assert _grade_points(grades) >= round(required * 100) * sum(round(c.credits * 100) for c in courses)
+        assert time.perf_counter() - started < 0.1
+
+    def test_above_top_grade(self):
+        with pytest.raises(ValueError):
+            self.scale.allocate(4.6, _courses(3))
+
+
+class TestGradedSimulation:
+    """grade_scale을 지정한 /simulate, /simulate/batch 테스트"""
+
+    PAYLOAD = {
+        "scale_max": 4.5, "G_t": 3.9, "C_tot": 72, "grade_scale": "kr-4.5",
+        "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.6}],
+        "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": c} for i, c in enumerate((18, 18, 18), start=1)]
+    }
+
+    def _post(self, path, payload):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.post(path, json=payload)
+        return asyncio.run(run())
+
+    def test_simulate(self):
+        response = self._post("/simulate", self.PAYLOAD)
+
+        assert response.status_code == 200
+        for term in response.json():
+            assert term["courses"] == 6
+            assert term["discrete_avg"] == term["grade_mixes"][0]["average"] >= term["required_avg"]
+
+    def test_validation(self):
+        assert self._post("/simulate", dict(self.PAYLOAD, grade_scale="unknown")).status_code == 400
+        assert self._post("/simulate", dict(self.PAYLOAD, scale_max=4.3)).status_code == 400
+
+    def test_batch_matches_single(self):
+        """grade_scale이 있는 학생만 등급 조합이 붙고, 결과는 단건 호출과 같다"""
+        plain = {k: v for k, v in self.PAYLOAD.items() if k != "grade_scale"}
+
+        response = self._post("/simulate/batch", {"inputs": [self.PAYLOAD, plain]})
+
+        items = response.json()
+        assert items[0]["results"] == self._post("/simulate", self.PAYLOAD).json()
+        assert items[1]["results"] == self._post("/simulate", plain).json()
+        assert "grade_mixes" not in items[1]["results"][0]
+
+    def test_courses(self):
+        """courses가 있는 학기만 과목별 등급, 배치 결과도 단건과 같다"""
+        terms = [dict(t) for t in self.PAYLOAD["terms"]]
+        terms[0]["courses"] = [{"id": f"CS{i}", "credits": c} for i, c in enumerate((3, 3, 3, 3, 2, 2, 1, 1))]
+        payload = dict(self.PAYLOAD, terms=terms)
+
+        response = self._post("/simulate", payload)
+
+        assert response.status_code == 200
+        first, second = response.json()[:2]
+        assert [c["id"] for c in first["course_grades"]] == [f"CS{i}" for i in range(8)]
+        assert sum(c["credits"] * c["points"] for c in first["course_grades"]) >= first["required_avg"] * 18 - 1e-9
+        assert second["course_grades"] is None
+        assert self._post("/simulate/batch", {"inputs": [payload]}).json()[0]["results"] == response.json()
+
+    def test_courses_validation(self):
+        terms = [dict(t) for t in self.PAYLOAD["terms"]]
+        terms[0]["courses"] = [{"id": "CS1", "credits": 3}]
+        assert self._post("/simulate", dict(self.PAYLOAD, terms=terms)).status_code == 400
+
+        terms[0]["courses"] = [{"id": f"CS{i}", "credits": 3} for i in range(6)]
+        plain = {k: v for k, v in self.PAYLOAD.items() if k != "grade_scale"}
+        assert self._post("/simulate", dict(plain, terms=terms)).status_code == 400
+
+    def test_cache_round_trip(self):
+        """캐시에서 꺼낸 결과도 등급 조합을 유지"""
+        terms = [dict(t) for t in self.PAYLOAD["terms"]]
+        terms[0]["courses"] = [{"id": f"CS{i}", "credits": 3} for i in range(6)]
+        data = SimulationInput.model_validate(dict(self.PAYLOAD, terms=terms))
+        cache = ResultCache(LocalCacheBackend())
+        results = tasks.simulate(data)
+
+        cache.set(canonical_key(data), results)
+
+        assert cache.get(canonical_key(data)) == results
@@ -0,0 +1,151 @@
+"""
+IncrementalSimulator 단위 테스트
+"""
+import random
+
+import pytest
+from app.models import HistoryItem, TermItem, SimulationInput, SimulationResult
+from app.simulator import GPASimulator
+from app.incremental import IncrementalSimulator, diff_plans
+
+
+def _full(history, terms, G_t=3.9, C_tot=130, scale_max=4.5):
+    """같은 입력을 처음부터 계산"""
+    simulator = GPASimulator(
+        scale_max=scale_max, G_t=G_t, C_tot=C_tot,
+        history=list(history), terms=[t.model_copy() for t in terms]
+    )
+    try:
+        return simulator.simulate()
+    except ValueError as e:
+        return e
+
+
+def _base(**overrides):
+    payload = dict(
+        scale_max=4.5, G_t=3.9, C_tot=130,
+        history=[HistoryItem(term_id="S1", credits=18, achieved_avg=3.7)],
+        terms=[TermItem(id=f"S{i}", type="regular", planned_credits=18, max_credits=21) for i in range(2, 9)]
+    )
+    payload.update(overrides)
+    return SimulationInput(**payload)
+
+
+class TestIncrementalSimulator:
+    """IncrementalSimulator 클래스 테스트"""
+
+    def test_initial_plan_matches_full(self):
+        """변경 전 계획은 전체 계산과 동일"""
+        data = _base()
+        assert IncrementalSimulator(data).plan() == _full(data.history, data.terms)
+
+    @pytest.mark.parametrize("fractional", [False, True])
+    def test_random_deltas_match_full(self, fractional):
+        """임의의 변경 사항을 적용한 결과가 매번 전체 재계산과 동일 (소수 학점 포함)"""
+        rng = random.Random(7)
+        planned = [6.3, 12.1, 15.7, 17.9, 19.5, 21.3, 2.2, 0.1] if fractional else [6, 12, 18, 24]
+        maximum = [9.1, 15.3, 18.7, 6.6, 21] if fractional else [9, 15, 21]
+
+        for _ in range(2000 if fractional else 30):
+            data = _base(
+                G_t=rng.choice([3.5, 3.8, 4.0, 4.2]),
+                C_tot=rng.choice([96.1, 130.3, 150.7] if fractional else [110, 130, 150]),
+                history=[HistoryItem(term_id="S1", credits=rng.choice([17.3, 18, 20.1] if fractional else [18]),
+                                     achieved_avg=3.7)],
+                terms=[
+                    TermItem(id=f"S{i}", type="regular",
+                             planned_credits=rng.choice(planned + [12, 15, 18, 19.5, 21, 24]),
+                             max_credits=rng.choice(maximum) if fractional else 21)
+                    for i in range(2, 2 + rng.randint(2, 10))
+                ]
+            )
+            simulator = IncrementalSimulator(data)
+            history = list(data.history)
+            terms = [t.model_copy() for t in data.terms]
+
+            for _ in range(6):
+                if not terms:
+                    break
+                kind = rng.choice(["complete", "planned", "max"])
+                if kind == "complete":
+                    term = terms.pop(0)
+                    avg = rng.choice([3.0, 3.5, 4.0, 4.5])
+                    simulator.complete_term(term.id, avg)
+                    history.append(HistoryItem(term_id=term.id, credits=term.planned_credits, achieved_avg=avg))
+                elif kind == "planned":
+                    term = rng.choice(terms)
+                    term.planned_credits = rng.choice(planned)
+                    simulator.set_planned_credits(term.id, term.planned_credits)
+                else:
+                    term = rng.choice(terms)
+                    term.max_credits = rng.choice(maximum)
+                    simulator.set_max_credits(term.id, term.max_credits)
+
+                expected = _full(history, terms, G_t=data.G_t, C_tot=data.C_tot)
+                if isinstance(expected, ValueError):
+                    with pytest.raises(ValueError) as exc_info:
+                        simulator.plan()
+                    assert str(exc_info.value) == str(expected)
+                else:
+                    assert simulator.plan() == expected
+
+    def test_unknown_term(self):
+        """없는 학기 ID는 KeyError"""
+        with pytest.raises(KeyError):
+            IncrementalSimulator(_base()).set_planned_credits("S99", 18)
+
+
+class TestDiffPlans:
+    """diff_plans 테스트"""
+
+    def test_changed_added_removed(self):
+        previous = [
+            SimulationResult(term_id="S2", credits=18, required_avg=4.0),
+            SimulationResult(term_id="S3", credits=18, required_avg=4.0)
+        ]
+        current = [
+            SimulationResult(term_id="S3", credits=18, required_avg=4.1),
+            SimulationResult(term_id="Summer2", credits=6, required_avg=4.1)
+        ]
+
+        diff = diff_plans(previous, current)
+
+        assert [r.term_id for r in diff.changed] == ["S3"]
+        assert [r.term_id for r in diff.added] == ["Summer2"]
+        assert diff.removed == ["S2"]
+
+
+class TestIncrementalAPI:
+    """증분 시뮬레이션 엔드포인트 통합 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """테스트 클라이언트 생성"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        return TestClient(app)
+
+    def test_term_completed(self, client):
+        """학기 성적 확정 후 변경된 학기만 diff에 포함"""
+        base = _base().model_dump()
+        payload = {
+            "base": base,
+            "deltas": [{"type": "term_completed", "term_id": "S2", "achieved_avg": 4.5}]
+        }
+
+        response = client.post("/simulate/incremental", json=payload)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [r["term_id"] for r in data["results"]] == [f"S{i}" for i in range(3, 9)]
+        assert data["diff"]["removed"] == ["S2"]
+        assert all(r["required_avg"] < 3.95 for r in data["diff"]["changed"])
+
+    def test_unknown_term_api(self, client):
+        """없는 학기 ID는 400"""
+        payload = {
+            "base": _base().model_dump(),
+            "deltas": [{"type": "max_credits_changed", "term_id": "S99", "max_credits": 18}]
+        }
+        response = client.post("/simulate/incremental", json=payload)
+        assert response.status_code == 400
@@ -0,0 +1,96 @@
+"""
+로깅 설정 단위 테스트
+"""
+import json
+import logging
+
+import pytest
+from app import logging_config
+from app.logging_config import JsonFormatter, is_sampled
+
+
+PAYLOAD = {
+    "scale_max": 4.5,
+    "G_t": 4.0,
+    "C_tot": 72,
+    "history": [{"term_id": "S0", "credits": 18, "achieved_avg": 3.9}],
+    "terms": [
+        {"id": "S1", "type": "regular", "planned_credits": 18, "max_credits": 21},
+        {"id": "S2", "type": "regular", "planned_credits": 18, "max_credits": 21},
+        {"id": "S3", "type": "regular", "planned_credits": 18, "max_credits": 21}
+    ]
+}
+
+
+class TestLogging:
+    """요청 로그 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """테스트 클라이언트 생성"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        return TestClient(app)
+
+    def test_single_summary_line(self, client, caplog):
+        """기본 모드에서는 요청당 요약 한 줄만 출력"""
+        caplog.set_level(logging.INFO)
+        response = client.post("/simulate", json=PAYLOAD, headers={"X-Request-ID": "req-1"})
+        assert response.status_code == 200
+
+        records = [r for r in caplog.records if r.name.startswith("app.")]
+        assert len(records) == 1
+        assert records[0].fields["request_id"] == "req-1"
+        assert records[0].fields["status"] == 200
+        assert records[0].fields["result_terms"] == 3
+
+    def test_debug_trace_header(self, client, caplog):
+        """X-Debug-Trace 헤더가 있으면 단계별 상세 로그 출력"""
+        caplog.set_level(logging.INFO)
+        client.post("/simulate", json=dict(PAYLOAD, G_t=4.01), headers={"X-Debug-Trace": "true"})
+
+        messages = [r.getMessage() for r in caplog.records if r.name.startswith("app.")]
+        assert any("[REQUEST]" in m for m in messages)
+        assert any("g_need" in m for m in messages)
+        assert any("[RESULT]" in m for m in messages)
+
+    def test_error_summary(self, client, caplog):
+        """실패한 요청도 상태 코드가 요약에 남음"""
+        caplog.set_level(logging.INFO)
+        client.post("/simulate", json=dict(PAYLOAD, G_t=5.0))
+
+        summaries = [r for r in caplog.records if getattr(r, "fields", None)]
+        assert summaries[-1].fields["status"] == 400
+
+
+class TestTraceSampling:
+    """요청 ID 샘플링 테스트"""
+
+    def test_sampling_rate(self, monkeypatch):
+        """샘플링 비율만큼 추적, 같은 ID는 항상 같은 결과"""
+        monkeypatch.setattr(logging_config, "_trace_sample_rate", 0.1)
+        sampled = [is_sampled(f"req-{i}") for i in range(10000)]
+
+        assert 800 < sum(sampled) < 1200
+        assert sampled == [is_sampled(f"req-{i}") for i in range(10000)]
+
+    def test_no_sampling_by_default(self):
+        """샘플링 비율이 0이면 추적하지 않음"""
+        assert not is_sampled("req-1")
+        assert not is_sampled(None)
+
+
+class TestJsonFormatter:
+    """JSON 포맷 테스트"""
+
+    def test_fields_merged(self):
+        """요약 필드가 한 줄 JSON에 포함"""
+        record = logging.LogRecord("app.main", logging.INFO, __file__, 1, "simulate", None, None)
+        record.fields = {"status": 200, "duration_ms": 1.5}
+
+        line = JsonFormatter().format(record)
+
+        assert "\n" not in line
+        entry = json.loads(line)
+        assert entry["message"] == "simulate"
+        assert entry["status"] == 200
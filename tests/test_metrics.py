@@ -0,0 +1,137 @@
+"""
+메트릭 수집 및 다중 워커 합산 테스트
+"""
+import multiprocessing
+
+import pytest
+from app.metrics import MetricsRegistry, Histogram, render_snapshots
+
+
+def _worker(directory, status_code):
+    """별도 워커 프로세스: 요청 하나 기록 후 스냅샷 기록"""
+    registry = MetricsRegistry(multiproc_dir=directory)
+    registry.register_collector(lambda: [("gpa_cache_entries", (), 5)])
+    registry.observe_request("/simulate", status_code, 0.002)
+    registry.flush()
+
+
+class TestHistogram:
+    """Histogram 테스트"""
+
+    def test_bucket_boundaries(self):
+        """경계값은 해당 버킷(le)에 포함, 마지막 버킷보다 크면 +Inf"""
+        histogram = Histogram((0.001, 0.01))
+        for value in (0.001, 0.005, 0.5):
+            histogram.observe(value)
+        assert histogram.counts == [1, 1, 1]
+        assert histogram.count == 3
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 테스트"""
+
+    def test_render(self):
+        """요청/단계 메트릭을 Prometheus 텍스트 형식으로 출력"""
+        registry = MetricsRegistry()
+        registry.observe_request("/simulate", 200, 0.0007)
+        registry.observe_simulation((1e-6, 1e-6, 2e-6, 3e-6, 8e-6), water_filling_solved=True,
+                                    shortage_terms=1, extra_terms=2)
+
+        text = registry.render()
+
+        assert '# TYPE gpa_request_duration_seconds histogram' in text
+        assert 'gpa_requests_total{endpoint="/simulate",status="200"} 1' in text
+        assert 'gpa_request_duration_seconds_bucket{endpoint="/simulate",status="200",le="0.0005"} 0' in text
+        assert 'gpa_request_duration_seconds_bucket{endpoint="/simulate",status="200",le="0.001"} 1' in text
+        assert 'gpa_simulator_step_duration_seconds_count{step="round_and_adjust"} 1' in text
+        assert 'gpa_water_filling_total{outcome="solved"} 1' in text
+        assert 'gpa_auto_summer_terms_total{kind="extra"} 2' in text
+
+    def test_disabled(self):
+        """비활성화하면 기록하지 않음"""
+        registry = MetricsRegistry(enabled=False)
+        registry.observe_request("/simulate", 200, 0.001)
+        assert registry.counters == {}
+
+    def test_multiprocess_aggregation(self, tmp_path):
+        """워커 프로세스별 스냅샷을 합산 (종료된 워커의 카운터는 유지, 게이지는 제외)"""
+        context = multiprocessing.get_context("fork")
+        for status_code in (200, 200, 422):
+            process = context.Process(target=_worker, args=(str(tmp_path), status_code))
+            process.start()
+            process.join()
+
+        registry = MetricsRegistry(multiproc_dir=str(tmp_path))
+        registry.register_collector(lambda: [("gpa_cache_entries", (), 7)])
+        registry.observe_request("/simulate", 200, 0.001)
+
+        text = registry.render()
+
+        assert len(list(tmp_path.glob("metrics-*.json"))) == 4
+        assert 'gpa_requests_total{endpoint="/simulate",status="200"} 3' in text
+        assert 'gpa_requests_total{endpoint="/simulate",status="422"} 1' in text
+        assert 'gpa_request_duration_seconds_count{endpoint="/simulate",status="200"} 3' in text
+        # 살아 있는 워커(현재 프로세스)의 게이지만 pid 라벨로 출력
+        assert text.count("gpa_cache_entries{") == 1
+        assert ' 7\n' in text
+
+    def test_flush_interval(self, tmp_path):
+        """마지막 기록 후 flush_interval이 지나야 스냅샷 파일 갱신"""
+        now = [100.0]
+        registry = MetricsRegistry(multiproc_dir=str(tmp_path), flush_interval=1.0, clock=lambda: now[0])
+
+        registry.observe_request("/simulate", 200, 0.001)
+        registry.observe_request("/simulate", 200, 0.001)
+        first = render_snapshots([_load(tmp_path)])
+        now[0] += 1.5
+        registry.observe_request("/simulate", 200, 0.001)
+        second = render_snapshots([_load(tmp_path)])
+
+        assert 'status="200"} 1\n' in first
+        assert 'status="200"} 3\n' in second
+
+
+def _load(directory):
+    import json
+    (path,) = list(directory.glob("metrics-*.json"))
+    return json.loads(path.read_text())
+
+
+class TestMetricsAPI:
+    """메트릭 엔드포인트 통합 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """테스트 클라이언트 생성"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        return TestClient(app)
+
+    def test_metrics_endpoint(self, client):
+        """시뮬레이션 후 상태 코드별 요청 수와 단계별 시간 노출"""
+        payload = {
+            "scale_max": 4.5, "G_t": 4.4, "C_tot": 130,
+            "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 2.0}],
+            "terms": [{"id": "S2", "type": "regular", "planned_credits": 18, "max_credits": 21}]
+        }
+        client.post("/simulate", json=payload)
+        client.post("/simulate", json=dict(payload, G_t=4.0))
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'gpa_requests_total{endpoint="/simulate",status="422"}' in response.text
+        assert 'gpa_simulator_step_duration_seconds_bucket{step="calculate_current_state"' in response.text
+        assert "gpa_cache_misses_total" in response.text
+
+    def test_path_parameter_label(self, client):
+        """경로 매개변수가 있는 라우트는 경로 템플릿으로, 등록되지 않은 경로는 other로 기록"""
+        client.get("/plans/20231234/versions")
+        client.get("/no-such-path")
+
+        text = client.get("/metrics").text
+
+        assert 'gpa_requests_total{endpoint="/plans/{student_key}/versions",status=' in text
+        assert 'endpoint="/plans/20231234/versions"' not in text
+        assert 'gpa_requests_total{endpoint="other",status="404"}' in text
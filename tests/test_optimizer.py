@@ -0,0 +1,166 @@
+"""
+PlanOptimizer 단위 테스트
+"""
+import asyncio
+import itertools
+import random
+
+import httpx
+import pytest
+from app.main import app
+from app.optimizer import PlanOptimizer
+from app.simulator import GPASimulator
+from app.models import HistoryItem, TermItem, OptimizeInput
+from benchmarks.scenarios import generate_inputs
+
+
+def _terms(*specs):
+    return [TermItem(id=f"T{i}", type="regular", planned_credits=planned, max_credits=max_credits)
+            for i, (planned, max_credits) in enumerate(specs, start=1)]
+
+
+def _achieved_gpa(history, results):
+    credits = sum(h.credits for h in history) + sum(r.credits for r in results)
+    points = sum(h.credits * h.achieved_avg for h in history) + sum(r.credits * r.required_avg for r in results)
+    return points / credits
+
+
+class TestPlanOptimizer:
+    """PlanOptimizer 클래스 테스트"""
+
+    def test_moves_excess_credits_instead_of_adding_summer(self):
+        """최대 학점 초과분은 계절학기 대신 여유 있는 학기로 이동"""
+        history = [HistoryItem(term_id="S1", credits=18, achieved_avg=3.8)]
+        terms = _terms((24, 21), (18, 21), (18, 21))
+
+        result = PlanOptimizer(4.5, 4.0, 78, history, terms).optimize()
+
+        assert [(r.term_id, r.credits) for r in result.results] == [("T1", 21.0), ("T2", 21.0), ("T3", 18.0)]
+        assert len(result.baseline_results) == 4  # 기본 시뮬레이션은 계절학기 추가
+        assert result.peak_required_avg <= result.baseline_peak_required_avg
+        assert _achieved_gpa(history, result.results) == pytest.approx(4.0, abs=0.01)
+
+    def test_uniform_weights_keep_plan(self):
+        """가중치가 없고 학점이 계획대로 가능하면 기본 시뮬레이션과 같음"""
+        terms = _terms((18, 21), (18, 21), (18, 21))
+        baseline = PlanOptimizer(4.5, 3.9, 54, [], terms).optimize()
+
+        assert [r.model_dump() for r in baseline.results] == [r.model_dump() for r in baseline.baseline_results]
+
+    def test_weights_lower_hard_terms(self):
+        """어려운 학기(가중치가 큰 학기)는 학점과 필요 평점이 낮아짐"""
+        terms = _terms((18, 21), (18, 21), (18, 21))
+
+        results = PlanOptimizer(4.5, 3.9, 54, [], terms, weights={"T1": 1.5}).optimize_records()
+
+        by_id = {r.term_id: r for r in results}
+        assert by_id["T1"].credits < 18 and by_id["T1"].required_avg < by_id["T2"].required_avg
+        assert 1.5 * by_id["T1"].required_avg == pytest.approx(by_id["T2"].required_avg, abs=0.02)
+        assert sum(r.credits for r in results) == 54
+
+    def test_weighted_peak_fields(self):
+        """peak 필드는 최적화 목표와 같은 가중 최고 평점이며, 기본 시뮬레이션보다 높지 않다"""
+        terms = _terms((18, 21), (18, 21), (18, 21))
+        weights = {"T1": 1.5}
+
+        result = PlanOptimizer(4.5, 3.9, 54, [], terms, weights=weights).optimize()
+
+        def weighted_peak(results):
+            return max(weights.get(r.term_id, 1.0) * r.required_avg for r in results)
+        assert result.peak_required_avg == weighted_peak(result.results)
+        assert result.baseline_peak_required_avg == weighted_peak(result.baseline_results) == 1.5 * 3.9
+        assert result.peak_required_avg < result.baseline_peak_required_avg
+        assert max(r.required_avg for r in result.results) > max(r.required_avg for r in result.baseline_results)
+
+    def test_peak_is_optimal(self):
+        """모든 정수 학점 배분을 확인한 최소 가중 최고 평점과 같음"""
+        rng = random.Random(7)
+        for _ in range(30):
+            maxes = [rng.choice([3, 6, 9]) for _ in range(3)]
+            C_r = rng.randint(3, sum(maxes))
+            weights = {f"T{i}": rng.choice([0.8, 1.0, 1.3, 2.0]) for i in range(1, 4)}
+            G_t = round(rng.uniform(1.0, 4.0), 2)
+            terms = _terms(*[(min(m, 3), m) for m in maxes])
+            optimizer = PlanOptimizer(4.5, G_t, C_r, [], terms, weights=weights)
+            w = [weights[f"T{i}"] for i in range(1, 4)]
+            rates = [1 / x for x in w]
+
+            best = float("inf")
+            for allocation in itertools.product(*[range(m + 1) for m in maxes]):
+                if sum(allocation) != C_r:
+                    continue
+                level = optimizer._level(list(allocation), rates, G_t * C_r)
+                peak = max(min(4.5 * wi, level) for wi, c in zip(w, allocation) if c > 0)
+                best = min(best, peak)
+
+            # 라운딩 전 계획으로 비교 (Step 5 보정은 마지막 학기에 몰림)
+            plans, _, _ = optimizer._optimal_plans(GPASimulator(4.5, G_t, C_r, [], terms))
+            peak = max(weights[plan.term_id] * plan.required_avg for plan in plans)
+            assert peak == pytest.approx(best, abs=1e-9)
+            assert all(plan.credits <= maxes[int(plan.term_id[1:]) - 1] for plan in plans)
+
+    def test_variance_keeps_credits(self):
+        """variance 목표는 계획 학점을 유지하고 평점만 가중치에 맞춰 나눔"""
+        terms = _terms((18, 21), (15, 21), (21, 21))
+
+        results = PlanOptimizer(4.5, 3.5, 54, [], terms, objective="variance", weights={"T3": 1.2}).optimize_records()
+
+        assert [r.credits for r in results] == [18.0, 15.0, 21.0]
+        assert results[2].required_avg < results[0].required_avg
+        assert _achieved_gpa([], results) == pytest.approx(3.5, abs=0.01)
+
+    def test_invariants_on_scenarios(self):
+        """무작위 시나리오에서 최대 학점, 평점 상한, 목표 GPA 유지"""
+        rng = random.Random(3)
+        for data in generate_inputs(5, 16, 50):
+            weights = {t.id: rng.uniform(0.8, 1.5) for t in data.terms}
+            for objective in ("peak", "variance"):
+                results = PlanOptimizer(
+                    data.scale_max, data.G_t, data.C_tot, data.history, data.terms, objective, weights
+                ).optimize_records()
+                maxes = {t.id: t.max_credits for t in data.terms}
+                assert all(r.credits <= maxes.get(r.term_id, 9) for r in results)
+                assert all(0 <= r.required_avg <= data.scale_max for r in results)
+                assert _achieved_gpa(data.history, results) == pytest.approx(data.G_t, abs=0.01)
+
+    def test_infeasible(self):
+        """목표 달성 불가능하면 기본 시뮬레이션과 같은 ValueError"""
+        with pytest.raises(ValueError, match="달성이 불가능"):
+            PlanOptimizer(4.5, 4.5, 36, [HistoryItem(term_id="S1", credits=18, achieved_avg=2.0)],
+                          _terms((18, 21))).optimize()
+
+    def test_unknown_weight_term(self):
+        with pytest.raises(ValueError):
+            OptimizeInput.model_validate({
+                "scale_max": 4.5, "G_t": 4.0, "C_tot": 18, "history": [],
+                "terms": [{"id": "T1", "type": "regular", "planned_credits": 18}],
+                "weights": {"T9": 1.2}
+            })
+
+
+class TestOptimizeEndpoint:
+    """POST /simulate/optimize 테스트"""
+
+    def _post(self, payload):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.post("/simulate/optimize", json=payload)
+        return asyncio.run(run())
+
+    def test_optimize(self):
+        payload = {
+            "scale_max": 4.5, "G_t": 4.0, "C_tot": 78,
+            "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.8}],
+            "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": p, "max_credits": 21}
+                      for i, p in enumerate((24, 18, 18), start=1)],
+            "weights": {"T3": 1.2}
+        }
+
+        response = self._post(payload)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["objective"] == "peak"
+        assert sum(r["credits"] for r in body["results"]) == 60
+        assert self._post(dict(payload, G_t=5.0)).status_code == 400
+        assert self._post(dict(payload, objective="median")).status_code == 422
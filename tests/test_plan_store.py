@@ -0,0 +1,142 @@
+"""
+계획 저장소 단위 테스트
+"""
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from app import main, tasks
+from app.main import app
+from app.plan_store import PlanStore, SQLitePlanStoreBackend
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PlanStore(SQLitePlanStoreBackend(str(tmp_path / "plans.db"), pool_size=2))
+    yield store
+    store.close()
+
+
+class TestPlanStore:
+    """PlanStore 테스트"""
+
+    def test_versions(self, store):
+        """입력이 바뀔 때만 버전 증가, 같은 입력이면 최신 버전 반환"""
+        first, created = store.save("20231234", "h1", "{}", "[]")
+        assert (first.version, created) == (1, True)
+        again, created = store.save("20231234", "h1", "{}", "[]")
+        assert (again.version, again.created_at, created) == (1, first.created_at, False)
+
+        second, created = store.save("20231234", "h2", "{}", "[]")
+
+        assert (second.version, created) == (2, True)
+        assert store.latest("20231234") is second
+        assert [s.version for s in store.versions("20231234")] == [1, 2]
+        assert store.get("20231234", 1).created_at == first.created_at
+
+    def test_persisted(self, store, tmp_path):
+        """save는 기록을 마친 뒤 반환하고, 다시 연 저장소에서도 같은 결과"""
+        for i in range(5):
+            store.save(f"S{i}", "h", "{}", f'[{{"term_id":"T{i}"}}]')
+        assert store.backend.latest("S3").version == 1
+
+        reopened = PlanStore(SQLitePlanStoreBackend(str(tmp_path / "plans.db")))
+        assert reopened.latest("S3").results_json == '[{"term_id":"T3"}]'
+        assert reopened.latest("missing") is None
+        reopened.close()
+
+    def test_two_stores(self, store, tmp_path):
+        """같은 파일을 쓰는 두 저장소(워커)는 버전을 저장소에서 받아 서로의 이력을 덮어쓰지 않는다"""
+        other = PlanStore(SQLitePlanStoreBackend(str(tmp_path / "plans.db"), pool_size=2))
+        store.save("A", "h1", "{}", "[]")
+        other.save("A", "h2", "{}", "[]")
+
+        third, created = store.save("A", "h3", "{}", "[]")
+        duplicate, created_again = other.save("A", "h3", "{}", "[]")
+
+        assert (third.version, created) == (3, True)
+        assert (duplicate.version, created_again) == (3, False)
+        assert [(s.version, s.input_hash) for s in store.versions("A")] == [(1, "h1"), (2, "h2"), (3, "h3")]
+        other.close()
+
+    def test_shared_cache(self, store, tmp_path):
+        """shared면 다른 저장소가 쓴 새 버전을 메모리의 오래된 버전 대신 반환"""
+        other = PlanStore(SQLitePlanStoreBackend(str(tmp_path / "plans.db"), pool_size=2), shared=True)
+        store.shared = True
+        store.save("A", "h1", "{}", "[]")
+        cached = store.latest("A")
+
+        other.save("A", "h2", "{}", "[]")
+
+        assert store.peek("A") is None
+        assert store.latest("A").input_hash == "h2"
+        assert store.latest("A") is store.latest("A")
+        assert cached.version == 1
+        other.close()
+
+    def test_group_commit(self, tmp_path):
+        """동시에 들어온 저장 요청은 한 트랜잭션으로 함께 기록하고 각자 자기 버전을 받는다"""
+        store = PlanStore(SQLitePlanStoreBackend(str(tmp_path / "plans.db")), batch_size=8)
+        batches = []
+        append_many = store.backend.append_many
+        store.backend.append_many = lambda snapshots: batches.append(len(snapshots)) or append_many(snapshots)
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            saved = list(pool.map(lambda i: store.save("A", f"h{i}", "{}", "[]"), range(64)))
+
+        assert sorted(s.version for s, _ in saved) == list(range(1, 65))
+        assert sum(batches) == 64 and max(batches) <= 8
+        assert store.latest("A").version == 64
+        store.close()
+
+
+class TestPlanEndpoints:
+    """PUT/GET /plans/{student_key} 테스트"""
+
+    PAYLOAD = {
+        "scale_max": 4.5, "G_t": 3.8, "C_tot": 72,
+        "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.6}],
+        "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": 18} for i in range(1, 4)]
+    }
+
+    def _request(self, method, path, payload=None):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.request(method, path, json=payload)
+        return asyncio.run(run())
+
+    def test_recompute_only_when_input_changes(self, store, monkeypatch):
+        monkeypatch.setattr(main, "plan_store", store)
+        calls = []
+        simulate = tasks.simulate
+        monkeypatch.setattr(tasks, "simulate", lambda data: calls.append(1) or simulate(data))
+        main.result_cache.backend.clear()
+
+        first = self._request("PUT", "/plans/20231234", self.PAYLOAD).json()
+        again = self._request("PUT", "/plans/20231234", self.PAYLOAD).json()
+        changed = self._request("PUT", "/plans/20231234", dict(self.PAYLOAD, G_t=3.9)).json()
+
+        assert (first["version"], first["recomputed"]) == (1, True)
+        assert (again["version"], again["recomputed"]) == (1, False)
+        assert again["results"] == first["results"] == self._request("POST", "/simulate", self.PAYLOAD).json()
+        assert (changed["version"], changed["recomputed"]) == (2, True)
+        assert len(calls) == 2
+
+        assert self._request("GET", "/plans/20231234").json() == dict(changed, recomputed=False)
+        assert [v["version"] for v in self._request("GET", "/plans/20231234/versions").json()] == [1, 2]
+        assert self._request("GET", "/plans/20231234/versions/1").json()["input_hash"] == first["input_hash"]
+
+    def test_errors(self, store, monkeypatch):
+        monkeypatch.setattr(main, "plan_store", store)
+
+        assert self._request("GET", "/plans/nobody").status_code == 404
+        assert self._request("GET", "/plans/nobody/versions/1").status_code == 404
+        assert self._request("PUT", "/plans/S", dict(self.PAYLOAD, G_t=5.0)).status_code == 400
+        assert self._request("PUT", "/plans/S", dict(self.PAYLOAD, G_t=4.5)).status_code == 422
+        assert self._request("GET", "/plans/S/versions").json() == []
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(main, "plan_store", None)
+
+        assert self._request("GET", "/plans/20231234").status_code == 503
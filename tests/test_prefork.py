@@ -0,0 +1,153 @@
+"""
+다중 워커 실행 (pre-fork) 테스트
+"""
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import pytest
+from app import prefork
+from app.metrics import MetricsRegistry
+from app.plan_store import PlanSnapshot, SQLitePlanStoreBackend
+from app.prefork import Supervisor, cpu_quota, worker_count
+from benchmarks.bench_startup import PROJECT_ROOT, _free_port, _request
+
+PAYLOAD = {
+    "scale_max": 4.5, "G_t": 3.8, "C_tot": 72,
+    "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.6}],
+    "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": 18} for i in range(1, 4)]
+}
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _put_plan(port, payload):
+    request = urllib.request.Request(f"http://127.0.0.1:{port}/plans/s1", data=json.dumps(payload).encode(),
+                                     headers={"Content-Type": "application/json"}, method="PUT")
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+class TestWorkerCount:
+    """CPU 할당량과 워커 수 테스트"""
+
+    def test_cgroup_v2(self, tmp_path):
+        _write(str(tmp_path / "cpu.max"), "150000 100000\n")
+        assert cpu_quota(str(tmp_path)) == 1.5
+
+        _write(str(tmp_path / "cpu.max"), "max 100000\n")
+        assert cpu_quota(str(tmp_path)) is None
+
+    def test_cgroup_v1(self, tmp_path):
+        _write(str(tmp_path / "cpu" / "cpu.cfs_quota_us"), "200000\n")
+        _write(str(tmp_path / "cpu" / "cpu.cfs_period_us"), "100000\n")
+        assert cpu_quota(str(tmp_path)) == 2.0
+
+        _write(str(tmp_path / "cpu" / "cpu.cfs_quota_us"), "-1\n")
+        assert cpu_quota(str(tmp_path)) is None
+
+    def test_worker_count(self, tmp_path, monkeypatch):
+        """할당량 올림과 사용 가능한 코어 수 중 작은 값, 직접 지정하면 그대로"""
+        monkeypatch.setattr(prefork, "available_cpus", lambda: 8)
+        _write(str(tmp_path / "cpu.max"), "150000 100000\n")
+
+        assert worker_count(0, str(tmp_path)) == 2
+        assert worker_count(3, str(tmp_path)) == 3
+        assert worker_count(0, str(tmp_path / "missing")) == 8
+
+
+class TestSupervisor:
+    """워커 fork와 감시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def restore_signals(self):
+        handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT)}
+        yield
+        for sig, handler in handlers.items():
+            signal.signal(sig, handler)
+
+    def test_restart_and_stop(self):
+        """죽은 워커는 다시 fork하고, stop이면 모든 워커에 SIGTERM을 보내고 반환"""
+        supervisor = Supervisor(lambda: sys.exit(1), workers=2, restart_delay=0.05)
+        spawn = supervisor.spawn
+        spawned = []
+        supervisor.spawn = lambda: spawned.append(spawn()) or spawned[-1]
+        timer = threading.Timer(0.5, supervisor.stop)
+        timer.start()
+
+        supervisor.run()
+        timer.join()
+
+        assert len(spawned) > 2
+        assert supervisor.children == {}
+
+
+class TestForkState:
+    """fork 후 워커가 다시 만드는 상태"""
+
+    def test_metrics_reset(self):
+        registry = MetricsRegistry()
+        registry.observe_request("/simulate", 200, 0.01)
+
+        registry.reset()
+
+        gauges = {name: value for name, _, value in registry.snapshot()["gauges"]}
+        assert registry.snapshot()["counters"] == []
+        assert gauges["gpa_worker_requests"] == 0
+
+    def test_plan_store_reopen(self, tmp_path):
+        backend = SQLitePlanStoreBackend(str(tmp_path / "plans.db"), pool_size=2)
+        backend.close()
+        backend.open()
+        backend.append_many([PlanSnapshot("s1", 0, "h", "{}", "[]", "2024-01-01T00:00:00")])
+
+        assert backend.latest("s1").version == 1
+        backend.close()
+
+
+class TestPreforkServer:
+    """python -m app.prefork 실행 테스트"""
+
+    def test_workers_share_port(self, tmp_path):
+        """워커 2개가 같은 포트에서 요청을 처리하고, 메트릭은 워커별로 합산, SIGTERM이면 정상 종료"""
+        port = _free_port()
+        env = dict(os.environ, WORKERS="2", HOST="127.0.0.1", PORT=str(port), CACHE_ENABLED="false",
+                   PLAN_STORE_BACKEND="sqlite", PLAN_STORE_PATH=str(tmp_path / "plans.db"))
+        process = subprocess.Popen([sys.executable, "-m", "app.prefork"], cwd=PROJECT_ROOT, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    _request(f"http://127.0.0.1:{port}/ready", timeout=1.0)
+                    break
+                except OSError:
+                    assert time.monotonic() < deadline and process.poll() is None
+                    time.sleep(0.05)
+
+            # 워커마다 계획 저장소 메모리가 따로 있어도 버전은 저장소 기준 (요청이 워커에 나뉘어 들어간다)
+            saved = [_put_plan(port, dict(PAYLOAD, G_t=g_t)) for g_t in (3.8, 3.9, 3.8, 3.8)]
+            assert [(p["version"], p["recomputed"]) for p in saved] == [(1, True), (2, True), (3, True), (3, False)]
+            for _ in range(4):
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/plans/s1", timeout=5) as response:
+                    assert json.loads(response.read())["version"] == 3
+            for _ in range(5):
+                assert _request(f"http://127.0.0.1:{port}/simulate", PAYLOAD) == 200
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                text = response.read().decode()
+
+            pids = {line.split('pid="')[1].split('"')[0] for line in text.splitlines()
+                    if line.startswith("gpa_worker_requests{")}
+            assert len(pids) == 2
+        finally:
+            process.send_signal(signal.SIGTERM)
+            assert process.wait(timeout=15) == 0
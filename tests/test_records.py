@@ -0,0 +1,45 @@
+"""
+내부 레코드 및 JSON 직렬화 단위 테스트
+"""
+import json
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.models import SimulationResult
+from app.records import ResultRecord, results_to_json
+from app.simulator import GPASimulator
+from benchmarks.scenarios import generate_inputs
+
+
+class TestResultsToJson:
+    """results_to_json 테스트"""
+
+    def test_matches_fastapi_response(self):
+        """FastAPI 기본 응답(pydantic 모델 → JSONResponse)과 바이트 단위로 동일"""
+        for data in generate_inputs(11, 40, 20):
+            simulator = GPASimulator(data.scale_max, data.G_t, data.C_tot, data.history, data.terms)
+            records = simulator.simulate_records()
+            models = [r.to_model() for r in records]
+
+            assert results_to_json(records) == JSONResponse(jsonable_encoder(models)).body
+
+    def test_escaping_and_non_finite(self):
+        """문자열 이스케이프, 정수 학점의 실수 표기, NaN/inf는 null"""
+        records = [ResultRecord('S"1\n', 18.0, 4.0), ResultRecord("여름", 6.0, float("inf"))]
+
+        parsed = json.loads(results_to_json(records))
+
+        assert parsed == [
+            {"term_id": 'S"1\n', "credits": 18.0, "required_avg": 4.0},
+            {"term_id": "여름", "credits": 6.0, "required_avg": None}
+        ]
+        assert b'"credits":18.0' in results_to_json(records)
+
+
+class TestResultRecord:
+    """ResultRecord 테스트"""
+
+    def test_to_model(self):
+        record = ResultRecord("S3", 18.0, 4.02)
+        assert record.to_model() == SimulationResult(term_id="S3", credits=18, required_avg=4.02)
@@ -0,0 +1,57 @@
+"""
+빠른 JSON 응답 단위 테스트
+"""
+import asyncio
+import json
+from typing import List
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from app import responses, tasks
+from app.main import app
+from app.models import BatchSimulationItem, SimulationInput
+from app.responses import FastJSONResponse
+
+PAYLOAD = {
+    "scale_max": 4.5, "G_t": 3.9, "C_tot": 72,
+    "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.6}],
+    "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": 18} for i in range(1, 4)]
+}
+
+
+def _items() -> List[BatchSimulationItem]:
+    """등급 조합 결과, 일반 결과, 실패가 섞인 배치 결과"""
+    inputs = [SimulationInput.model_validate(p) for p in (dict(PAYLOAD, grade_scale="kr-4.5"), PAYLOAD)]
+    items = [BatchSimulationItem(index=i, status_code=200, results=r) for i, r in enumerate(tasks.simulate_batch(inputs))]
+    return items + [BatchSimulationItem(index=2, status_code=422, detail="목표 GPA (4.8)가 최대 평점 (4.5)을 초과합니다")]
+
+
+class TestFastJSONResponse:
+    """FastJSONResponse 테스트"""
+
+    def test_matches_fastapi_encoding(self):
+        """response_model 검증 + jsonable_encoder 결과와 같은 JSON"""
+        items = _items()
+        expected = jsonable_encoder(TypeAdapter(List[BatchSimulationItem]).validate_python(items))
+
+        assert json.loads(FastJSONResponse(items).body) == expected
+        assert "grade_mixes" in json.loads(FastJSONResponse(items).body)[0]["results"][0]
+
+    def test_without_orjson(self, monkeypatch):
+        """orjson이 없으면 pydantic_core로 같은 JSON"""
+        items = _items()
+        expected = json.loads(responses.dumps(items))
+        monkeypatch.setattr(responses, "orjson", None)
+
+        assert json.loads(responses.dumps(items)) == expected
+
+    def test_endpoint(self):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.post("/simulate/batch", json={"inputs": [PAYLOAD]})
+        response = asyncio.run(run())
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()[0]["results"] == [r.to_dict() for r in tasks.simulate(SimulationInput.model_validate(PAYLOAD))]
@@ -0,0 +1,151 @@
+"""
+재수강(성적 대체) 단위 테스트
+"""
+import asyncio
+import itertools
+
+import httpx
+import pytest
+from app.main import app
+from app.models import RetakeSearchInput
+from app.retake import CourseIndex, RetakePlanner
+from app import tasks
+
+HISTORY = [
+    {"term_id": "S1", "credits": 18, "achieved_avg": 3.0, "courses": [
+        {"id": "MATH101", "credits": 3, "grade_points": 0.0},
+        {"id": "CS101", "credits": 3, "grade_points": 4.5},
+        {"id": "ENG101", "credits": 2, "grade_points": 2.0},
+        {"id": "PHY101", "credits": 3, "grade_points": 3.5},
+        {"id": "CHEM101", "credits": 3, "grade_points": 4.0},
+        {"id": "ART101", "credits": 4, "grade_points": 3.5},
+    ]},
+    {"term_id": "S2", "credits": 18, "achieved_avg": 3.5},
+]
+
+PAYLOAD = {
+    "scale_max": 4.5, "G_t": 3.8, "C_tot": 72, "history": HISTORY,
+    "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": 18} for i in (3, 4)]
+}
+
+
+class TestCourseIndex:
+    """CourseIndex 테스트"""
+
+    def test_replace(self):
+        data = RetakeSearchInput.model_validate(PAYLOAD)
+        index = CourseIndex(data.history)
+
+        assert index.gain("MATH101", 4.0) == 12.0
+        assert index.replace("MATH101", 4.0) == 12.0
+        assert index.grade_points == 18 * 3.0 + 18 * 3.5 + 12.0
+
+        history = index.to_history()
+        assert history[0].achieved_avg == pytest.approx(3.0 + 12.0 / 18)
+        assert history[1] is data.history[1]
+
+
+class TestRetakePlanner:
+    """RetakePlanner 테스트"""
+
+    def test_required_avg_matches_simulator(self):
+        """O(1) 갱신한 필요 평점은 성적을 바꾼 이력으로 다시 계산한 값과 같다"""
+        data = RetakeSearchInput.model_validate(PAYLOAD)
+        planner = RetakePlanner(data)
+
+        gain = planner.index.gain("ENG101", 4.0)
+        changed = [dict(HISTORY[0], achieved_avg=3.0 + gain / 18), HISTORY[1]]
+        expected = (3.8 * 72 - (18 * changed[0]["achieved_avg"] + 18 * 3.5)) / 36
+
+        assert planner.required_avg(gain) == pytest.approx(expected)
+
+    def test_fewest_retakes(self):
+        """필요 평점을 max_required_avg 이하로 만드는 가장 적은 과목 수 (모든 조합과 비교)"""
+        data = RetakeSearchInput.model_validate(PAYLOAD)
+        planner = RetakePlanner(data)
+        ceiling = 4.1
+
+        result = planner.search(retake_grade=4.0, max_required_avg=ceiling)
+
+        courses = [c["id"] for c in HISTORY[0]["courses"]]
+        fewest = min(
+            k for k in range(len(courses) + 1)
+            for combo in itertools.combinations(courses, k)
+            if planner.required_avg(sum(max(planner.index.gain(c, 4.0), 0) for c in combo)) <= ceiling
+        )
+        assert result.reachable
+        assert len(result.selected) == fewest
+        assert result.selected[0] == "MATH101"
+        assert result.plan.required_avg <= ceiling
+        assert [c.course_id for c in result.candidates] == ["MATH101", "ENG101", "ART101", "PHY101"]
+
+    def test_constraints(self):
+        """eligible_max, max_retakes로 후보와 과목 수 제한"""
+        data = RetakeSearchInput.model_validate(PAYLOAD)
+
+        eligible = RetakePlanner(data).search(retake_grade=4.0, eligible_max=2.0)
+        limited = RetakePlanner(data).search(retake_grade=4.0, max_retakes=1, max_required_avg=4.0)
+
+        assert [c.course_id for c in eligible.candidates] == ["MATH101", "ENG101"]
+        assert not limited.reachable and limited.selected == [] and limited.plan is None
+
+    def test_already_reachable(self):
+        result = RetakePlanner(RetakeSearchInput.model_validate(dict(PAYLOAD, G_t=3.5))).search()
+
+        assert result.reachable and result.selected == [] and result.plan is None
+
+
+class TestRetakeEndpoints:
+    """POST /simulate/retakes, /simulate/retakes/best 테스트"""
+
+    def _post(self, path, payload):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.post(path, json=payload)
+        return asyncio.run(run())
+
+    def test_retakes(self):
+        """반영한 결과는 성적을 바꾼 이력으로 /simulate를 호출한 결과와 같다"""
+        response = self._post("/simulate/retakes", dict(PAYLOAD, retakes=[{"course_id": "MATH101", "grade_points": 4.0}]))
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["retakes"][0]["gain"] == 12.0
+        changed = [dict(HISTORY[0], achieved_avg=3.0 + 12.0 / 18), HISTORY[1]]
+        assert body["results"] == self._post("/simulate", dict(PAYLOAD, history=changed)).json()
+
+    def test_validation(self):
+        retakes = [{"course_id": "NOPE", "grade_points": 4.0}]
+        assert self._post("/simulate/retakes", dict(PAYLOAD, retakes=retakes)).status_code == 400
+
+        retakes = [{"course_id": "MATH101", "grade_points": 4.0}] * 2
+        assert self._post("/simulate/retakes", dict(PAYLOAD, retakes=retakes)).status_code == 400
+
+        wrong_credits = [dict(HISTORY[0], credits=19), HISTORY[1]]
+        assert self._post("/simulate/retakes/best", dict(PAYLOAD, history=wrong_credits)).status_code == 400
+
+    def test_grade_consistency(self):
+        """과목 평점 평균이 학기 평균과 다르거나 평점이 scale_max를 넘으면 400 (반올림 오차는 허용)"""
+        rounded = [dict(HISTORY[0], achieved_avg=3.004), HISTORY[1]]
+        assert self._post("/simulate/retakes/best", dict(PAYLOAD, history=rounded)).status_code == 200
+
+        inconsistent = [dict(HISTORY[0], achieved_avg=3.2), HISTORY[1]]
+        response = self._post("/simulate/retakes/best", dict(PAYLOAD, history=inconsistent))
+        assert response.status_code == 400
+        assert "S1" in response.json()["detail"]
+
+        courses = [dict(c, grade_points=5.0) if c["id"] == "CS101" else c for c in HISTORY[0]["courses"]]
+        too_high = [dict(HISTORY[0], courses=courses, achieved_avg=3.0 + 0.5 * 3 / 18), HISTORY[1]]
+        assert self._post("/simulate/retakes/best", dict(PAYLOAD, history=too_high)).status_code == 400
+
+        retakes = [{"course_id": "MATH101", "grade_points": 4.6}]
+        assert self._post("/simulate/retakes", dict(PAYLOAD, retakes=retakes)).status_code == 400
+        assert self._post("/simulate/retakes/best", dict(PAYLOAD, retake_grade=4.6)).status_code == 400
+
+    def test_best(self):
+        response = self._post("/simulate/retakes/best", dict(PAYLOAD, retake_grade=4.0, max_required_avg=4.1))
+
+        assert response.status_code == 200
+        assert response.json()["selected"] == tasks.retake_search(
+            RetakeSearchInput.model_validate(dict(PAYLOAD, retake_grade=4.0, max_required_avg=4.1))
+        ).selected
@@ -0,0 +1,124 @@
+"""
+RiskSimulator 단위 테스트
+"""
+import asyncio
+import math
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from app.main import app
+from app.risk import RiskSimulator, DEFAULT_STD
+from app.models import HistoryItem, TermItem, RiskInput
+
+HISTORY = [
+    HistoryItem(term_id="S1", credits=18, achieved_avg=3.6),
+    HistoryItem(term_id="S2", credits=18, achieved_avg=3.8),
+]
+
+
+def _terms(*credits):
+    return [TermItem(id=f"T{i}", type="regular", planned_credits=c) for i, c in enumerate(credits, start=1)]
+
+
+def _normal_cdf(x):
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+class TestRiskSimulator:
+    """RiskSimulator 클래스 테스트"""
+
+    def test_fit_from_history(self):
+        """평균은 학점 가중 평균, 표준편차는 학점 가중 표준편차"""
+        mean, std = RiskSimulator(4.5, 3.7, 72, HISTORY, _terms(18, 18)).fit()
+
+        assert mean == pytest.approx(3.7)
+        assert std == pytest.approx(0.1)
+
+    def test_fit_defaults_and_overrides(self):
+        """이력이 한 학기면 기본 표준편차, mean/std를 지정하면 그대로 사용"""
+        one_term = HISTORY[:1]
+
+        assert RiskSimulator(4.5, 3.7, 72, one_term, _terms(18)).fit() == (pytest.approx(3.6), DEFAULT_STD)
+        assert RiskSimulator(4.5, 3.7, 72, HISTORY, _terms(18), mean=3.0, std=0.5).fit() == (3.0, 0.5)
+
+    def test_success_probability_matches_normal(self):
+        """평점 상한/하한에 거의 닿지 않으면 졸업 GPA는 정규분포 (해석해와 비교)"""
+        terms = _terms(18, 18, 18, 18)
+        G_t = 3.72
+        result = RiskSimulator(4.5, G_t, 108, HISTORY, terms, seed=1).run()
+
+        # 졸업 GPA = (이력 + Σ c_i x_i) / 108, x_i ~ N(3.7, 0.1)
+        mean = (18 * 3.6 + 18 * 3.8 + 72 * 3.7) / 108
+        std = 0.1 * math.sqrt(4 * 18 ** 2) / 108
+        expected = 1 - _normal_cdf((G_t - mean) / std)
+
+        assert result.success_probability == pytest.approx(expected, abs=0.01)
+        assert result.gpa_percentiles["p50"] == pytest.approx(mean, abs=0.01)
+        assert result.terms[0].meet_probability == pytest.approx(1 - _normal_cdf((3.73 - 3.7) / 0.1), abs=1e-3)
+
+    def test_seed_reproducible(self):
+        terms = _terms(18, 18, 18)
+
+        first = RiskSimulator(4.5, 3.75, 90, HISTORY, terms, draws=5000, seed=3).run()
+        second = RiskSimulator(4.5, 3.75, 90, HISTORY, terms, draws=5000, seed=3).run()
+
+        assert first == second
+
+    def test_most_sensitive_term(self):
+        """같은 분포면 학점이 가장 많은 학기가 가장 민감함"""
+        result = RiskSimulator(4.5, 3.72, 84, HISTORY, _terms(12, 21, 15), seed=2).run()
+
+        assert result.most_sensitive_term == "T2"
+        assert result.terms[1].sensitivity == max(t.sensitivity for t in result.terms) > 0
+
+    def test_infeasible(self):
+        """목표 달성 불가능하면 /simulate와 같은 ValueError"""
+        with pytest.raises(ValueError, match="달성이 불가능"):
+            RiskSimulator(4.5, 4.5, 54, HISTORY, _terms(18)).run()
+
+    def test_requires_mean_without_history(self):
+        with pytest.raises(ValidationError):
+            RiskInput.model_validate({
+                "scale_max": 4.5, "G_t": 3.5, "C_tot": 18, "history": [],
+                "terms": [{"id": "T1", "type": "regular", "planned_credits": 18}]
+            })
+
+
+class TestRiskEndpoint:
+    """POST /simulate/risk, /simulate/risk/batch 테스트"""
+
+    PAYLOAD = {
+        "scale_max": 4.5, "G_t": 3.75, "C_tot": 90, "draws": 10000,
+        "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.6},
+                    {"term_id": "S2", "credits": 18, "achieved_avg": 3.8}],
+        "terms": [{"id": f"T{i}", "type": "regular", "planned_credits": 18} for i in range(1, 4)]
+    }
+
+    def _post(self, path, payload):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.post(path, json=payload)
+        return asyncio.run(run())
+
+    def test_risk(self):
+        response = self._post("/simulate/risk", self.PAYLOAD)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert 0 < body["success_probability"] < 1
+        assert set(body["gpa_percentiles"]) == {"p5", "p25", "p50", "p75", "p95"}
+        assert self._post("/simulate/risk", dict(self.PAYLOAD, G_t=5.0)).status_code == 400
+        assert self._post("/simulate/risk", dict(self.PAYLOAD, G_t=4.5)).status_code == 422
+
+    def test_batch_matches_single(self):
+        """학생별 결과는 단건 호출과 같고, 실패한 학생은 단건 호출의 상태 코드"""
+        inputs = [self.PAYLOAD, dict(self.PAYLOAD, G_t=5.0), dict(self.PAYLOAD, G_t=4.5), dict(self.PAYLOAD, seed=7)]
+
+        response = self._post("/simulate/risk/batch", {"inputs": inputs})
+
+        assert response.status_code == 200
+        items = response.json()
+        assert [item["status_code"] for item in items] == [200, 400, 422, 200]
+        assert items[0]["result"] == self._post("/simulate/risk", self.PAYLOAD).json()
+        assert items[3]["result"]["seed"] == 7
@@ -0,0 +1,173 @@
+"""
+학기 계획 시나리오 비교 테스트
+"""
+import asyncio
+import random
+
+import httpx
+import pytest
+from app import main
+from app.executor import SimulationExecutor
+from app.main import app
+from app.metrics import MetricsRegistry
+from app.models import ScenarioInput
+from app.records import TermRecord
+from app.scenarios import ScenarioComparer, apply_edits, split_scenarios
+from benchmarks.scenarios import generate_payload
+
+BASE = {
+    "scale_max": 4.5, "G_t": 4.0, "C_tot": 130,
+    "history": [
+        {"term_id": "S1", "credits": 18, "achieved_avg": 3.8},
+        {"term_id": "S2", "credits": 18, "achieved_avg": 3.9}
+    ],
+    "terms": [{"id": f"S{i}", "type": "regular", "planned_credits": 15, "max_credits": 21} for i in range(3, 9)]
+}
+
+
+def _request(method, path, payload=None):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.request(method, path, json=payload)
+    return asyncio.run(run())
+
+
+def _random_scenarios(payload, count, seed=0):
+    rng = random.Random(seed)
+    term_ids = [t["id"] for t in payload["terms"]]
+    scenarios = []
+    for i in range(count):
+        term_id = rng.choice(term_ids)
+        kind = rng.choice(["planned", "max", "added", "removed"])
+        if kind == "planned":
+            edit = {"type": "planned_credits_changed", "term_id": term_id, "planned_credits": rng.choice([9, 12, 21])}
+        elif kind == "max":
+            edit = {"type": "max_credits_changed", "term_id": term_id, "max_credits": rng.choice([12, 15, 18])}
+        elif kind == "added":
+            edit = {"type": "term_added", "after": term_id,
+                    "term": {"id": f"SU{i}", "type": "summer", "planned_credits": 6, "max_credits": 9}}
+        else:
+            edit = {"type": "term_removed", "term_id": term_id}
+        scenarios.append({"name": f"{kind}-{term_id}", "edits": [edit]})
+    return scenarios
+
+
+def _edited_payload(payload, scenario):
+    data = ScenarioInput.model_validate({"base": payload, "scenarios": [scenario]})
+    terms = apply_edits([TermRecord.from_item(t) for t in data.base.terms], data.scenarios[0].edits)
+    return dict(payload, terms=[
+        {"id": t.id, "type": t.type, "planned_credits": t.planned_credits, "max_credits": t.max_credits}
+        for t in terms
+    ])
+
+
+class TestScenarioComparison:
+    """시나리오별 결과는 변경을 적용한 입력의 /simulate와 같다"""
+
+    @pytest.mark.parametrize("rounding", ["float", "exact"])
+    def test_matches_simulate(self, rounding, monkeypatch):
+        monkeypatch.setattr(main.result_cache, "enabled", False)
+        for seed in range(5):
+            payload = dict(generate_payload(seed, 8), rounding=rounding)
+            scenarios = _random_scenarios(payload, 10, seed)
+
+            response = _request("POST", "/simulate/scenarios",
+                                {"base": payload, "scenarios": scenarios, "include_results": True})
+            if response.status_code == 422:
+                assert _request("POST", "/simulate", payload).status_code == 422
+                continue
+            body = response.json()
+
+            assert body["base"]["results"] == _request("POST", "/simulate", payload).json()
+            for scenario, row in zip(scenarios, body["scenarios"]):
+                expected = _request("POST", "/simulate", _edited_payload(payload, scenario))
+                assert row["status_code"] == expected.status_code
+                if expected.status_code == 200:
+                    assert row["results"] == expected.json()
+                    assert row["peak_required_avg"] == max(r["required_avg"] for r in expected.json())
+
+    def test_compact_table(self):
+        """학기를 줄여 졸업 학점이 모자라면 추가 계절학기 학점과 최고 필요 평점이 늘어난다"""
+        scenarios = [
+            {"name": "S8 12학점", "edits": [{"type": "planned_credits_changed", "term_id": "S8", "planned_credits": 12}]},
+            {"name": "S8 삭제", "edits": [{"type": "term_removed", "term_id": "S8"}]},
+            {"name": "S99", "edits": [{"type": "planned_credits_changed", "term_id": "S99", "planned_credits": 12}]},
+            {"name": "중복", "edits": [{"type": "term_added", "term": {"id": "S3", "type": "summer", "planned_credits": 6}}]},
+        ]
+
+        body = _request("POST", "/simulate/scenarios", {"base": BASE, "scenarios": scenarios}).json()
+
+        base, short, removed, missing, duplicate = body["base"], *body["scenarios"]
+        assert body["required_avg"] == pytest.approx((4.0 * 130 - (18 * 3.8 + 18 * 3.9)) / 94)
+        assert base["extra_summer_credits"] == 4 and base["total_credits"] == 94
+        assert short["extra_summer_credits"] == 7
+        # 부족한 19학점 중 9학점(자동 계절학기 상한)을 넘는 만큼은 추가 계절학기로 채운다
+        assert removed["extra_summer_credits"] == 21
+        assert removed["peak_required_avg"] >= base["peak_required_avg"]
+        assert "results" not in base or base["results"] is None
+        assert (missing["status_code"], missing["detail"]) == (400, "남은 학기에 S99가 없습니다")
+        assert duplicate["status_code"] == 400
+
+    def test_invalid_term_list(self, monkeypatch):
+        """모든 학기를 지우거나 학기 수 상한을 넘는 시나리오는 /simulate처럼 그 행만 422"""
+        monkeypatch.setattr(main.settings, "max_terms", 7)
+        remove_all = [{"type": "term_removed", "term_id": t["id"]} for t in BASE["terms"]]
+        add_two = [{"type": "term_added", "term": {"id": f"SU{i}", "type": "summer", "planned_credits": 6}}
+                   for i in range(2)]
+        scenarios = [{"name": "전부 삭제", "edits": remove_all}, {"name": "학기 과다", "edits": add_two}]
+
+        body = _request("POST", "/simulate/scenarios", {"base": BASE, "scenarios": scenarios}).json()
+
+        assert [(row["name"], row["status_code"]) for row in body["scenarios"]] == [("전부 삭제", 422), ("학기 과다", 422)]
+        assert _request("POST", "/simulate", dict(BASE, terms=[])).status_code == 422
+
+    def test_shared_errors(self):
+        """기준 입력 검증 실패(400)와 달성 불가능(422)은 시나리오와 무관하게 한 번만 판정"""
+        scenarios = [{"name": "x", "edits": [{"type": "term_removed", "term_id": "S8"}]}]
+
+        too_high = _request("POST", "/simulate/scenarios", {"base": dict(BASE, G_t=4.6), "scenarios": scenarios})
+        unreachable = _request("POST", "/simulate/scenarios", {"base": dict(BASE, G_t=4.4), "scenarios": scenarios})
+
+        assert too_high.status_code == 400
+        assert unreachable.status_code == 422
+        assert unreachable.json()["detail"] == _request("POST", "/simulate", dict(BASE, G_t=4.4)).json()["detail"]
+
+
+class TestParallelChunks:
+    """process 모드에서 시나리오 구간을 나눠 실행"""
+
+    def test_split(self):
+        assert [len(c) for c in split_scenarios(list(range(10)), parts=4)] == [10]
+        assert [len(c) for c in split_scenarios(list(range(100)), parts=4)] == [50, 50]
+        assert [len(c) for c in split_scenarios(list(range(1000)), parts=4)] == [250] * 4
+
+    def test_base_computed_in_executor(self, monkeypatch):
+        """기준 입력의 Step 1도 이벤트 루프가 아니라 실행 풀에서 계산 (달성 불가능 422 포함)"""
+        executor = SimulationExecutor("thread", workers=1, registry=MetricsRegistry())
+        monkeypatch.setattr(main, "executor", executor)
+        scenarios = [{"name": "x", "edits": [{"type": "term_removed", "term_id": "S8"}]}]
+
+        try:
+            ok = _request("POST", "/simulate/scenarios", {"base": BASE, "scenarios": scenarios})
+            unreachable = _request("POST", "/simulate/scenarios", {"base": dict(BASE, G_t=4.4), "scenarios": scenarios})
+        finally:
+            executor.shutdown()
+
+        assert (ok.status_code, unreachable.status_code) == (200, 422)
+        assert executor.completed == 2
+
+    def test_process_chunks_match_sequential(self, monkeypatch):
+        executor = SimulationExecutor("process", workers=2, registry=MetricsRegistry())
+        monkeypatch.setattr(main, "executor", executor)
+        scenarios = _random_scenarios(BASE, 150)
+
+        try:
+            response = _request("POST", "/simulate/scenarios", {"base": BASE, "scenarios": scenarios})
+        finally:
+            executor.shutdown()
+
+        data = ScenarioInput.model_validate({"base": BASE, "scenarios": scenarios})
+        expected = ScenarioComparer(data.base).compare(data.scenarios)
+        assert response.status_code == 200
+        assert response.json() == expected.model_dump()
+        assert executor.completed == 2
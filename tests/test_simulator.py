@@ -1,9 +1,13 @@
 """
 GPA Simulator 단위 테스트
 """
+from fractions import Fraction
+import random
+
 import pytest
-from app.models import HistoryItem, TermItem
-from app.simulator import GPASimulator
+from app.models import HistoryItem, TermItem, SimulationResult
+from app.simulator import GPASimulator, water_level
+from app.records import TermPlan
 
 
 class TestGPASimulator:
@@ -173,6 +177,121 @@ class TestGPASimulator:
         total_result_credits = sum(r.credits for r in results)
         assert total_result_credits >= 82  # 100 - 18 = 82학점 필요
 
+    def test_many_extra_summer_terms(self):
+        """추가 계절학기가 20개 이상 필요한 경우에도 정확히 계산"""
+        history = [
+            HistoryItem(term_id="S1", credits=18, achieved_avg=3.8)
+        ]
+        terms = [
+            TermItem(id="S2", type="regular", planned_credits=10, max_credits=21)
+        ]
+
+        simulator = GPASimulator(
+            scale_max=4.5,
+            G_t=4.0,
+            C_tot=300,
+            history=history,
+            terms=terms
+        )
+
+        results = simulator.simulate()
+
+        # 272학점 중 19학점만 배정 가능 -> 6학점 계절학기 44개 추가
+        extra = [r for r in results if r.term_id.startswith("Summer_Extra")]
+        assert len(extra) == 44
+        assert sum(r.credits for r in results) >= 282
+        assert all(0 <= r.required_avg <= 4.5 for r in results)
+
+        total_credits = 18 + sum(r.credits for r in results)
+        final_gpa = (18 * 3.8 + sum(r.credits * r.required_avg for r in results)) / total_credits
+        assert abs(final_gpa - 4.0) < 0.01
+
+    def test_does_not_mutate_input(self):
+        """학점 보정과 계절학기 추가가 입력 객체를 바꾸지 않음"""
+        terms = [
+            TermItem(id="S2", type="regular", planned_credits=30, max_credits=21),
+            TermItem(id="S3", type="regular", planned_credits=30, max_credits=21)
+        ]
+        simulator = GPASimulator(scale_max=4.5, G_t=4.0, C_tot=100, history=[], terms=terms)
+
+        simulator.simulate()
+
+        assert len(terms) == 2
+        assert [t.planned_credits for t in terms] == [30, 30]
+
+    def test_water_level(self):
+        """상한이 다른 학기들의 수위 계산"""
+        # 상한 3.0인 학기는 고정, 나머지 두 학기는 (70 - 30) / 10 = 4.0
+        level, capped = water_level([10, 5, 5], [3.0, 4.5, 4.5], 70)
+        assert abs(level - 4.0) < 1e-9
+        assert capped == 1
+
+        # 상한에 걸리지 않으면 단순 평균
+        level, capped = water_level([10, 10], [4.5, 4.5], 80)
+        assert level == 4.0
+        assert capped == 0
+
+        # 모두 상한이어도 부족하면 inf
+        level, capped = water_level([10, 10], [4.0, 4.5], 100)
+        assert level == float('inf')
+        assert capped == 2
+
+
+def _decimal_gpa(history, results):
+    """응답 값을 10진수 그대로 읽어 계산한 GPA"""
+    credits = sum(Fraction(repr(h.credits)) for h in history) + sum(Fraction(repr(r.credits)) for r in results)
+    points = (
+        sum(Fraction(repr(h.credits)) * Fraction(repr(h.achieved_avg)) for h in history)
+        + sum(Fraction(repr(r.credits)) * Fraction(repr(r.required_avg)) for r in results)
+    )
+    return points / credits
+
+
+class TestExactRounding:
+    """exact 라운딩 테스트"""
+
+    def test_largest_remainder(self):
+        """모두 내림한 뒤 부족분을 잔여가 큰 학기부터 0.01씩 올림"""
+        simulator = GPASimulator(scale_max=4.5, G_t=3.5, C_tot=30, history=[], terms=[], rounding="exact")
+        plans = [TermPlan("T1", 10, 3.504, 21), TermPlan("T2", 10, 3.509, 21), TermPlan("T3", 10, 3.487, 21)]
+
+        results = simulator._round_and_adjust(plans, 0, 0)
+
+        assert [r.required_avg for r in results] == [3.5, 3.51, 3.49]
+
+    def test_meets_target(self):
+        """응답 값으로 다시 계산한 GPA가 항상 목표 이상 (float 방식은 목표보다 낮은 경우가 있음)"""
+        rng = random.Random(5)
+        float_misses = 0
+        for _ in range(300):
+            history = [
+                HistoryItem(term_id=f"H{i}", credits=rng.choice([15, 17, 18, 19.5]),
+                            achieved_avg=round(rng.uniform(2.5, 4.5), 2))
+                for i in range(rng.randint(0, 5))
+            ]
+            terms = [
+                TermItem(id=f"T{i}", type="regular", planned_credits=rng.choice([3, 15, 17, 19, 20]))
+                for i in range(rng.randint(1, 8))
+            ]
+            C_tot = sum(h.credits for h in history) + sum(t.planned_credits for t in terms)
+            G_t = round(rng.uniform(2.5, 4.4), 2)
+            try:
+                exact = GPASimulator(4.5, G_t, C_tot, history, terms, rounding="exact").simulate_records()
+            except ValueError:
+                continue
+            rounded = GPASimulator(4.5, G_t, C_tot, history, terms).simulate_records()
+
+            assert _decimal_gpa(history, exact) >= Fraction(repr(G_t))
+            assert all(0 <= r.required_avg <= 4.5 for r in exact)
+            assert [(r.term_id, r.credits) for r in exact] == [(r.term_id, r.credits) for r in rounded]
+            float_misses += _decimal_gpa(history, rounded) < Fraction(repr(G_t))
+
+        assert float_misses > 0
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            GPASimulator(scale_max=4.5, G_t=3.5, C_tot=30, history=[], terms=[], rounding="decimal")
+
 
 class TestAPIIntegration:
     """FastAPI 엔드포인트 통합 테스트"""
@@ -234,6 +353,23 @@ class TestAPIIntegration:
         response = client.post("/simulate", json=payload)
         assert response.status_code == 400
 
+    def test_exact_rounding_api(self, client):
+        """rounding=exact는 단건/배치 결과가 같고 목표 이상, 알 수 없는 방식은 422"""
+        payload = {
+            "scale_max": 4.5, "G_t": 3.87, "C_tot": 96, "rounding": "exact",
+            "history": [{"term_id": "S1", "credits": 19.5, "achieved_avg": 3.61}],
+            "terms": [{"id": f"S{i}", "type": "regular", "planned_credits": 19} for i in range(2, 6)]
+        }
+
+        single = client.post("/simulate", json=payload).json()
+        batch = client.post("/simulate/batch", json={"inputs": [payload]}).json()
+
+        assert batch[0]["results"] == single
+        assert _decimal_gpa(
+            [HistoryItem(**h) for h in payload["history"]], [SimulationResult(**r) for r in single]
+        ) >= Fraction("3.87")
+        assert client.post("/simulate", json=dict(payload, rounding="decimal")).status_code == 422
+
     def test_impossible_target_api(self, client):
         """달성 불가능한 목표 API 테스트"""
         payload = {
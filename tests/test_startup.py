@@ -0,0 +1,43 @@
+"""
+기동 시간 관련 테스트 (지연 import, 준비 상태 엔드포인트)
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImports:
+    """app.main import 시 불러오지 않는 모듈"""
+
+    def test_numpy_not_imported(self):
+        """배치 엔드포인트 전용 numpy는 첫 배치 요청 때 로딩"""
+        code = "import sys, app.main; print('numpy' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip().splitlines()[-1] == "False"
+
+
+class TestReadyAPI:
+    """준비 상태 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """테스트 클라이언트 생성"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        return TestClient(app)
+
+    def test_ready_warms_once(self, client):
+        """처음 호출 시 예열하고, 이후에는 같은 결과 반환"""
+        first = client.get("/ready")
+        second = client.get("/ready")
+
+        assert first.status_code == 200
+        assert first.json()["status"] == "ready"
+        assert set(first.json()["warmup"]) == {"validation_ms", "simulation_ms", "grade_tables_ms"}
+        assert second.json() == first.json()
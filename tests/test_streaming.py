@@ -0,0 +1,152 @@
+"""
+NDJSON 스트리밍 시뮬레이션 단위 테스트
+"""
+import asyncio
+import json
+
+import httpx
+from app.executor import ExecutorSaturated
+from app.main import app
+from app.streaming import read_lines, simulate_stream
+from app import tasks
+from app.models import SimulationInput
+
+PAYLOAD = {
+    "scale_max": 4.5, "G_t": 4.0, "C_tot": 130,
+    "history": [{"term_id": "S1", "credits": 18, "achieved_avg": 3.8}],
+    "terms": [{"id": f"S{i}", "type": "regular", "planned_credits": 18, "max_credits": 21} for i in range(2, 9)]
+}
+
+
+def _line(key, **overrides) -> bytes:
+    return json.dumps(dict(PAYLOAD, key=key, **overrides)).encode() + b"\n"
+
+
+async def _body(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _run_chunk(inputs):
+    return tasks.simulate_batch(inputs)
+
+
+def _collect(chunks, run_chunk=_run_chunk, chunk_size=256, max_line_bytes=1 << 20):
+    async def run():
+        return [chunk async for chunk in simulate_stream(
+            _body(chunks), run_chunk, chunk_size, max_line_bytes
+        )]
+    return asyncio.run(run())
+
+
+def _parse(outputs):
+    return [json.loads(line) for chunk in outputs for line in chunk.splitlines()]
+
+
+class TestReadLines:
+    """read_lines 함수 테스트"""
+
+    def _read(self, chunks, max_line_bytes=1 << 20):
+        async def run():
+            return [lines async for lines in read_lines(_body(chunks), max_line_bytes)]
+        return asyncio.run(run())
+
+    def test_lines_across_reads(self):
+        """네트워크 읽기 경계에 걸친 줄, 빈 줄, 마지막 줄바꿈 없는 줄"""
+        batches = self._read([b'{"a":', b'1}\n\n{"b"', b':2}\n{"c":3}'])
+
+        assert batches == [[(1, b'{"a":1}')], [(3, b'{"b":2}')], [(4, b'{"c":3}')]]
+
+    def test_oversized_line(self):
+        """최대 크기를 넘는 줄은 버리고 다음 줄부터 계속"""
+        batches = self._read([b"x" * 10, b"x" * 10, b'\n{"a":1}\n'], max_line_bytes=16)
+
+        assert batches == [[(1, None), (2, b'{"a":1}')]]
+
+
+class TestSimulateStream:
+    """simulate_stream 함수 테스트"""
+
+    def test_results_match_single_simulation(self):
+        """성공 줄은 단건 시뮬레이션과 같고, 실패 줄은 단건 /simulate와 같은 상태 코드"""
+        outputs = _collect([
+            _line("ok") + b"not json\n" + _line(7, G_t=5.0) + _line("infeasible", G_t=4.5, C_tot=40)
+            + json.dumps({"key": "missing"}).encode() + b"\n"
+        ])
+        lines = _parse(outputs)
+
+        expected = tasks.simulate(SimulationInput.model_validate(PAYLOAD))
+        assert lines[0]["key"] == "ok" and lines[0]["line"] == 1 and lines[0]["status_code"] == 200
+        assert lines[0]["results"] == [r.to_dict() for r in expected]
+        assert [(line["key"], line["line"], line["status_code"]) for line in lines[1:]] == [
+            (None, 2, 422), (7, 3, 400), ("infeasible", 4, 422), ("missing", 5, 422)
+        ]
+
+    def test_chunk_size(self):
+        """한 번에 계산하는 레코드 수는 chunk_size 이하"""
+        sizes = []
+
+        async def run_chunk(inputs):
+            sizes.append(len(inputs))
+            return tasks.simulate_batch(inputs)
+
+        outputs = _collect([_line(i) for i in range(3)] + [b"".join(_line(i) for i in range(3, 10))],
+                           run_chunk=run_chunk, chunk_size=4)
+
+        assert sizes == [1, 1, 1, 4, 3]
+        assert [line["key"] for line in _parse(outputs)] == list(range(10))
+
+    def test_saturated_chunk(self):
+        """실행 풀이 가득 차면 해당 청크의 레코드는 503 줄"""
+        async def run_chunk(inputs):
+            raise ExecutorSaturated(3)
+
+        lines = _parse(_collect([_line("a") + _line("b")], run_chunk=run_chunk))
+
+        assert [(line["key"], line["status_code"]) for line in lines] == [("a", 503), ("b", 503)]
+
+
+class TestStreamEndpoint:
+    """POST /simulate/stream 테스트"""
+
+    def test_first_result_before_upload_finishes(self):
+        """첫 줄의 결과가 나간 뒤에야 다음 본문을 보내는 클라이언트도 끝까지 처리"""
+        sent = []
+        first_result = asyncio.Event()
+        bodies = [_line("first"), _line("second")]
+
+        async def receive():
+            if not bodies:
+                await asyncio.Event().wait()
+            if len(bodies) == 1:
+                await asyncio.wait_for(first_result.wait(), timeout=5)
+            body = bodies.pop(0)
+            return {"type": "http.request", "body": body, "more_body": bool(bodies)}
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body" and message.get("body"):
+                first_result.set()
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+            "scheme": "http", "path": "/simulate/stream", "raw_path": b"/simulate/stream",
+            "query_string": b"", "root_path": "", "server": ("test", 80), "client": ("test", 1),
+            "headers": [(b"content-type", b"application/x-ndjson")],
+        }
+        asyncio.run(app(scope, receive, send))
+
+        assert sent[0]["status"] == 200
+        lines = _parse([m["body"] for m in sent if m["type"] == "http.response.body"])
+        assert [(line["key"], line["status_code"]) for line in lines] == [("first", 200), ("second", 200)]
+
+    def test_content_type(self):
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return await client.post("/simulate/stream", content=_line("a"))
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert json.loads(response.text)["key"] == "a"
@@ -0,0 +1,132 @@
+"""
+GoalSweeper 단위 테스트
+"""
+import pytest
+from pydantic import ValidationError
+from app.models import HistoryItem, TermItem, SweepInput
+from app.simulator import GPASimulator
+from app.sweep import GoalSweeper
+
+
+HISTORY = [
+    HistoryItem(term_id="S1", credits=18, achieved_avg=3.8),
+    HistoryItem(term_id="S2", credits=18, achieved_avg=3.9)
+]
+
+
+def _terms(planned=18, max_credits=21, count=6):
+    return [
+        TermItem(id=f"S{i+3}", type="regular", planned_credits=planned, max_credits=max_credits)
+        for i in range(count)
+    ]
+
+
+def _single(G_t, terms, C_tot=130, rounding="float"):
+    simulator = GPASimulator(
+        scale_max=4.5, G_t=G_t, C_tot=C_tot,
+        history=HISTORY, terms=[t.model_copy() for t in terms], rounding=rounding
+    )
+    return simulator.simulate()
+
+
+class TestGoalSweeper:
+    """GoalSweeper 클래스 테스트"""
+
+    @pytest.mark.parametrize("rounding", ["float", "exact"])
+    @pytest.mark.parametrize("planned,max_credits", [(18, 21), (24, 21)])
+    def test_matches_single_simulation(self, planned, max_credits, rounding):
+        """각 행이 같은 목표의 단건 시뮬레이션과 동일 (학점 상한 적용, 라운딩 방식 포함)"""
+        terms = _terms(planned, max_credits)
+        targets = [round(3.5 + 0.01 * i, 2) for i in range(101)]
+
+        result = GoalSweeper(4.5, 130, HISTORY, terms, rounding).sweep(targets)
+
+        for row in result.rows:
+            if not row.feasible:
+                with pytest.raises(ValueError):
+                    _single(row.G_t, terms, rounding=rounding)
+                continue
+            expected = _single(row.G_t, terms, rounding=rounding)
+            assert result.term_ids == [r.term_id for r in expected]
+            assert result.credits == [r.credits for r in expected]
+            assert row.required_avg == [r.required_avg for r in expected]
+
+    def test_feasibility_boundary(self):
+        """최대 달성 가능 GPA 이하만 feasible"""
+        terms = _terms()
+        result = GoalSweeper(4.5, 130, HISTORY, terms).sweep([4.3, 4.4, 4.5])
+
+        # (3.85 * 36 + 4.5 * 94) / 130 = 4.32
+        assert abs(result.max_achievable_gpa - 4.32) < 1e-9
+        assert [row.feasible for row in result.rows] == [True, False, False]
+        assert "4.32" in result.rows[1].detail
+
+    def test_does_not_mutate_input(self):
+        """입력 학기 계획이 변경되지 않음"""
+        terms = _terms(planned=30, count=2)
+        GoalSweeper(4.5, 100, HISTORY, terms).sweep([3.9])
+        assert len(terms) == 2
+        assert all(t.planned_credits == 30 for t in terms)
+
+
+class TestSweepInput:
+    """SweepInput 검증 테스트"""
+
+    def test_range_targets(self):
+        """범위 지정 시 끝값 포함"""
+        data = SweepInput(
+            scale_max=4.5, C_tot=130, history=[], terms=_terms(),
+            G_t_min=3.5, G_t_max=4.5, G_t_step=0.05
+        )
+        targets = data.target_list()
+        assert len(targets) == 21
+        assert targets[0] == 3.5 and targets[-1] == 4.5
+        assert targets[3] == 3.65
+
+    def test_targets_xor_range(self):
+        """targets와 범위를 함께 지정하거나 둘 다 없으면 오류"""
+        with pytest.raises(ValidationError):
+            SweepInput(scale_max=4.5, C_tot=130, history=[], terms=_terms())
+        with pytest.raises(ValidationError):
+            SweepInput(scale_max=4.5, C_tot=130, history=[], terms=_terms(),
+                       targets=[4.0], G_t_min=3.5, G_t_max=4.0)
+
+
+class TestSweepAPI:
+    """목표 범위 엔드포인트 통합 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """테스트 클라이언트 생성"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        return TestClient(app)
+
+    def test_sweep_endpoint(self, client):
+        """슬라이더 범위 요청"""
+        payload = {
+            "scale_max": 4.5,
+            "C_tot": 130,
+            "history": [h.model_dump() for h in HISTORY],
+            "terms": [t.model_dump() for t in _terms()],
+            "G_t_min": 3.5,
+            "G_t_max": 4.5,
+            "G_t_step": 0.05
+        }
+
+        response = client.post("/simulate/sweep", json=payload)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert len(data["rows"]) == 21
+        assert len(data["term_ids"]) == 6
+        assert all(len(row["required_avg"]) == 6 for row in data["rows"] if row["feasible"])
+
+    def test_sweep_validation(self, client):
+        """등급 조합을 계산하지 않으므로 courses가 있는 학기는 /simulate처럼 400"""
+        terms = [t.model_dump() for t in _terms()]
+        terms[0]["courses"] = [{"id": f"CS{i}", "credits": 3} for i in range(6)]
+        payload = {"scale_max": 4.5, "C_tot": 130, "history": [], "terms": terms, "targets": [3.9]}
+
+        assert client.post("/simulate/sweep", json=payload).status_code == 400
+        assert client.post("/simulate/sweep", json=dict(payload, terms=terms[1:], rounding="exact")).status_code == 200